@@ -4,7 +4,7 @@ def get_palette_bytes(palette_id):
     return get_rgb_bytes(get_palette_path(palette_id))
 
 def get_rgb_bytes(palette_path):
-    from graphics.palette_file import PaletteFile
-    palette = PaletteFile(palette_path)
+    from api.sprite_renderer import get_palette
+    palette = get_palette(palette_path)
 
     return [(color.red, color.green, color.blue) for color in palette.colors]
@@ -5,12 +5,10 @@ def get_portrait_bytes(portrait_id):
     return get_rgb_bytes(get_bin_path(portrait_id), get_pal_path(portrait_id))
 
 def get_rgb_bytes(portrait_path, palette_path):
-    from graphics.palette_file import PaletteFile
-    from graphics.sprite_file import SpriteFile
+    from api.sprite_renderer import get_sprite
     from graphics.poses import PORTRAIT
-    palette = PaletteFile(palette_path)
-
-    sprite = SpriteFile(portrait_path, palette)
+    sprite = get_sprite(portrait_path, palette_path)
+    palette = sprite.palette
 
     portrait_bytes = [item for sublist in sprite.tile_matrix(PORTRAIT) for item in sublist]
     palette_bytes =  [(color.red, color.green, color.blue) for color in palette.colors]
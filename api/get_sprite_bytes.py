@@ -5,12 +5,10 @@ def get_sprite_bytes(sprite_id, palette_id, pose_id):
     return get_rgb_bytes(get_sprite_path(sprite_id), get_palette_path(palette_id), pose_id)
 
 def get_rgb_bytes(sprite_path, palette_path, pose_id):
-    from graphics.palette_file import PaletteFile
-    from graphics.sprite_file import SpriteFile
+    from api.sprite_renderer import get_sprite
     from graphics.poses import CHARACTER
-    palette = PaletteFile(palette_path)
-
-    sprite = SpriteFile(sprite_path, palette)
+    sprite = get_sprite(sprite_path, palette_path)
+    palette = sprite.palette
 
     rgb_bytes = sprite.rgb_data(CHARACTER[pose_id])
     alpha_bytes = palette.alpha_rgb_data
@@ -0,0 +1,76 @@
+# in-process sprite rendering for the api, sprite and palette files are decoded once and kept in a cache keyed by
+# path and modification time so an edited file is decoded again
+#   get_png_base64(sprite_path, palette_path, pose_id)
+#   get_all_png_base64(sprite_path, palette_path)   # {pose_id : png base64} for every character pose
+from collections import OrderedDict
+
+CACHE_SIZE = 512 # number of decoded sprite and palette files to keep
+
+_cache = OrderedDict() # (file type, path) -> (modification time, decoded file), least recently used first
+
+def _cached(file_type, path, load):
+    import os
+    key = (file_type, path)
+    mtime = os.stat(path).st_mtime_ns
+    if key in _cache and _cache[key][0] == mtime:
+        _cache.move_to_end(key)
+        return _cache[key][1]
+
+    _cache[key] = (mtime, load(path))
+    _cache.move_to_end(key)
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last = False)
+    return _cache[key][1]
+
+def clear_cache():
+    _cache.clear()
+
+def get_palette(palette_path):
+    from graphics.palette_file import PaletteFile
+    return _cached("palette", palette_path, PaletteFile)
+
+def get_sprite(sprite_path, palette_path):
+    # sprite using the cached tiles of sprite_path and the cached palette of palette_path
+    from graphics.sprite import Sprite
+    from graphics.sprite_file import SpriteFile
+    sprite_file = _cached("sprite", sprite_path, lambda path : SpriteFile(path, None))
+    return Sprite(sprite_file.tiles, get_palette(palette_path))
+
+def _rgba_colors(palette):
+    # rgba bytes of each color id, colors matching the background color are transparent white
+    background = palette.alpha_rgb_data
+    return [bytes([255, 255, 255, 0]) if color.rgb == background else bytes(color.rgb + [255])
+            for color in palette.colors]
+
+def _png(sprite, pose, rgba_colors):
+    from PIL import Image
+    from io import BytesIO
+
+    image = Image.frombytes("RGBA", sprite.size(pose), sprite.pixel_bytes(pose, rgba_colors))
+    output = BytesIO()
+    image.save(output, format = "PNG")
+    return output.getvalue()
+
+def get_png(sprite_path, palette_path, pose_id):
+    from graphics.poses import CHARACTER
+    sprite = get_sprite(sprite_path, palette_path)
+    return _png(sprite, CHARACTER[pose_id], _rgba_colors(sprite.palette))
+
+def get_all_png(sprite_path, palette_path, pose_ids = None):
+    # png of each pose in pose_ids (default every character pose) with the sprite and palette decoded once
+    from graphics.poses import CHARACTER
+    if pose_ids is None:
+        pose_ids = range(len(CHARACTER))
+
+    sprite = get_sprite(sprite_path, palette_path)
+    rgba_colors = _rgba_colors(sprite.palette)
+    return {pose_id : _png(sprite, CHARACTER[pose_id], rgba_colors) for pose_id in pose_ids}
+
+def get_png_base64(sprite_path, palette_path, pose_id):
+    import base64
+    return base64.b64encode(get_png(sprite_path, palette_path, pose_id)).decode("utf-8")
+
+def get_all_png_base64(sprite_path, palette_path, pose_ids = None):
+    import base64
+    return {pose_id : base64.b64encode(png).decode("utf-8")
+            for pose_id, png in get_all_png(sprite_path, palette_path, pose_ids).items()}
@@ -1,8 +1,18 @@
 from args.arguments import Arguments
-arguments = Arguments()
 
-import sys
-module = sys.modules[__name__]
-for name, value in arguments.__dict__.items():
-    setattr(module, name, value)
+# importing args does not read sys.argv, entry points call parse before anything reads the arguments
+_argument_names = []
+def parse(argv = None):
+    # parse given argv (default sys.argv) and replace the arguments from any previous parse
+    import sys
+    module = sys.modules[__name__]
+    arguments = Arguments(argv)
+
+    for name in _argument_names:
+        delattr(module, name)
+    _argument_names[:] = arguments.__dict__.keys()
+    for name, value in arguments.__dict__.items():
+        setattr(module, name, value)
+    module.arguments = arguments
+
 from args.log import log
@@ -1,5 +1,5 @@
 class Arguments:
-    def __init__(self):
+    def __init__(self, argv = None):
         import importlib
         self.groups = [
             "settings",
@@ -22,17 +22,23 @@ class Arguments:
         self.parser.add_argument("-o", dest = "output_file", required = False, help = "Modified FFIII US v1.0 rom file")
         self.parser.add_argument("-url", dest = "website_url", required = False, help = "Url to the shareable link for the seed")
         self.parser.add_argument("-manifest", dest = "manifest_file", required = False, help = "Output location for api metadata")
+        self.parser.add_argument("-patch", dest = "patch_file", required = False, help = "Output location for a patch from the input rom to the modified rom (ips if it ends with .ips, otherwise bps)")
         self.parser.add_argument("-debug", dest = "debug", action = "store_true", help = "Debug mode")
         self.parser.add_argument("-sid", dest = "seed_id", action = "store_true", help = "Key used for api tracking")
 
         self.parser.add_argument("-nro", dest = "no_rom_output", action = "store_true", help = "Do not output a modified rom file")
         self.parser.add_argument("-slog", dest = "stdout_log", action = "store_true", help = "Write log to stdout instead of file")
         self.parser.add_argument("-hf", dest = "hide_flags", action = "store_true", help = "Hide Flags (no log, no flags menu)")
+        self.parser.add_argument("-profile", dest = "profile", action = "store_true", help = "Write time and memory used by each generation stage to <output>.profile.json")
+        self.parser.add_argument("-cache", dest = "rom_cache_directory", required = False, help = "Directory to cache the validated input rom in to speed up later runs")
+        self.parser.add_argument("-scache", dest = "stage_cache_directory", required = False, help = "Directory to cache generated roms in, re-rolls which only change -cspr/-cpor/-cpal reuse them")
+        self.parser.add_argument("-pbundle", dest = "patch_bundle", required = False, help = "Patch bundle file, seed independent stages are copied from it instead of assembled and added to it when missing")
+        self.parser.add_argument("-pack", dest = "pack_allocations", action = "store_true", help = "Place relocatable code and data after every block is known, largest first in each bank, to reduce fragmentation")
 
         for group in self.group_modules.values():
             group.parse(self.parser)
 
-        self.parser.parse_args(namespace = self)
+        self.parser.parse_args(argv, namespace = self)
 
         self.flags = ""
         self.seed_rng_flags = ""
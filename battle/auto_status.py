@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Write
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Plan
 import instruction.asm as asm
 
 import constants.status_effects as status_effects
@@ -42,7 +42,7 @@ class _AutoStatus:
         src += [
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "auto status effects")
+        space = Plan(Bank.F0, src, "auto status effects")
         auto_status_effects = space.start_address
 
         space = Reserve(0x228bf, 0x228c8, "equipment status effects", asm.NOP())
@@ -117,6 +117,6 @@ class _AutoStatus:
         src += [
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, auto_status_name)
+        space = Plan(Bank.F0, src, auto_status_name)
         return space.start_address
 auto_status = _AutoStatus()
@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Allocate, Write
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Allocate, Plan
 import instruction.asm as asm
 import instruction.f0 as f0
 import args
@@ -89,6 +89,6 @@ class CheckDragonBoss(asm.JSL):
             asm.PLP(),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "update boss/dragon count/bit")
+        space = Plan(Bank.F0, src, "update boss/dragon count/bit")
         CheckDragonBoss.__init__ = lambda self : super().__init__(START_ADDRESS_SNES + space.start_address)
         self.__init__()
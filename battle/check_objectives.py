@@ -1,4 +1,4 @@
-from memory.space import Bank, Write
+from memory.space import Bank, Plan
 import instruction.asm as asm
 
 class CheckObjectives(asm.JSR):
@@ -27,6 +27,6 @@ class CheckObjectives(asm.JSR):
             asm.RTS(),
         ]
 
-        space = Write(Bank.C2, src, "battle check objectives")
+        space = Plan(Bank.C2, src, "battle check objectives")
         CheckObjectives.__init__ = lambda self : super().__init__(space.start_address, asm.ABS)
         self.__init__()
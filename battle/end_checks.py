@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Write
+from memory.space import Bank, Reserve, Plan
 import instruction.asm as asm
 import instruction.c2 as c2
 
@@ -21,7 +21,7 @@ class _EndChecks:
             "AFTER_CHECKS",
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "battle end checks")
+        space = Plan(Bank.C2, src, "battle end checks")
         end_checks = space.start_address
 
         space = Reserve(0x2488f, 0x24891, "call battle end checks", asm.NOP())
@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Write, Read
+from memory.space import Bank, Reserve, Plan, Read
 
 import instruction.asm as asm
 import instruction.f0 as f0
@@ -42,7 +42,7 @@ class _FormationFlags:
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "initialize formation flags")
+        space = Plan(Bank.C2, src, "initialize formation flags")
         initialize_formation_flags = space.start_address
 
         space = Reserve(0x22447, 0x22449, "load formation data", asm.NOP())
@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Write, Read
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Plan, Read
 import instruction.asm as asm
 
 from battle.scaling import scaling
@@ -33,7 +33,7 @@ class _LoadEnemyLevel:
 
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "load enemy level")
+        space = Plan(Bank.C2, src, "load enemy level")
         load_enemy_level = space.start_address
 
         space = Reserve(0x22d1e, 0x22d24, "call load enemy level", asm.NOP())
@@ -71,7 +71,7 @@ class _LoadEnemyLevel:
         src += [
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, f"{result_name} objectives")
+        space = Plan(Bank.F0, src, f"{result_name} objectives")
         return space.start_address
 
 load_enemy_level = _LoadEnemyLevel()
@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Write, Read
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Plan, Read
 import instruction.asm as asm
 
 import data.event_bit as event_bit
@@ -16,7 +16,7 @@ class _MagitekUpgrade:
             0x04, 0xFF, #HEAL_FORCE, <empty>, 
             0xFF, 0xFF  #<empty>, <empty>
         ]
-        space = Write(Bank.F0, src, "magitek default table")
+        space = Plan(Bank.F0, src, "magitek default table")
         magitek_default_table_addr = space.start_address
 
         # Upgraded: Match Terra's options
@@ -26,7 +26,7 @@ class _MagitekUpgrade:
             0x04, 0x05, #HEAL_FORCE, CONFUSER, 
             0x06, 0x07  #X_FER, TEKMISSILE
         ]
-        space = Write(Bank.F0, src, "magitek upgraded table")
+        space = Plan(Bank.F0, src, "magitek upgraded table")
         magitek_upgraded_table_addr = space.start_address
 
         # Write our modifications to the C1 routines that use the 
@@ -55,7 +55,7 @@ class _MagitekUpgrade:
             asm.STA(0x5760, asm.ABS),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "build magitek menu")
+        space = Plan(Bank.F0, src, "build magitek menu")
         build_magitek_menu_addr = space.start_address
 
         space = Reserve(0x14d42, 0x14d6d, "build magitek menu jsl", asm.NOP())
@@ -74,7 +74,7 @@ class _MagitekUpgrade:
             asm.LDA(START_ADDRESS_SNES + magitek_upgraded_table_addr, asm.LNG_X),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "select from magitek menu")
+        space = Plan(Bank.F0, src, "select from magitek menu")
         select_from_magitek_menu_addr_snes = space.start_address_snes
 
         space = Reserve(0x1866a, 0x18683, "select from magitek menu jsl", asm.NOP())
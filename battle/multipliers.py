@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Write
+from memory.space import Bank, Reserve, Plan
 import instruction.asm as asm
 import instruction.c2 as c2
 import args
@@ -24,7 +24,7 @@ class Multipliers():
             asm.JSR(c2.multiply_max_65535, asm.ABS),    # a = enemy exp * multiplier
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "exp multiply function")
+        space = Plan(Bank.C2, src, "exp multiply function")
         multiply_exp = space.start_address
 
         # multiply each enemies exp at end of battle by given multiplier (applied after enemy scaling)
@@ -47,7 +47,7 @@ class Multipliers():
             asm.JSR(c2.multiply_max_65535, asm.ABS),    # a = enemy gp * multiplier
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "gp multiply function")
+        space = Plan(Bank.C2, src, "gp multiply function")
         multiply_gp = space.start_address
 
         # multiply each enemies gp at end of battle by given multiplier (applied after enemy scaling)
@@ -68,7 +68,7 @@ class Multipliers():
             asm.JSR(c2.multiply_max_255, asm.ABS),      # a = multiplier * magic points
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "magic points multiply function")
+        space = Plan(Bank.C2, src, "magic points multiply function")
         multiply_mp = space.start_address
 
         # NOTE: max magic points battle can give is 255 (1 byte)
@@ -93,7 +93,7 @@ class Multipliers():
             asm.ADC(0x1cf6, asm.ABS),        # add morph time to existing morph time
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "divide gained morph time by magic points multiplier")
+        space = Plan(Bank.C2, src, "divide gained morph time by magic points multiplier")
         add_morph_time = space.start_address
 
         space = Reserve(0x25e3f, 0x25e41, "call add_morph_time", asm.NOP())
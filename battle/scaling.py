@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Write, Read
+from memory.space import Bank, Reserve, Plan, Read
 from battle.scaling_functions import ScalingFunctions
 from battle.formation_flags import FormationFlag, formation_flags_address
 
@@ -31,7 +31,7 @@ class _Scaling():
                 asm.A16(),
                 asm.JSR(scaling_function, asm.ABS),
             ]
-            if scaling_function == self.scaling_functions.time:
+            if scaling_function is self.scaling_functions.time:
                 # divide by factor
                 src += [
                     asm.ASL(),
@@ -72,7 +72,7 @@ class _Scaling():
             "RETURN",
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "c2 load scale levels")
+        space = Plan(Bank.C2, src, "c2 load scale levels")
         load_scale_levels = space.start_address
 
         if args.level_scaling or args.hp_mp_scaling or args.xp_gp_scaling:
@@ -121,7 +121,7 @@ class _Scaling():
             asm.LDA(value_ptr_addr, asm.DIR_24),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "c2 scale value")
+        space = Plan(Bank.C2, src, "c2 scale value")
         self.scale_value = space.start_address
 
     def scale_hp_mp_mod(self):
@@ -150,7 +150,7 @@ class _Scaling():
             asm.STA(0xea, asm.DIR),
             asm.JMP(self.scale_value, asm.ABS),
         ]
-        space = Write(Bank.C2, src, "scale hp/mp")
+        space = Plan(Bank.C2, src, "scale hp/mp")
         self.scale_hp_mp = space.start_address
 
         if args.hp_mp_scaling:
@@ -185,7 +185,7 @@ class _Scaling():
             asm.STA(0xea, asm.DIR),
             asm.JMP(self.scale_value, asm.ABS),
         ]
-        space = Write(Bank.C2, src, "scale hp/mp")
+        space = Plan(Bank.C2, src, "scale hp/mp")
         self.scale_xp_gp = space.start_address
 
         if args.xp_gp_scaling:
@@ -218,6 +218,6 @@ class _Scaling():
            "RETURN",
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scale and distort level")
+        space = Plan(Bank.C2, src, "scale and distort level")
         self.scale_and_distort_level = space.start_address
 scaling = _Scaling()
@@ -1,4 +1,4 @@
-from memory.space import Bank, Write
+from memory.space import Bank, Plan
 import instruction.asm as asm
 import instruction.c2 as c2
 import args
@@ -84,7 +84,7 @@ class ScalingFunctions():
             "RETURN",
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "c2 min max bound")
+        space = Plan(Bank.C2, src, "c2 min max bound")
         self.min_max_bound = space.start_address
 
     def party_average_level_mod(self):
@@ -124,7 +124,7 @@ class ScalingFunctions():
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scaling function party average level")
+        space = Plan(Bank.C2, src, "scaling function party average level")
         self.party_average_level = space.start_address
 
     def party_highest_level_mod(self):
@@ -159,7 +159,7 @@ class ScalingFunctions():
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scaling function party highest level")
+        space = Plan(Bank.C2, src, "scaling function party highest level")
         self.party_highest_level = space.start_address
 
     def ce_mod(self):
@@ -183,7 +183,7 @@ class ScalingFunctions():
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scaling function ce")
+        space = Plan(Bank.C2, src, "scaling function ce")
         self.ce = space.start_address
 
     def ced_mod(self):
@@ -203,7 +203,7 @@ class ScalingFunctions():
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scaling function ced")
+        space = Plan(Bank.C2, src, "scaling function ced")
         self.ced = space.start_address
 
     def checks_mod(self):
@@ -221,7 +221,7 @@ class ScalingFunctions():
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scaling function checks")
+        space = Plan(Bank.C2, src, "scaling function checks")
         self.checks = space.start_address
 
     def bosses_dragons_mod(self):
@@ -242,7 +242,7 @@ class ScalingFunctions():
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scaling function bosses")
+        space = Plan(Bank.C2, src, "scaling function bosses")
         self.bosses_dragons = space.start_address
 
     def time_mod(self):
@@ -265,5 +265,5 @@ class ScalingFunctions():
             asm.PLP(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "scaling function time")
+        space = Plan(Bank.C2, src, "scaling function time")
         self.time = space.start_address
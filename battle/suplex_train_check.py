@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Write
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Plan
 import instruction.asm as asm
 import data.event_bit as event_bit
 
@@ -35,7 +35,7 @@ class _SuplexTrainCheck:
             asm.STA(0x3412, asm.ABS),   # set flag to display blitz name at top of screen
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "blitz suplex a train check")
+        space = Plan(Bank.F0, src, "blitz suplex a train check")
         suplex_train_check = space.start_address
 
         space = Reserve(0x215b0, 0x215b4, "if successful blitz, check if suplexing train", asm.NOP())
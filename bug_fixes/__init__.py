@@ -6,7 +6,13 @@ from bug_fixes.retort import Retort
 from bug_fixes.enemy_damage_counter import EnemyDamageCounter
 from bug_fixes.capture import Capture
 
-__all__ = ["BugFixes"]
+__all__ = ["BugFixes", "bundle_key"]
+def bundle_key():
+    # every flag bug fixes depend on, bug fixes are applied from the patch bundle if these match
+    import args
+    return [args.fix_capture, args.fix_enemy_damage_counter, args.fix_evade, args.fix_jump, args.fix_retort,
+            args.fix_sketch, args.fix_vanish_doom]
+
 class BugFixes:
     def __init__(self):
         self.evade = Evade()
@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Write
+from memory.space import Bank, Reserve, Write, Plan
 import instruction.asm as asm
 import args
 
@@ -53,7 +53,7 @@ class Capture:
             asm.STZ(STOLEN_ITEM_ARRAY_INDEX, asm.ABS),  # zero the index
             asm.RTS()
         ]
-        space = Write(Bank.C2, src, "Multisteal fix: reset stolen item array index routine")
+        space = Plan(Bank.C2, src, "Multisteal fix: reset stolen item array index routine")
         stolen_item_index_reset = space.start_address
 
         space = Reserve(0x2140f, 0x21411, "Multisteal Fix: reset stolen item index")
@@ -67,7 +67,7 @@ class Capture:
             asm.STZ(STOLEN_ITEM_ARRAY_INDEX, asm.ABS),  # zero the index
             asm.RTS()
         ]
-        space = Write(Bank.C2, src, "Multisteal fix: reset stolen item array index routine")
+        space = Plan(Bank.C2, src, "Multisteal fix: reset stolen item array index routine")
         stolen_item_index_reset = space.start_address
 
         space = Reserve(0x213fa, 0x213fc, "Multisteal Fix: reset stolen item index")
@@ -98,7 +98,7 @@ class Capture:
             asm.STA(0x32f4, asm.ABS_X), # store in reserve item byte again
             asm.RTS()
         ]
-        space = Write(Bank.C2, src, "Multisteal Fix: store acquired item")
+        space = Plan(Bank.C2, src, "Multisteal Fix: store acquired item")
         store_acquired_addr = space.start_address
 
         # Update steal formula where it stores the acquired item
@@ -128,7 +128,7 @@ class Capture:
             asm.STZ(NEW_SPECIAL_EFFECT_VAR, asm.ABS), #Clear new special effect variable
             asm.RTS()
         ]
-        space = Write(Bank.C2, src, "Capture Fix: null dog block")
+        space = Plan(Bank.C2, src, "Capture Fix: null dog block")
         null_dog_block_addr = space.start_address
 
         #Call Square's per-target special effect function as normal.  Then call it again with
@@ -151,7 +151,7 @@ class Capture:
             asm.PLP(),
             asm.RTS()
         ]
-        space = Write(Bank.C2, src, "Capture Fix: new special effect function")
+        space = Plan(Bank.C2, src, "Capture Fix: new special effect function")
         new_special_effect_addr = space.start_address
 
         ##### 
@@ -191,7 +191,7 @@ class Capture:
             "NO_CHANGE",
             asm.RTS()
         ]
-        space = Write(Bank.C2, src, "Capture Fix: new dice toss animation")
+        space = Plan(Bank.C2, src, "Capture Fix: new dice toss animation")
         dice_toss_animation_addr = space.start_address
 
         space = Reserve(0x241d9, 0x241e5, "Capture Fix: replace dice toss animation", asm.NOP())
@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Write
+from memory.space import Bank, Reserve, Plan
 import instruction.asm as asm
 import args
 
@@ -19,7 +19,7 @@ class Retort:
             asm.TRB(0x3a56, asm.ABS),   # clear entity bit
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "retort bug fix")
+        space = Plan(Bank.C2, src, "retort bug fix")
         retort_fix = space.start_address
 
         space = Reserve(0x245f2, 0x245f4, "call retort bug fix when removing petrify/death")
@@ -44,7 +44,7 @@ class Retort:
             asm.ASL(0x3e4c, asm.ABS_X), # restore other bits
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "imp retort bug fix")
+        space = Plan(Bank.C2, src, "imp retort bug fix")
         retort_fix = space.start_address
 
         space = Reserve(0x245ed, 0x245ef, "call imp retort bug fix when setting/clearing imp status")
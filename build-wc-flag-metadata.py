@@ -1,5 +1,6 @@
 def main():
     import args
+    args.parse()
     from metadata.flag_metadata_writer import FlagMetadataWriter
     FlagMetadataWriter(args).write()
 
@@ -1,7 +1,7 @@
 from data.blitz import Blitz
 from data.structures import DataArray
 
-from memory.space import Bank, Reserve, Allocate, Write, Read
+from memory.space import Bank, Reserve, Allocate, Write, Read, Plan
 import instruction.asm as asm
 
 class Blitzes:
@@ -167,7 +167,7 @@ class Blitzes:
             Read(0x261f1, 0x261f4),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "check/set blitzes learned event bit")
+        space = Plan(Bank.C2, src, "check/set blitzes learned event bit")
         check_blitzes_learned = space.start_address
 
         space = Reserve(0x261f1, 0x261f4, "call check/set blitzes learned event bit", asm.NOP())
@@ -8,6 +8,8 @@ from data.party_battle_scripts import PartyBattleScripts
 from data.structures import DataArray
 
 import data.characters_asm as characters_asm
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Characters():
     CHARACTER_COUNT = 14   # 14 playable characters
@@ -67,9 +69,8 @@ class Characters():
         if exclude is None:
             exclude = []
 
-        import random
         possible_characters = [character_id for character_id in self.available_characters if character_id not in exclude]
-        random_character = random.choice(possible_characters)
+        random_character = rng.choice(possible_characters)
         self.set_unavailable(random_character)
         return random_character
 
@@ -89,15 +90,14 @@ class Characters():
         characters_asm.set_starting_level(self.args.start_level)
 
     def stats_random_percent(self):
-        import random
         stats = ["init_extra_hp", "init_extra_mp", "init_vigor", "init_speed", "init_stamina", "init_magic",
                  "init_attack", "init_defense", "init_magic_defense", "init_evasion", "init_magic_evasion"]
         for character in self.characters:
             for stat in stats:
                 stat_value = getattr(character, stat)
                 if stat_value != 0:
-                    character_stat_percent = random.randint(self.args.character_stat_random_percent_min,
-                                                            self.args.character_stat_random_percent_max) / 100.0
+                    character_stat_percent = rng.randint(self.args.character_stat_random_percent_min,
+                                                         self.args.character_stat_random_percent_max) / 100.0
                     value = int(stat_value * character_stat_percent)
                     setattr(character, stat, max(min(value, 255), 0))
 
@@ -192,8 +192,7 @@ class Characters():
     def get_random_esper_item_sprite(self):
         sprites = [self.SOLDIER, self.IMP, self.MERCHANT, self.GHOST]
 
-        import random
-        return sprites[random.randrange(len(sprites))]
+        return sprites[rng.randrange(len(sprites))]
 
     def get_palette(self, character):
         return self.character_palettes.get(character)
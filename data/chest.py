@@ -1,3 +1,6 @@
+from seed import random_stream
+rng = random_stream(__name__)
+
 class Chest():
     EMPTY, MONSTER, ITEM, GOLD, UNUSED = (0x08, 0x20, 0x40, 0x80, 0xfe)
     MAX_GOLD_VALUE = 2 ** 8 - 1 # 1 byte for chest contents, 2^8 - 1 max gold value
@@ -28,8 +31,7 @@ class Chest():
         return data
 
     def randomize_gold(self):
-        from random import randint
-        self.contents = randint(1, self.MAX_GOLD_VALUE)
+        self.contents = rng.randint(1, self.MAX_GOLD_VALUE)
 
     def contains(self, contents_type, contents):
         return self.type == contents_type and self.contents == contents
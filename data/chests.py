@@ -1,7 +1,8 @@
 from data.chest import Chest
 import data.chests_asm as chests_asm
 from data.structures import DataArrays
-import random
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Chests():
     PTRS_START = 0x2d82f4
@@ -76,7 +77,7 @@ class Chests():
         import copy
         chests_shuffle = [copy.deepcopy(chest) for chest in self.chests if chest.type in types]
 
-        random.shuffle(chests_shuffle)
+        rng.shuffle(chests_shuffle)
 
         shuffle_index = 0
         for chest in self.chests:
@@ -98,7 +99,7 @@ class Chests():
         possible_chests = [chest for chest in self.chests if chest.type in randomizable_types]
         random_percent = self.args.chest_contents_shuffle_random_percent / 100.0
         num_random_chests = int(len(possible_chests) * random_percent)
-        random_chests = random.sample(possible_chests, num_random_chests)
+        random_chests = rng.sample(possible_chests, num_random_chests)
         for chest in random_chests:
             if chest.type == Chest.GOLD:
                 chest.randomize_gold()
@@ -110,13 +111,13 @@ class Chests():
             from data.chest_item_tiers import weights
             from utils.weighted_random import weighted_random
 
-            random_tier = weighted_random(weights)
+            random_tier = weighted_random(weights, rng)
             if random_tier < len(weights) - 1: # not s tier, use equal distribution
-                random_tier_index = random.randrange(len(tiers[random_tier]))
+                random_tier_index = rng.randrange(len(tiers[random_tier]))
                 return tiers[random_tier][random_tier_index]
 
             weights = [entry[1] for entry in tier_s_distribution]
-            random_s_index = weighted_random(weights)
+            random_s_index = weighted_random(weights, rng)
             return tier_s_distribution[random_s_index][0]
 
         # first shuffle the chests to mix up empty/item/gold positions
@@ -124,7 +125,7 @@ class Chests():
 
         for chest in self.chests:
             if chest.type == Chest.GOLD:
-                chest.contents = int(random.triangular(1, Chest.MAX_GOLD_VALUE + 1, 1))
+                chest.contents = int(rng.triangular(1, Chest.MAX_GOLD_VALUE + 1, 1))
                 if chest.contents == Chest.MAX_GOLD_VALUE + 1:
                     # triangular max is inclusive, very small chance need to round max down
                     chest.contents = Chest.MAX_GOLD_VALUE
@@ -173,13 +174,13 @@ class Chests():
                     weights[tier_index] = -weights[tier_index]
                 weights[tier_index] += start_weights[tier_index]
 
-            random_tier_index = weighted_random(weights)
+            random_tier_index = weighted_random(weights, rng)
             if random_tier_index < len(self.item_tiers) - 1: # not s tier, use equal distribution
-                random_element_index = random.randrange(len(self.item_tiers[random_tier_index]))
+                random_element_index = rng.randrange(len(self.item_tiers[random_tier_index]))
                 self.item_contents.append(self.item_tiers[random_tier_index][random_element_index])
             else:
                 weights = [entry[1] for entry in self.item_tier_s_distribution]
-                random_s_index = weighted_random(weights)
+                random_s_index = weighted_random(weights, rng)
                 self.item_contents.append(self.item_tier_s_distribution[random_s_index][0])
             item_bits.append(chest.bit.to_bytes(2, "little"))
 
@@ -189,7 +190,7 @@ class Chests():
         self.gold_contents = []
         for chest_index, chest in enumerate(gold_chests):
             max_value = int((Chest.MAX_GOLD_VALUE / len(gold_chests)) * (chest_index + 1))
-            self.gold_contents.append(random.randint(1, max_value))
+            self.gold_contents.append(rng.randint(1, max_value))
             gold_bits.append(chest.bit.to_bytes(2, "little"))
 
         chests_asm.scale_gold(gold_bits, self.gold_contents)
@@ -213,15 +214,15 @@ class Chests():
                            chest not in ze_crush_room_chests]
         num_monster_chests = int(len(possible_chests) * ((enemy_percent) / 100.0))
         #gets the specific chests that will be randomized
-        random_chests = random.sample(possible_chests, num_monster_chests)  
+        random_chests = rng.sample(possible_chests, num_monster_chests)  
 
         for chest in random_chests:
             chest.type = Chest.MONSTER
-            is_boss = (random.random()*100 < boss_percent)
+            is_boss = (rng.random()*100 < boss_percent)
             if is_boss:
-                chest.contents = random.choice(MIAB_boss)
+                chest.contents = rng.choice(MIAB_boss)
             else:
-                chest.contents = random.choice(MIAB_noboss)
+                chest.contents = rng.choice(MIAB_noboss)
 
     def clear_contents(self):
         for chest in self.chests:
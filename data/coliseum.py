@@ -1,4 +1,7 @@
 from data.match import Match
+from data.structures import RecordArray
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Coliseum():
     MATCH_COUNT = 256
@@ -13,48 +16,35 @@ class Coliseum():
         self.read()
 
     def read(self):
-        self.matches = []
-        for match_index in range(self.MATCH_COUNT):
-            match_data_start = self.DATA_START_ADDR + match_index * Match.DATA_SIZE
-            match_data = self.rom.get_bytes(match_data_start, Match.DATA_SIZE)
-
-            new_match = Match(match_data)
-            self.matches.append(new_match)
+        self.match_data = RecordArray(self.rom, self.DATA_START_ADDR, Match.LAYOUT, self.MATCH_COUNT)
+        self.matches = self.match_data.records(Match)
 
     def shuffle_opponents(self):
         opponents = []
         for match in self.matches:
             opponents.append(match.opponent)
-        import random
-        random.shuffle(opponents)
+        rng.shuffle(opponents)
         for match_index, match in enumerate(self.matches):
             match.opponent = opponents[match_index]
 
     def randomize_opponents(self, random_opponent_percent = None):
-        import random
-
         for match in self.matches:
-            match.opponent = self.enemies.get_random() if random_opponent_percent is not None and (random.random() < random_opponent_percent) else match.opponent
+            match.opponent = self.enemies.get_random() if random_opponent_percent is not None and (rng.random() < random_opponent_percent) else match.opponent
 
     def shuffle_rewards(self):
         rewards = []
         for match in self.matches:
             rewards.append(match.reward)
 
-        import random
-        random.shuffle(rewards)
+        rng.shuffle(rewards)
         for match_index, match in enumerate(self.matches):
             match.reward = rewards[match_index]
 
     def randomize_rewards(self, random_reward_percent = None):
-        import random
-
         for match in self.matches:
-            match.reward = self.items.get_random() if random_reward_percent is not None and (random.random() < random_reward_percent) else match.reward
+            match.reward = self.items.get_random() if random_reward_percent is not None and (rng.random() < random_reward_percent) else match.reward
 
     def remove_excluded_items(self):
-        import random
-
         exclude = self.items.get_excluded()
         if self.args.coliseum_no_exp_eggs:
             exclude.append(self.items.get_id("Exp. Egg"))
@@ -65,17 +55,16 @@ class Coliseum():
 
         for match in self.matches:
             if match.reward in exclude:
-                match.reward = random.choice(possible_items)
+                match.reward = rng.choice(possible_items)
 
     def randomize_rewards_hidden(self):
         for match in self.matches:
             match.reward_hidden = 0
 
-        import random
-        number_visible = random.randint(self.args.coliseum_rewards_visible_random_min,
-                                        self.args.coliseum_rewards_visible_random_max)
+        number_visible = rng.randint(self.args.coliseum_rewards_visible_random_min,
+                                     self.args.coliseum_rewards_visible_random_max)
         number_hidden = self.items.ITEM_COUNT - number_visible - 1
-        hidden_indices = random.sample(range(self.items.ITEM_COUNT - 1), number_hidden)
+        hidden_indices = rng.sample(range(self.items.ITEM_COUNT - 1), number_hidden)
         for match_index in hidden_indices:
             self.matches[match_index].reward_hidden = 1
 
@@ -129,7 +118,5 @@ class Coliseum():
         if self.args.spoiler_log:
             self.log()
 
-        for match_index, match in enumerate(self.matches):
-            match_data = match.data()
-            match_data_start = self.DATA_START_ADDR + match_index * Match.DATA_SIZE
-            self.rom.set_bytes(match_data_start, match_data)
+        self.match_data.set_records(self.matches)
+        self.match_data.write()
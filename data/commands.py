@@ -1,7 +1,8 @@
 from multiprocessing.sharedctypes import Value
 from constants.commands import *
-import random
 import args
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Commands:
     def __init__(self, characters):
@@ -43,7 +44,7 @@ class Commands:
                 pass
         if len(possible_moogle_commands) > 0:
             for index in range(Characters.FIRST_MOOGLE, Characters.LAST_MOOGLE + 1):
-                self.characters[index].commands[1] = random.choice(possible_moogle_commands)
+                self.characters[index].commands[1] = rng.choice(possible_moogle_commands)
 
         # if suplex a train condition exists, guarantee blitz
         import objectives
@@ -60,7 +61,7 @@ class Commands:
                 # force a random command to be blitz instead
                 possible_indices = list(range(len(args.character_commands)))
 
-            random_index = random.choice(possible_indices)
+            random_index = rng.choice(possible_indices)
             args.character_commands[random_index] = blitz_id
             command_set.discard(blitz_id)
 
@@ -68,7 +69,7 @@ class Commands:
             if command not in allowed_commands and (index != 0 or command != name_id["Morph"]) and (index != 12 or command != name_id["Leap"]):
                 raise ValueError(f"Invalid character command {command}")
             elif command == RANDOM_COMMAND:
-                args.character_commands[index] = random.choice(command_list)
+                args.character_commands[index] = rng.choice(command_list)
                 if args.character_commands[index] == morph_id:
                     command_list.remove(morph_id) # only one character gets morph
             elif command == NONE_COMMAND:
@@ -78,7 +79,7 @@ class Commands:
 
         for index, command in enumerate(args.character_commands):
             if command == RANDOM_UNIQUE_COMMAND:
-                args.character_commands[index] = random.choice(tuple(command_set))
+                args.character_commands[index] = rng.choice(tuple(command_set))
                 command_set.discard(args.character_commands[index])
 
         # apply the commands to the characters
@@ -95,7 +96,7 @@ class Commands:
             commands.append(self.characters[index].commands[1])
         commands.append(self.characters[Characters.GAU].commands[0]) # rage
 
-        random.shuffle(commands)
+        rng.shuffle(commands)
 
         for index in range(len(COMMAND_OPTIONS) - 1):
             self.characters[index].commands[1] = commands[index]
@@ -1,6 +1,6 @@
 from data.control import Control
 from data.structures import DataArray
-from memory.space import Reserve, Allocate, Bank, Write
+from memory.space import Reserve, Allocate, Bank, Plan
 import instruction.asm as asm
 
 class Controls():
@@ -50,7 +50,7 @@ class Controls():
             "exit",
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "Control: ignore Randomize Target bit")
+        space = Plan(Bank.C2, src, "Control: ignore Randomize Target bit")
         ignore_randomize_target_addr = space.start_address
 
         # Call our new subroutine 
@@ -77,7 +77,7 @@ class Controls():
             asm.LDA(0x3B18, asm.ABS_X),   # displaced code: get Level
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "Controller Caster Stats")
+        space = Plan(Bank.C2, src, "Controller Caster Stats")
         use_controller_stats_addr = space.start_address
 
         # Call our new subroutine
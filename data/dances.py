@@ -3,6 +3,8 @@ from data.structures import DataArray
 
 from memory.space import Bank, Reserve, Allocate, Write, Read
 import instruction.asm as asm
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Dances:
     DANCE_COUNT = 8
@@ -141,10 +143,8 @@ class Dances:
         )
 
     def start_random_dances(self):
-        import random
-
-        number_initial_dances = random.randint(self.args.start_dances_random_min, self.args.start_dances_random_max)
-        initial_dances = random.sample(range(self.DANCE_COUNT), number_initial_dances)
+        number_initial_dances = rng.randint(self.args.start_dances_random_min, self.args.start_dances_random_max)
+        initial_dances = rng.sample(range(self.DANCE_COUNT), number_initial_dances)
 
         dance_bits = 0
         for dance_index in initial_dances:
@@ -156,8 +156,7 @@ class Dances:
         for dance in self.dances:
             abilities.extend(dance.dances)
 
-        import random
-        random.shuffle(abilities)
+        rng.shuffle(abilities)
 
         for dance_index, dance in enumerate(self.dances):
             ability_index = dance_index * self.DATA_SIZE
@@ -19,66 +19,87 @@ import data.shops as shops
 import data.coliseum as coliseum
 import data.title_graphics as title_graphics
 
+from utils import profile
+
 class Data:
     def __init__(self, rom, args):
         self.dialogs = dialogs
 
-        self.spells = spells.Spells(rom, args)
-        self.spells.mod()
+        with profile.stage("spells"):
+            self.spells = spells.Spells(rom, args)
+            self.spells.mod()
 
-        self.characters = characters.Characters(rom, args, self.spells)
-        self.characters.mod()
+        with profile.stage("characters"):
+            self.characters = characters.Characters(rom, args, self.spells)
+            self.characters.mod()
 
-        self.items = items.Items(rom, args, self.dialogs, self.characters)
-        self.items.mod()
+        with profile.stage("items"):
+            self.items = items.Items(rom, args, self.dialogs, self.characters)
+            self.items.mod()
 
-        self.metamorph_groups = metamorph_groups.MetamorphGroups(rom)
-        self.metamorph_groups.mod()
+        with profile.stage("metamorph_groups"):
+            self.metamorph_groups = metamorph_groups.MetamorphGroups(rom)
+            self.metamorph_groups.mod()
 
-        self.maps = maps.Maps(rom, args, self.items)
-        self.maps.mod(self.characters)
+        with profile.stage("maps"):
+            self.maps = maps.Maps(rom, args, self.items)
+            self.maps.mod(self.characters)
 
-        self.enemies = enemies.Enemies(rom, args, self.items)
-        self.enemies.mod(self.maps)
+        with profile.stage("enemies"):
+            self.enemies = enemies.Enemies(rom, args, self.items)
+            self.enemies.mod(self.maps)
 
-        self.swdtechs = swdtechs.SwdTechs(rom, args, self.characters)
-        self.swdtechs.mod()
+        with profile.stage("swdtechs"):
+            self.swdtechs = swdtechs.SwdTechs(rom, args, self.characters)
+            self.swdtechs.mod()
 
-        self.blitzes = blitzes.Blitzes(rom, args, self.characters)
-        self.blitzes.mod()
+        with profile.stage("blitzes"):
+            self.blitzes = blitzes.Blitzes(rom, args, self.characters)
+            self.blitzes.mod()
 
-        self.lores = lores.Lores(rom, args, self.characters)
-        self.lores.mod(self.dialogs)
+        with profile.stage("lores"):
+            self.lores = lores.Lores(rom, args, self.characters)
+            self.lores.mod(self.dialogs)
 
-        self.rages = rages.Rages(rom, args, self.enemies)
-        self.rages.mod()
+        with profile.stage("rages"):
+            self.rages = rages.Rages(rom, args, self.enemies)
+            self.rages.mod()
 
-        self.dances = dances.Dances(rom, args, self.characters)
-        self.dances.mod()
+        with profile.stage("dances"):
+            self.dances = dances.Dances(rom, args, self.characters)
+            self.dances.mod()
 
-        self.steal = steal.Steal(rom, args)
-        self.steal.mod()
+        with profile.stage("steal"):
+            self.steal = steal.Steal(rom, args)
+            self.steal.mod()
 
-        self.sketches = sketches.Sketches(rom, args, self.enemies, self.rages)
-        self.sketches.mod()
+        with profile.stage("sketches"):
+            self.sketches = sketches.Sketches(rom, args, self.enemies, self.rages)
+            self.sketches.mod()
 
-        self.controls = controls.Controls(rom, args, self.enemies, self.rages)
-        self.controls.mod()
+        with profile.stage("controls"):
+            self.controls = controls.Controls(rom, args, self.enemies, self.rages)
+            self.controls.mod()
 
-        self.magiteks = magiteks.Magiteks(rom, args)
-        self.magiteks.mod()
+        with profile.stage("magiteks"):
+            self.magiteks = magiteks.Magiteks(rom, args)
+            self.magiteks.mod()
 
-        self.espers = espers.Espers(rom, args, self.spells, self.characters)
-        self.espers.mod(self.dialogs)
+        with profile.stage("espers"):
+            self.espers = espers.Espers(rom, args, self.spells, self.characters)
+            self.espers.mod(self.dialogs)
 
-        self.shops = shops.Shops(rom, args, self.items)
-        self.shops.mod()
+        with profile.stage("shops"):
+            self.shops = shops.Shops(rom, args, self.items)
+            self.shops.mod()
 
-        self.coliseum = coliseum.Coliseum(rom, args, self.enemies, self.items)
-        self.coliseum.mod()
+        with profile.stage("coliseum"):
+            self.coliseum = coliseum.Coliseum(rom, args, self.enemies, self.items)
+            self.coliseum.mod()
 
-        self.title_graphics = title_graphics.TitleGraphics(rom, args)
-        self.title_graphics.mod()
+        with profile.stage("title_graphics"):
+            self.title_graphics = title_graphics.TitleGraphics(rom, args)
+            self.title_graphics.mod()
 
     def write(self):
         self.dialogs.write()
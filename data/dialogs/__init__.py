@@ -1,4 +1,4 @@
-def __init__():
+def init():
     from data.dialogs.dialogs import Dialogs
     dialogs = Dialogs()
 
@@ -10,4 +10,3 @@ def __init__():
 
     module.OBJECTIVES = Dialogs.OBJECTIVES
     module.BATTLE_OBJECTIVES = Dialogs.BATTLE_OBJECTIVES
-__init__()
@@ -20,9 +20,7 @@ class Dialog():
 
     def data(self):
         if self.modified:
-            # only convert modified text
-            # converting every dialog frees up a lot of space (~7-10k bytes) but is slightly slower
-            # remove modified flag and convert all if extra dialog space needed
+            # only convert modified text, Dialogs.write converts every dialog and keeps the smaller data
             return get_bytes(self.text, self.type)
         return self.original_data
 
@@ -1,7 +1,7 @@
 from data.dialogs.dialog import Dialog
 from data.structures import DataList
 from memory.space import Space
-from data.fonts import widths
+import data.fonts as fonts
 import data.text
 
 class Dialogs():
@@ -137,7 +137,7 @@ class Dialogs():
         MAX_WIDTH = 219
         space_width = 5
 
-        string_width = widths.width(string)
+        string_width = fonts.widths.width(string)
         center_start = (MAX_WIDTH - string_width) // 2 + 1
         left_spaces = center_start // space_width
         return (" " * left_spaces) + string
@@ -557,21 +557,55 @@ class Dialogs():
 
         #### end of NPC dialog tip mod
 
+    def _data(self, dialogs):
+        # convert text of every dialog in one call, dialogs in each list have the same type
+        # each pair of characters with a value is one byte and the pairs are chosen left to right, which uses the
+        # most pairs possible so the converted data is as small as it can be for the text
+        # vanilla data is not always optimal, unmodified dialogs use the converted data if it is smaller and
+        # converts back to the same text
+        if not dialogs:
+            return []
+
+        text_type = dialogs[0].type
+        converted = data.text.get_bytes_list([dialog.text for dialog in dialogs], text_type)
+
+        result = []
+        for dialog, dialog_data in zip(dialogs, converted):
+            if dialog.modified or (len(dialog_data) < len(dialog.original_data) and
+                                   data.text.get_string(dialog_data, text_type) == dialog.text):
+                result.append(dialog_data)
+            else:
+                result.append(dialog.original_data)
+        return result
+
+    def _log_sizes(self, label, dialogs, dialog_data, start_time):
+        import logging, time
+        original_size = sum(len(dialog.original_data) for dialog in dialogs)
+        size = sum(len(values) for values in dialog_data)
+        logging.info(f"{label}: {original_size} -> {size} bytes ({original_size - size} saved), "
+                     f"{(time.perf_counter() - start_time) * 1000:.1f} ms")
+
     def write(self):
-        self.dialog_data.assign([dialog.data() for dialog in self.dialogs])
+        import args, time
+        start_time = time.perf_counter()
+        dialog_data = self._data(self.dialogs)
+        if args.debug:
+            self._log_sizes("Dialogs", self.dialogs, dialog_data, start_time)
+
+        self.dialog_data.assign(dialog_data)
         for dialog_index, dialog in enumerate(self.dialogs):
             if (dialog_index < len(self.dialogs) - 1 and
                     self.dialog_data.pointers[dialog_index] < self.dialog_data.pointers[dialog_index - 1]):
                 Space.rom.set_short(self.FIRST_CE_PTR_INDEX_ADDR, dialog_index)
         self.dialog_data.write()
 
-        self.battle_message_data.assign([dialog.data() for dialog in self.battle_messages])
+        self.battle_message_data.assign(self._data(self.battle_messages))
         self.battle_message_data.write()
 
-        self.single_line_battle_dialog_data.assign([dialog.data() for dialog in self.single_line_battle_dialogs])
+        self.single_line_battle_dialog_data.assign(self._data(self.single_line_battle_dialogs))
         self.single_line_battle_dialog_data.write()
 
-        self.multi_line_battle_dialog_data.assign([dialog.data() for dialog in self.multi_line_battle_dialogs])
+        self.multi_line_battle_dialog_data.assign(self._data(self.multi_line_battle_dialogs))
         self.multi_line_battle_dialog_data.write()
 
     def print(self):
@@ -6,11 +6,14 @@ from data.enemy_packs import EnemyPacks
 from data.enemy_zones import EnemyZones
 from data.enemy_scripts import EnemyScripts
 import data.bosses as bosses
+from utils.get_ids import get_ids
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Enemies():
     DATA_START = 0xf0000
     DATA_END = 0xf2fff
-    DATA_SIZE = 32
+    DATA_SIZE = Enemy.DATA_SIZE
 
     NAMES_START = 0xfc050
     NAMES_END = 0xfd0cf
@@ -47,6 +50,7 @@ class Enemies():
 
             if enemy_index in bosses.enemy_name and enemy_index not in bosses.removed_enemy_name:
                 self.bosses.append(enemy)
+        self._update_names()
 
         self.formations = EnemyFormations(self.rom, self.args, self)
         self.packs = EnemyPacks(self.rom, self.args, self.formations)
@@ -63,16 +67,21 @@ class Enemies():
         return len(self.enemies)
 
     def get_random(self):
-        import random
-        random_enemy = random.choice(self.enemies[:255])
+        random_enemy = rng.choice(self.enemies[:255])
         return random_enemy.id
 
-    def get_enemy(self, name):
-        if name in bosses.name_enemy:
-            return bosses.name_enemy[name]
+    def _update_names(self):
+        # boss names take priority, otherwise the first enemy with the name
+        self.name_id = {}
         for enemy in self.enemies:
-            if enemy.name == name:
-                return enemy.id
+            self.name_id.setdefault(enemy.name, enemy.id)
+        self.name_id.update(bosses.name_enemy)
+
+    def get_enemy(self, name):
+        return self.get_ids([name])[0]
+
+    def get_ids(self, names):
+        return get_ids(self.name_id, names, "enemy")
 
     def get_name(self, enemy_id):
         if enemy_id in bosses.enemy_name:
@@ -92,7 +101,6 @@ class Enemies():
         self.enemies[enemy_id].drop_common = item_id
 
     def remove_fenix_downs(self):
-        import random
         from data.item_names import name_id
 
         fenix_down = name_id["Fenix Down"]
@@ -102,19 +110,19 @@ class Enemies():
 
         for enemy in self.enemies:
             if enemy.steal_common == fenix_down:
-                replacement = random.choice(possible_replacements)
+                replacement = rng.choice(possible_replacements)
                 self.set_common_steal(enemy.id, replacement)
 
             if enemy.steal_rare == fenix_down:
-                replacement = random.choice(possible_replacements)
+                replacement = rng.choice(possible_replacements)
                 self.set_rare_steal(enemy.id, replacement)
 
             if enemy.drop_common == fenix_down:
-                replacement = random.choice(possible_replacements)
+                replacement = rng.choice(possible_replacements)
                 self.set_common_drop(enemy.id, replacement)
 
             if enemy.drop_rare == fenix_down:
-                replacement = random.choice(possible_replacements)
+                replacement = rng.choice(possible_replacements)
                 self.set_rare_drop(enemy.id, replacement)
 
     def apply_scaling(self):
@@ -151,8 +159,6 @@ class Enemies():
             self.enemies[enemy_id].exp = exp * self.enemies[enemy_id].level
 
     def boss_normalize_distort_stats(self):
-        import random
-
         def stat_min_max(stat_value, min_possible, max_possible):
             distortion_percent = 0.25
             stat_distortion_amount = int(stat_value * distortion_percent)
@@ -181,7 +187,7 @@ class Enemies():
                     # max rand value is lower than the minimum for this stat, increase it to the minimum
                     stat_max = min_stat_max[stat_index]
 
-                setattr(enemy, stat, random.randint(stat_min, stat_max))
+                setattr(enemy, stat, rng.randint(stat_min, stat_max))
 
         stats = ["hp", "mp"]
         for enemy in self.bosses:
@@ -198,8 +204,8 @@ class Enemies():
             if mp_max < min_mp_max:
                 mp_max = min_mp_max
 
-            enemy.hp = random.randint(hp_min, hp_max)
-            enemy.mp = random.randint(mp_min, mp_max)
+            enemy.hp = rng.randint(hp_min, hp_max)
+            enemy.mp = rng.randint(mp_min, mp_max)
 
     def skip_shuffling_zone(self, maps, zone):
         if zone.MAP and zone.id >= maps.MAP_COUNT:
@@ -263,8 +269,7 @@ class Enemies():
                     formations.append(pack.formations[y])
 
         # shuffle the randomly encounterable formations
-        import random
-        random.shuffle(formations)
+        rng.shuffle(formations)
 
         for pack in packs:
             for y in range(pack.FORMATION_COUNT):
@@ -314,7 +319,6 @@ class Enemies():
             self.set_rare_drop(enemy.id, self.items.get_random())
 
     def shuffle_steals_drops_random(self):
-        import random
         from data.bosses import final_battle_enemy_name
 
         # Assemble the list of steals and drops
@@ -330,12 +334,12 @@ class Enemies():
         random_percent = self.args.shuffle_steals_drops_random_percent / 100.0
         number_random = int(random_percent * len(steals_drops))
         which_random = [a for a in range(len(steals_drops))]
-        random.shuffle(which_random)
+        rng.shuffle(which_random)
         for id in range(number_random):
             steals_drops[which_random[id]] = self.items.get_random()
 
         # Shuffle list & reassign to enemies
-        random.shuffle(steals_drops)
+        rng.shuffle(steals_drops)
         for enemy in self.enemies:
             if len(enemy.name) > 0:
                 self.set_common_steal(enemy.id, steals_drops.pop(0))
@@ -345,14 +349,12 @@ class Enemies():
                     self.set_rare_drop(enemy.id, steals_drops.pop(0))
 
     def set_escapable(self):
-        import random
-
         escapable_percent = self.args.encounters_escapable_random / 100.0
         for enemy in self.enemies:
             if enemy.id in bosses.enemy_name or enemy.id == self.SRBEHEMOTH2_ID or enemy.id == self.INVINCIBLE_GUARDIAN_ID:
                 continue
 
-            enemy.no_run = random.random() >= escapable_percent
+            enemy.no_run = rng.random() >= escapable_percent
 
     def no_undead_bosses(self):
         boss_ids = list(bosses.enemy_name.keys())
@@ -1,6 +1,9 @@
 from data.enemy_formation import EnemyFormation
 from data.structures import DataArray
 import data.bosses as bosses
+from utils.get_ids import get_ids
+from seed import random_stream
+rng = random_stream(__name__)
 
 class EnemyFormations():
     FLAGS_START = 0xf5900
@@ -38,7 +41,6 @@ class EnemyFormations():
 
         self.normal = []
         self.formations = []
-        self.formation_names = []
         for formation_index in range(len(self.flags_data)):
             formation = EnemyFormation(formation_index, self.flags_data[formation_index], self.enemies_data[formation_index])
             self.formations.append(formation)
@@ -46,6 +48,11 @@ class EnemyFormations():
             if formation_index not in non_normal_set:
                 self.normal.append(formation_index)
 
+        self._update_names()
+
+    def _update_names(self):
+        self.formation_names = []
+        for formation in self.formations:
             # name the formation based on enemies and their counts
             enemy_count = {}
             enemies = formation.enemies()
@@ -63,15 +70,20 @@ class EnemyFormations():
                     name += f"{self.enemies.get_name(enemy_id)} x{count}, "
             self.formation_names.append(name[:-2])
 
+        # boss names take priority, otherwise the first formation with the name
+        self.name_id = {}
+        for formation_index, formation_name in enumerate(self.formation_names):
+            self.name_id.setdefault(formation_name, formation_index)
+        self.name_id.update(bosses.name_formation)
+
     def __len__(self):
         return len(self.formations)
 
     def get_id(self, name):
-        if name in bosses.name_formation:
-            return bosses.name_formation[name]
-        for formation_index, formation_name in self.formation_names:
-            if formation_name == name:
-                return formation_index
+        return self.get_ids([name])[0]
+
+    def get_ids(self, names):
+        return get_ids(self.name_id, names, "formation")
 
     def get_name(self, formation_id):
         if formation_id in bosses.formation_name:
@@ -89,20 +101,17 @@ class EnemyFormations():
         return False
 
     def get_random_normal(self):
-        import random
-        return random.choice(self.normal)
+        return rng.choice(self.normal)
 
     def get_random_boss(self, exclude = None):
-        import random
         if exclude is None:
-            return random.choice(self.bosses)
+            return rng.choice(self.bosses)
 
         possible_bosses = [boss_id for boss_id in self.bosses if boss_id not in exclude]
-        return random.choice(possible_bosses)
+        return rng.choice(possible_bosses)
 
     def get_random_dragon(self):
-        import random
-        return random.choice(self.dragons)
+        return rng.choice(self.dragons)
 
     def set_chadarnook_position_left_screen(self):
         self.formations[456].enemy_x_positions[0] = 1 # painting
@@ -115,7 +124,6 @@ class EnemyFormations():
 
         # Enemy id's are the same as rage IDs.
         from constants.rages import rage_id
-        import random
         possible_minions = [
             rage_id["Red Wolf"],
             rage_id["Covert"],
@@ -129,7 +137,7 @@ class EnemyFormations():
             rage_id["Barb-e"],
             rage_id["Retainer"]
         ]
-        random_minion = random.choice(possible_minions)
+        random_minion = rng.choice(possible_minions)
         self.formations[bosses.name_formation["Marshal"]].enemy_ids[0] = random_minion
         self.formations[bosses.name_formation["Marshal"]].enemy_ids[1] = random_minion
 
@@ -179,6 +187,9 @@ class EnemyFormations():
         if self.args.random_encounters_chupon:
             self.add_chupon()
 
+        # after modification, update names
+        self._update_names()
+
     def print_scripts(self):
         for formation_index, formation in enumerate(self.formations):
             if formation.enable_event_script:
@@ -1,6 +1,9 @@
 from data.enemy_pack import EnemyPack4, EnemyPack2
 from data.structures import DataArray
 import data.bosses as bosses
+from utils.get_ids import get_ids
+from seed import random_stream
+rng = random_stream(__name__)
 
 class EnemyPacks():
     # the first 256 enemy packs are groups of 4 formations -- these are the Battle -> "Random Battle Groups" in ff6tools
@@ -36,6 +39,8 @@ class EnemyPacks():
             pack = EnemyPack2(pack2_index, self.pack2_data[pack2_index])
             self.packs.append(pack)
 
+        self._update_names()
+
     # Returns the list of all boss packs that can be used during randomization
     def _replaceable_bosses(self):
         dragon_packs = list(bosses.dragon_pack_name)
@@ -61,16 +66,14 @@ class EnemyPacks():
 
     # Statue locations that become available for the general boss pool
     def _replaceable_statues(self):
-        import random
         statues = list(bosses.statue_pack_name)
-        random.shuffle(statues)
+        rng.shuffle(statues)
         return statues if self.args.statue_boss_location == bosses.BossLocations.MIX else []
 
     # Dragon locations that become available for the general boss pool
     def _replaceable_dragons(self):
-        import random
         statues = list(bosses.dragon_pack_name)
-        random.shuffle(statues)
+        rng.shuffle(statues)
         return statues if self.args.dragon_boss_location == bosses.BossLocations.MIX else []
 
     # As MIX is handled in the shuffle/random functions, this is for handling the other options
@@ -81,10 +84,9 @@ class EnemyPacks():
             for statue in statues:
                 self.event_boss_replacements[statue] = statue
         elif self.args.statue_boss_location == bosses.BossLocations.SHUFFLE:
-            import random
             replacements = statues.copy()
-            random.shuffle(statues)
-            random.shuffle(replacements)
+            rng.shuffle(statues)
+            rng.shuffle(replacements)
 
             for statue in statues:
                 self.event_boss_replacements[replacements.pop()] = statue
@@ -100,10 +102,9 @@ class EnemyPacks():
             for dragon in dragons:
                 self.event_boss_replacements[dragon] = dragon
         elif self.args.dragon_boss_location == bosses.BossLocations.SHUFFLE:
-            import random
             replacements = dragons.copy()
-            random.shuffle(dragons)
-            random.shuffle(replacements)
+            rng.shuffle(dragons)
+            rng.shuffle(replacements)
 
             for dragon in dragons:
                 self.event_boss_replacements[replacements.pop()] = dragon
@@ -112,8 +113,6 @@ class EnemyPacks():
             pass
 
     def phunbaba3_safety_check(self, bosses_possible):
-        import random
-
         # bababreath in the mine cart ride causes a bug, if phunbaba3 was assigned to the
         # number 128 location then randomly choose a different boss to swap it with
         number_128_id = self.get_id("Number 128")
@@ -128,25 +127,23 @@ class EnemyPacks():
                 self.event_boss_replacements[number_128_id] = self.get_id("Phunbaba 4")
                 return
 
-            random.shuffle(possible_replacements)
+            rng.shuffle(possible_replacements)
             swap_target = possible_replacements.pop()
             self.event_boss_replacements[number_128_id] = self.event_boss_replacements[swap_target]
             self.event_boss_replacements[swap_target] = self.PHUNBABA3
 
     def shuffle_event_bosses(self):
-        import random
-
         bosses_to_replace = self._replaceable_bosses()
         bosses_possible = bosses_to_replace.copy()
 
-        random.shuffle(bosses_possible)
+        rng.shuffle(bosses_possible)
         for index, boss in enumerate(bosses_to_replace):
             self.event_boss_replacements[boss] = bosses_possible[index]
 
         self.phunbaba3_safety_check(bosses_to_replace)
 
     def randomize_event_bosses(self):
-        import args, random, objectives
+        import args, objectives
         from constants.objectives.conditions import names as possible_condition_names
 
         boss_condition_name = "Boss"
@@ -178,7 +175,7 @@ class EnemyPacks():
         if dragon_formations_needed > 0:
             all_dragon_formations = set(bosses.dragon_formation_name)
             remaining_dragon_formations = list(all_dragon_formations - required_dragon_formations)
-            random_dragon_formations = random.sample(remaining_dragon_formations, dragon_formations_needed)
+            random_dragon_formations = rng.sample(remaining_dragon_formations, dragon_formations_needed)
             required_dragon_formations |= set(random_dragon_formations)
 
         required_boss_packs = set()
@@ -201,7 +198,7 @@ class EnemyPacks():
 
         # randomizing and shuffling
         bosses_to_replace = self._replaceable_bosses()
-        random.shuffle(bosses_to_replace)
+        rng.shuffle(bosses_to_replace)
         for pack in required_boss_packs:
             self.event_boss_replacements[bosses_to_replace.pop()] = pack
 
@@ -214,10 +211,10 @@ class EnemyPacks():
             for pack in required_dragon_packs:
                 self.event_boss_replacements[bosses_to_replace.pop()] = pack
 
-        random.shuffle(bosses_to_replace)
+        rng.shuffle(bosses_to_replace)
         bosses_possible = self._replaceable_bosses()
         for boss in bosses_to_replace:
-            self.event_boss_replacements[boss] = random.choice(bosses_possible)
+            self.event_boss_replacements[boss] = rng.choice(bosses_possible)
 
         self.phunbaba3_safety_check(bosses_possible)
 
@@ -240,9 +237,8 @@ class EnemyPacks():
         if self.args.dragon_boss_location != bosses.BossLocations.MIX:
             exclude_bosses += self.formations.ALL_DRAGONS
 
-        import random
         for pack_id in packs:
-            if random.random() < boss_percent:
+            if rng.random() < boss_percent:
                 formation = self.formations.get_random_boss(exclude_bosses) # outside of the below for loop, this ensures that there's no variability within fixed encounters within the same seed
                 for formation_index in range(self.packs[pack_id].FORMATION_COUNT):
                     self.packs[pack_id].formations[formation_index] = formation
@@ -322,12 +318,17 @@ class EnemyPacks():
                 name = name[:-4]
             self.pack_names.append(name)
 
+        # boss names take priority, otherwise the first pack with the name
+        self.name_id = {}
+        for pack_id, pack_name in enumerate(self.pack_names):
+            self.name_id.setdefault(pack_name, pack_id)
+        self.name_id.update(bosses.name_pack)
+
     def get_id(self, name):
-        if name in bosses.name_pack:
-            return bosses.name_pack[name]
-        for pack in self.packs:
-            if pack.name == name:
-                return pack.id
+        return self.get_ids([name])[0]
+
+    def get_ids(self, names):
+        return get_ids(self.name_id, names, "pack")
 
     def get_name(self, pack_id):
         if pack_id in bosses.pack_name:
@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Allocate, Write
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Allocate, Plan
 import instruction.asm as asm
 
 # 0xf0 custom argument values (e.g. FIRE1 = randomly choose from fire category with tier +1)
@@ -49,7 +49,7 @@ class EnemyScriptCommands:
             asm.PLX(),
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "enemy script calculate percent of max hp")
+        space = Plan(Bank.C2, src, "enemy script calculate percent of max hp")
         hp_percent_calculate = space.start_address
 
         space = Reserve(0x21bbd, 0x21bc3, "enemy script command 0xfc 0x06 calculate hp threshold", asm.NOP())
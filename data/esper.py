@@ -2,6 +2,8 @@ from data.ability_data import AbilityData
 import data.text as text
 
 from enum import IntFlag
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Esper(AbilityData):
     NO_BONUS = 0xff
@@ -127,38 +129,35 @@ class Esper(AbilityData):
         self.bonus = bonus
 
     def randomize_rates(self):
-        import random
         for spell_index in range(self.spell_count):
-            self.spells[spell_index].rate = random.choice(self.LEARN_RATES)
+            self.spells[spell_index].rate = rng.choice(self.LEARN_RATES)
 
     def randomize_rates_tiered(self):
-        import random
         from data.esper_spell_tiers import tiers
         for spell_index in range(self.spell_count):
             if self.spells[spell_index].id in tiers[0]:
-                self.spells[spell_index].rate = random.choice([10, 15, 16, 20])
+                self.spells[spell_index].rate = rng.choice([10, 15, 16, 20])
             elif self.spells[spell_index].id in tiers[1]:
-                self.spells[spell_index].rate = random.choice([5, 6, 7, 8])
+                self.spells[spell_index].rate = rng.choice([5, 6, 7, 8])
             elif self.spells[spell_index].id in tiers[2]:
-                self.spells[spell_index].rate = random.choice([1, 2, 3, 4])
+                self.spells[spell_index].rate = rng.choice([1, 2, 3, 4])
             elif self.spells[spell_index].id in tiers[3]:
-                self.spells[spell_index].rate = random.choice([10, 15, 16, 20])
+                self.spells[spell_index].rate = rng.choice([10, 15, 16, 20])
             elif self.spells[spell_index].id in tiers[4]:
-                self.spells[spell_index].rate = random.choice([6, 7, 8, 10, 15])
+                self.spells[spell_index].rate = rng.choice([6, 7, 8, 10, 15])
             elif self.spells[spell_index].id in tiers[5]:
-                self.spells[spell_index].rate = random.choice([4, 5, 6, 7, 8])
+                self.spells[spell_index].rate = rng.choice([4, 5, 6, 7, 8])
             elif self.spells[spell_index].id in tiers[6]:
-                self.spells[spell_index].rate = random.choice([2, 3, 4])
+                self.spells[spell_index].rate = rng.choice([2, 3, 4])
             elif self.spells[spell_index].id in tiers[7]:
                 self.spells[spell_index].rate = 1
 
     def randomize_bonus(self):
-        import random
         # exclude lvl percent bonuses
         possible = [self.HP_10_PERCENT, self.HP_30_PERCENT, self.HP_50_PERCENT, self.MP_10_PERCENT,
                     self.MP_30_PERCENT, self.MP_50_PERCENT, self.HP_100_PERCENT, self.STRENGTH_1, self.STRENGTH_2,
                     self.SPEED_1, self.SPEED_2, self.STAMINA_1, self.STAMINA_2, self.MAGIC_1, self.MAGIC_2]
-        self.set_bonus(random.choice(possible))
+        self.set_bonus(rng.choice(possible))
 
     def get_equipable_characters(self):
         from data.characters import Characters
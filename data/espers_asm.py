@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Allocate, Write
+from memory.space import Bank, Reserve, Allocate, Plan
 import instruction.asm as asm
 
 def mastered_mod(espers):
@@ -36,7 +36,7 @@ def mastered_mod(espers):
         asm.JSL(0xc20006), # get actor stats -- displaced code
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "set spell offset")
+    space = Plan(Bank.F0, src, "set spell offset")
     set_spell_offset = space.start_address_snes
 
     space = Reserve(0x31b64, 0x31b67, "calculate actor's spells starting RAM offset")
@@ -93,7 +93,7 @@ def mastered_mod(espers):
         asm.LDA(0x7e9d89, asm.LNG_X), # load esper ID -- displaced code
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "check mastered")
+    space = Plan(Bank.F0, src, "check mastered")
     check_mastered = space.start_address_snes
 
     space = Reserve(0x3552e, 0x35531, "check if current esper is mastered")
@@ -113,7 +113,7 @@ def mastered_mod(espers):
         asm.RTL(),
     ]
 
-    space = Write(Bank.F0, src, "add esper learned icon")
+    space = Plan(Bank.F0, src, "add esper learned icon")
     add_icon = space.start_address_snes
 
     space = Reserve(0x3553f, 0x35543, "set icon for mastered espers", asm.NOP())
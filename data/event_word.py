@@ -46,4 +46,6 @@ def _init_event_words_mod():
     space.write(
         asm.JSR(init_event_words, asm.ABS),
     )
-_init_event_words_mod()
+
+def init():
+    _init_event_words_mod()
@@ -1,4 +1,4 @@
-import args, random
+import args
 from data.item import Item
 from data.structures import DataList
 
@@ -7,6 +7,9 @@ from constants.items import id_name, name_id
 
 import data.items_asm as items_asm
 import data.text as text
+from utils.get_ids import get_ids
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Items():
     ITEM_COUNT = 256
@@ -21,7 +24,7 @@ class Items():
     DESC_START = 0x2d6400
     DESC_END = 0x2d779f
 
-    GOOD = args.item_rewards_ids
+    GOOD = None # item reward ids, assigned by init
 
     def __init__(self, rom, args, dialogs, characters):
         self.rom = rom
@@ -52,8 +55,8 @@ class Items():
         for item in self.items:
             if item.is_equipable() and item.id != self.EMPTY and type_condition(item.type):
                 item.remove_all_equipable_characters()
-                num_chars = random.randint(rand_min, rand_max)
-                rand_chars = random.sample(self.characters.playable, num_chars)
+                num_chars = rng.randint(rand_min, rand_max)
+                rand_chars = rng.sample(self.characters.playable, num_chars)
                 for character in rand_chars:
                     item.add_equipable_character(character)
 
@@ -79,7 +82,7 @@ class Items():
                     # select characters at random from possible pool until
                     # character_group contains characters_per_item unique characters
                     while len(character_group) < characters_per_item:
-                        candidate = random.choice(possible_characters)
+                        candidate = rng.choice(possible_characters)
                         if candidate not in character_group:
                             character_group.append(candidate)
                             possible_characters.remove(candidate)
@@ -88,7 +91,7 @@ class Items():
                     for character in character_group:
                         item.add_equipable_character(self.characters.playable[character])
                 else:
-                    character_group = random.sample(possible_characters, characters_per_item)
+                    character_group = rng.sample(possible_characters, characters_per_item)
                     for character in character_group:
                         possible_characters.remove(character)
                         item.add_equipable_character(self.characters.playable[character])
@@ -108,12 +111,12 @@ class Items():
 
                 item.remove_all_equipable_characters()
 
-                num_chars = random.randint(tier_mins[item_tier], tier_maxes[item_tier])
-                rand_chars = random.sample(self.characters.playable, num_chars)
+                num_chars = rng.randint(tier_mins[item_tier], tier_maxes[item_tier])
+                rand_chars = rng.sample(self.characters.playable, num_chars)
 
                 # if Paladin Shld is only equipable by Gogo and/or Umaro, instead reroll for 3 characters
                 if item.id == 103 and all(obj.id in [13, 14] for obj in rand_chars):
-                    rand_chars = random.sample(self.characters.playable, 3)
+                    rand_chars = rng.sample(self.characters.playable, 3)
 
                 for character in rand_chars:
                     item.add_equipable_character(character)
@@ -130,9 +133,9 @@ class Items():
         for item in self.items:
             if item.is_equipable() and item.id != self.EMPTY and type_condition(item.type):
                 for character in self.characters.playable:
-                    if percent < 0 and item.equipable_by(character) and random.random() < -percent:
+                    if percent < 0 and item.equipable_by(character) and rng.random() < -percent:
                         item.remove_equipable_character(character)
-                    elif percent > 0 and not item.equipable_by(character) and random.random() < percent:
+                    elif percent > 0 and not item.equipable_by(character) and rng.random() < percent:
                         item.add_equipable_character(character)
 
     def equipable_shuffle_random(self, type_condition, percent):
@@ -145,7 +148,7 @@ class Items():
                         equipable[character].append(item)
                 item.remove_all_equipable_characters()
 
-        random.shuffle(equipable)
+        rng.shuffle(equipable)
 
         for character in range(Characters.CHARACTER_COUNT):
             for item in equipable[character]:
@@ -177,13 +180,13 @@ class Items():
 
     def random_prices_value(self):
         for item in self.items:
-            item.price = random.randint(self.args.shop_prices_random_value_min,
-                                        self.args.shop_prices_random_value_max)
+            item.price = rng.randint(self.args.shop_prices_random_value_min,
+                                     self.args.shop_prices_random_value_max)
 
     def random_prices_percent(self):
         for item in self.items:
-            price_percent = random.randint(self.args.shop_prices_random_percent_min,
-                                           self.args.shop_prices_random_percent_max) / 100.0
+            price_percent = rng.randint(self.args.shop_prices_random_percent_min,
+                                        self.args.shop_prices_random_percent_max) / 100.0
             value = int(item.price * price_percent)
             item.price = max(min(value, 2 ** 16 - 1), 0)
 
@@ -216,8 +219,8 @@ class Items():
         from data.characters import Characters
 
         for index in range(Characters.FIRST_MOOGLE, Characters.LAST_MOOGLE + 1):
-            self.characters.characters[index].init_body = random.choice(tiers[Item.ARMOR][1])
-            self.characters.characters[index].init_head = random.choice(tiers[Item.HELMET][1])
+            self.characters.characters[index].init_body = rng.choice(tiers[Item.ARMOR][1])
+            self.characters.characters[index].init_head = rng.choice(tiers[Item.HELMET][1])
 
     def mod(self):
         not_relic_condition = lambda x: x != Item.RELIC
@@ -272,8 +275,8 @@ class Items():
         if self.args.cursed_shield_battles_original:
             self.cursed_shield_battles = 256
         else:
-            self.cursed_shield_battles = random.randint(self.args.cursed_shield_battles_min,
-                                                        self.args.cursed_shield_battles_max)
+            self.cursed_shield_battles = rng.randint(self.args.cursed_shield_battles_min,
+                                                     self.args.cursed_shield_battles_max)
             items_asm.cursed_shield_mod(self.cursed_shield_battles)
 
         if self.args.stronger_atma_weapon:
@@ -304,7 +307,10 @@ class Items():
         self.desc_data.write()
 
     def get_id(self, name):
-        return name_id[name]
+        return self.get_ids([name])[0]
+
+    def get_ids(self, names):
+        return get_ids(name_id, names, "item")
 
     def get_name(self, id):
         name = self.items[id].name
@@ -367,14 +373,14 @@ class Items():
 
         try:
             # pick random type if multiple provided
-            item_type = random.choice(item_types)
+            item_type = rng.choice(item_types)
         except TypeError:
             item_type = item_types
 
-        return random.choice(self.get_items(exclude, item_type))
+        return rng.choice(self.get_items(exclude, item_type))
 
     def get_good_random(self):
-        return random.choice(self.GOOD)
+        return rng.choice(self.GOOD)
 
     def get_receive_dialog(self, item):
         return self.receive_dialogs[item]
@@ -392,3 +398,6 @@ class Items():
     def print(self):
         for item in self.items:
             item.print()
+
+def init():
+    Items.GOOD = args.item_rewards_ids
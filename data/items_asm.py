@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Write, Read
+from memory.space import Bank, Reserve, Plan, Read
 import instruction.asm as asm
 
 from data.item_names import name_id
@@ -23,7 +23,7 @@ def cursed_shield_mod(battles):
         asm.LDA(name_id["Cursed Shld"], asm.IMM8),  # a = cursed shield id
         asm.RTS(),
     ]
-    space = Write(Bank.C2, src, "cursed shield uncursed check")
+    space = Plan(Bank.C2, src, "cursed shield uncursed check")
     uncurse_shield_check = space.start_address
 
     space = Reserve(0x25ffe, 0x2600b, "cursed shield battles increment", asm.NOP())
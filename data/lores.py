@@ -2,8 +2,10 @@ from data.lore import Lore
 from data.ability_data import AbilityData
 from data.structures import DataBits, DataArray, DataList
 
-from memory.space import Bank, Reserve, Allocate, Write, Space
+from memory.space import Bank, Reserve, Allocate, Write, Space, Plan
 import instruction.asm as asm
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Lores:
     LORE_COUNT = 24
@@ -140,12 +142,10 @@ class Lores:
         )
 
     def start_random_lores(self):
-        import random
-
         self.init_data.clear_all()
 
-        number_initial_lores = random.randint(self.args.start_lores_random_min, self.args.start_lores_random_max)
-        initial_lores = random.sample(range(self.LORE_COUNT), number_initial_lores)
+        number_initial_lores = rng.randint(self.args.start_lores_random_min, self.args.start_lores_random_max)
+        initial_lores = rng.sample(range(self.LORE_COUNT), number_initial_lores)
         for lore_id in initial_lores:
             self.init_data[lore_id] = 1
 
@@ -154,21 +154,18 @@ class Lores:
         for lore in self.lores:
             mp.append(lore.mp)
 
-        import random
-        random.shuffle(mp)
+        rng.shuffle(mp)
         for lore in self.lores:
             lore.mp = mp.pop()
 
     def random_mp_value(self):
-        import random
         for lore in self.lores:
-            lore.mp = random.randint(self.args.lores_mp_random_value_min, self.args.lores_mp_random_value_max)
+            lore.mp = rng.randint(self.args.lores_mp_random_value_min, self.args.lores_mp_random_value_max)
 
     def random_mp_percent(self):
-        import random
         for lore in self.lores:
-            mp_percent = random.randint(self.args.lores_mp_random_percent_min,
-                                        self.args.lores_mp_random_percent_max) / 100.0
+            mp_percent = rng.randint(self.args.lores_mp_random_percent_min,
+                                     self.args.lores_mp_random_percent_max) / 100.0
             value = int(lore.mp * mp_percent)
             lore.mp = max(min(value, 254), 0)
 
@@ -188,7 +185,7 @@ class Lores:
         return new_desc
 
     def random_lx_levels(self, dialogs):
-        import random, re
+        import re
         LX_LORE_IDX = [Lores.L_5_DOOM, Lores.L_4_FLARE, Lores.L_3_MUDDLE, Lores.L_PEARL]
         LQ_EFFECT = 29 # the AbilityData.effect setting for L?
         NO_EFFECT = 255 # The AbilityData.effect setting for no effect
@@ -197,10 +194,10 @@ class Lores:
         for lore_index in LX_LORE_IDX:
             lore = self.lores[lore_index]
 
-            level_divisor = random.randint(0, MAX_DIVISOR)
+            level_divisor = rng.randint(0, MAX_DIVISOR)
             if lore_index == Lores.L_5_DOOM:
                 # prevent soft-locks with bosses by removing unmissable doom
-                level_divisor = random.randint(2, MAX_DIVISOR) 
+                level_divisor = rng.randint(2, MAX_DIVISOR) 
 
             lore.accuracy = level_divisor
             if level_divisor: # non-zero
@@ -241,7 +238,7 @@ class Lores:
             "magic_exit",
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "check for Lore")
+        space = Plan(Bank.C3, src, "check for Lore")
         mp_hook = space.start_address
         space = Reserve(0x30cb7, 0x30cb9, "check for magic command")
         space.write(
@@ -1,6 +1,14 @@
+from data.structures import RecordField, RecordLayout
+
 class MapEvent():
     DATA_SIZE = 0x05
 
+    LAYOUT = RecordLayout(DATA_SIZE, [
+        RecordField("x",                0),
+        RecordField("y",                1),
+        RecordField("event_address",    2, width = 3),
+    ])
+
     def __init__(self):
         self.x = 0
         self.y = 0
@@ -8,23 +16,10 @@ class MapEvent():
 
     def from_data(self, data):
         assert(len(data) == self.DATA_SIZE)
-
-        self.x = data[0]
-        self.y = data[1]
-
-        self.event_address = data[2] | (data[3] << 8) | (data[4] << 16)
+        self.LAYOUT.decode(self, data)
 
     def to_data(self):
-        data = [0x00] * self.DATA_SIZE
-
-        data[0] = self.x
-        data[1] = self.y
-
-        data[2] = self.event_address & 0xff
-        data[3] = (self.event_address & 0xff00) >> 8
-        data[4] = (self.event_address & 0xff0000) >> 16
-
-        return data
+        return self.LAYOUT.encode(self)
 
     def print(self):
         print("{}, {}: {}".format(self.x, self.y, hex(self.event_address)))
@@ -34,6 +29,14 @@ class LongMapEvent():
     # By analogy to LongMapExit()
     DATA_SIZE = 0x06
 
+    LAYOUT = RecordLayout(DATA_SIZE, [
+        RecordField("x",                0),
+        RecordField("y",                1),
+        RecordField("event_address",    2, width = 3),
+        RecordField("size",             5, 0x7f),               # tile length
+        RecordField("direction",        5, 0x80, shift = 0),    # 0 = horizontal, 128 = vertical
+    ])
+
     def __init__(self):
         self.x = 0
         self.y = 0
@@ -43,28 +46,10 @@ class LongMapEvent():
 
     def from_data(self, data):
         assert(len(data) == self.DATA_SIZE)
-
-        self.x = data[0]
-        self.y = data[1]
-
-        self.event_address = data[2] | (data[3] << 8) | (data[4] << 16)
-
-        self.size = data[5] & 0x7f  # tile length
-        self.direction = data[5] & 0x80  # 0 = horizontal, 128 = vertical
+        self.LAYOUT.decode(self, data)
 
     def to_data(self):
-        data = [0x00] * self.DATA_SIZE
-
-        data[0] = self.x
-        data[1] = self.y
-
-        data[2] = self.event_address & 0xff
-        data[3] = (self.event_address & 0xff00) >> 8
-        data[4] = (self.event_address & 0xff0000) >> 16
-
-        data[5] = self.size | self.direction
-
-        return data
+        return self.LAYOUT.encode(self)
 
     def print(self):
         print("{}, {}, {}, {}: {}".format(self.x, self.y, self.size, self.direction, hex(self.event_address)))
@@ -1,4 +1,5 @@
 from data.map_event import MapEvent, LongMapEvent
+from data.structures import RecordArray
 from event.event import *
 
 class MapEvents:
@@ -11,44 +12,27 @@ class MapEvents:
         self.read()
 
     def read(self):
-        self.events = []
-
-        for event_index in range(self.EVENT_COUNT):
-            event_data_start = self.DATA_START_ADDR + event_index * MapEvent.DATA_SIZE
-            event_data = self.rom.get_bytes(event_data_start, MapEvent.DATA_SIZE)
-
-            new_event = MapEvent()
-            new_event.from_data(event_data)
-            self.events.append(new_event)
+        self.event_data = RecordArray(self.rom, self.DATA_START_ADDR, MapEvent.LAYOUT, self.EVENT_COUNT)
+        self.events = self.event_data.records(MapEvent)
 
     def write(self):
-        for event_index, event in enumerate(self.events):
-            event_data = event.to_data()
-            event_data_start = self.DATA_START_ADDR + event_index * MapEvent.DATA_SIZE
-            # Assert that the address being written doesn't go beyond the expected end point
-            assert(event_data_start < self.DATA_END_ADDR)
-            self.rom.set_bytes(event_data_start, event_data)
+        # Assert that the address being written doesn't go beyond the expected end point
+        last_event_data_start = self.DATA_START_ADDR + (len(self.events) - 1) * MapEvent.DATA_SIZE
+        assert(last_event_data_start < self.DATA_END_ADDR)
+
+        self.event_data.set_records(self.events)
+        self.event_data.write()
 
     def mod(self):
         pass
 
-    def get_event(self, search_start, search_end, x, y):
-        for event in self.events[search_start:search_end + 1]:
-            if event.x == x and event.y == y:
-                return event
-        raise IndexError(f"get_event: could not find event at {x} {y}")
-
     def add_event(self, index, new_event):
         self.events.insert(index, new_event)
         self.EVENT_COUNT += 1
 
-    def delete_event(self, search_start, search_end, x, y):
-        for event in self.events[search_start:search_end + 1]:
-            if event.x == x and event.y == y:
-                self.events.remove(event)
-                self.EVENT_COUNT -= 1
-                return
-        raise IndexError("delete_event: could not find event at {x} {y}")
+    def delete_event(self, index):
+        del self.events[index]
+        self.EVENT_COUNT -= 1
 
     def print_range(self, start, count):
         for offset in range(count):
@@ -74,42 +58,23 @@ class LongMapEvents:
 
     def read(self):
         # by default, no LongMapEvents in the rom
-        self.events = []
-
-        for event_index in range(self.EVENT_COUNT):
-            event_data_start = self.DATA_START_ADDR_LONG + event_index * LongMapEvent.DATA_SIZE
-            event_data = self.rom.get_bytes(event_data_start, LongMapEvent.DATA_SIZE)
-
-            new_event = LongMapEvent()
-            new_event.from_data(event_data)
-            self.events.append(new_event)
+        self.event_data = RecordArray(self.rom, self.DATA_START_ADDR_LONG, LongMapEvent.LAYOUT, self.EVENT_COUNT)
+        self.events = self.event_data.records(LongMapEvent)
 
     def write(self):
-        for event_index, event in enumerate(self.events):
-            event_data = event.to_data()
-            event_data_start = self.DATA_START_ADDR_LONG + event_index * LongMapEvent.DATA_SIZE
-            self.rom.set_bytes(event_data_start, event_data)
+        self.event_data.set_records(self.events)
+        self.event_data.write()
 
     def mod(self):
         pass
 
-    def get_event(self, search_start, search_end, x, y):
-        for event in self.events[search_start:search_end + 1]:
-            if event.x == x and event.y == y:
-                return event
-        raise IndexError(f"get_event: could not find event at {x} {y}")
-
     def add_event(self, index, new_event):
         self.events.insert(index, new_event)
         self.EVENT_COUNT += 1
 
-    def delete_event(self, search_start, search_end, x, y):
-        for event in self.events[search_start:search_end + 1]:
-            if event.x == x and event.y == y:
-                self.events.remove(event)
-                self.EVENT_COUNT -= 1
-                return
-        raise IndexError("delete_event: could not find event at {x} {y}")
+    def delete_event(self, index):
+        del self.events[index]
+        self.EVENT_COUNT -= 1
 
     def print_range(self, start, count):
         for offset in range(count):
@@ -58,12 +58,9 @@ class MapExits():
         for offset in range(count):
             self.long_exits[start + offset].print()
 
-    def delete_short_exit(self, search_start, x, y):
-        for exit in self.short_exits[search_start:]:
-            if exit.x == x and exit.y == y:
-                self.short_exits.remove(exit)
-                self.SHORT_EXIT_COUNT -= 1
-                return
+    def delete_short_exit(self, index):
+        del self.short_exits[index]
+        self.SHORT_EXIT_COUNT -= 1
 
     def print(self):
         for short_exit in self.short_exits:
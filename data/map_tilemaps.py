@@ -0,0 +1,113 @@
+from collections import Counter, OrderedDict
+from data.structures import DataPointers
+
+class MapTilemaps():
+    # compressed map layer tilemaps, pointers are offsets from DATA_START
+    # the last pointer is not a tilemap, it marks the end of the tilemap data
+    PTRS_START = 0x19cd90
+    PTRS_END = 0x19d1af
+    DATA_START = 0x19d1b0
+
+    CACHE_SIZE = 32 # number of unmodified decompressed tilemaps to keep
+
+    def __init__(self, rom):
+        self.rom = rom
+        self.read()
+
+    def read(self):
+        self.pointers = DataPointers(self.rom, self.PTRS_START, self.PTRS_END, self.rom.LONG_PTR_SIZE)
+        self.data_end = self.pointers[len(self.pointers) - 1]
+
+        self.cache = OrderedDict()  # decompressed tilemaps, least recently used first
+        self.modified = {}          # decompressed tilemaps which need to be recompressed
+
+    def __len__(self):
+        return len(self.pointers) - 1
+
+    def _block_sizes(self):
+        # size of each tilemap's space, tilemaps which share an address share the space
+        addresses = sorted(set(self.pointers[tilemap_id] for tilemap_id in range(len(self))) | {self.data_end})
+        next_addresses = dict(zip(addresses, addresses[1:]))
+        return [next_addresses.get(self.pointers[tilemap_id], self.pointers[tilemap_id]) - self.pointers[tilemap_id]
+                for tilemap_id in range(len(self))]
+
+    def _decompressed(self, tilemap_id):
+        from utils.compression import decompress
+        if tilemap_id in self.modified:
+            return self.modified[tilemap_id]
+
+        if tilemap_id in self.cache:
+            self.cache.move_to_end(tilemap_id)
+            return self.cache[tilemap_id]
+
+        address = self.DATA_START + self.pointers[tilemap_id]
+        tilemap = decompress(self.rom.get_view(address, self.rom.get_short(address)))
+
+        self.cache[tilemap_id] = tilemap
+        if len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last = False)
+        return tilemap
+
+    def get(self, tilemap_id):
+        # read-only view of decompressed tilemap
+        return memoryview(self._decompressed(tilemap_id)).toreadonly()
+
+    def edit(self, tilemap_id):
+        # decompressed tilemap to modify, it is recompressed when written
+        tilemap = self._decompressed(tilemap_id)
+        self.cache.pop(tilemap_id, None)
+        self.modified[tilemap_id] = tilemap
+        return tilemap
+
+    def write(self):
+        from utils.compression import compress
+        if not self.modified:
+            return
+
+        block_sizes = self._block_sizes()
+        compressed = {tilemap_id : compress(tilemap) for tilemap_id, tilemap in self.modified.items()}
+        address_counts = Counter(self.pointers[tilemap_id] for tilemap_id in range(len(self)))
+        if all(len(data) <= block_sizes[tilemap_id] and address_counts[self.pointers[tilemap_id]] == 1
+               for tilemap_id, data in compressed.items()):
+            # every modified tilemap fits in its own space, nothing needs to move
+            for tilemap_id, data in compressed.items():
+                self.rom.set_bytes(self.DATA_START + self.pointers[tilemap_id], data)
+        else:
+            self._repack(compressed, block_sizes)
+
+        for tilemap_id, tilemap in self.modified.items():
+            self.cache[tilemap_id] = tilemap
+        self.modified = {}
+        while len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last = False)
+
+    def _repack(self, compressed, block_sizes):
+        # copy blocks in address order with modified tilemaps replaced, unmodified tilemaps which shared an address
+        # still share it, modified tilemaps get their own space
+        blocks = {}
+        for tilemap_id in range(len(self)):
+            if tilemap_id not in compressed:
+                address = self.pointers[tilemap_id]
+                blocks.setdefault(address, []).append(tilemap_id)
+        order = sorted([(address, 0, tilemap_ids) for address, tilemap_ids in blocks.items()] +
+                       [(self.pointers[tilemap_id], 1, [tilemap_id]) for tilemap_id in compressed])
+
+        start = order[0][0]
+        data = bytearray()
+        new_pointers = {}
+        for address, is_modified, tilemap_ids in order:
+            if is_modified:
+                block = compressed[tilemap_ids[0]]
+            else:
+                block = self.rom.get_view(self.DATA_START + address, block_sizes[tilemap_ids[0]])
+            for tilemap_id in tilemap_ids:
+                new_pointers[tilemap_id] = start + len(data)
+            data += block
+
+        # Assert that the tilemaps still fit between the first tilemap and the end of the tilemap data
+        assert start + len(data) <= self.data_end, f"map tilemaps too large ({start + len(data) - self.data_end} bytes)"
+
+        self.rom.set_bytes(self.DATA_START + start, data)
+        for tilemap_id, pointer in new_pointers.items():
+            self.pointers[tilemap_id] = pointer
+        self.pointers.write()
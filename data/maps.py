@@ -11,11 +11,14 @@ from data.map_event import MapEvent, LongMapEvent
 import data.map_exits as exits
 from data.map_exit import ShortMapExit, LongMapExit
 
+from data.map_tilemaps import MapTilemaps
+
 import data.world_map_event_modifications as world_map_event_modifications
 from data.world_map import WorldMap
 
 import instruction.asm as asm
 from memory.space import Reserve
+from utils.fenwick import FenwickTree
 
 class Maps():
     MAP_COUNT = 416
@@ -38,13 +41,80 @@ class Maps():
         self.events = events.MapEvents(rom)
         self.long_events = events.LongMapEvents(rom)
         self.exits = exits.MapExits(rom)
+        self.tilemaps = MapTilemaps(rom)
         self.world_map_event_modifications = world_map_event_modifications.WorldMapEventModifications(rom)
         self.world_map = WorldMap(rom, args)
         self.read()
 
+    def _read_pointers(self, ptr_start):
+        ptrs = []
+        for map_index in range(self.MAP_COUNT):
+            ptr_address = ptr_start + map_index * self.rom.SHORT_PTR_SIZE
+            ptr = self.rom.get_bytes(ptr_address, self.rom.SHORT_PTR_SIZE)
+            ptrs.append(ptr[0] | (ptr[1] << 8))
+        return ptrs
+
+    def _init_records(self, record_type, ptrs):
+        # each map's records are stored contiguously in map order, keep the first pointer and the size in bytes of
+        # every map's records so adding/removing a record only updates one size instead of shifting every later pointer
+        # the last map's size is not in the pointer table, it starts empty
+        sizes = [next_ptr - ptr for ptr, next_ptr in zip(ptrs, ptrs[1:])] + [0]
+        self.first_ptrs[record_type] = ptrs[0]
+        self.record_sizes[record_type] = FenwickTree(sizes)
+
+    def _first_record(self, record_type, map_id, data_size):
+        # index of map's first record in the list of all records of record_type
+        return self.record_sizes[record_type].prefix_sum(map_id) // data_size
+
+    def _record_count(self, record_type, map_id, data_size):
+        return self.record_sizes[record_type].get(map_id) // data_size
+
+    def _init_tiles(self, record_type, records, data_size):
+        # records of each map by (map_id, x, y) in list order, kept up to date when records are added or deleted
+        # so finding the record on a tile does not search the map's records
+        tiles = {}
+        for map_id, offset in enumerate(self.record_sizes[record_type].prefix_sums()):
+            first_record = offset // data_size
+            last_record = first_record + self._record_count(record_type, map_id, data_size)
+            for record in records[first_record : last_record]:
+                tiles.setdefault((map_id, record.x, record.y), []).append(record)
+        self.tiles[record_type] = tiles
+
+    def _tile_record(self, record_type, map_id, x, y):
+        tile_records = self.tiles[record_type].get((map_id, x, y))
+        if tile_records:
+            return tile_records[0]
+        return None
+
+    def _add_tile_record(self, record_type, map_id, record):
+        # new records are inserted before the map's other records
+        self.tiles[record_type].setdefault((map_id, record.x, record.y), []).insert(0, record)
+
+    def _remove_tile_record(self, record_type, map_id, x, y, records, data_size):
+        # remove first record of map at x, y from the tile index and return its index in records, None if not found
+        key = (map_id, x, y)
+        tile_records = self.tiles[record_type].get(key)
+        if not tile_records:
+            return None
+
+        record = tile_records.pop(0)
+        if not tile_records:
+            del self.tiles[record_type][key]
+
+        first_record = self._first_record(record_type, map_id, data_size)
+        last_record = first_record + self._record_count(record_type, map_id, data_size)
+        return records.index(record, first_record, last_record)
+
+    def _pointers(self, record_type):
+        first_ptr = self.first_ptrs[record_type]
+        return [first_ptr + offset for offset in self.record_sizes[record_type].prefix_sums()]
+
     def read(self):
         self.maps = []
         self.properties = []
+        self.first_ptrs = {}
+        self.record_sizes = {}
+        self.tiles = {}
 
         for map_index in range(self.MAP_COUNT):
             self.maps.append({"id" : map_index})
@@ -57,25 +127,20 @@ class Maps():
             entrance_event = self.rom.get_bytes(entrance_event_start, self.rom.LONG_PTR_SIZE)
             self.maps[map_index]["entrance_event_address"] = entrance_event[0] | (entrance_event[1] << 8) | (entrance_event[2] << 16)
 
-            events_ptr_address = self.EVENT_PTR_START + map_index * self.rom.SHORT_PTR_SIZE
-            events_ptr = self.rom.get_bytes(events_ptr_address, self.rom.SHORT_PTR_SIZE)
-            self.maps[map_index]["events_ptr"] = events_ptr[0] | (events_ptr[1] << 8)
-
-            # LONG EVENTS INITIALIZATION: Vanilla code has no long events.
-            # Set initial offset to the vanilla value for each map.
-            self.maps[map_index]["long_events_ptr"] = self.maps[0]["events_ptr"]
+        events_ptrs = self._read_pointers(self.EVENT_PTR_START)
+        self._init_records("events", events_ptrs)
 
-            short_exit_ptr_address = self.SHORT_EXIT_PTR_START + map_index * self.rom.SHORT_PTR_SIZE
-            short_exit_ptr = self.rom.get_bytes(short_exit_ptr_address, self.rom.SHORT_PTR_SIZE)
-            self.maps[map_index]["short_exits_ptr"] = short_exit_ptr[0] | (short_exit_ptr[1] << 8)
+        # LONG EVENTS INITIALIZATION: Vanilla code has no long events.
+        # Set initial offset to the vanilla value for each map.
+        self._init_records("long_events", [events_ptrs[0]] * self.MAP_COUNT)
 
-            long_exit_ptr_address = self.LONG_EXIT_PTR_START + map_index * self.rom.SHORT_PTR_SIZE
-            long_exit_ptr = self.rom.get_bytes(long_exit_ptr_address, self.rom.SHORT_PTR_SIZE)
-            self.maps[map_index]["long_exits_ptr"] = long_exit_ptr[0] | (long_exit_ptr[1] << 8)
+        self._init_records("short_exits", self._read_pointers(self.SHORT_EXIT_PTR_START))
+        self._init_records("long_exits", self._read_pointers(self.LONG_EXIT_PTR_START))
+        self._init_records("npcs", self._read_pointers(self.NPCS_PTR_START))
 
-            npcs_ptr_address = self.NPCS_PTR_START + map_index * self.rom.SHORT_PTR_SIZE
-            npcs_ptr = self.rom.get_bytes(npcs_ptr_address, self.rom.SHORT_PTR_SIZE)
-            self.maps[map_index]["npcs_ptr"] = npcs_ptr[0] | (npcs_ptr[1] << 8)
+        self._init_tiles("events", self.events.events, MapEvent.DATA_SIZE)
+        self._init_tiles("long_events", self.long_events.events, LongMapEvent.DATA_SIZE)
+        self._init_tiles("short_exits", self.exits.short_exits, ShortMapExit.DATA_SIZE)
 
     def set_entrance_event(self, map_id, event_address):
         self.maps[map_id]["entrance_event_address"] = event_address
@@ -84,7 +149,7 @@ class Maps():
         return self.maps[map_id]["entrance_event_address"]
 
     def get_npc_index(self, map_id, npc_id):
-        first_npc_index = (self.maps[map_id]["npcs_ptr"] - self.maps[0]["npcs_ptr"]) // NPC.DATA_SIZE
+        first_npc_index = self._first_record("npcs", map_id, NPC.DATA_SIZE)
         return first_npc_index + (npc_id - 0x10)
 
     def get_npc(self, map_id, npc_id):
@@ -94,23 +159,21 @@ class Maps():
         prev_npc_count = self.get_npc_count(map_id)
         new_npc_id = 0x10 + prev_npc_count
 
-        for map_index in range(map_id + 1, self.MAP_COUNT):
-            self.maps[map_index]["npcs_ptr"] += NPC.DATA_SIZE
+        self.record_sizes["npcs"].add(map_id, NPC.DATA_SIZE)
 
-        npc_index = (self.maps[map_id]["npcs_ptr"] - self.maps[0]["npcs_ptr"]) // NPC.DATA_SIZE
+        npc_index = self._first_record("npcs", map_id, NPC.DATA_SIZE)
         npc_index += prev_npc_count # add new npc to the end of current map's npcs
         self.npcs.add_npc(npc_index, new_npc)
 
         return new_npc_id # return id of the new npc
 
     def remove_npc(self, map_id, npc_id):
-        for map_index in range(map_id + 1, self.MAP_COUNT):
-            self.maps[map_index]["npcs_ptr"] -= NPC.DATA_SIZE
+        self.record_sizes["npcs"].add(map_id, -NPC.DATA_SIZE)
 
         self.npcs.remove_npc(self.get_npc_index(map_id, npc_id))
 
     def get_npc_count(self, map_id):
-        return (self.maps[map_id + 1]["npcs_ptr"] - self.maps[map_id]["npcs_ptr"]) // NPC.DATA_SIZE
+        return self._record_count("npcs", map_id, NPC.DATA_SIZE)
 
     def get_chest_count(self, map_id):
         return self.chests.chest_count(map_id)
@@ -119,87 +182,85 @@ class Maps():
         self.chests.set_item(map_id, x, y, item_id)
 
     def get_event_count(self, map_id):
-        return (self.maps[map_id + 1]["events_ptr"] - self.maps[map_id]["events_ptr"]) // MapEvent.DATA_SIZE
+        return self._record_count("events", map_id, MapEvent.DATA_SIZE)
 
     def print_events(self, map_id):
-        first_event_id = (self.maps[map_id]["events_ptr"] - self.maps[0]["events_ptr"]) // MapEvent.DATA_SIZE
+        first_event_id = self._first_record("events", map_id, MapEvent.DATA_SIZE)
 
         self.events.print_range(first_event_id, self.get_event_count(map_id))
 
     def get_event(self, map_id, x, y):
-        first_event_id = (self.maps[map_id]["events_ptr"] - self.maps[0]["events_ptr"]) // MapEvent.DATA_SIZE
-        last_event_id = first_event_id + self.get_event_count(map_id)
-        return self.events.get_event(first_event_id, last_event_id, x, y)
+        event = self._tile_record("events", map_id, x, y)
+        if event is None:
+            raise IndexError(f"get_event: could not find event at {x} {y}")
+        return event
 
     def add_event(self, map_id, new_event):
-        for map_index in range(map_id + 1, self.MAP_COUNT):
-            self.maps[map_index]["events_ptr"] += MapEvent.DATA_SIZE
+        self.record_sizes["events"].add(map_id, MapEvent.DATA_SIZE)
 
-        event_id = (self.maps[map_id]["events_ptr"] - self.maps[0]["events_ptr"]) // MapEvent.DATA_SIZE
+        event_id = self._first_record("events", map_id, MapEvent.DATA_SIZE)
         self.events.add_event(event_id, new_event)
+        self._add_tile_record("events", map_id, new_event)
 
     def delete_event(self, map_id, x, y):
-        for map_index in range(map_id + 1, self.MAP_COUNT):
-            self.maps[map_index]["events_ptr"] -= MapEvent.DATA_SIZE
+        event_id = self._remove_tile_record("events", map_id, x, y, self.events.events, MapEvent.DATA_SIZE)
+        if event_id is None:
+            raise IndexError(f"delete_event: could not find event at {x} {y}")
 
-        first_event_id = (self.maps[map_id]["events_ptr"] - self.maps[0]["events_ptr"]) // MapEvent.DATA_SIZE
-        last_event_id = first_event_id + self.get_event_count(map_id)
-        self.events.delete_event(first_event_id, last_event_id, x, y)
+        self.record_sizes["events"].add(map_id, -MapEvent.DATA_SIZE)
+        self.events.delete_event(event_id)
 
     ### LONG EVENTS ###
     def get_long_event_count(self, map_id):
-        return (self.maps[map_id + 1]["long_events_ptr"] - self.maps[map_id][
-            "long_events_ptr"]) // LongMapEvent.DATA_SIZE
+        return self._record_count("long_events", map_id, LongMapEvent.DATA_SIZE)
 
     def print_long_events(self, map_id):
-        first_event_id = (self.maps[map_id]["long_events_ptr"] - self.maps[0][
-            "long_events_ptr"]) // LongMapEvent.DATA_SIZE
+        first_event_id = self._first_record("long_events", map_id, LongMapEvent.DATA_SIZE)
 
         self.long_events.print_range(first_event_id, self.get_event_count(map_id))
 
     def get_long_event(self, map_id, x, y):
-        first_event_id = (self.maps[map_id]["long_events_ptr"] - self.maps[0][
-            "long_events_ptr"]) // LongMapEvent.DATA_SIZE
-        last_event_id = first_event_id + self.get_event_count(map_id)
-        return self.long_events.get_event(first_event_id, last_event_id, x, y)
+        event = self._tile_record("long_events", map_id, x, y)
+        if event is None:
+            raise IndexError(f"get_event: could not find event at {x} {y}")
+        return event
 
     def add_long_event(self, map_id, new_event):
-        for map_index in range(map_id + 1, self.MAP_COUNT):
-            self.maps[map_index]["long_events_ptr"] += LongMapEvent.DATA_SIZE
+        self.record_sizes["long_events"].add(map_id, LongMapEvent.DATA_SIZE)
 
-        event_id = (self.maps[map_id]["long_events_ptr"] - self.maps[0][
-            "long_events_ptr"]) // LongMapEvent.DATA_SIZE
+        event_id = self._first_record("long_events", map_id, LongMapEvent.DATA_SIZE)
         self.long_events.add_event(event_id, new_event)
+        self._add_tile_record("long_events", map_id, new_event)
 
     def delete_long_event(self, map_id, x, y):
-        for map_index in range(map_id + 1, self.MAP_COUNT):
-            self.maps[map_index]["long_events_ptr"] -= LongMapEvent.DATA_SIZE
+        event_id = self._remove_tile_record("long_events", map_id, x, y, self.long_events.events, LongMapEvent.DATA_SIZE)
+        if event_id is None:
+            raise IndexError(f"delete_event: could not find event at {x} {y}")
 
-        first_event_id = (self.maps[map_id]["long_events_ptr"] - self.maps[0][
-            "long_events_ptr"]) // LongMapEvent.DATA_SIZE
-        last_event_id = first_event_id + self.get_event_count(map_id)
-        self.long_events.delete_event(first_event_id, last_event_id, x, y)
+        self.record_sizes["long_events"].add(map_id, -LongMapEvent.DATA_SIZE)
+        self.long_events.delete_event(event_id)
     ### LONG EVENTS ###
 
     def get_short_exit_count(self, map_id):
-        return (self.maps[map_id + 1]["short_exits_ptr"] - self.maps[map_id]["short_exits_ptr"]) // ShortMapExit.DATA_SIZE
+        return self._record_count("short_exits", map_id, ShortMapExit.DATA_SIZE)
 
     def print_short_exits(self, map_id):
-        first_exit_id = (self.maps[map_id]["short_exits_ptr"] - self.maps[0]["short_exits_ptr"]) // ShortMapExit.DATA_SIZE
+        first_exit_id = self._first_record("short_exits", map_id, ShortMapExit.DATA_SIZE)
         self.exits.print_short_exit_range(first_exit_id, self.get_short_exit_count(map_id))
 
     def delete_short_exit(self, map_id, x, y):
-        for map_index in range(map_id + 1, self.MAP_COUNT):
-            self.maps[map_index]["short_exits_ptr"] -= ShortMapExit.DATA_SIZE
+        exit_id = self._remove_tile_record("short_exits", map_id, x, y, self.exits.short_exits, ShortMapExit.DATA_SIZE)
+        if exit_id is None:
+            return
 
-        map_first_short_exit = (self.maps[map_id]["short_exits_ptr"] - self.maps[0]["short_exits_ptr"]) // ShortMapExit.DATA_SIZE
-        self.exits.delete_short_exit(map_first_short_exit, x, y)
+        self.record_sizes["short_exits"].add(map_id, -ShortMapExit.DATA_SIZE)
+        self.exits.delete_short_exit(exit_id)
 
     def get_long_exit_count(self, map_id):
-        return (self.maps[map_id + 1]["long_exits_ptr"] - self.maps[map_id]["long_exits_ptr"]) // LongMapExit.DATA_SIZE
+        return self._record_count("long_exits", map_id, LongMapExit.DATA_SIZE)
 
     def print_long_exits(self, map_id):
-        first_exit_id = (self.maps[map_id]["long_exits_ptr"] - self.maps[0]["long_exits_ptr"]) // LongMapExit.DATA_SIZE
+        first_exit_id = self._first_record("long_exits", map_id, LongMapExit.DATA_SIZE)
         self.exits.print_long_exit_range(first_exit_id, self.get_long_exit_count(map_id))
 
     def _fix_imperial_camp_boxes(self):
@@ -207,33 +268,17 @@ class Maps():
         # there is a box which can be walked into but not out of which causes the game to lock
         # fix the three boxes to no longer be walkable
 
-        from utils.compression import compress, decompress
         layer1_tilemap = 0x1c
-        tilemap_ptrs_start = 0x19cd90
-        tilemap_ptr_addr = tilemap_ptrs_start + layer1_tilemap * self.rom.LONG_PTR_SIZE
-        tilemap_addr_bytes = self.rom.get_bytes(tilemap_ptr_addr, self.rom.LONG_PTR_SIZE)
-        tilemap_addr = int.from_bytes(tilemap_addr_bytes, byteorder = "little")
-
-        next_tilemap_ptr_addr = tilemap_ptr_addr + self.rom.LONG_PTR_SIZE
-        next_tilemap_addr_bytes = self.rom.get_bytes(next_tilemap_ptr_addr, self.rom.LONG_PTR_SIZE)
-        next_tilemap_addr = int.from_bytes(next_tilemap_addr_bytes, byteorder = "little")
-
-        tilemaps_start = 0x19d1b0
-        tilemap_len = next_tilemap_addr - tilemap_addr
-        tilemap = self.rom.get_bytes(tilemaps_start + tilemap_addr, tilemap_len)
-        decompressed = decompress(tilemap)
+        tilemap = self.tilemaps.edit(layer1_tilemap)
 
         map_width = 64
         impassable_box_tile = 62 # box tile that cannot be entered
         coordinates = [(19, 13), (15, 14), (18, 14)] # coordinates of boxes to change
         for coordinate in coordinates:
-            decompressed[coordinate[0] + coordinate[1] * map_width] = impassable_box_tile
-
-        compressed = compress(decompressed)
-        self.rom.set_bytes(tilemaps_start + tilemap_addr, compressed)
+            tilemap[coordinate[0] + coordinate[1] * map_width] = impassable_box_tile
 
     def _fix_Cid_timer_glitch(self):
-        from memory.space import Bank, Write
+        from memory.space import Bank, Plan
         import instruction.field as field
         from event.event import EVENT_CODE_START
         # If you start Cid's timer and then leave, the timer can affect event tile, NPC and objective triggering
@@ -249,7 +294,7 @@ class Maps():
             "SetBit",
             field.Return(),
         ]
-        space = Write(Bank.CC, src, 'Reset Cid event timer')
+        space = Plan(Bank.CC, src, 'Reset Cid event timer')
 
         map_id = 0x18c  # Cid's Island, Outside
 
@@ -291,8 +336,15 @@ class Maps():
         self.events.write()
         self.long_events.write()
         self.exits.write()
+        self.tilemaps.write()
         self.world_map_event_modifications.write()
 
+        events_ptrs = self._pointers("events")
+        long_events_ptrs = self._pointers("long_events")
+        short_exits_ptrs = self._pointers("short_exits")
+        long_exits_ptrs = self._pointers("long_exits")
+        npcs_ptrs = self._pointers("npcs")
+
         for map_index, cur_map in enumerate(self.maps):
             self.properties[map_index].write()
 
@@ -305,31 +357,31 @@ class Maps():
 
             events_ptr_start = self.EVENT_PTR_START + cur_map["id"] * self.rom.SHORT_PTR_SIZE
             events_ptr_bytes = [0x00] * self.rom.SHORT_PTR_SIZE
-            events_ptr_bytes[0] = cur_map["events_ptr"] & 0xff
-            events_ptr_bytes[1] = (cur_map["events_ptr"] & 0xff00) >> 8
+            events_ptr_bytes[0] = events_ptrs[map_index] & 0xff
+            events_ptr_bytes[1] = (events_ptrs[map_index] & 0xff00) >> 8
             self.rom.set_bytes(events_ptr_start, events_ptr_bytes)
 
             # LONG EVENTS
             long_events_ptr_start = self.LONG_EVENT_PTR_START + cur_map["id"] * self.rom.SHORT_PTR_SIZE
             long_events_ptr_bytes = [0x00] * self.rom.SHORT_PTR_SIZE
-            long_events_ptr_bytes[0] = cur_map["long_events_ptr"] & 0xff
-            long_events_ptr_bytes[1] = (cur_map["long_events_ptr"] & 0xff00) >> 8
+            long_events_ptr_bytes[0] = long_events_ptrs[map_index] & 0xff
+            long_events_ptr_bytes[1] = (long_events_ptrs[map_index] & 0xff00) >> 8
             self.rom.set_bytes(long_events_ptr_start, long_events_ptr_bytes)
 
             short_exits_ptr_start = self.SHORT_EXIT_PTR_START + cur_map["id"] * self.rom.SHORT_PTR_SIZE
             short_exits_bytes = [0x00] * self.rom.SHORT_PTR_SIZE
-            short_exits_bytes[0] = cur_map["short_exits_ptr"] & 0xff
-            short_exits_bytes[1] = (cur_map["short_exits_ptr"] & 0xff00) >> 8
+            short_exits_bytes[0] = short_exits_ptrs[map_index] & 0xff
+            short_exits_bytes[1] = (short_exits_ptrs[map_index] & 0xff00) >> 8
             self.rom.set_bytes(short_exits_ptr_start, short_exits_bytes)
 
             long_exits_ptr_start = self.LONG_EXIT_PTR_START + cur_map["id"] * self.rom.SHORT_PTR_SIZE
             long_exits_bytes = [0x00] * self.rom.SHORT_PTR_SIZE
-            long_exits_bytes[0] = cur_map["long_exits_ptr"] & 0xff
-            long_exits_bytes[1] = (cur_map["long_exits_ptr"] & 0xff00) >> 8
+            long_exits_bytes[0] = long_exits_ptrs[map_index] & 0xff
+            long_exits_bytes[1] = (long_exits_ptrs[map_index] & 0xff00) >> 8
             self.rom.set_bytes(long_exits_ptr_start, long_exits_bytes)
 
             npcs_ptr_address = self.NPCS_PTR_START + cur_map["id"] * self.rom.SHORT_PTR_SIZE
             npcs_ptr = [0x00] * self.rom.SHORT_PTR_SIZE
-            npcs_ptr[0] = cur_map["npcs_ptr"] & 0xff
-            npcs_ptr[1] = (cur_map["npcs_ptr"] & 0xff00) >> 8
+            npcs_ptr[0] = npcs_ptrs[map_index] & 0xff
+            npcs_ptr[1] = (npcs_ptrs[map_index] & 0xff00) >> 8
             self.rom.set_bytes(npcs_ptr_address, npcs_ptr)
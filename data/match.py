@@ -1,20 +1,18 @@
+from data.structures import RecordField, RecordLayout
+
 class Match():
     DATA_SIZE = 4
 
+    LAYOUT = RecordLayout(DATA_SIZE, [
+        RecordField("opponent",         0),
+        RecordField("unknown",          1),
+        RecordField("reward",           2),
+        RecordField("reward_hidden",    3),
+    ])
+
     def __init__(self, data):
         assert(len(data) == self.DATA_SIZE)
-
-        self.opponent = data[0]
-        self.unknown = data[1]
-        self.reward = data[2]
-        self.reward_hidden = data[3]
+        self.LAYOUT.decode(self, data)
 
     def data(self):
-        data = [0x00] * self.DATA_SIZE
-
-        data[0] = self.opponent
-        data[1] = self.unknown
-        data[2] = self.reward
-        data[3] = self.reward_hidden
-
-        return data
+        return self.LAYOUT.encode(self)
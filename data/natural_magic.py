@@ -3,6 +3,8 @@ from data.structures import DataArray
 
 from memory.space import Bank, Reserve, Allocate
 import instruction.asm as asm
+from seed import random_stream
+rng = random_stream(__name__)
 
 class NaturalMagic:
     TERRA_SPELL_DATA_START = 0x2ce3c0
@@ -113,12 +115,11 @@ class NaturalMagic:
             )
 
     def mod_learners(self):
-        import random
         from data.characters import Characters
         possible_learners = list(range(Characters.CHARACTER_COUNT - 2)) # exclude gogo/umaro
 
         if self.args.natural_magic1 == "random":
-            self.learner1 = random.choice(possible_learners)
+            self.learner1 = rng.choice(possible_learners)
             self.learner1_name = self.characters.get_name(self.learner1)
         elif self.args.natural_magic1:
             self.learner1 = self.characters.get_by_name(self.args.natural_magic1).id
@@ -133,7 +134,7 @@ class NaturalMagic:
             pass
 
         if self.args.natural_magic2 == "random":
-            self.learner2 = random.choice(possible_learners)
+            self.learner2 = rng.choice(possible_learners)
             self.learner2_name = self.characters.get_name(self.learner2)
         elif self.args.natural_magic2:
             self.learner2 = self.characters.get_by_name(self.args.natural_magic2).id
@@ -171,16 +172,14 @@ class NaturalMagic:
                     celes_spell.level = 0
 
     def randomize_levels1(self):
-        import random
-        levels = random.sample(range(1, 100), len(self.terra_spells))
+        levels = rng.sample(range(1, 100), len(self.terra_spells))
         sorted_levels = sorted(levels)
 
         for index, spell in enumerate(self.terra_spells):
             spell.level = sorted_levels[index]
 
     def randomize_levels2(self):
-        import random
-        levels = random.sample(range(1, 100), len(self.celes_spells))
+        levels = rng.sample(range(1, 100), len(self.celes_spells))
         sorted_levels = sorted(levels)
 
         for index, spell in enumerate(self.celes_spells):
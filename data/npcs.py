@@ -1,4 +1,5 @@
 from data.npc import NPC
+from data.structures import RecordArray
 
 class NPCs():
     NPC_COUNT = 2192
@@ -10,15 +11,8 @@ class NPCs():
         self.read()
 
     def read(self):
-        self.npcs = []
-
-        for npc_index in range(self.NPC_COUNT):
-            npc_data_start = self.DATA_START_ADDR + npc_index * NPC.DATA_SIZE
-            npc_data = self.rom.get_bytes(npc_data_start, NPC.DATA_SIZE)
-
-            new_npc = NPC()
-            new_npc.from_data(npc_data)
-            self.npcs.append(new_npc)
+        self.npc_data = RecordArray(self.rom, self.DATA_START_ADDR, NPC.LAYOUT, self.NPC_COUNT)
+        self.npcs = self.npc_data.records(NPC)
 
     def mod(self, characters):
         for npc in self.npcs:
@@ -49,10 +43,10 @@ class NPCs():
             npc.print()
 
     def write(self):
-        for npc_index, npc in enumerate(self.npcs):
-            npc_data = npc.to_data()
-            npc_data_start = self.DATA_START_ADDR + npc_index * NPC.DATA_SIZE
-            # Assert that the address being written doesn't go beyond the expected end point
-            # If it does, then the npc_index is too high -- you've added more NPCs than the ROM can handle
-            assert(npc_data_start < self.DATA_END_ADDR)
-            self.rom.set_bytes(npc_data_start, npc_data)
+        # Assert that the address being written doesn't go beyond the expected end point
+        # If it does, then the npc_index is too high -- you've added more NPCs than the ROM can handle
+        last_npc_data_start = self.DATA_START_ADDR + (len(self.npcs) - 1) * NPC.DATA_SIZE
+        assert(last_npc_data_start < self.DATA_END_ADDR)
+
+        self.npc_data.set_records(self.npcs)
+        self.npc_data.write()
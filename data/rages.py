@@ -1,6 +1,8 @@
 from data.rage import Rage
 from data.structures import DataBits, DataArray
 from data.ability_data import AbilityData
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Rages():
     RAGE_COUNT = 256 # 255 available
@@ -39,13 +41,11 @@ class Rages():
             self.abilities.append(ability)
 
     def start_random_rages(self):
-        import random
-
         self.init_data.clear_all()
         possible_rages = [x for x in range(self.RAGE_COUNT) if x != self.PUGS_RAGE_ID]
 
-        number_initial_rages = random.randint(self.args.start_rages_random_min, self.args.start_rages_random_max)
-        initial_rages = random.sample(possible_rages, number_initial_rages)
+        number_initial_rages = rng.randint(self.args.start_rages_random_min, self.args.start_rages_random_max)
+        initial_rages = rng.sample(possible_rages, number_initial_rages)
         for rage_id in initial_rages:
             self.init_data[rage_id] = 1
 
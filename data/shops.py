@@ -1,5 +1,7 @@
 from data.shop import Shop
 from data.structures import DataArray
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Shops():
     DATA_START = 0x47ac0
@@ -53,7 +55,6 @@ class Shops():
         }
         type_items[Shop.ITEM].extend(type_items[Shop.VENDOR])
 
-        import random
         import collections
         for shop_type in range(1, Shop.SHOP_TYPE_COUNT - 1): # skip EMPTY and VENDOR shop types
             frequencies = collections.Counter(item for item in type_items[shop_type])
@@ -67,10 +68,10 @@ class Shops():
                 shop.clear()
                 shop_indices.append(shop_index)
 
-            random.shuffle(item_counts)
+            rng.shuffle(item_counts)
 
             while len(items) > 0:
-                shop_index = random.choice(shop_indices)
+                shop_index = rng.choice(shop_indices)
                 shop = type_shops[shop_type][shop_index]
                 if not shop.contains(items[-1]):
                     item = items.pop()
@@ -80,24 +81,23 @@ class Shops():
 
     def random_tiered(self):
         def get_item(item_type, exclude = None):
-            import random
             from utils.weighted_random import weighted_random
             from data.shop_item_tiers import tiers, weights
 
             if exclude is None:
                 exclude = []
 
-            random_tier = weighted_random(weights[item_type])
+            random_tier = weighted_random(weights[item_type], rng)
             possible_items = [item_id for item_id in tiers[item_type][random_tier] if item_id not in exclude]
             while not possible_items:
                 # no more items left in chosen tier, pick a different one
                 weights[item_type][random_tier] = 0
                 assert(any(weights[item_type])) # ensure tier left which has not been tried
 
-                random_tier = weighted_random(weights[item_type])
+                random_tier = weighted_random(weights[item_type], rng)
                 possible_items = [item_id for item_id in tiers[item_type][random_tier] if item_id not in exclude]
 
-            random_item_index = random.randrange(len(possible_items))
+            random_item_index = rng.randrange(len(possible_items))
             return possible_items[random_item_index]
 
         self.shuffle()
@@ -121,10 +121,9 @@ class Shops():
         for shop in self.shops:
             total_item_count += shop.item_count
 
-        import random
         random_percent = self.args.shop_inventory_shuffle_random_percent / 100.0
         num_random_items = int(total_item_count * random_percent)
-        sorted_random_indices = sorted(random.sample(range(total_item_count), num_random_items), reverse = True)
+        sorted_random_indices = sorted(rng.sample(range(total_item_count), num_random_items), reverse = True)
 
         total_index = 0
         for shop in self.shops:
@@ -160,26 +159,25 @@ class Shops():
                 no_dried_meat_shops.append(shop)
         number_shops_with_dried_meat = len(dried_meat_shops)
 
-        import random
         if number_shops_with_dried_meat > self.args.shop_dried_meat:
             # too many shops have dried meat, randomly remove extras
             for index in range(self.args.shop_dried_meat, number_shops_with_dried_meat):
-                random_shop = random.choice(dried_meat_shops)
+                random_shop = rng.choice(dried_meat_shops)
                 random_shop.remove(dried_meat_id)
                 dried_meat_shops.remove(random_shop)
         elif number_shops_with_dried_meat < self.args.shop_dried_meat:
             # too few shops have dried meat, choose random shops and
             # add a dried meat if space, otherwise replace a random item with dried meat
             for index in range(number_shops_with_dried_meat, self.args.shop_dried_meat):
-                random_shop = random.choice(no_dried_meat_shops)
+                random_shop = rng.choice(no_dried_meat_shops)
 
                 while random_shop.name() in excluded_shops: # keep looping if shop is on the "bad" list
-                    random_shop = random.choice(no_dried_meat_shops)
+                    random_shop = rng.choice(no_dried_meat_shops)
 
                 if not random_shop.full():
                     random_shop.append(dried_meat_id)
                 else:
-                    random_index = random.randrange(random_shop.item_count)
+                    random_index = rng.randrange(random_shop.item_count)
                     random_shop.items[random_index] = dried_meat_id
                 no_dried_meat_shops.remove(random_shop)
                 dried_meat_shops.append(random_shop)
@@ -208,7 +206,7 @@ class Shops():
     def disable_buy_if_empty(self):
         # in shops with no items scrolling breaks and you can buy "Empty" items
         # this function will not allow the buy menu to be selected if the shop type is empty
-        from memory.space import Bank, Reserve, Write
+        from memory.space import Bank, Reserve, Plan
         import instruction.asm as asm
 
         src = [
@@ -223,7 +221,7 @@ class Shops():
             "OPEN_BUY_MENU",
             asm.JMP(0xb7a3, asm.ABS),       # jump to normal buy menu initialization
         ]
-        space = Write(Bank.C3, src, "shops handle buy menu empty shop")
+        space = Plan(Bank.C3, src, "shops handle buy menu empty shop")
         check_empty_shop = space.start_address
 
         space = Reserve(0x3b79a, 0x3b79b, "shops initialize buy menu address")
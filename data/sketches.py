@@ -1,6 +1,6 @@
 from data.sketch import Sketch
 from data.structures import DataArray
-from memory.space import Reserve, Bank, Write
+from memory.space import Reserve, Bank, Plan
 import instruction.asm as asm
 
 class Sketches():
@@ -44,7 +44,7 @@ class Sketches():
             "exit",
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "Sketch Caster Stats")
+        space = Plan(Bank.C2, src, "Sketch Caster Stats")
         use_sketcher_stats_addr = space.start_address
         
         # Call our new subroutine
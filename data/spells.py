@@ -3,6 +3,9 @@ from data.spell_names import id_name, name_id
 from data.ability_data import AbilityData
 from data.structures import DataArray
 from memory.space import Reserve
+from utils.get_ids import get_ids
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Spells:
     BLACK_MAGIC_COUNT = 24
@@ -35,7 +38,10 @@ class Spells:
             self.spells.append(spell)
 
     def get_id(self, name):
-        return name_id[name]
+        return self.get_ids([name])[0]
+
+    def get_ids(self, names):
+        return get_ids(name_id, names, "spell")
 
     def get_name(self, id):
         if id == 0xff:
@@ -46,19 +52,17 @@ class Spells:
         if exclude is None:
             exclude = []
 
-        import random
         possible_spell_ids = [spell.id for spell in self.spells if spell.id not in exclude]
         count = min(len(possible_spell_ids), count)
-        return random.sample(possible_spell_ids, count)
+        return rng.sample(possible_spell_ids, count)
 
     def get_replacement(self, spell_id, exclude):
         ''' get a random spell from the same tier as the given spell_id '''
-        import random
         from data.esper_spell_tiers import tiers
 
         same_tier = next((tier for tier in tiers if spell_id in tier), [])
         replacements = [i for i in same_tier if i not in exclude]
-        replacement = random.choice(replacements) if len(replacements) else None
+        replacement = rng.choice(replacements) if len(replacements) else None
         return replacement
 
     def no_mp_scan(self):
@@ -78,21 +82,18 @@ class Spells:
         for spell in self.spells:
             mp.append(spell.mp)
 
-        import random
-        random.shuffle(mp)
+        rng.shuffle(mp)
         for spell in self.spells:
             spell.mp = mp.pop()
 
     def random_mp_value(self):
-        import random
         for spell in self.spells:
-            spell.mp = random.randint(self.args.magic_mp_random_value_min, self.args.magic_mp_random_value_max)
+            spell.mp = rng.randint(self.args.magic_mp_random_value_min, self.args.magic_mp_random_value_max)
 
     def random_mp_percent(self):
-        import random
         for spell in self.spells:
-            mp_percent = random.randint(self.args.magic_mp_random_percent_min,
-                                        self.args.magic_mp_random_percent_max) / 100.0
+            mp_percent = rng.randint(self.args.magic_mp_random_percent_min,
+                                     self.args.magic_mp_random_percent_max) / 100.0
             value = int(spell.mp * mp_percent)
             spell.mp = max(min(value, 254), 0)
 
@@ -1,4 +1,4 @@
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 
 @total_ordering
 class DataPointer:
@@ -30,15 +30,15 @@ class DataPointers:
             if self.pointer_size == 4:
                 # four byte pointers are stored as pairs of 2 bytes (e.g. 0x12345678 stored as 0x34127856)
                 half_pointer_size = self.pointer_size // 2
-                data_address_bytes = self.rom.get_bytes(pointer_address, half_pointer_size)
+                data_address_bytes = self.rom.get_view(pointer_address, half_pointer_size)
                 data_address_high = int.from_bytes(data_address_bytes, byteorder="little")
 
-                data_address_bytes = self.rom.get_bytes(pointer_address + half_pointer_size, half_pointer_size)
+                data_address_bytes = self.rom.get_view(pointer_address + half_pointer_size, half_pointer_size)
                 data_address_low = int.from_bytes(data_address_bytes, byteorder="little")
 
                 data_address = (data_address_high << 16) | data_address_low
             else:
-                data_address_bytes = self.rom.get_bytes(pointer_address, self.pointer_size)
+                data_address_bytes = self.rom.get_view(pointer_address, self.pointer_size)
                 data_address = int.from_bytes(data_address_bytes, byteorder="little")
 
             pointer = DataPointer(pointer_address, data_address)
@@ -134,9 +134,11 @@ class DataArray:
 
         self.elements = []
         self.element_capacity = self.size() // self.element_size
+        view = self.rom.get_view(self.start_address, self.element_capacity * self.element_size)
         for index in range(self.element_capacity):
             data_address = self.start_address + index * self.element_size
-            data = self.rom.get_bytes(data_address, self.element_size)
+            data_offset = index * self.element_size
+            data = list(view[data_offset : data_offset + self.element_size])
 
             element = DataElement(data, data_address)
             self.elements.append(element)
@@ -171,6 +173,267 @@ class DataArray:
         for element in self.elements:
             self.rom.set_bytes(element.address, element.data)
 
+@lru_cache(maxsize = None)
+def _translate_table(shift, mask):
+    # bytes.translate table which shifts each byte value left by shift (right if negative) and masks it
+    if shift >= 0:
+        return bytes(((value << shift) & mask) for value in range(256))
+    return bytes(((value >> -shift) & mask) for value in range(256))
+
+def _item_typecode(width):
+    # smallest array typecode with items of at least width bytes
+    from array import array
+    return next(typecode for typecode in "BHILQ" if array(typecode).itemsize >= width)
+
+def _overflow(name, value, mask):
+    raise OverflowError(f"{name} {value} does not fit in field mask {hex(mask)}")
+
+# field of a fixed size record
+# the value is read from the width byte integer starting at offset, masked by mask and shifted right by shift
+# shift defaults to the lowest bit of mask, e.g. RecordField("event_bit", 2, 0x01c0, 2) reads bits 6-8 of bytes 2-3
+# encoding a value which does not fit raises OverflowError unless truncate is set, then only the bits which fit are kept
+class RecordField:
+    def __init__(self, name, offset, mask = None, width = 1, byteorder = "little", shift = None, truncate = False):
+        self.name = name
+        self.offset = offset
+        self.width = width
+        self.byteorder = byteorder
+        self.mask = (2 ** (width * 8) - 1) if mask is None else mask
+        self.shift = (self.mask & -self.mask).bit_length() - 1 if shift is None else shift
+        self.truncate = truncate
+
+    def byte_masks(self):
+        # (byte offset, significance, mask of the bits this field uses in that byte)
+        result = []
+        for index in range(self.width):
+            significance = index if self.byteorder == "little" else self.width - 1 - index
+            byte_mask = (self.mask >> (significance * 8)) & 0xff
+            if byte_mask:
+                result.append((self.offset + index, significance, byte_mask))
+        return result
+
+# layout of fixed size records, built once into functions which decode/encode a single record and
+# into bulk decode/encode of whole tables stored as struct of arrays (one typed array column per field)
+# decode(record, data) sets an attribute for each field, encode(record, data = None) returns data with every field's
+# bits replaced by the record's attributes (bits which are not part of a field are kept)
+# encoding a value which does not fit in its field raises OverflowError unless the field truncates it
+class RecordLayout:
+    def __init__(self, size, fields):
+        self.size = size
+        self.fields = fields
+        self.names = [field.name for field in fields]
+
+        self.byte_fields = {} # byte offset -> [(field, significance, byte mask)]
+        for field in fields:
+            for offset, significance, byte_mask in field.byte_masks():
+                self.byte_fields.setdefault(offset, []).append((field, significance, byte_mask))
+
+        self.decode = self._decode_function()
+        self.encode = self._encode_function()
+        self.records = self._records_function()
+
+    def _value_mask(self, field):
+        return field.mask >> field.shift
+
+    def _typecode(self, field):
+        from array import array
+        bits = self._value_mask(field).bit_length()
+        for typecode in "BHILQ":
+            if array(typecode).itemsize * 8 >= bits:
+                return typecode
+
+    def _decode_function(self):
+        # (name, [(byte offset, bit position)], shift, value mask or None if the field uses every bit) for each field
+        fields = []
+        for field in self.fields:
+            byte_positions = [(offset, significance * 8) for offset, significance, _ in field.byte_masks()]
+            value_mask = None
+            if field.mask != 2 ** (field.width * 8) - 1 or field.shift:
+                value_mask = self._value_mask(field)
+            fields.append((field.name, byte_positions, field.shift, value_mask))
+
+        def decode(record, data):
+            for name, byte_positions, shift, value_mask in fields:
+                value = 0
+                for offset, position in byte_positions:
+                    value |= data[offset] << position
+                if value_mask is not None:
+                    value = (value >> shift) & value_mask
+                setattr(record, name, value)
+            return record
+        return decode
+
+    def _encode_function(self):
+        value_masks = [(field.name, self._value_mask(field)) for field in self.fields if not field.truncate]
+
+        # (byte offset, mask of bits not used by any field, [(name, shift, bit position, byte mask)]) for each byte
+        byte_fields = []
+        for offset in sorted(self.byte_fields):
+            keep_mask = 0xff
+            terms = []
+            for field, significance, byte_mask in self.byte_fields[offset]:
+                terms.append((field.name, field.shift, significance * 8, byte_mask))
+                keep_mask &= ~byte_mask
+            byte_fields.append((offset, keep_mask, terms))
+        size = self.size
+
+        def encode(record, data = None):
+            for name, value_mask in value_masks:
+                value = getattr(record, name)
+                if value & ~value_mask:
+                    _overflow(name, value, value_mask)
+
+            if data is None:
+                data = [0x00] * size
+            for offset, keep_mask, terms in byte_fields:
+                byte = data[offset] & keep_mask
+                for name, shift, position, byte_mask in terms:
+                    byte |= ((getattr(record, name) << shift) >> position) & byte_mask
+                data[offset] = byte
+            return data
+        return encode
+
+    def _records_function(self):
+        # records(record_class, columns) creates a record_class object for each row of columns
+        # without calling record_class.__init__, record_class attributes must all be layout fields
+        names = self.names
+
+        def records(record_class, columns):
+            new = record_class.__new__
+            result = []
+            for values in zip(*[columns[name] for name in names]):
+                record = new(record_class)
+                record.__dict__ = dict(zip(names, values))
+                result.append(record)
+            return result
+        return records
+
+    def decode_columns(self, data, count):
+        # decode count records from contiguous bytes, returns dictionary of field name -> typed array column
+        import sys
+        from array import array
+        data = memoryview(data)
+        end = count * self.size
+
+        columns = {}
+        for field in self.fields:
+            if field.width == 1:
+                column = bytes(data[field.offset : end : self.size])
+                if field.mask != 0xff:
+                    column = column.translate(_translate_table(-field.shift, self._value_mask(field)))
+                columns[field.name] = array("B", column)
+                continue
+
+            # mask each byte column and interleave them into little endian integers the size of an array item
+            typecode = _item_typecode(field.width)
+            item_size = array(typecode).itemsize
+            interleaved = bytearray(count * item_size)
+            for offset, significance, byte_mask in field.byte_masks():
+                column = bytes(data[offset : end : self.size])
+                if byte_mask != 0xff:
+                    column = column.translate(_translate_table(0, byte_mask))
+                interleaved[significance : : item_size] = column
+
+            values = array(typecode)
+            values.frombytes(interleaved)
+            if sys.byteorder == "big":
+                values.byteswap()
+            if field.shift:
+                values = array(typecode, [value >> field.shift for value in values])
+            columns[field.name] = values
+        return columns
+
+    def encode_columns(self, columns, count, data = None):
+        # encode count records from field name -> column (typed arrays or lists), returns bytearray
+        # each byte position is built with one translate/or over the whole column instead of per record
+        import sys
+        from array import array
+        result = bytearray(count * self.size) if data is None else bytearray(data)
+        end = count * self.size
+
+        columns = dict(columns)
+        for field in self.fields:
+            values = columns[field.name]
+            value_mask = self._value_mask(field)
+            if field.truncate:
+                columns[field.name] = [value & value_mask for value in values]
+                continue
+            contiguous = not value_mask & (value_mask + 1) # value mask starts at bit 0 without gaps
+            if count and (min(values) < 0 or max(values) > value_mask or
+                          (not contiguous and any(value & ~value_mask for value in values))):
+                value = next(value for value in values if value & ~value_mask)
+                _overflow(field.name, value, value_mask)
+
+        field_bytes = {} # little endian bytes of multi-byte field values
+        for field in self.fields:
+            if field.width > 1 and not field.shift:
+                values = array(_item_typecode(field.width), columns[field.name])
+                if sys.byteorder == "big":
+                    values.byteswap()
+                field_bytes[field.name] = (values.tobytes(), values.itemsize)
+
+        for offset, byte_fields in self.byte_fields.items():
+            clear_mask = 0
+            for _, _, byte_mask in byte_fields:
+                clear_mask |= byte_mask
+
+            if clear_mask == 0xff:
+                combined = 0
+            else:
+                column = bytes(result[offset : end : self.size])
+                combined = int.from_bytes(column.translate(_translate_table(0, 0xff & ~clear_mask)), "little")
+
+            for field, significance, byte_mask in byte_fields:
+                values = columns[field.name]
+                if field.width == 1:
+                    column = bytes(values).translate(_translate_table(field.shift, byte_mask))
+                elif field.name in field_bytes:
+                    values, item_size = field_bytes[field.name]
+                    column = values[significance : : item_size].translate(_translate_table(0, byte_mask))
+                else:
+                    shift = significance * 8
+                    column = bytes((((value << field.shift) >> shift) & byte_mask) for value in values)
+                combined |= int.from_bytes(column, "little")
+
+            result[offset : end : self.size] = combined.to_bytes(count, "little")
+        return result
+
+# fixed size records stored as struct of arrays, one typed array column per field of layout
+# records are decoded/encoded in bulk, e.g. every npc is read with a few operations per field instead of per npc
+class RecordArray:
+    def __init__(self, rom, start_address, layout, count):
+        self.rom = rom
+        self.start_address = start_address
+        self.layout = layout
+        self.count = count
+
+        self.columns = self.layout.decode_columns(self.rom.get_view(self.start_address, self.count * self.layout.size), self.count)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def records(self, record_class):
+        # create a record_class object for each row, record_class attributes must all be layout fields
+        return self.layout.records(record_class, self.columns)
+
+    def set_records(self, records):
+        # replace every row with the field attributes of the given records
+        from array import array
+        self.count = len(records)
+        self.columns = {}
+        for field in self.layout.fields:
+            values = [getattr(record, field.name) for record in records]
+            if field.truncate:
+                value_mask = self.layout._value_mask(field)
+                values = [value & value_mask for value in values]
+            self.columns[field.name] = array(self.layout._typecode(field), values)
+
+    def write(self):
+        self.rom.set_bytes(self.start_address, self.layout.encode_columns(self.columns, self.count))
+
 # pointers to arrays of data
 # each array pointed to can be zero or more elements long and each element is the same size
 # the number of pointers/arrays does not change but the array sizes can change
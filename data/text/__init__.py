@@ -7,68 +7,67 @@ TEXT1 = TextType.TEXT1
 TEXT2 = TextType.TEXT2
 TEXT3 = TextType.TEXT3
 
-def convert(string, to_type):
-    if to_type == TEXT1:
-        from data.text.text1 import text_value
-    elif to_type == TEXT2:
-        from data.text.text2 import text_value
-    elif to_type == TEXT3:
-        from data.text.text3 import text_value
-    else:
-        raise NameError("text_type {} not found".format(text_type))
+UNKNOWN_VALUE = 0xff
+UNKNOWN_TEXT = '\0'
 
-    result = ""
-    string_index = 0
-    slen = len(string)
-    while string_index < slen:
-        cur_value = 0xffffff
-        if string[string_index] == '<':
-            # text starting with '<' is variable length but ends with '>'
-            substring_end = string.find('>', string_index) + 1
-            substring = string[string_index:substring_end]
-            if substring in text_value:
-                result += substring
-            string_index = substring_end - 1
-        else:
-            # value represents either 2 or 1 characters
-            substring = string[string_index:string_index + 2]
-            if substring in text_value:
-                result += substring
-                string_index += 1
-            elif string[string_index] in text_value:
-                result += string[string_index]
-        string_index += 1
-    return result
+class _Codec():
+    # text is split into tokens once with a compiled pattern, tokens are text starting with '<' and ending with the
+    # next '>', two characters with a value (e.g. 'th'), or a single character
+    def __init__(self, text_value):
+        import re
+        self.text_value = text_value
 
-def get_string(values, text_type):
-    if text_type == TEXT1:
-        from data.text.text1 import value_text
-    elif text_type == TEXT2:
-        from data.text.text2 import value_text
-    elif text_type == TEXT3:
-        from data.text.text3 import value_text
-    else:
-        raise NameError("text_type {} not found".format(text_type))
+        pairs = {}
+        for text in text_value:
+            if len(text) == 2 and text[0] != '<':
+                pairs.setdefault(text[0], []).append(text[1])
+        pair_patterns = [re.escape(first) + "[" + "".join(re.escape(second) for second in sorted(seconds)) + "]"
+                         for first, seconds in sorted(pairs.items())]
+        self.token_pattern = re.compile("|".join(["<[^>]*>"] + pair_patterns + ["."]), re.DOTALL)
 
-    result = ''
-    value_index = 0
-    vlen = len(values)
-    while value_index < vlen:
-        cur_text = '\0'
-        if values[value_index] in value_text:
-            cur_text = value_text[values[value_index]]
-        elif value_index < len(values) - 1:
-            two_byte_value = values[value_index] << 8 | values[value_index + 1]
-            if two_byte_value in value_text:
-                cur_text = value_text[two_byte_value]
-                value_index += 1
+        # values greater than 0xff are two bytes, high byte first
+        self.token_bytes = {text : value.to_bytes(2 if value > 0xff else 1, "big") for text, value in text_value.items()}
 
-        result += cur_text
-        value_index += 1
+        self.value_text = [UNKNOWN_TEXT] * 256  # single byte values
+        prefix_text = {}                        # first byte of two byte values -> second byte -> text
+        for text, value in text_value.items():
+            if value > 0xff:
+                prefix_text.setdefault(value >> 8, {})[value & 0xff] = text
+            else:
+                self.value_text[value] = text
 
-    return result
+        # values are split into single bytes and two byte values the same way, single byte values take priority
+        self.value_tokens = {bytes([value]) : text for value, text in enumerate(self.value_text)}
+        value_pair_patterns = []
+        for prefix, second_text in sorted(prefix_text.items()):
+            if self.value_text[prefix] != UNKNOWN_TEXT:
+                continue
+            value_pair_patterns.append(re.escape(bytes([prefix])) + b"[" + b"".join(re.escape(bytes([second])) for second in sorted(second_text)) + b"]")
+            for second, text in second_text.items():
+                self.value_tokens[bytes([prefix, second])] = text
+        self.prefixes = frozenset(prefix for prefix in prefix_text if self.value_text[prefix] == UNKNOWN_TEXT)
+        self.value_pattern = re.compile(b"|".join(value_pair_patterns + [b"."]), re.DOTALL)
+
+    def tokens(self, string):
+        return self.token_pattern.findall(string)
+
+    def encode(self, string):
+        token_bytes = self.token_bytes
+        unknown = bytes([UNKNOWN_VALUE])
+        return list(b"".join([token_bytes.get(token, unknown) for token in self.tokens(string)]))
+
+    def decode(self, values):
+        if self.prefixes.isdisjoint(values):
+            return "".join([self.value_text[value] for value in values])
+
+        value_tokens = self.value_tokens
+        return "".join([value_tokens[token] for token in self.value_pattern.findall(bytes(values))])
+
+_codecs = {}
+def _codec(text_type):
+    if text_type in _codecs:
+        return _codecs[text_type]
 
-def get_bytes(string, text_type):
     if text_type == TEXT1:
         from data.text.text1 import text_value
     elif text_type == TEXT2:
@@ -78,37 +77,21 @@ def get_bytes(string, text_type):
     else:
         raise NameError("text_type {} not found".format(text_type))
 
-    result = [None] * len(string)
-    result_index = 0
-    string_index = 0
-    slen = len(string)
-    while string_index < slen:
-        cur_value = 0xff
-        if string[string_index] == '<':
-            # text starting with '<' is variable length but ends with '>'
-            substring_end = string.find('>', string_index) + 1
-            substring = string[string_index:substring_end]
-            if substring in text_value:
-                cur_value = text_value[substring]
-            string_index = substring_end - 1
-        else:
-            # value represents either 2 or 1 characters
-            substring = string[string_index:string_index + 2]
-            if substring in text_value:
-                cur_value = text_value[substring]
-                string_index += 1
-            elif string[string_index] in text_value:
-                cur_value = text_value[string[string_index]]
-
-        if cur_value > 0xff:
-            # two bytes
-            result[result_index] = cur_value >> 8
-            result_index += 1
-            result[result_index] = cur_value & 0xff
-            result_index += 1
-        else:
-            result[result_index] = cur_value
-            result_index += 1
-        string_index += 1
-
-    return result[:result_index]
+    _codecs[text_type] = _Codec(text_value)
+    return _codecs[text_type]
+
+def convert(string, to_type):
+    # remove text which cannot be represented in to_type
+    codec = _codec(to_type)
+    return "".join([token for token in codec.tokens(string) if token in codec.text_value])
+
+def get_string(values, text_type):
+    return _codec(text_type).decode(values)
+
+def get_bytes(string, text_type):
+    return _codec(text_type).encode(string)
+
+def get_bytes_list(strings, text_type):
+    # encode multiple strings of the same type
+    encode = _codec(text_type).encode
+    return [encode(string) for string in strings]
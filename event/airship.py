@@ -297,7 +297,7 @@ class Airship(Event):
                 field.RemoveAllEquipment(self.characters.UMARO),
                 field.Return(),
             ]
-            space = Write(Bank.CB, src, "airship unequip_gogo_umaro if not in party")
+            space = Plan(Bank.CB, src, "airship unequip_gogo_umaro if not in party")
             unequip_gogo_umaro = space.start_address
 
             space = Reserve(0xc3664, 0xc3673, "airship unequip gogo if recruited and not in party", field.NOP())
@@ -316,7 +316,7 @@ class Airship(Event):
                 field.RemoveAllEquipment(self.characters.UMARO),
                 field.Return(),
             ]
-            space = Write(Bank.CB, src, "airship unequip_all_gogo_umaro")
+            space = Plan(Bank.CB, src, "airship unequip_all_gogo_umaro")
             unequip_all_gogo_umaro = space.start_address
 
             space = Reserve(0xc3591, 0xc3599, "airship unequip gogo if recruited", field.NOP())
@@ -338,7 +338,7 @@ class Airship(Event):
         space.write(
             field.SetParty(1),
             field.Call(field.REMOVE_ALL_CHARACTERS_FROM_ALL_PARTIES),
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
             field.UpdatePartyLeader(),
             field.ShowEntity(field_entity.PARTY0),
             field.RefreshEntities(),
@@ -80,7 +80,7 @@ class AncientCastle(Event):
             field.WaitForFade(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "ancient castle statue to character")
+        space = Plan(Bank.CC, src, "ancient castle statue to character")
         recruit_character = space.start_address
 
         space = Reserve(0xc1f76, 0xc1f84, "ancient castle display receive raiden dialog and take odin", field.NOP())
@@ -110,7 +110,7 @@ class AncientCastle(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "ancient castle finish check")
+        space = Plan(Bank.CC, src, "ancient castle finish check")
         finish_check = space.start_address
 
         space = Reserve(0xc1f85, 0xc1f88, "ancient castle give raiden and set event bit", field.NOP())
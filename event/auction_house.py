@@ -194,7 +194,7 @@ class AuctionHouse(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, space_description)
+        space = Plan(Bank.CB, src, space_description)
         receive_esper = space.start_address
 
         space = Reserve(start_addr, end_addr, "call " + space_description, field.NOP())
@@ -210,7 +210,7 @@ class AuctionHouse(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, space_description)
+        space = Plan(Bank.CB, src, space_description)
         receive_item = space.start_address
 
         space = Reserve(start_addr, end_addr, space_description, field.NOP())
@@ -226,7 +226,7 @@ class AuctionHouse(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, space_description)
+        space = Plan(Bank.CB, src, space_description)
         receive_item = space.start_address
 
         space = Reserve(start_addr, end_addr, space_description, field.NOP())
@@ -331,7 +331,7 @@ class AuctionHouse(Event):
                                dest1 = self.start_auction,
                                dest2 = field.RETURN),
         ]
-        space = Write(Bank.CB, src, "auction house door npc hint")
+        space = Plan(Bank.CB, src, "auction house door npc hint")
         door_npc_hint = space.start_address
 
         space = Reserve(0xb4e53, 0xb4e5c, "auction house door npc original dialog", field.NOP())
@@ -39,7 +39,7 @@ class BarenFalls(Event):
             field.ReturnIfEventBitClear(event_bit.character_recruited(self.character_gate())),
             Read(0xbc03f, 0xbc057)   # jump? dialog
         ]
-        space = Write(Bank.CB, src, "baren falls character gating")
+        space = Plan(Bank.CB, src, "baren falls character gating")
         gate_check = space.start_address
 
         space = Reserve(0xbc03f, 0xbc057, "baren falls jump dialog options", field.NOP())
@@ -67,7 +67,7 @@ class BarenFalls(Event):
             vehicle.LoadMap(0x09f, direction.DOWN, default_music = True, x = 15, y = 0, fade_in = False),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "baren falls move airship after rizopas battle")
+        space = Plan(Bank.CB, src, "baren falls move airship after rizopas battle")
         load_map = space.start_address
 
         space = Reserve(0xbc0bf, 0xbc0c4, "baren falls load map after rizopas battle", field.NOP())
@@ -93,7 +93,7 @@ class BarenFalls(Event):
             vehicle.LoadMap(0x000, direction.DOWN, default_music = True, x = 192, y = 105),
             world.End(),
         ]
-        space = Write(Bank.CB, src, "baren falls exit function")
+        space = Plan(Bank.CB, src, "baren falls exit function")
         exit_function = space.start_address
 
         space = Reserve(0xbc203, 0xbc209, "baren falls rizopas already defeated, load wob", field.NOP())
@@ -125,7 +125,7 @@ class BarenFalls(Event):
         space.write(
             field.Pause(0.5),
             field.RecruitCharacter(character),
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
             field.Branch(space.end_address + 1), # skip nop
         )
 
@@ -136,7 +136,7 @@ class BarenFalls(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "baren falls character finish check")
+        space = Plan(Bank.CB, src, "baren falls character finish check")
         finish_check = space.start_address
 
         space = Reserve(0xbc1f2, 0xbc1f5, "baren falls character call finish check", field.NOP())
@@ -131,7 +131,7 @@ class BurningHouse(Event):
             field.Call(field.GATHER_AFTER_INN),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "burning house wake up")
+        space = Plan(Bank.CB, src, "burning house wake up")
         self.wake_up = space.start_address
 
     def fixed_battles_mod(self):
@@ -70,7 +70,7 @@ class CidIsland(Event):
             field.StartTimer(0, 64, DECREMENT_HEALTH, pause_in_menu_and_battle = True),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "cid's island start feeding cid")
+        space = Plan(Bank.CA, src, "cid's island start feeding cid")
         start_feeding_cid = space.start_address
 
         # the quest can be repeated and neither/either/both of cid_survived/cid_died may be set
@@ -84,7 +84,7 @@ class CidIsland(Event):
             field.StartTimer(0, 64, DECREMENT_HEALTH, pause_in_menu_and_battle = True),
             field.Branch(FEED_CID),
         ]
-        space = Write(Bank.CA, src, "cid's island talk to cid, feed/survive/die")
+        space = Plan(Bank.CA, src, "cid's island talk to cid, feed/survive/die")
         feed_survive_die = space.start_address
 
         space = Reserve(0xa5374, 0xa537f, "cid's island talk to cid, check feeding/survived/dead", field.NOP())
@@ -99,7 +99,7 @@ class CidIsland(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "cid's island finish feeding cid check objectives")
+        space = Plan(Bank.CA, src, "cid's island finish feeding cid check objectives")
         finish_feeding_cid = space.start_address
 
         space = Reserve(0xa541c, 0xa542b, "cid's island let cid die", field.NOP())
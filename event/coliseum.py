@@ -21,7 +21,7 @@ class Coliseum(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "coliseum after battle")
+        space = Plan(Bank.CB, src, "coliseum after battle")
         after_battle = space.start_address
 
         space = Reserve(0xb796d, 0xb7970, "coliseum call after battle")
@@ -1,4 +1,6 @@
 from event.event import *
+from seed import random_stream
+rng = random_stream(__name__)
 
 class CollapsingHouse(Event):
     def name(self):
@@ -37,10 +39,9 @@ class CollapsingHouse(Event):
 
     def timer_mod(self):
         if self.args.event_timers_random:
-            import random
 
             # randomize timer between 2 and 5 minutes
-            seconds = random.randint(120, 300)
+            seconds = rng.randint(120, 300)
 
             space = Reserve(0xc5925, 0xc5926, "collapsing house timer")
             space.write(
@@ -80,7 +81,7 @@ class CollapsingHouse(Event):
             field.ReturnIfEventBitClear(event_bit.character_recruited(self.character_gate())),
             field.Branch(start_event),
         ]
-        space = Write(Bank.CB, src, "collapsing house event check")
+        space = Plan(Bank.CB, src, "collapsing house event check")
         start_event_check = space.start_address
 
         space = Reserve(0xc583e, start_event - 1, "collapsing house event tile")
@@ -128,7 +129,7 @@ class CollapsingHouse(Event):
             field.ShowEntity(mother_during_collapsing_house_id),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "tzen wor no gate character entrance event")
+        space = Plan(Bank.CC, src, "tzen wor no gate character entrance event")
         gated_entrance_event = space.start_address
 
         # when gated, give mother her wob dialog
@@ -203,7 +204,7 @@ class CollapsingHouse(Event):
             field.FreeMovement(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "collapsing house finish check")
+        space = Plan(Bank.CC, src, "collapsing house finish check")
         finish_check = space.start_address
 
         space = Reserve(0xc5ac4, 0xc5ac7, "collapsing house re-enable collisions", field.NOP())
@@ -56,7 +56,7 @@ class DarylTomb(Event):
             world.End(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "daryl tomb back exit")
+        space = Plan(Bank.CA, src, "daryl tomb back exit")
         back_exit = space.start_address
 
         space = Reserve(0xa435d, 0xa4362, "daryl tomb staircase and getting falcon scenes", field.NOP())
@@ -126,7 +126,7 @@ class DarylTomb(Event):
             field.PlaySoundEffect(187),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "daryl tomb finish check")
+        space = Plan(Bank.CA, src, "daryl tomb finish check")
         finish_check = space.start_address
 
         OPEN_BACK_EXIT = 0xaf1ed
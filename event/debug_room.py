@@ -25,7 +25,7 @@ class DebugRoom(Event):
             field.StartSong(get_character_theme(character)),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "Recruit NPC")
+        space = Plan(Bank.CC, src, "Recruit NPC")
 
         recruit_npc = NPC()
         recruit_npc.x = x
@@ -59,7 +59,7 @@ class DebugRoom(Event):
             field.LoadMap(dest_map, direction, True, dest_x, dest_y, fade_in = True),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "Teleport NPC")
+        space = Plan(Bank.CC, src, "Teleport NPC")
 
         teleport_npc = NPC()
         teleport_npc.x = source_x
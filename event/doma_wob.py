@@ -197,7 +197,7 @@ class DomaWOB(Event):
             field.FadeInScreen(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "doma wob recruit character")
+        space = Plan(Bank.CB, src, "doma wob recruit character")
         recruit_character = space.start_address
 
         space = Reserve(0xb9e89, 0xb9e8c, "doma call set party members' layering priority to 0", field.NOP())
@@ -116,7 +116,7 @@ class DomaWOR(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "doma wor stooges receive reward")
+        space = Plan(Bank.CB, src, "doma wor stooges receive reward")
         receive_reward = space.start_address
 
         space = Reserve(0xb8c4f, 0xb8c55, "doma wor clear event bits, hide stooges, fade in screen", field.NOP())
@@ -142,11 +142,11 @@ class DomaWOR(Event):
         #       a party of 4 with magitek was never intended and has a graphical bug
         space = Reserve(0xb93da, 0xb93e5, "toggle magitek on for party", field.NOP())
         space.write(
-            field.Call(field.TOGGLE_PARTY_MAGITEK),
+            field.Call(field_functions.TOGGLE_PARTY_MAGITEK),
         )
         space = Reserve(0xb9503, 0xb950e, "toggle magitek off for party", field.NOP())
         space.write(
-            field.Call(field.TOGGLE_PARTY_MAGITEK),
+            field.Call(field_functions.TOGGLE_PARTY_MAGITEK),
         )
 
     def doma_mod(self):
@@ -269,7 +269,7 @@ class DomaWOR(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "doma wor finish dream")
+        space = Plan(Bank.CB, src, "doma wor finish dream")
         finish_dream_awaken = space.start_address
 
         space = Reserve(0xb9a49, 0xb9a4c, "doma wor peak swordsmanship dialog", field.NOP())
@@ -286,7 +286,7 @@ class DomaWOR(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "doma wor throne receive reward")
+        space = Plan(Bank.CB, src, "doma wor throne receive reward")
         receive_reward = space.start_address
 
         space = Reserve(0xb9a7a, 0xb9a7d, "doma wor throne call receive reward", field.NOP())
@@ -43,7 +43,7 @@ class DoomGaze(Event):
             asm.STA(0x11e3, asm.ABS),   # store battle type in the same place invoke_battle_type does
             asm.RTS(),
         ]
-        space = Write(Bank.EE, src, "doom gaze set battle type")
+        space = Plan(Bank.EE, src, "doom gaze set battle type")
         set_battle_type = space.start_address
 
         space = Reserve(0x2e6f46, 0x2e6f57, "doom gaze set formation", asm.NOP())
@@ -67,7 +67,7 @@ class DoomGaze(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "doom gaze receive reward")
+        space = Plan(Bank.CA, src, "doom gaze receive reward")
         receive_reward = space.start_address
 
         space = Reserve(0xa00de, 0xa00e2, "doom gaze receive magicite", field.NOP())
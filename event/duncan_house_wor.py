@@ -40,7 +40,7 @@ class DuncanHouseWOR(Event):
             Read(0xc0c05, 0xc0c09),  # set sabin as party leader
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "duncan house bum rush make sabin leader if in party")
+        space = Plan(Bank.CB, src, "duncan house bum rush make sabin leader if in party")
         choose_leader = space.start_address
 
         space = Reserve(0xc0c05, 0xc0c09, "duncan house bum rush set sabin as party leader", field.NOP())
@@ -153,7 +153,7 @@ class EbotsRock(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "ebots rock finish check")
+        space = Plan(Bank.CB, src, "ebots rock finish check")
         finish_check = space.start_address
 
         space = Reserve(0xb73f2, 0xb73f7, "ebots rock load strago's house after character reward", field.NOP())
@@ -216,7 +216,7 @@ class EbotsRock(Event):
             field.BranchRandomly(GO_TO_SAVE_ADDR),  # 50% chance to go to save
             field.Branch(GO_TO_EXIT_ADDR),      # else, go to entrance
         ]
-        space = Write(Bank.CB, src, "Coral check to branch")
+        space = Plan(Bank.CB, src, "Coral check to branch")
         check_coral = space.start_address
 
         space = Reserve(0xb6f01, 0xb6f04, "Call Ebot's Cave branch logic")
@@ -65,11 +65,11 @@ class EightDragons(Event):
                 field.FinishCheck(),
                 field.Return(),
             ]
-            space = Write(Bank.CC, src, f"8 dragons {dragon.name.lower()} receive reward")
+            space = Plan(Bank.CC, src, f"8 dragons {dragon.name.lower()} receive reward")
             receive_reward = space.start_address
 
             space = Reserve(dragon.countdown_address, dragon.countdown_address + call_instr_size - 1,
-                            f"8 dragons call receive reward {hex(receive_reward)}", field.NOP())
+                            f"8 dragons {dragon.name.lower()} call receive reward", field.NOP())
             space.write(
                 field.Call(receive_reward),
             )
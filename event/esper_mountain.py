@@ -65,7 +65,7 @@ class EsperMountain(Event):
         src += [
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "esper mountain entrance event")
+        space = Plan(Bank.CB, src, "esper mountain entrance event")
         entrance_event = space.start_address
 
         space = Reserve(0xbf2a2, 0xbf2b3, "esper mountain entrance event branch", field.NOP())
@@ -97,7 +97,7 @@ class EsperMountain(Event):
             ),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "esper mountain south ultros event tile")
+        space = Plan(Bank.CB, src, "esper mountain south ultros event tile")
         south_ultros_event_tile = space.start_address
 
         from data.map_event import MapEvent
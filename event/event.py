@@ -1,4 +1,4 @@
-from memory.space import Bank, Space, Reserve, Allocate, Free, Write, Read
+from memory.space import Bank, Space, Reserve, Allocate, Free, Write, Read, Plan
 import data.direction as direction
 
 import data.event_bit as event_bit
@@ -8,6 +8,7 @@ import data.battle_bit as battle_bit
 
 import instruction.asm as asm
 import instruction.field as field
+import instruction.field.functions as field_functions
 import instruction.field.entity as field_entity
 import instruction.world as world
 import instruction.vehicle as vehicle
@@ -1,4 +1,7 @@
 from enum import Flag, unique, auto
+from seed import random_stream
+rng = random_stream(__name__)
+
 @unique
 class RewardType(Flag):
     NONE = auto()
@@ -31,10 +34,8 @@ class Reward:
         return result + " (" + ', '.join(possible_strings) + ")"
 
 def choose_reward(possible_types, characters, espers, items):
-    import random
-
     all_types = [flag for flag in RewardType]
-    random.shuffle(all_types)
+    rng.shuffle(all_types)
 
     item_possible = False
     for reward_type in all_types:
@@ -89,4 +90,4 @@ def weighted_reward_choice(slot_iterations, iteration):
     weights = reward_slot_weights(slot_iterations, iteration)
 
     from utils.weighted_random import weighted_random
-    return weighted_random(weights)
+    return weighted_random(weights, rng)
@@ -1,6 +1,9 @@
 from memory.space import Bank, Allocate
 from event.event_reward import CHARACTER_ESPER_ONLY_REWARDS, RewardType, choose_reward, weighted_reward_choice
 import instruction.field as field
+from utils import profile
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Events():
     def __init__(self, rom, args, data):
@@ -20,24 +23,17 @@ class Events():
         self.validate(events)
 
     def mod(self):
-        # generate list of events from files
-        import os, importlib, inspect
-        from event.event import Event
+        # generate list of events from registry, each event module is imported when its event is created
+        import importlib
+        from event.registry import EVENTS
         events = []
         name_event = {}
-        for event_file in sorted(os.listdir(os.path.dirname(__file__))):
-            if event_file[-3:] != '.py' or event_file == 'events.py' or event_file == 'event.py':
-                continue
-
-            module_name = event_file[:-3]
-            event_module = importlib.import_module('event.' + module_name)
-
-            for event_name, event_class in inspect.getmembers(event_module, inspect.isclass):
-                if event_name.lower() != module_name.replace('_', '').lower():
-                    continue
-                event = event_class(name_event, self.rom, self.args, self.dialogs, self.characters, self.items, self.maps, self.enemies, self.espers, self.shops)
-                events.append(event)
-                name_event[event.name()] = event
+        for event_name, module_name, class_name in EVENTS:
+            event_class = getattr(importlib.import_module(module_name), class_name)
+            event = event_class(name_event, self.rom, self.args, self.dialogs, self.characters, self.items, self.maps, self.enemies, self.espers, self.shops)
+            assert event.name() == event_name, f"{module_name}.{class_name} name changed, run event/tools/build_registry.py"
+            events.append(event)
+            name_event[event_name] = event
 
         # select event rewards
         if self.args.character_gating:
@@ -50,7 +46,8 @@ class Events():
         space = Allocate(Bank.CC, 400, "event/npc bit initialization", field.NOP())
         for event in events:
             event.init_event_bits(space)
-            event.mod()
+            with profile.stage(event.name()):
+                event.mod()
 
             if self.args.spoiler_log and (event.rewards_log or event.changes_log):
                 log_strings.append(event.log_string())
@@ -63,7 +60,6 @@ class Events():
         return events
 
     def init_reward_slots(self, events):
-        import random
         reward_slots = []
         for event in events:
             event.init_rewards()
@@ -71,7 +67,7 @@ class Events():
                 if reward.id is None:
                     reward_slots.append(reward)
 
-        random.shuffle(reward_slots)
+        rng.shuffle(reward_slots)
         return reward_slots
 
     def choose_single_possible_type_rewards(self, reward_slots):
@@ -89,7 +85,6 @@ class Events():
             slot.id, slot.type = choose_reward(slot.possible_types, self.characters, self.espers, self.items)
 
     def character_gating_mod(self, events, name_event):
-        import random
         reward_slots = self.init_reward_slots(events)
 
         # for every event with only one reward type possible, assign random rewards
@@ -136,7 +131,7 @@ class Events():
 
         # get all reward slots still available
         reward_slots = [reward for event in events for reward in event.rewards if reward.id is None]
-        random.shuffle(reward_slots) # shuffle to prevent picking them in alphabetical order
+        rng.shuffle(reward_slots) # shuffle to prevent picking them in alphabetical order
 
         # for every event with only char/esper rewards possible, assign random rewards
         self.choose_char_esper_possible_rewards(reward_slots)
@@ -148,7 +143,6 @@ class Events():
         return
 
     def open_world_mod(self, events):
-        import random
         reward_slots = self.init_reward_slots(events)
 
         # first choose all the rewards that only have a single type possible
@@ -189,7 +189,7 @@ class FanaticsTower(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "fanatic's tower magimaster finish check")
+        space = Plan(Bank.CC, src, "fanatic's tower magimaster finish check")
         finish_check = space.start_address
 
         space = Reserve(0xc5583, 0xc5588, "fanatic's tower load map after magimaster", field.NOP())
@@ -203,7 +203,7 @@ class FanaticsTower(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "fanatics tower strago finish check")
+        space = Plan(Bank.CC, src, "fanatics tower strago finish check")
         finish_check = space.start_address
 
         space = Reserve(0xc5438, 0xc543d, "fanatics tower load map after strago", field.NOP())
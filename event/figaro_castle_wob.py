@@ -45,7 +45,7 @@ class FigaroCastleWOB(Event):
             field.HideEntity(self.edgar_npc_id),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "figaro castle wob character gate")
+        space = Plan(Bank.CA, src, "figaro castle wob character gate")
         entrance_event = space.start_address
 
         self.maps.set_entrance_event(0x03a, entrance_event - EVENT_CODE_START)
@@ -68,7 +68,7 @@ class FigaroCastleWOB(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "figaro castle wob character reward")
+        space = Plan(Bank.CA, src, "figaro castle wob character reward")
         recruit_character = space.start_address
 
         space = Reserve(0xa6623, 0xa6628, "figaro castle wob call recruit character")
@@ -93,7 +93,7 @@ class FigaroCastleWOB(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "figaro castle wob esper/item reward")
+        space = Plan(Bank.CA, src, "figaro castle wob esper/item reward")
         add_esper_item = space.start_address
 
         space = Reserve(0xa6623, 0xa6628, "figaro castle wob call recruit character")
@@ -165,7 +165,7 @@ class FigaroCastleWOR(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "figaro castle wor finish check")
+        space = Plan(Bank.CA, src, "figaro castle wor finish check")
         finish_check = space.start_address
 
         space = Reserve(0xa6bee, 0xa6bf1, "figaro castle wor hide party members except leader", field.NOP())
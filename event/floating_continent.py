@@ -1,4 +1,6 @@
 from event.event import *
+from seed import random_stream
+rng = random_stream(__name__)
 
 # TODO game can freeze, is this something i did or a bug in emulator/game?
 #      go through and when you get to the hole that brings you to three possible holes (including the one you came from)
@@ -186,7 +188,7 @@ class FloatingContinent(Event):
             field.DeleteEntity(0x10),
             field.DeleteEntity(0x11),
             field.DeleteEntity(0x12),
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
 
             # loading the map here instead of just fading in the screen prevents a graphics bug with
             # the save point when the player has already acquired around 8+ characters
@@ -216,7 +218,7 @@ class FloatingContinent(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "floating continent ground finish check")
+        space = Plan(Bank.CA, src, "floating continent ground finish check")
         finish_check = space.start_address
 
         space = Reserve(0xad9ee, 0xad9f2, "floating continent set bits, update leader after shadow", field.NOP())
@@ -254,7 +256,7 @@ class FloatingContinent(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "floating continent atma weapon finish check")
+        space = Plan(Bank.CA, src, "floating continent atma weapon finish check")
         finish_check = space.start_address
 
         space = Reserve(0xada3f, 0xada46, "floating continent do not remove shadow after fighting atma", field.NOP())
@@ -379,7 +381,7 @@ class FloatingContinent(Event):
 
             field.Branch(begin_escape)
         ]
-        space = Write(Bank.CA, src, "floating continent statues shoot light at gestahl and party")
+        space = Plan(Bank.CA, src, "floating continent statues shoot light at gestahl and party")
         light_shot = space.start_address
 
         space = Reserve(0xade5e, 0xade63, "floating continent statues light shot branch", field.NOP())
@@ -389,10 +391,9 @@ class FloatingContinent(Event):
 
     def timer_mod(self):
         if self.args.event_timers_random:
-            import random
 
             # randomize timer between 5 and 8 minutes
-            seconds = random.randint(300, 480)
+            seconds = rng.randint(300, 480)
 
             space = Reserve(0xae3f6, 0xae3f7, "floating continent timer 0")
             space.write(
@@ -446,7 +447,7 @@ class FloatingContinent(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "floating continent return to airship")
+        space = Plan(Bank.CA, src, "floating continent return to airship")
         airship_return = space.start_address
 
         space = Reserve(0xa48dd, 0xa48e2, "floating continent return to airship", field.NOP())
@@ -109,7 +109,7 @@ class GauFatherHouse(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "gau father house finish check")
+        space = Plan(Bank.CB, src, "gau father house finish check")
         finish_check = space.start_address
 
         space = Reserve(0xb0b02, 0xb0b05, "gau father house recruit shadow bit, fade in", field.NOP())
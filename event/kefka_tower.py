@@ -262,7 +262,7 @@ class KefkaTower(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        post_battle = Write(Bank['CC'], src, f"{boss_name} post-battle. 1) Set event bit. 2) Finish check")
+        post_battle = Plan(Bank['CC'], src, f"{boss_name} post-battle. 1) Set event bit. 2) Finish check")
 
         space = Reserve(start_target, end_target, description, asm.NOP())
         space.write([
@@ -324,7 +324,7 @@ class KefkaTower(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "kefka tower atma reward")
+        space = Plan(Bank.CC, src, "kefka tower atma reward")
         atma_reward = space.start_address
 
         space = Reserve(0xc18d3, 0xc18d6, "kefka tower after atma", field.NOP())
@@ -368,7 +368,7 @@ class KefkaTower(Event):
             field.HideEntity(invisible_block_npc_id),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "kefka tower hide inferno block")
+        space = Plan(Bank.CB, src, "kefka tower hide inferno block")
         hide_inferno_block = space.start_address
 
         space = Reserve(0xc18aa, 0xc18ad, "kefka tower hide inferno, clear npc bit", field.NOP())
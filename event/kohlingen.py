@@ -75,7 +75,7 @@ class Kohlingen(Event):
         src += [
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "kohlingen inn sleep mod")
+        space = Plan(Bank.CC, src, "kohlingen inn sleep mod")
         load_inn_map = space.start_address
 
         space = Reserve(0xc69e8, 0xc69ed, "kohlingen inn call load inn map", field.NOP())
@@ -138,7 +138,7 @@ class Kohlingen(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "kohlingen finish check")
+        space = Plan(Bank.CC, src, "kohlingen finish check")
         finish_check = space.start_address
 
         space = Reserve(0xc7073, 0xc7076, "kohlingen clear npc bit, set finished bit", field.NOP())
@@ -51,7 +51,7 @@ class LeteRiver(Event):
             field.HideEntity(self.raft_npc_id),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "lete river entrance event character gate")
+        space = Plan(Bank.CB, src, "lete river entrance event character gate")
         entrance_event_gate = space.start_address
 
         space = Reserve(0xb0469, 0xb0473, "lete river entrance event", field.NOP())
@@ -184,7 +184,7 @@ class LeteRiver(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "lete river after ultros")
+        space = Plan(Bank.CB, src, "lete river after ultros")
         after_ultros = space.start_address
 
         space = Reserve(0xb0916, 0xb091a, "lete river call after ultros", field.NOP()) # unused dialog 0171 SABIN!!!
@@ -200,7 +200,7 @@ class LeteRiver(Event):
             field.SetVehicle(field_entity.PARTY3, field.Vehicle.NONE),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "lete river remove raft from party")
+        space = Plan(Bank.CB, src, "lete river remove raft from party")
         self.remove_raft = space.start_address
 
     def exit_river_mod(self):
@@ -212,7 +212,7 @@ class LeteRiver(Event):
             vehicle.LoadMap(0x00, direction.LEFT, default_music = True, x = 93, y = 41),
             world.End(),
         ]
-        space = Write(Bank.CB, src, "lete river exit after ultros")
+        space = Plan(Bank.CB, src, "lete river exit after ultros")
         self.exit_river = space.start_address
 
     def character_mod(self, character):
@@ -256,7 +256,7 @@ class LeteRiver(Event):
             field.WaitForFade(),
 
             field.Call(self.remove_raft),
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
             field.Call(self.exit_river),
             field.Return(),
         )
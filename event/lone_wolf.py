@@ -104,7 +104,7 @@ class LoneWolf(Event):
 
         space = Reserve(0xcd67c, 0xcd6dc, "lone wolf add char", field.NOP())
         space.write(
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
             field.HideEntity(self.mog_npc_id),
             field.HideEntity(self.invisible_bridge_block_npc_id),
             field.ClearEventBit(event_bit.TEMP_SONG_OVERRIDE),
@@ -181,7 +181,7 @@ class LoneWolf(Event):
             field.RefreshEntities(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "lone wolf hide lone wolf and remove bridge block")
+        space = Plan(Bank.CC, src, "lone wolf hide lone wolf and remove bridge block")
         hide_npcs = space.start_address
 
         space = Reserve(0xcd5d1, 0xcd5d6, "lone wolf hide npcs after fall", field.NOP())
@@ -197,7 +197,7 @@ class LoneWolf(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "lone wolf finish check")
+        space = Plan(Bank.CC, src, "lone wolf finish check")
         finish_check = space.start_address
 
         space = Reserve(0xcd6dd, 0xcd6e0, "lone wolf finish saving mog", field.NOP())
@@ -222,7 +222,7 @@ class LoneWolf(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "lone wolf moogle room npc character reward")
+        space = Plan(Bank.CC, src, "lone wolf moogle room npc character reward")
         return space.start_address
 
     def moogle_room_esper_item_mod(self, esper_item_instructions):
@@ -238,7 +238,7 @@ class LoneWolf(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "lone wolf moogle room npc esper/item reward")
+        space = Plan(Bank.CC, src, "lone wolf moogle room npc esper/item reward")
         return space.start_address
 
     def moogle_room_esper_mod(self, esper):
@@ -288,7 +288,7 @@ class LoneWolf(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "lone wolf npc event second reward not chosen")
+        space = Plan(Bank.CC, src, "lone wolf npc event second reward not chosen")
         npc_event = space.start_address
 
         space = Reserve(0xc396c, 0xc3970, "lone wolf npc not saved second reward", field.NOP())
@@ -313,6 +313,6 @@ class LoneWolf(Event):
             field.RefreshEntities(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "lone wolf new moogle room entrance event")
+        space = Plan(Bank.CC, src, "lone wolf new moogle room entrance event")
 
         self.maps.set_entrance_event(0x02c, space.start_address - EVENT_CODE_START)
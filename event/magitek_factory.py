@@ -289,7 +289,7 @@ class MagitekFactory(Event):
         # refreshing objects or updating the party leader causes a hard lock at the end of the ride (never return from black screen)
         space = Reserve(0xc80ad, 0xc80b0, "magitek factory check game over after mine cart ride", field.NOP())
         space.write(
-            field.Call(field.ORIGINAL_CHECK_GAME_OVER),
+            field.Call(field_functions.ORIGINAL_CHECK_GAME_OVER),
         )
 
     def character_mod(self, character):
@@ -1,6 +1,8 @@
 from event.event import *
 from data.item_names import id_name
 from utils.truncated_discrete_distribution import truncated_discrete_distribution
+from seed import random_stream
+rng = random_stream(__name__)
 
 class MoblizWOB(Event):
     def name(self):
@@ -13,7 +15,7 @@ class MoblizWOB(Event):
 
         self.prices = []
         for _ in range(5):
-            self.prices.append(truncated_discrete_distribution(500, 1000, 1, 2 ** 16 - 1))
+            self.prices.append(truncated_discrete_distribution(500, 1000, 1, 2 ** 16 - 1, rng))
         self.log_change("", ', '.join([str(x) for x in self.prices]))
 
         self.set_postal_prices()
@@ -44,7 +46,7 @@ class MoblizWOB(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "mobliz wob injured lad reward, check objectives")
+        space = Plan(Bank.CC, src, "mobliz wob injured lad reward, check objectives")
         reward_check_objectives = space.start_address
 
         space = Reserve(0xc6883, 0xc6886, "mobliz wob injured lad item, event bit", field.NOP())
@@ -63,7 +65,7 @@ class MoblizWOB(Event):
             field.HideEntity(duane_id),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "mobliz wob hide duane/dog")
+        space = Plan(Bank.CC, src, "mobliz wob hide duane/dog")
         hide_npcs = space.start_address
 
         space = Reserve(0xc50ea, 0xc50ed, "mobliz wob entrance event music", field.NOP())
@@ -128,7 +128,7 @@ class MoblizWOR(Event):
             "RETURN",
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "character joins before Mobliz battle")
+        space = Plan(Bank.CC, src, "character joins before Mobliz battle")
         add_character = space.start_address
 
         space = Reserve(0xc4cca, 0xc4cd9, "mobliz wor add character to party before phunbaba 4 if room available", field.NOP())
@@ -176,7 +176,7 @@ class MoblizWOR(Event):
         )
         if not self.args.shuffle_random_phunbaba3:
             space.write(
-                field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+                field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
             )
         space.write(
             field.FadeOutSong(0),
@@ -41,7 +41,7 @@ class MtKolts(Event):
             field.ReturnIfEventBitClear(event_bit.character_recruited(self.character_gate())),
             Read(0xa8267, 0xa828e)
         ]
-        space = Write(Bank.CA, src, "mt kolts vargas appears at end gate")
+        space = Plan(Bank.CA, src, "mt kolts vargas appears at end gate")
         vargas_appears = space.start_address
 
         space = Reserve(0xa8267, 0xa828e, "mt kolts vargas appears at end", field.NOP())
@@ -91,7 +91,7 @@ class MtKolts(Event):
             ]),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "mt kolts block back entrance")
+        space = Plan(Bank.CA, src, "mt kolts block back entrance")
         block_back_entrance = space.start_address
 
         self.maps.set_entrance_event(0x64, block_back_entrance - EVENT_CODE_START)
@@ -109,7 +109,7 @@ class MtKolts(Event):
             field.FadeInScreen(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "mt kolts entrance move airship")
+        space = Plan(Bank.CA, src, "mt kolts entrance move airship")
         entrance_move_airship = space.start_address
 
         src = [
@@ -122,7 +122,7 @@ class MtKolts(Event):
             field.FadeInScreen(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "mt kolts exit move airship")
+        space = Plan(Bank.CA, src, "mt kolts exit move airship")
         exit_move_airship = space.start_address
 
         from data.map_event import MapEvent
@@ -218,12 +218,12 @@ class MtKolts(Event):
         space = Reserve(0xa8353, 0xa8353, "mt kolts pause before locke approaches sabin", field.NOP())
 
         src = [
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
             field.FadeInScreen(),
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "mt kolts character receive reward")
+        space = Plan(Bank.CA, src, "mt kolts character receive reward")
         receive_reward = space.start_address
 
         space = Reserve(0xa83b3, 0xa83bf, "mt kolts hide party, add char", field.NOP())
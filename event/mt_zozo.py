@@ -62,7 +62,7 @@ class MtZozo(Event):
             ),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "zozo entrance event wor/wob check")
+        space = Plan(Bank.CA, src, "zozo entrance event wor/wob check")
         wor_wob_check = space.start_address
 
         space = Reserve(0xaefb3, 0xaefb6, "zozo animate woman laying down", field.NOP())
@@ -165,7 +165,7 @@ class MtZozo(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "mt zozo character finish check")
+        space = Plan(Bank.CC, src, "mt zozo character finish check")
         finish_check = space.start_address
 
         space = Reserve(0xc42b5, 0xc42b8, "mt zozo update leader, fade in screen", field.NOP())
@@ -92,7 +92,7 @@ class NarsheBattle(Event):
             )
         space.write(
             field.Call(field.REMOVE_ALL_CHARACTERS_FROM_ALL_PARTIES),
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_TWO_PARTIES),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_TWO_PARTIES),
             field.Branch(space.end_address + 1),
         )
 
@@ -165,7 +165,7 @@ class NarsheBattle(Event):
 
             Read(0xcbca5, 0xcbcb0), # check game over, if not show end scene, else move party back to save point spot
         ]
-        space = Write(Bank.CC, src, "narshe wob invoke kefka battle")
+        space = Plan(Bank.CC, src, "narshe wob invoke kefka battle")
         invoke_kefka_battle = space.start_address
 
         space = Reserve(0xcbca0, 0xcbcb0, "narshe battle call invoke kefka battle", field.NOP())
@@ -222,7 +222,7 @@ class NarsheBattle(Event):
             field.WaitForFade(),
 
             field.Call(field.REMOVE_ALL_CHARACTERS_FROM_ALL_PARTIES),
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
 
             field.UpdatePartyLeader(),
             field.ShowEntity(field_entity.PARTY0),
@@ -237,7 +237,7 @@ class NarsheBattle(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "narshe battle reward/end event")
+        space = Plan(Bank.CC, src, "narshe battle reward/end event")
         end_event = space.start_address
 
         space = Reserve(0xcbcff, 0xcbd04, "narshe battle call reward/event end")
@@ -95,7 +95,7 @@ class NarsheMoogleDefense(Event):
         self.add_moogle_to_party = [] #note: 0-indexed whereas parties are 1 indexed in code
         # Create the needed methods for adding a moogle to a party
         for i in range(1,4):
-            space = Write(Bank.CC, self._add_moogle_to_party_src(i), f"Add moogle to party {i}")
+            space = Plan(Bank.CC, self._add_moogle_to_party_src(i), f"Add moogle to party {i}")
             self.add_moogle_to_party.append(space.start_address)
 
         src = [
@@ -184,7 +184,7 @@ class NarsheMoogleDefense(Event):
             field.WaitForFade(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "TEST Marshal battle")
+        space = Plan(Bank.CC, src, "TEST Marshal battle")
         test_marshal_battle = space.start_address
 
         test_npc = NPC()
@@ -230,7 +230,7 @@ class NarsheMoogleDefense(Event):
             field.AddItem("Hero Ring", sound_effect = True),
             field.Return()
         ]
-        space = Write(Bank.CC, src, "Item Giver Debug NPC")
+        space = Plan(Bank.CC, src, "Item Giver Debug NPC")
         item_giver = space.start_address
 
         item_giver_npc = NPC()
@@ -282,7 +282,7 @@ class NarsheMoogleDefense(Event):
             Read(0xc395a, 0xc3965), # displaced code
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "narshe moogle defense character gate")
+        space = Plan(Bank.CC, src, "narshe moogle defense character gate")
         entrance_event = space.start_address
 
         space = Reserve(0xc395a, 0xc3965, "narshe: other rooms entrance event")
@@ -300,7 +300,7 @@ class NarsheMoogleDefense(Event):
             field.WaitForFade(),
             field.Branch(0xCCA2EB) # 'Got her!' scene
         ]
-        space = Write(Bank.CC, src, "load narshe caves map for Terra event")
+        space = Plan(Bank.CC, src, "load narshe caves map for Terra event")
         got_her_map_change = space.start_address
 
         # Change Arvis Script
@@ -395,7 +395,7 @@ class NarsheMoogleDefense(Event):
             "RETURN", 
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "Check for Party 2 and 3 sizes before placing")
+        space = Plan(Bank.CC, src, "Check for Party 2 and 3 sizes before placing")
         place_parties = space.start_address
 
         space = Reserve(0xcaa23, 0xcaa2a, "place party 2 and 3 on map", field.NOP())
@@ -411,7 +411,7 @@ class NarsheMoogleDefense(Event):
             "RETURN",
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "Position party 2")
+        space = Plan(Bank.CC, src, "Position party 2")
         position_parties = space.start_address
 
         space = Reserve(0xcaa3a, 0xcaa57, "position party 2 on map", field.NOP())
@@ -465,7 +465,7 @@ class NarsheMoogleDefense(Event):
             # give Shadow Interceptor again
             field.AddStatusEffects(self.characters.SHADOW, field.Status.DOG_BLOCK),
             
-            field.Call(field.REFRESH_CHARACTERS_AND_SELECT_PARTY),
+            field.Call(field_functions.REFRESH_CHARACTERS_AND_SELECT_PARTY),
             field.UpdatePartyLeader(),
             field.ShowEntity(field_entity.PARTY0),
             field.RefreshEntities(),
@@ -55,7 +55,7 @@ class NarsheWOB(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "narshe wob security checkpoint check objectives")
+        space = Plan(Bank.CC, src, "narshe wob security checkpoint check objectives")
         check_objectives = space.start_address
 
         space = Reserve(0xce3fa, 0xce3fd, "narshe wob security checkpoint clear first event word", field.NOP())
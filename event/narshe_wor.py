@@ -127,7 +127,7 @@ class NarsheWOR(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "narshe wor choose first reward")
+        space = Plan(Bank.CC, src, "narshe wor choose first reward")
         choose_first_option = space.start_address
 
         space = Reserve(0xc0b53, 0xc0b56, "narshe wor give party ragnarok esper", field.NOP())
@@ -141,7 +141,7 @@ class NarsheWOR(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "narshe wor choose second reward")
+        space = Plan(Bank.CC, src, "narshe wor choose second reward")
         choose_second_option = space.start_address
 
         space = Reserve(0xc0b67, 0xc0b6a, "narshe wor give party ragnarok weapon", field.NOP())
@@ -183,7 +183,7 @@ class NarsheWOR(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "narshe wor second weapon shop reward guard npc event")
+        space = Plan(Bank.CC, src, "narshe wor second weapon shop reward guard npc event")
         guard_event = space.start_address
 
         guard_npc.set_event_address(guard_event)
@@ -29,7 +29,7 @@ class Nikeah(Event):
             field.SetParentMap(0x01, direction.DOWN, x = 147, y = 76),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "nikeah boat from south figaro move airship")
+        space = Plan(Bank.CA, src, "nikeah boat from south figaro move airship")
         move_airship = space.start_address
 
         space = Reserve(0xa932a, 0xa9336, "nikeah boat from south figaro load map", field.NOP())
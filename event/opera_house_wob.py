@@ -1,5 +1,7 @@
 from constants.entities import SETZER
 from event.event import *
+from seed import random_stream
+rng = random_stream(__name__)
 
 class OperaHouseWOB(Event):
     def name(self):
@@ -88,7 +90,7 @@ class OperaHouseWOB(Event):
             Read(0xabb0c, 0xabb16), # load castle map, tint screen
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "opera scene initialize")
+        space = Plan(Bank.CA, src, "opera scene initialize")
         initialize = space.start_address
 
         space = Reserve(0xabafd, 0xabb16, "opera scene begin", field.NOP())
@@ -139,7 +141,7 @@ class OperaHouseWOB(Event):
         src += [
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "opera scene restore character sprite/palette")
+        space = Plan(Bank.CA, src, "opera scene restore character sprite/palette")
         restore_character_graphics = space.start_address
 
         space = Reserve(0xabee0, 0xabf05, "opera scene dance", field.NOP())
@@ -171,7 +173,7 @@ class OperaHouseWOB(Event):
             field.FreeMovement(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "opera scene check conditions")
+        space = Plan(Bank.CA, src, "opera scene check conditions")
         check_conditions = space.start_address
 
         space = Reserve(0xabf15, 0xabf19, "opera scene call check conditions", field.NOP())
@@ -187,10 +189,9 @@ class OperaHouseWOB(Event):
         )
 
         if self.args.event_timers_random:
-            import random
 
             # randomize timer between 4 and 7 minutes
-            seconds = random.randint(240, 420)
+            seconds = rng.randint(240, 420)
 
             space = Reserve(0xaba03, 0xaba04, "opera house timer")
             space.write(
@@ -283,7 +284,7 @@ class OperaHouseWOB(Event):
             field.SetEventBit(event_bit.CONTINUE_MUSIC_DURING_BATTLE),
             field.InvokeBattle(boss_pack_id, check_game_over = False),
             field.ClearEventBit(event_bit.CONTINUE_MUSIC_DURING_BATTLE),
-            field.Call(field.ORIGINAL_CHECK_GAME_OVER),
+            field.Call(field_functions.ORIGINAL_CHECK_GAME_OVER),
         )
 
     def after_battle_mod(self):
@@ -298,7 +299,7 @@ class OperaHouseWOB(Event):
             field.ShowEntity(self.celes_after_maria_npc_id),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "opera house show celes after maria npc")
+        space = Plan(Bank.CB, src, "opera house show celes after maria npc")
         show_celes = space.start_address
 
         # hide party leader to prevent possible conflict between celes being party leader and the person on stage at
@@ -359,7 +360,7 @@ class OperaHouseWOB(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "opera house reward/end event")
+        space = Plan(Bank.CB, src, "opera house reward/end event")
         end_event = space.start_address
 
         space = Reserve(0xb1b0e, 0xb1b13, "opera house call reward/end event", field.NOP())
@@ -64,7 +64,7 @@ class OwzerMansion(Event):
             field.Dialog(2703, wait_for_input = True, inside_text_box = False),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "owzer mansion light switch character gate")
+        space = Plan(Bank.CA, src, "owzer mansion light switch character gate")
         light_switch = space.start_address
 
         space = Reserve(0xb4930, 0xb4955, "owzer mansion light toggle", field.NOP())
@@ -161,7 +161,7 @@ class OwzerMansion(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "owzer mansion finish check")
+        space = Plan(Bank.CB, src, "owzer mansion finish check")
         finish_check = space.start_address
 
         space = Reserve(0xb4e25, 0xb4e28, "owzer mansion call finish check", field.NOP())
@@ -1,4 +1,6 @@
 from event.event import *
+from seed import random_stream
+rng = random_stream(__name__)
 
 class PhantomTrain(Event):
     def name(self):
@@ -66,7 +68,7 @@ class PhantomTrain(Event):
             world.Turn(direction.DOWN),
             world.End(),
         ]
-        space = Write(Bank.CB, src, "phantom train move airship and return to world map")
+        space = Plan(Bank.CB, src, "phantom train move airship and return to world map")
         self.load_world_map = space.start_address
 
     def esper_item_mod(self, esper_item_instructions):
@@ -80,7 +82,7 @@ class PhantomTrain(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "phantom train caboose esper item receive reward")
+        space = Plan(Bank.CB, src, "phantom train caboose esper item receive reward")
         receive_reward = space.start_address
 
         space = Reserve(0xbaafe, 0xbab08, "phantom train caboose esper/item", field.NOP())
@@ -143,19 +145,18 @@ class PhantomTrain(Event):
 
     def ghost_shop_forest_mod(self):
         # select a location at random where ghost shop will appear in forest
-        import random
         from collections import namedtuple
         ForestPos = namedtuple("ForestPos", ["map_id", "x", "y"])
         possible_positions = [ForestPos(0x84, 10, 9), ForestPos(0x84, 17, 9), ForestPos(0x84, 27, 10),
                               ForestPos(0x85, 3, 9), ForestPos(0x85, 13, 10), ForestPos(0x85, 18, 9),
                               ForestPos(0x86, 5, 10), ForestPos(0x86, 7, 9), ForestPos(0x86, 13, 9)]
-        forest_pos = random.choice(possible_positions)
+        forest_pos = rng.choice(possible_positions)
 
         from data.npc import NPC
         ghost_shop_npc = NPC()
         ghost_shop_npc.x = forest_pos.x
         ghost_shop_npc.y = forest_pos.y
-        ghost_shop_npc.direction = random.randrange(4)
+        ghost_shop_npc.direction = rng.randrange(4)
         ghost_shop_npc.speed = NPC.SLOWEST
         ghost_shop_npc.movement = NPC.RANDOM_MOVE
         ghost_shop_npc.sprite = 20
@@ -437,7 +438,7 @@ class PhantomTrain(Event):
             field.ClearEventBit(event_bit.SIEGFRIED_LUMP_OF_METAL_CHESTS),
             field.Branch(self.load_world_map),
         ]
-        space = Write(Bank.CB, src, "phantom train ensure reward and exit forest")
+        space = Plan(Bank.CB, src, "phantom train ensure reward and exit forest")
         end_event = space.start_address
 
         space = Reserve(0xbba06, 0xbba0b, "phantom train defeated call ensure reward and exit froest", field.NOP())
@@ -464,7 +465,7 @@ class PhantomTrain(Event):
                 destination,
                 field.Return(),
             ]
-            space = Write(Bank.CB, src, "phantom forest random destination")
+            space = Plan(Bank.CB, src, "phantom forest random destination")
             addresses.append(space.start_address)
 
         src = [
@@ -488,7 +489,7 @@ class PhantomTrain(Event):
         src += [
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "phantom forest randomly find phantom train or a random map")
+        space = Plan(Bank.CB, src, "phantom forest randomly find phantom train or a random map")
         random_destination = space.start_address
 
         space = Reserve(0xba3c4, 0xba3c9, "phantom forest last map branch if finished phantom train", field.NOP())
@@ -40,7 +40,7 @@ class PhoenixCave(Event):
             Read(0xa0405, 0xa0408),
             Read(0xa040c, 0xa0428),
         ]
-        space = Write(Bank.CA, src, "phoenix cave enter")
+        space = Plan(Bank.CA, src, "phoenix cave enter")
         enter_phoenix_cave = space.start_address
 
         src = [
@@ -48,21 +48,21 @@ class PhoenixCave(Event):
             vehicle.End(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "phoenix cave cancel landing")
+        space = Plan(Bank.CA, src, "phoenix cave cancel landing")
         cancel_landing = space.start_address
 
         src = [
             field.Dialog(self.need_locke_dialog),
             field.Branch(cancel_landing),
         ]
-        space = Write(Bank.CA, src, "phoenix cave no locke cancel")
+        space = Plan(Bank.CA, src, "phoenix cave no locke cancel")
         no_locke_cancel_landing = space.start_address
 
         src = [
             field.Dialog(self.need_more_characters_dialog),
             field.Branch(cancel_landing),
         ]
-        space = Write(Bank.CA, src, "phoenix cave character requirements cancel")
+        space = Plan(Bank.CA, src, "phoenix cave character requirements cancel")
         character_requirements_cancel_landing = space.start_address
 
         space = Reserve(0xa0405, 0xa0428, "phoenix cave landing checks", field.NOP())
@@ -94,7 +94,7 @@ class PhoenixCave(Event):
             Read(0xc2b3a, 0xc2b41), # create/show locke/npc
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "phoenix cave reward room npc check")
+        space = Plan(Bank.CC, src, "phoenix cave reward room npc check")
         npc_check = space.start_address
 
         space = Reserve(0xc2b3a, 0xc2b41, "phoenix cave reward room start event tile", field.NOP())
@@ -106,7 +106,7 @@ class PhoenixCave(Event):
             Read(0xc2b49, 0xc2b53), # event bits, magicite npc
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "phoenix cave begin reward")
+        space = Plan(Bank.CC, src, "phoenix cave begin reward")
         begin_reward = space.start_address
 
         space = Reserve(0xc2b49, 0xc2b53, "phoenix cave call begin reward", field.NOP())
@@ -0,0 +1,62 @@
+# generated by event/tools/build_registry.py, do not edit
+# (event name, module, class) in the order events are created
+EVENTS = [
+    ('Airship', 'event.airship', 'Airship'),
+    ('Albrook WOB', 'event.albrook_wob', 'AlbrookWOB'),
+    ('Ancient Castle', 'event.ancient_castle', 'AncientCastle'),
+    ('Auction House', 'event.auction_house', 'AuctionHouse'),
+    ('Baren Falls', 'event.baren_falls', 'BarenFalls'),
+    ('Burning House', 'event.burning_house', 'BurningHouse'),
+    ("Cid's Island", 'event.cid_island', 'CidIsland'),
+    ('Coliseum', 'event.coliseum', 'Coliseum'),
+    ('Collapsing House', 'event.collapsing_house', 'CollapsingHouse'),
+    ("Daryl's Tomb", 'event.daryl_tomb', 'DarylTomb'),
+    ('Debug Room', 'event.debug_room', 'DebugRoom'),
+    ('Doma WOB', 'event.doma_wob', 'DomaWOB'),
+    ('Doma WOR', 'event.doma_wor', 'DomaWOR'),
+    ('Doom Gaze', 'event.doom_gaze', 'DoomGaze'),
+    ('Duncan House WOB', 'event.duncan_house_wob', 'DuncanHouseWOB'),
+    ('Duncan House WOR', 'event.duncan_house_wor', 'DuncanHouseWOR'),
+    ("Ebot's Rock", 'event.ebots_rock', 'EbotsRock'),
+    ('8 Dragons', 'event.eight_dragons', 'EightDragons'),
+    ('Esper Mountain', 'event.esper_mountain', 'EsperMountain'),
+    ("Fanatic's Tower", 'event.fanatics_tower', 'FanaticsTower'),
+    ('Figaro Castle WOB', 'event.figaro_castle_wob', 'FigaroCastleWOB'),
+    ('Figaro Castle WOR', 'event.figaro_castle_wor', 'FigaroCastleWOR'),
+    ('Floating Continent', 'event.floating_continent', 'FloatingContinent'),
+    ('Gau Father House', 'event.gau_father_house', 'GauFatherHouse'),
+    ('Imperial Base', 'event.imperial_base', 'ImperialBase'),
+    ('Imperial Camp', 'event.imperial_camp', 'ImperialCamp'),
+    ("Kefka's Tower", 'event.kefka_tower', 'KefkaTower'),
+    ('Kohlingen', 'event.kohlingen', 'Kohlingen'),
+    ('Lete River', 'event.lete_river', 'LeteRiver'),
+    ('Lone Wolf', 'event.lone_wolf', 'LoneWolf'),
+    ('Magitek Factory', 'event.magitek_factory', 'MagitekFactory'),
+    ('Maranda', 'event.maranda', 'Maranda'),
+    ('Mobliz WOB', 'event.mobliz_wob', 'MoblizWOB'),
+    ('Mobliz WOR', 'event.mobliz_wor', 'MoblizWOR'),
+    ('Mt. Kolts', 'event.mt_kolts', 'MtKolts'),
+    ('Mt. Zozo', 'event.mt_zozo', 'MtZozo'),
+    ('Narshe Battle', 'event.narshe_battle', 'NarsheBattle'),
+    ('Narshe Moogle Defense', 'event.narshe_moogle_defense', 'NarsheMoogleDefense'),
+    ('Narshe WOB', 'event.narshe_wob', 'NarsheWOB'),
+    ('Narshe WOR', 'event.narshe_wor', 'NarsheWOR'),
+    ('Nikeah', 'event.nikeah', 'Nikeah'),
+    ('Opera House', 'event.opera_house_wob', 'OperaHouseWOB'),
+    ('Owzer Mansion', 'event.owzer_mansion', 'OwzerMansion'),
+    ('Phantom Train', 'event.phantom_train', 'PhantomTrain'),
+    ('Phoenix Cave', 'event.phoenix_cave', 'PhoenixCave'),
+    ('Sealed Gate', 'event.sealed_gate', 'SealedGate'),
+    ('Serpent Trench', 'event.serpent_trench', 'SerpentTrench'),
+    ('South Figaro', 'event.south_figaro', 'SouthFigaro'),
+    ('South Figaro Cave', 'event.south_figaro_cave_wob', 'SouthFigaroCaveWOB'),
+    ('Start', 'event.start', 'Start'),
+    ('Tritoch', 'event.tritoch', 'Tritoch'),
+    ('Tzen', 'event.tzen', 'Tzen'),
+    ("Umaro's Cave", 'event.umaro_cave', 'UmaroCave'),
+    ('Veldt', 'event.veldt', 'Veldt'),
+    ('Veldt Cave WOR', 'event.veldt_cave_wor', 'VeldtCaveWOR'),
+    ('Whelk', 'event.whelk', 'Whelk'),
+    ('Zone Eater', 'event.zone_eater', 'ZoneEater'),
+    ('Zozo', 'event.zozo', 'Zozo'),
+]
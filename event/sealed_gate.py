@@ -106,7 +106,7 @@ class SealedGate(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "sealed gate end/reward")
+        space = Plan(Bank.CB, src, "sealed gate end/reward")
         end_event = space.start_address
 
         space = Reserve(0xb39d8, 0xb39dd, "sealed gate end/reward branch", field.NOP())
@@ -122,7 +122,7 @@ class SealedGate(Event):
             field.RefreshEntities(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "sealed gate entrance event")
+        space = Plan(Bank.CB, src, "sealed gate entrance event")
         entrance_event = space.start_address
 
         space = Reserve(0xb39be, 0xb39c8, "sealed gate call entrance event", field.NOP())
@@ -177,7 +177,7 @@ class SealedGate(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CB, src, "sealed gate ninja set event bit, check objectives")
+        space = Plan(Bank.CB, src, "sealed gate ninja set event bit, check objectives")
         check_objectives = space.start_address
 
         space = Reserve(0xb30bb, 0xb30be, "sealed gate ninja i thought i had the monopoly", field.NOP())
@@ -134,7 +134,7 @@ class SerpentTrench(Event):
                                 x = 12, y = 11, fade_in = True, entrance_event = True),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "serpent trench move airship to south figaro")
+        space = Plan(Bank.CA, src, "serpent trench move airship to south figaro")
         self.move_airship_to_south_figaro = space.start_address
 
         src = [
@@ -147,7 +147,7 @@ class SerpentTrench(Event):
                                 x = 24, y = 11, entrance_event = True),
             field.Return()
         ]
-        space = Write(Bank.CA, src, "serpent trench move airship to nikeah")
+        space = Plan(Bank.CA, src, "serpent trench move airship to nikeah")
         self.move_airship_to_nikeah = space.start_address
 
         space = Reserve(0xa8d21, 0xa8d26, "serpent trench move airship to south figaro after boat ride to south figaro", field.NOP())
@@ -213,7 +213,7 @@ class SerpentTrench(Event):
             field.WaitForFade(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "serpent trench recruit character")
+        space = Plan(Bank.CA, src, "serpent trench recruit character")
         recruit_character = space.start_address
 
         space = Reserve(0xa8c03, 0xa8c04, "serpent trench pause before showing screen", field.NOP())
@@ -241,7 +241,7 @@ class SerpentTrench(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "serpent trench esper/item reward")
+        space = Plan(Bank.CA, src, "serpent trench esper/item reward")
         esper_item_reward = space.start_address
 
         space = Reserve(0xa8c03, 0xa8c04, "serpent trench pause before showing screen", field.NOP())
@@ -75,7 +75,7 @@ class SouthFigaro(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "south figaro basement recruit character")
+        space = Plan(Bank.CA, src, "south figaro basement recruit character")
         recruit_character = space.start_address
 
         space = Reserve(0xa8837, 0xa8841, "south figaro basement recruit character branch", field.NOP())
@@ -102,7 +102,7 @@ class SouthFigaro(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "south figaro basement esper/item reward")
+        space = Plan(Bank.CA, src, "south figaro basement esper/item reward")
         esper_item_reward = space.start_address
 
         space = Reserve(0xa8837, 0xa8841, "south figaro basement esper/item reward branch", field.NOP())
@@ -63,7 +63,7 @@ class SouthFigaroCaveWOB(Event):
         src = [
             Read(0xa767a, 0xa7687),
         ]
-        space = Write(Bank.CA, src, "figaro cave first noise")
+        space = Plan(Bank.CA, src, "figaro cave first noise")
         first_noise = space.start_address
 
         space = Reserve(0xa7674, 0xa7687, "figaro cave first noise branch", field.NOP())
@@ -81,7 +81,7 @@ class SouthFigaroCaveWOB(Event):
         src = [
             Read(0xa768e, 0xa769b),
         ]
-        space = Write(Bank.CA, src, "figaro cave second noise")
+        space = Plan(Bank.CA, src, "figaro cave second noise")
         second_noise = space.start_address
 
         space = Reserve(0xa7688, 0xa769b, "figaro cave second noise branch", field.NOP())
@@ -96,7 +96,7 @@ class SouthFigaroCaveWOB(Event):
             # skip copying "LOCKE: What IS that noise?" dialog
             Read(0xa76ad, 0xa76b2),
         ]
-        space = Write(Bank.CA, src, "figaro cave third noise")
+        space = Plan(Bank.CA, src, "figaro cave third noise")
         third_noise = space.start_address
 
         space = Reserve(0xa769c, 0xa76b2, "figaro cave third noise branch", field.NOP())
@@ -122,7 +122,7 @@ class SouthFigaroCaveWOB(Event):
             field.FadeInScreen(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "figaro cave move airship to castle side")
+        space = Plan(Bank.CA, src, "figaro cave move airship to castle side")
         move_airship_to_castle_side = space.start_address
 
         src = [
@@ -135,7 +135,7 @@ class SouthFigaroCaveWOB(Event):
             world.Turn(direction.DOWN),
             world.End(),
         ]
-        space = Write(Bank.CA, src, "figaro cave move airship to town side")
+        space = Plan(Bank.CA, src, "figaro cave move airship to town side")
         move_airship_to_town_side = space.start_address
 
         from data.map_event import MapEvent
@@ -163,7 +163,7 @@ class SouthFigaroCaveWOB(Event):
             reward_instructions,
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "figaro cave tunnel armor and reward")
+        space = Plan(Bank.CA, src, "figaro cave tunnel armor and reward")
         battle_reward = space.start_address
 
         space = Reserve(0xa89af, 0xa89eb, "figaro cave tunnel armor", field.NOP())
@@ -1,5 +1,6 @@
 from event.event import *
-import random
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Start(Event):
     def name(self):
@@ -117,7 +118,7 @@ class Start(Event):
         space.write(
             field.AddStatusEffects(self.characters.SHADOW, field.Status.DOG_BLOCK),
             field.RefreshEntities(),
-            field.Call(field.DELETE_ALL_CHARACTERS),
+            field.Call(field_functions.DELETE_ALL_CHARACTERS),
             field.RefreshEntities(),
 
             field.Return(),
@@ -141,7 +142,7 @@ class Start(Event):
             field.UpdatePartyLeader(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "start party")
+        space = Plan(Bank.CC, src, "start party")
         self.start_party = space.start_address
 
     def start_esper_mod(self):
@@ -156,7 +157,7 @@ class Start(Event):
             field.Return()
         ]
 
-        space = Write(Bank.CC, src, "start espers")
+        space = Plan(Bank.CC, src, "start espers")
         self.start_esper = space.start_address
 
     def start_gold_mod(self):
@@ -178,7 +179,7 @@ class Start(Event):
         src += [
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "start gold")
+        space = Plan(Bank.CC, src, "start gold")
         self.start_gold = space.start_address
 
     def start_items_mod(self):
@@ -202,7 +203,7 @@ class Start(Event):
 
         tools = ["NoiseBlaster", "Bio Blaster", "Flash", "Chain Saw",
                  "Debilitator", "Drill", "Air Anchor", "AutoCrossbow"]
-        start_tools = random.sample(tools, self.args.start_tools)
+        start_tools = rng.sample(tools, self.args.start_tools)
         for tool in start_tools:
             src += [
                 field.AddItem(tool, sound_effect = False),
@@ -218,7 +219,7 @@ class Start(Event):
         junk += tiers[Item.ARMOR][0]
         junk += tiers[Item.RELIC][0]
 
-        start_junk = random.sample(junk, self.args.start_junk)
+        start_junk = rng.sample(junk, self.args.start_junk)
 
         for junk_id in start_junk:
             src += [
@@ -237,7 +238,7 @@ class Start(Event):
         src += [
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "start items")
+        space = Plan(Bank.CC, src, "start items")
         self.start_items = space.start_address
 
     def start_game_mod(self):
@@ -258,5 +259,5 @@ class Start(Event):
             field.FadeInScreen(speed = 4),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "start game")
+        space = Plan(Bank.CC, src, "start game")
         self.start_game = space.start_address
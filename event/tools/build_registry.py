@@ -0,0 +1,64 @@
+# generate event/registry.py, the list of event names, modules and classes used by event.events.Events
+# run after adding, removing or renaming an event (use -check to only verify the registry is up to date)
+import ast, os
+
+EVENT_DIRECTORY = os.path.join(os.path.dirname(__file__), "..")
+REGISTRY_PATH = os.path.join(EVENT_DIRECTORY, "registry.py")
+
+def _event_name(class_node):
+    # event names are returned as string literals by each event's name() method
+    for node in class_node.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "name":
+            for statement in node.body:
+                if isinstance(statement, ast.Return) and isinstance(statement.value, ast.Constant):
+                    return statement.value.value
+    return None
+
+def find_events():
+    events = []
+    for event_file in sorted(os.listdir(EVENT_DIRECTORY)):
+        if event_file[-3:] != '.py' or event_file in ('events.py', 'event.py', 'registry.py'):
+            continue
+
+        module_name = event_file[:-3]
+        with open(os.path.join(EVENT_DIRECTORY, event_file), "r") as source:
+            tree = ast.parse(source.read(), event_file)
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name.lower() == module_name.replace('_', '').lower():
+                event_name = _event_name(node)
+                if event_name is None:
+                    raise ValueError(f"{event_file}: {node.name}.name() does not return a string literal")
+                events.append((event_name, "event." + module_name, node.name))
+    return events
+
+def registry_source(events):
+    lines = [
+        "# generated by event/tools/build_registry.py, do not edit",
+        "# (event name, module, class) in the order events are created",
+        "EVENTS = [",
+    ]
+    for event in events:
+        lines.append(f"    {event!r},")
+    lines.append("]")
+    return "\n".join(lines) + "\n"
+
+def build_registry(check):
+    source = registry_source(find_events())
+    if check:
+        with open(REGISTRY_PATH, "r") as registry:
+            if registry.read() != source:
+                raise SystemExit("event/registry.py is out of date, run event/tools/build_registry.py")
+        print("event/registry.py is up to date")
+        return
+
+    with open(REGISTRY_PATH, "w") as registry:
+        registry.write(source)
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-check", action = "store_true", help = "Verify event/registry.py is up to date instead of writing it")
+
+    args = parser.parse_args()
+    build_registry(args.check)
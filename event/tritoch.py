@@ -41,7 +41,7 @@ class Tritoch(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "tritoch receive reward finish check")
+        space = Plan(Bank.CC, src, "tritoch receive reward finish check")
         receive_reward = space.start_address
 
         space = Reserve(0xc37a6, 0xc37a9, "tritoch add esper", field.NOP())
@@ -1,4 +1,6 @@
 from event.event import *
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Tzen(Event):
     def name(self):
@@ -13,9 +15,8 @@ class Tzen(Event):
         )
 
     def mod(self):
-        from random import randint
-        self.wob_price = randint(1, field.RemoveGP.MAX)
-        self.wor_price = randint(1, field.RemoveGP.MAX)
+        self.wob_price = rng.randint(1, field.RemoveGP.MAX)
+        self.wor_price = rng.randint(1, field.RemoveGP.MAX)
 
         if self.reward.type == RewardType.ESPER:
             self.esper_mod(self.reward.id)
@@ -48,7 +49,7 @@ class Tzen(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CC, src, "tzen receive reward")
+        space = Plan(Bank.CC, src, "tzen receive reward")
         receive_reward = space.start_address
 
         space = Reserve(0xc5e08, 0xc5e10, "tzen call receive reward wob", field.NOP())
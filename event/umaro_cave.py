@@ -51,7 +51,7 @@ class UmaroCave(Event):
             field.Dialog(cliff_no_jump_dialog_id),
             field.Branch(CLIFF_MOVE_BACK),
         ]
-        space = Write(Bank.CC, src, "umaro cave cliff gating condition")
+        space = Plan(Bank.CC, src, "umaro cave cliff gating condition")
         cliff_jump_gate = space.start_address
 
         space = Reserve(0xc37ed, 0xc37f7, "umaro cave cliff gating condition branch", field.NOP())
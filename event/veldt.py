@@ -1,5 +1,7 @@
 from event.event import *
 from event.veldt_helpers import *
+from seed import random_stream
+rng = random_stream(__name__)
 
 # NOTE: if gau in menus he has been recruited (will not change based on leap status)
 #       if gau not in menus he has not been recruited yet
@@ -38,8 +40,7 @@ class Veldt(Event):
             self.char = self.reward.id
             self.sprite = self.reward.id
         else:
-            import random
-            self.sprite = random.choice([14, 15, 19, 20])
+            self.sprite = rng.choice([14, 15, 19, 20])
 
         self.leap_mod()
         self.gau_ai_mod()
@@ -71,7 +72,7 @@ class Veldt(Event):
             asm.DEC(characters_available_address, asm.ABS),                 # decrement available chars count
             asm.RTS(),
         ]
-        space = Write(Bank.C2, src, "veldt set gau unavailable after leap")
+        space = Plan(Bank.C2, src, "veldt set gau unavailable after leap")
         set_unavailable = space.start_address
 
         space = Reserve(0x248e6, 0x248ea, "veldt mark gau unavailable after leap", asm.NOP())
@@ -278,7 +279,7 @@ class Veldt(Event):
         )
         if self.reward.type == RewardType.CHARACTER:
             import instruction.c0 as c0
-            from memory.space import START_ADDRESS_SNES
+            from memory.space import START_ADDRESS_SNES, Plan
 
             recruit_character_address = START_ADDRESS_SNES + c0.recruit_character
             space.write(
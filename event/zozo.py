@@ -1,4 +1,6 @@
 from event.event import *
+from seed import random_stream
+rng = random_stream(__name__)
 
 class Zozo(Event):
     def name(self):
@@ -61,7 +63,7 @@ class Zozo(Event):
             field.HideEntity(self.ramuh_magicite_npc_id),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "zozo entrance event character gate")
+        space = Plan(Bank.CA, src, "zozo entrance event character gate")
         entrance_event = space.start_address
 
         self.maps.set_entrance_event(0x0e2, entrance_event - EVENT_CODE_START)
@@ -90,7 +92,7 @@ class Zozo(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "zozo character reward")
+        space = Plan(Bank.CA, src, "zozo character reward")
         recruit_character = space.start_address
 
         self.ramuh_npc.set_event_address(recruit_character)
@@ -106,7 +108,7 @@ class Zozo(Event):
             field.FinishCheck(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "zozo receive esper")
+        space = Plan(Bank.CA, src, "zozo receive esper")
         receive_esper = space.start_address
 
         space = Reserve(0xaa820, 0xaa824, "zozo call receive esper", field.NOP())
@@ -136,7 +138,7 @@ class Zozo(Event):
             field.RefreshEntities(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "zozo item reward")
+        space = Plan(Bank.CA, src, "zozo item reward")
         receive_item = space.start_address
 
         self.ramuh_npc.set_event_address(receive_item)
@@ -149,7 +151,7 @@ class Zozo(Event):
             field.CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "zozo successsfully set clock check objectives")
+        space = Plan(Bank.CA, src, "zozo successsfully set clock check objectives")
         check_objectives = space.start_address
 
         space = Reserve(0xa9744, 0xa9747, "zozo successfully set clock", field.NOP())
@@ -158,7 +160,7 @@ class Zozo(Event):
         )
 
     def randomize_clock_mod(self):
-        import random, copy
+        import copy
         from collections import namedtuple
 
         # original clues:
@@ -198,7 +200,7 @@ class Zozo(Event):
         solution_indices = []
         solution_values = []
         for option in options:
-            solution_index = random.randint(0, len(option.values) - 1)
+            solution_index = rng.randint(0, len(option.values) - 1)
             solution_indices.append(solution_index)
             solution_values.append(option.values[solution_index])
 
@@ -225,7 +227,7 @@ class Zozo(Event):
             )
 
         # first clue gives either the hour, minute, or second
-        digit_index = random.randint(0, len(options) - 1)
+        digit_index = rng.randint(0, len(options) - 1)
         solution_value = solution_values[digit_index]
         self.dialogs.set_text(1058, (f"That clock has no {options[digit_index].name} hand."
                                       " It's never pointing to the right time anyway!<end>"))
@@ -236,7 +238,7 @@ class Zozo(Event):
         del solution_values[digit_index]
 
         # second clue removes half (or half - 1) of the possibilities from one of the two remaining digits
-        digit_index = random.randint(0, len(options) - 1)
+        digit_index = rng.randint(0, len(options) - 1)
         if options[digit_index].name == "hour":
             divisor = 4
         else:
@@ -266,8 +268,8 @@ class Zozo(Event):
                 # if more clues than options, allow multiple clues for same value
                 options = copy.deepcopy(single_clue_options)
 
-            digit_index = random.randint(0, len(options) - 1)
-            value_index = random.randint(0, len(options[digit_index].values) - 1)
+            digit_index = rng.randint(0, len(options) - 1)
+            value_index = rng.randint(0, len(options[digit_index].values) - 1)
 
             digit = options[digit_index].name
             value = options[digit_index].values[value_index]
@@ -1,6 +1,6 @@
 # each tile is 8x8 colors which are each represented by a palette id
 
-from graphics.sprite_tile import SpriteTile
+from graphics.sprite_tile import SpriteTile, decode, encode
 
 class Sprite:
     def __init__(self, tiles, palette):
@@ -10,21 +10,12 @@ class Sprite:
 
     @property
     def data(self):
-        data = []
-        for tile in self.tiles:
-            data.extend(tile.data)
-        return data
+        return list(encode([tile.colors for tile in self.tiles]))
 
     @data.setter
     def data(self, new_data):
-        self.tiles = []
-        self.tile_count = len(new_data) // SpriteTile.DATA_SIZE
-        for tile_index in range(self.tile_count):
-            data_index = tile_index * SpriteTile.DATA_SIZE
-            tile_data = new_data[data_index : data_index + SpriteTile.DATA_SIZE]
-
-            tile = SpriteTile(tile_data)
-            self.tiles.append(tile)
+        self.tiles = [SpriteTile(colors = colors) for colors in decode(new_data)]
+        self.tile_count = len(self.tiles)
 
     def tile_matrix(self, tile_id_matrix):
         # tile_id_matrix is lists of rows, inner lists joined horizontally then outer list joined vertically
@@ -50,50 +41,30 @@ class Sprite:
                     result.append(result_row)
         return result
 
-    def rgb_data(self, pose):
-        pose_values = self.tile_matrix(pose)
+    def pixel_bytes(self, pose, color_values):
+        # color_values[color_id] bytes for each pixel of pose, left to right and top to bottom
+        return b"".join([color_values[color_id] for row in self.tile_matrix(pose) for color_id in row])
 
-        OUTPUT_WIDTH = SpriteTile.COL_COUNT * len(pose[0])
-        OUTPUT_HEIGHT = SpriteTile.ROW_COUNT * len(pose)
+    def _rgb_bytes(self, pose):
+        # rgb bytes of each color id looked up once, then each pixel is a single index
+        return self.pixel_bytes(pose, [bytes(color.rgb) for color in self.palette.colors])
 
-        rgb_values = []
-        for row_index in range(OUTPUT_HEIGHT):
-            for col_index in range(OUTPUT_WIDTH):
-                color_id = pose_values[row_index][col_index]
-                rgb_values.extend(self.palette.colors[color_id].rgb)
+    def size(self, pose):
+        return (SpriteTile.COL_COUNT * len(pose[0]), SpriteTile.ROW_COUNT * len(pose))
 
-        return rgb_values
+    def rgb_data(self, pose):
+        return list(self._rgb_bytes(pose))
 
     def write_ppm(self, output_file, pose):
-        import graphics.poses as poses
-        pose_values = self.tile_matrix(pose)
-
-        OUTPUT_WIDTH = SpriteTile.COL_COUNT * len(pose[0])
-        OUTPUT_HEIGHT = SpriteTile.ROW_COUNT * len(pose)
+        OUTPUT_WIDTH, OUTPUT_HEIGHT = self.size(pose)
         BITS_PER_VALUE = 8
 
-        rgb_values = []
-        for row_index in range(OUTPUT_HEIGHT):
-            for col_index in range(OUTPUT_WIDTH):
-                color_id = pose_values[row_index][col_index]
-                rgb_values.extend(self.palette.colors[color_id].rgb)
-
         from graphics.ppm import write_ppm6
-        write_ppm6(OUTPUT_WIDTH, OUTPUT_HEIGHT, BITS_PER_VALUE, rgb_values, output_file)
+        write_ppm6(OUTPUT_WIDTH, OUTPUT_HEIGHT, BITS_PER_VALUE, self._rgb_bytes(pose), output_file)
 
     def get_ppm(self, pose):
-        import graphics.poses as poses
-        pose_values = self.tile_matrix(pose)
-
-        OUTPUT_WIDTH = SpriteTile.COL_COUNT * len(pose[0])
-        OUTPUT_HEIGHT = SpriteTile.ROW_COUNT * len(pose)
+        OUTPUT_WIDTH, OUTPUT_HEIGHT = self.size(pose)
         BITS_PER_VALUE = 8
 
-        rgb_values = []
-        for row_index in range(OUTPUT_HEIGHT):
-            for col_index in range(OUTPUT_WIDTH):
-                color_id = pose_values[row_index][col_index]
-                rgb_values.extend(self.palette.colors[color_id].rgb)
-
         from graphics.ppm import get_ppm
-        return get_ppm(OUTPUT_WIDTH, OUTPUT_HEIGHT, BITS_PER_VALUE, rgb_values)
+        return get_ppm(OUTPUT_WIDTH, OUTPUT_HEIGHT, BITS_PER_VALUE, self._rgb_bytes(pose))
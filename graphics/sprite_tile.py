@@ -34,6 +34,44 @@
 # row 2 is bytes 0x04, 0x05, 0x14, 0x15
 # etc...
 
+# each bitplane byte spread into one byte per column, first column in the highest byte
+#   _SPREAD[0b10000001] = 0x0100000000000001
+# or-ing a row's four bitplanes spread and shifted by bitplane gives one byte per column holding its color id
+_SPREAD = [sum(((byte >> bit) & 1) << (bit * 8) for bit in range(8)) for byte in range(256)]
+
+# multiplying the low bit of each byte by _GATHER collects them in the top byte, first column in the highest bit
+_GATHER_MASK = 0x0101010101010101
+_GATHER = 0x0102040810204080
+
+def decode(data):
+    # 4bpp tile data to lists of 8 rows of 8 color ids per tile
+    data = bytes(data)
+    spread = _SPREAD
+    tiles = []
+    for tile_start in range(0, len(data) - len(data) % SpriteTile.DATA_SIZE, SpriteTile.DATA_SIZE):
+        rows = []
+        for row_start in range(tile_start, tile_start + SpriteTile.ROW_COUNT * 2, 2):
+            row = (spread[data[row_start]] | (spread[data[row_start + 1]] << 1) |
+                   (spread[data[row_start + 16]] << 2) | (spread[data[row_start + 17]] << 3))
+            rows.append(list(row.to_bytes(SpriteTile.COL_COUNT, "big")))
+        tiles.append(rows)
+    return tiles
+
+def encode(tiles):
+    # lists of 8 rows of 8 color ids per tile to 4bpp tile data
+    data = bytearray(len(tiles) * SpriteTile.DATA_SIZE)
+    tile_start = 0
+    for rows in tiles:
+        for row_index, row in enumerate(rows):
+            columns = int.from_bytes(bytes(row), "big")
+            row_start = tile_start + row_index * 2
+            data[row_start]      = (((columns     ) & _GATHER_MASK) * _GATHER >> 56) & 0xff
+            data[row_start + 1]  = (((columns >> 1) & _GATHER_MASK) * _GATHER >> 56) & 0xff
+            data[row_start + 16] = (((columns >> 2) & _GATHER_MASK) * _GATHER >> 56) & 0xff
+            data[row_start + 17] = (((columns >> 3) & _GATHER_MASK) * _GATHER >> 56) & 0xff
+        tile_start += SpriteTile.DATA_SIZE
+    return data
+
 class SpriteTile:
     ROW_COUNT = 8
     COL_COUNT = 8
@@ -46,38 +84,21 @@ class SpriteTile:
         (DATA_SIZE // 2) + 1,
     ]
 
-    def __init__(self, data = None):
-        self.colors = [[0 for x in range(self.COL_COUNT)] for y in range(self.ROW_COUNT)]
-        if data is not None:
+    def __init__(self, data = None, colors = None):
+        if colors is not None:
+            self.colors = colors
+        elif data is not None:
             self.data = data
+        else:
+            self.colors = [[0 for x in range(self.COL_COUNT)] for y in range(self.ROW_COUNT)]
 
     @property
     def data(self):
-        tile_bytes = [0x00] * self.DATA_SIZE
-
-        for row_index in range(self.ROW_COUNT):
-            for col_index in range(self.COL_COUNT):
-                color = self.colors[row_index][col_index]
-                dest_bit = (self.COL_COUNT - col_index) - 1
-
-                for byte_index in range(len(self.row_offsets)):
-                    tile_bytes[row_index * 2 + self.row_offsets[byte_index]] |= (((color >> byte_index) & 1) << dest_bit)
-
-        return tile_bytes
+        return list(encode([self.colors]))
 
     @data.setter
     def data(self, new_data):
-        for row_index in range(self.ROW_COUNT):
-            row_bytes = []
-            for byte_index in range(len(self.row_offsets)):
-                row_bytes.append(new_data[row_index * 2 + self.row_offsets[byte_index]])
-
-            for col_index in range(self.COL_COUNT):
-                color = 0x00
-                source_bit = (self.COL_COUNT - col_index) - 1
-
-                for bit_index, byte in enumerate(row_bytes):
-                    self.colors[row_index][col_index] |= (((byte >> source_bit) & 1) << bit_index)
+        self.colors = decode(new_data[:self.DATA_SIZE])[0]
 
     def color(self, x, y):
         # (0, 0) is top left of tile
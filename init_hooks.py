@@ -0,0 +1,39 @@
+# modules which write to the rom or read args when initialized instead of when imported
+# importing them only defines functions and classes, run() calls each module's init() in order once the rom is
+# loaded and args are parsed, the values they assign (e.g. function addresses) do not exist before that
+# modules are listed in the order they were first imported by a generation, which is the order their code is allocated
+MODULES = [
+    "instruction.field.functions",
+    "data.event_word",
+    "instruction.c0",
+    "instruction.field.custom",
+    "instruction.field.y_npc.functions",
+    "instruction.f0",
+    "data.items",
+    "instruction.c4",
+    "instruction.c3",
+    "menus.pregame_track_scroll_area",
+    "instruction.c2",
+    "instruction.c1",
+    "instruction.battle_event",
+    "data.fonts",
+    "data.dialogs",
+    "objectives.results",
+    "objectives",
+]
+
+# modules which still read args or the rom when imported, a generation only imports them after args are parsed and
+# the rom is loaded (the battle stage, the log and the item tables read while creating Data)
+# each name also covers the modules in its package
+IMPORT_EXCEPTIONS = [
+    "battle",
+    "log",
+    "data.chest_item_tiers",
+    "data.shop_item_tiers",
+    "data.item_custom_values",
+]
+
+def run():
+    from importlib import import_module
+    for name in MODULES:
+        import_module(name).init()
@@ -17,7 +17,6 @@ def _add_remove_entity_mod():
     ]
     space = Write(Bank.C1, src, "c1 add remove entity")
     _set_opcode_address(0x13, space.start_address)
-_add_remove_entity_mod()
 
 class NOP(_Instruction):
     def __init__(self):
@@ -103,3 +102,6 @@ class IncrementChecksComplete(_Instruction):
 
         IncrementChecksComplete.__init__ = lambda self : super().__init__(opcode)
         self.__init__()
+
+def init():
+    _add_remove_entity_mod()
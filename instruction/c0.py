@@ -40,7 +40,6 @@ def _multiply_mod():
     data = Read(0x24781, 0x24791) # multiply function
     space = Write(Bank.C0, data, "c0 multiply a = low a * high a")
     return space.start_address
-multiply = _multiply_mod()
 
 def _divide_mod():
     # 16-bit a = 16-bit a / 8-bit x
@@ -48,12 +47,10 @@ def _divide_mod():
     data = Read(0x24792, 0x247b6) # divide function
     space = Write(Bank.C0, data, "c0 divide 16-bit a / 8-bit x")
     return space.start_address
-divide = _divide_mod()
 
 def _rng_mod():
     # a = random number (0 to 255)
     return 0x062e
-rng = _rng_mod()
 
 def _rng_a_mod():
     # a = random number (0 to a register - 1)
@@ -76,21 +73,17 @@ def _rng_a_mod():
     ]
     space = Write(Bank.C0, src, "c0 rng_a (0 to a - 1)")
     return space.start_address
-rng_a = _rng_a_mod()
 
 def _set_palette_mod():
     # assign palette $eb to object $ec
     return _extract_original(0x9ca9, 0x9cc9)
-set_palette = _set_palette_mod()
 
 def _set_sprite_mod():
     # assign sprite $eb to object $ec
     return _extract_original(0x9c8f, 0x9ca8)
-set_sprite = _set_sprite_mod()
 
 def _set_vehicle_mod():
     return _extract_original(0x9cca, 0x9ce1)
-set_vehicle = _set_vehicle_mod()
 
 def _random_sprite_palette_mod():
     # apply random sprite/palette to object $eb
@@ -111,7 +104,6 @@ def _random_sprite_palette_mod():
     ]
     space = Write(Bank.C0, src, "c0 random_sprite_palette")
     return space.start_address
-random_sprite_palette = _random_sprite_palette_mod()
 
 def _any_random_sprite_palette_mod():
     # apply random sprite/palette to object $eb (including glitchy sprites/palettes)
@@ -132,21 +124,17 @@ def _any_random_sprite_palette_mod():
     ]
     space = Write(Bank.C0, src, "c0 any_random_sprite_palette")
     return space.start_address
-any_random_sprite_palette = _any_random_sprite_palette_mod()
 
 def _show_object_mod():
     return _extract_original(0xa2fa, 0xa335)
-show_object = _show_object_mod()
 
 def _hide_object_mod():
     return _extract_original(0xa336, 0xa369)
-hide_object = _hide_object_mod()
 
 def _character_data_offset_mod():
     # input: $eb = character id
     # output: y = character data offset (character data address = y + 0x1600)
     return 0x09dad
-character_data_offset = _character_data_offset_mod()
 
 def _average_level_mod():
     # set character in $eb to average level of available characters
@@ -170,13 +158,11 @@ def _average_level_mod():
     # free remaining space
     Free(space.next_address, 0x9f77)
     return average_level
-average_level = _average_level_mod()
 
 def _update_magic_skills_mod():
     # update magic/skills for character in $eb based on their current level
     # i.e. after a character's level is changed, call to learn magic/skills
     return 0xa17f
-update_magic_skills = _update_magic_skills_mod()
 
 def _esper_found_mod():
     # input: a = esper id
@@ -203,7 +189,6 @@ def _esper_found_mod():
     ]
     space = Write(Bank.C0, src, "c0 esper_found")
     return space.start_address
-esper_found = _esper_found_mod()
 
 def _recruit_character_mod():
     import data.event_word as event_word
@@ -237,7 +222,6 @@ def _recruit_character_mod():
         asm.RTL(),
     )
     return space.start_address
-recruit_character = _recruit_character_mod()
 
 def _character_recruited_mod():
     # input: a = character id
@@ -264,7 +248,6 @@ def _character_recruited_mod():
     ]
     space = Write(Bank.C0, src, "c0 charcter_recruited")
     return space.start_address
-character_recruited = _character_recruited_mod()
 
 def _character_available_mod():
     # input: a = character id
@@ -291,7 +274,6 @@ def _character_available_mod():
     ]
     space = Write(Bank.C0, src, "c0 character_available")
     return space.start_address
-character_available = _character_available_mod()
 
 def _is_skill_learner_mod():
     # input: a = character id, x = 16 bit offset to end of learners table + 1, y = size of learners table
@@ -321,7 +303,6 @@ def _is_skill_learner_mod():
     ]
     space = Write(Bank.C0, src, "c0, is_skill_learner")
     return space.start_address
-is_skill_learner = _is_skill_learner_mod()
 
 def _add_item_mod():
     # input: 16 bit a = item id
@@ -333,4 +314,29 @@ def _add_item_mod():
     ]
     space = Write(Bank.C0, src, "c0 add item")
     return space.start_address
-add_item = _add_item_mod()
+
+def init():
+    global multiply, divide, rng, rng_a, set_palette, set_sprite, set_vehicle, random_sprite_palette
+    global any_random_sprite_palette, show_object, hide_object, character_data_offset, average_level
+    global update_magic_skills, esper_found, recruit_character, character_recruited
+    global character_available, is_skill_learner, add_item
+    multiply = _multiply_mod()
+    divide = _divide_mod()
+    rng = _rng_mod()
+    rng_a = _rng_a_mod()
+    set_palette = _set_palette_mod()
+    set_sprite = _set_sprite_mod()
+    set_vehicle = _set_vehicle_mod()
+    random_sprite_palette = _random_sprite_palette_mod()
+    any_random_sprite_palette = _any_random_sprite_palette_mod()
+    show_object = _show_object_mod()
+    hide_object = _hide_object_mod()
+    character_data_offset = _character_data_offset_mod()
+    average_level = _average_level_mod()
+    update_magic_skills = _update_magic_skills_mod()
+    esper_found = _esper_found_mod()
+    recruit_character = _recruit_character_mod()
+    character_recruited = _character_recruited_mod()
+    character_available = _character_available_mod()
+    is_skill_learner = _is_skill_learner_mod()
+    add_item = _add_item_mod()
@@ -1,18 +1,16 @@
-from memory.space import Bank, START_ADDRESS_SNES, Space, Reserve, Allocate, Free, Write
+from memory.space import Bank, START_ADDRESS_SNES, Space, Reserve, Allocate, Free, Plan
 import instruction.asm as asm
 import args
 
 def _multiply_mod():
     # 16 bit a = high byte of a * low byte of a
     return 0x24781
-multiply = _multiply_mod()
 
 def _multiply_a_e8_mod():
     # 24 bit e8 = 8 bit e8 * 16 bit a
     # 16 bit a = (8 bit e8 * 16 bit a) / 256
     # 16 bit ec = 8 bit e8 * high byte of a
     return 0x247b7
-multiply_a_e8 = _multiply_a_e8_mod()
 
 def _multiply_max_100_mod():
     # 16 bit a = high byte of a * low byte of a
@@ -29,9 +27,8 @@ def _multiply_max_100_mod():
         asm.PLP(),
         asm.RTS(),
     ]
-    space = Write(Bank.C2, src, "c2 multiply_max_100, a = low a * high a")
+    space = Plan(Bank.C2, src, "c2 multiply_max_100, a = low a * high a")
     return space.start_address
-multiply_max_100 = _multiply_max_100_mod()
 
 def _multiply_max_255_mod():
     # 8 bit a = high byte of a * low byte of a
@@ -48,9 +45,8 @@ def _multiply_max_255_mod():
         asm.PLP(),
         asm.RTS(),
     ]
-    space = Write(Bank.C2, src, "c2 multiply_max_255, a = low a * high a")
+    space = Plan(Bank.C2, src, "c2 multiply_max_255, a = low a * high a")
     return space.start_address
-multiply_max_255 = _multiply_max_255_mod()
 
 def _multiply_max_65535_mod():
     # 16 bit a = 8 bit e8 * 16 bit a
@@ -72,32 +68,40 @@ def _multiply_max_65535_mod():
         asm.PLP(),
         asm.RTS(),
     ]
-    space = Write(Bank.C2, src, "c2 multiply_max_65535, a = e8 * a")
+    space = Plan(Bank.C2, src, "c2 multiply_max_65535, a = e8 * a")
     return space.start_address
-multiply_max_65535 = _multiply_max_65535_mod()
 
 def _divide_mod():
     # 16 bit a = 16 bit a // 8 bit x
     # 8 bit x = 16 bit a % 8 bit x
     return 0x24792
-divide = _divide_mod()
 
 def _rng_carry_mod():
     # randomly set/clear carry bit
     return 0x24b53
-rng_carry = _rng_carry_mod()
 
 def _rng_mod():
     # a = random number (0 to 255)
     return 0x24b5a
-rng = _rng_mod()
 
 def _rng_a_mod():
     # a = random number (0 to a register - 1)
     return 0x24b65
-rng_a = _rng_a_mod()
 
 def _set_bit_x_mod():
     # set bit #x in a
     return 0x21e57
-set_bit_x = _set_bit_x_mod()
+
+def init():
+    global multiply, multiply_a_e8, multiply_max_100, multiply_max_255, multiply_max_65535, divide
+    global rng_carry, rng, rng_a, set_bit_x
+    multiply = _multiply_mod()
+    multiply_a_e8 = _multiply_a_e8_mod()
+    multiply_max_100 = _multiply_max_100_mod()
+    multiply_max_255 = _multiply_max_255_mod()
+    multiply_max_65535 = _multiply_max_65535_mod()
+    divide = _divide_mod()
+    rng_carry = _rng_carry_mod()
+    rng = _rng_mod()
+    rng_a = _rng_a_mod()
+    set_bit_x = _set_bit_x_mod()
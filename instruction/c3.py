@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Space, Reserve, Allocate, Free, Write
+from memory.space import Bank, START_ADDRESS_SNES, Space, Reserve, Allocate, Free, Plan
 import instruction.asm as asm
 
 # Allow Eggers jumps into C3 -- that is, enable calls to JSR routines from other banks
@@ -8,9 +8,8 @@ def _eggers_jump_return_mod():
         asm.RTS(),
         asm.RTL()
     ]
-    space =  Write(Bank.C3, src, "C3 eggers jump return")
+    space =  Plan(Bank.C3, src, "C3 eggers jump return")
     return space.start_address
-eggers_jump_return = _eggers_jump_return_mod()
 
 # Eggers jump src to jump to the specified C3 subroutine and successfully return to another bank
 def eggers_jump(c3addr):
@@ -21,4 +20,8 @@ def eggers_jump(c3addr):
         asm.PEA(c3addr-1), # return after execution
         asm.JMP(eggers_jump_return + START_ADDRESS_SNES, asm.LNG),
     ]
-    return src
\ No newline at end of file
+    return src
+
+def init():
+    global eggers_jump_return
+    eggers_jump_return = _eggers_jump_return_mod()
\ No newline at end of file
@@ -6,14 +6,12 @@ def _multiply_mod():
     src = Read(0x24781, 0x24791)
     space = Write(Bank.C4, src, "c4 multiply a = low a * high a")
     return space.start_address
-multiply = _multiply_mod()
 
 def _divide_mod():
     # 16 bit a = 16 bit a / 8 bit x and x = 8 bit remainder
     src = Read(0x24792, 0x247b6)
     space = Write(Bank.C4, src, "c4 divide a = a / x, x = a % x")
     return space.start_address
-divide = _divide_mod()
 
 def _battle_rng():
     # a = random number (0 to 255)
@@ -21,7 +19,6 @@ def _battle_rng():
     src = Read(0x24b5a, 0x24b64)
     space = Write(Bank.C4, src, "c4 battle_rng (0 to 255)")
     return space.start_address
-battle_rng = _battle_rng()
 
 def _battle_rng_a():
     # a = random number (0 to a register - 1)
@@ -33,4 +30,10 @@ def _battle_rng_a():
     ]
     space = Write(Bank.C4, src, "c4 battle_rng_a (0 to a - 1)")
     return space.start_address
-battle_rng_a = _battle_rng_a()
+
+def init():
+    global multiply, divide, battle_rng, battle_rng_a
+    multiply = _multiply_mod()
+    divide = _divide_mod()
+    battle_rng = _battle_rng()
+    battle_rng_a = _battle_rng_a()
@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Write, Read
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Plan, Read
 from instruction.event import _Instruction, _Branch
 import instruction.asm as asm
 import instruction.c0 as c0
@@ -18,12 +18,11 @@ def _add_esper_increment():
         asm.INC(event_word.address(event_word.ESPERS_FOUND), asm.ABS),
         Read(0xadd4, 0xadd6),   # advance event script
     ]
-    space = Write(Bank.C0, src, "add esper command increment espers found event word")
+    space = Plan(Bank.C0, src, "add esper command increment espers found event word")
     increment_found = space.start_address
 
     space = Reserve(0xadd4, 0xadd6, "add esper command jmp to increment event word", asm.NOP())
     space.write(asm.JMP(increment_found, asm.ABS))
-_add_esper_increment()
 
 class RemoveDeath(_Instruction):
     def __init__(self, character):
@@ -49,7 +48,7 @@ class RemoveDeath(_Instruction):
             asm.LDA(0x02, asm.IMM8),        # command size
             asm.JMP(0x9b5c, asm.ABS),       # next command
         ]
-        space = Write(Bank.C0, src, "custom remove_death command")
+        space = Plan(Bank.C0, src, "custom remove_death command")
         address = space.start_address
 
         opcode = 0x6f
@@ -135,7 +134,7 @@ class SetEquipmentAndCommands(_Instruction):
             # C0/A17C:	4C5C9B  	JMP $9B5C
             asm.JMP(0x9b5c, asm.ABS),       # next command
         ]
-        space = Write(Bank.C0, src, "custom swap equipment and commands command")
+        space = Plan(Bank.C0, src, "custom swap equipment and commands command")
         address = space.start_address
 
         opcode = 0xa3
@@ -154,7 +153,7 @@ class ToggleWorlds(_Instruction):
             asm.STA(0x1f69, asm.ABS),           # update parent map
             asm.JMP(fade_load_map, asm.ABS),    # jump to original fade load map command
         ]
-        space = Write(Bank.C0, src, "custom toggle worlds instruction")
+        space = Plan(Bank.C0, src, "custom toggle worlds instruction")
         address = space.start_address
 
         opcode = 0x6d
@@ -178,7 +177,7 @@ class LoadEsperFound(_Instruction):
             asm.LDA(0x02, asm.IMM8),        # command size
             asm.JMP(0x9b5c, asm.ABS),       # next command
         ]
-        space = Write(Bank.C0, src, "custom load esper found instruction")
+        space = Plan(Bank.C0, src, "custom load esper found instruction")
         address = space.start_address
 
         opcode = 0x83
@@ -230,7 +229,7 @@ class LoadPartiesWithCharacters(_Instruction):
             asm.JMP(0x9b5c, asm.ABS),       # next command
         ]
 
-        space = Write(Bank.C0, src, "custom load parties with characters instruction")
+        space = Plan(Bank.C0, src, "custom load parties with characters instruction")
         address = space.start_address
 
         opcode = 0xe5
@@ -247,7 +246,7 @@ class RecruitCharacter(_Instruction):
             asm.LDA(0x02, asm.IMM8),        # command size
             asm.JMP(0x9b5c, asm.ABS),       # next command
         ]
-        space = Write(Bank.C0, src, "custom recruit_character command")
+        space = Plan(Bank.C0, src, "custom recruit_character command")
         address = space.start_address
 
         opcode = 0x76
@@ -291,7 +290,7 @@ class _InvokeBattleType(_Instruction):
             asm.STA(0x11e3, asm.ABS),       # store battle type in upper byte of battle background
             asm.JMP(0xa57b, asm.ABS),       # jmp to original invoke battle command code (after setup)
         ]
-        space = Write(Bank.C0, src, "custom invoke_battle_type command")
+        space = Plan(Bank.C0, src, "custom invoke_battle_type command")
         invoke_battle_type_address = space.start_address
 
         src = [
@@ -308,7 +307,7 @@ class _InvokeBattleType(_Instruction):
             Read(0x22e3a, 0x22e3c),
             asm.JMP(0x2e3d, asm.ABS),       # jmp back to normal battle type loading code
         ]
-        space = Write(Bank.C2, src, "custom event instruction battle type check")
+        space = Plan(Bank.C2, src, "custom event instruction battle type check")
         battle_type_check = space.start_address
 
         space = Reserve(0x22e3a, 0x22e3c, "battle load relic effects 2", asm.NOP())
@@ -354,7 +353,7 @@ class BranchChance(_Branch):
             asm.LDA(0xee, asm.DIR),         # a = high byte of destination
             asm.JMP(yes_branch, asm.ABS),
         ]
-        space = Write(Bank.C0, src, "custom branch_chance command")
+        space = Plan(Bank.C0, src, "custom branch_chance command")
         address = space.start_address
 
         opcode = 0xa5
@@ -374,7 +373,7 @@ class LongCall(_Instruction):
             asm.LDA(0x05, asm.IMM8),        # command size
             asm.JMP(0x9b5c, asm.ABS),       # next command
         ]
-        space = Write(Bank.C0, src, "custom long call return")
+        space = Plan(Bank.C0, src, "custom long call return")
         return_address = space.start_address
 
         src = [
@@ -393,7 +392,7 @@ class LongCall(_Instruction):
 
             asm.JMP(0x05f4, asm.ABS_24),
         ]
-        space = Write(Bank.C0, src, "custom long call")
+        space = Plan(Bank.C0, src, "custom long call")
         address = space.start_address
 
         opcode = 0x8f # overwrite learn all swdtech
@@ -402,3 +401,6 @@ class LongCall(_Instruction):
         LongCall.__init__ = (lambda self, function_address, arg = 0 :
                              super().__init__(opcode, function_address.to_bytes(3, "little"), arg))
         self.__init__(function_address, arg)
+
+def init():
+    _add_esper_increment()
@@ -1,4 +1,5 @@
-from memory.space import Bank, Reserve, Write
+from memory.space import Bank, Reserve, Plan
+from memory import patch_bundle
 import instruction.field.instructions as field
 import instruction.field.entity as field_entity
 import data.battle_bit as battle_bit
@@ -33,9 +34,8 @@ def _delete_all_characters_mod():
     src += [
         field.Return(),
     ]
-    space = Write(Bank.CA, src, "field function delete all characters")
+    space = Plan(Bank.CA, src, "field function delete all characters")
     return space.start_address
-DELETE_ALL_CHARACTERS = _delete_all_characters_mod()
 
 def _refresh_characters_and_select_parties_mod(count):
     # create all available characters, select count parties, delete characters not placed into any party
@@ -52,21 +52,18 @@ def _refresh_characters_and_select_parties_mod(count):
 
 def _select_party_mod():
     src = _refresh_characters_and_select_parties_mod(1)
-    space = Write(Bank.CA, src, "field function refresh characters and select party")
+    space = Plan(Bank.CA, src, "field function refresh characters and select party")
     return space.start_address
-REFRESH_CHARACTERS_AND_SELECT_PARTY = _select_party_mod()
 
 def _select_two_parties_mod():
     src = _refresh_characters_and_select_parties_mod(2)
-    space = Write(Bank.CA, src, "field function refresh characters and select two parties")
+    space = Plan(Bank.CA, src, "field function refresh characters and select two parties")
     return space.start_address
-REFRESH_CHARACTERS_AND_SELECT_TWO_PARTIES = _select_two_parties_mod()
 
 def _select_three_parties_mod():
     src = _refresh_characters_and_select_parties_mod(3)
-    space = Write(Bank.CA, src, "field function refresh characters and select three parties")
+    space = Plan(Bank.CA, src, "field function refresh characters and select three parties")
     return space.start_address
-REFRESH_CHARACTERS_AND_SELECT_THREE_PARTIES = _select_three_parties_mod()
 
 def _toggle_party_magitek_mod():
     src = [
@@ -76,9 +73,8 @@ def _toggle_party_magitek_mod():
         field.ToggleStatusEffects(field_entity.PARTY3, field.Status.MAGITEK),
         field.Return(),
     ]
-    space = Write(Bank.CA, src, "field function toggle party magitek")
+    space = Plan(Bank.CA, src, "field function toggle party magitek")
     return space.start_address
-TOGGLE_PARTY_MAGITEK = _toggle_party_magitek_mod()
 
 def _original_check_game_over_mod():
     src = [
@@ -86,9 +82,8 @@ def _original_check_game_over_mod():
         field.Call(GAME_OVER),
         field.Return(),
     ]
-    space = Write(Bank.CA, src, "field function original check game over")
+    space = Plan(Bank.CA, src, "field function original check game over")
     return space.start_address
-ORIGINAL_CHECK_GAME_OVER = _original_check_game_over_mod()
 
 def _check_game_over_mod():
     src = [
@@ -101,7 +96,7 @@ def _check_game_over_mod():
         field.Call(GAME_OVER),
         field.Return(),
     ]
-    space = Write(Bank.CA, src, "field function check game over")
+    space = Plan(Bank.CA, src, "field function check game over")
     check_game_over = space.start_address
 
     # replace original game over check with bababreath safe one
@@ -111,7 +106,6 @@ def _check_game_over_mod():
         field.Return(),
     )
     return check_game_over
-CHECK_GAME_OVER = _check_game_over_mod()
 
 class CheckObjectives(field.Call):
     def __init__(self):
@@ -125,7 +119,7 @@ class CheckObjectives(field.Call):
         src += [
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "field check objectives")
+        space = Plan(Bank.CA, src, "field check objectives")
         CheckObjectives.__init__ = lambda self : super().__init__(space.start_address)
         self.__init__()
 
@@ -137,6 +131,20 @@ class FinishCheck(field.Call):
             CheckObjectives(),
             field.Return(),
         ]
-        space = Write(Bank.CA, src, "field function finish check")
+        space = Plan(Bank.CA, src, "field function finish check")
         FinishCheck.__init__ = lambda self : super().__init__(space.start_address)
         self.__init__()
+
+def init():
+    global DELETE_ALL_CHARACTERS, REFRESH_CHARACTERS_AND_SELECT_PARTY
+    global REFRESH_CHARACTERS_AND_SELECT_TWO_PARTIES, REFRESH_CHARACTERS_AND_SELECT_THREE_PARTIES
+    global TOGGLE_PARTY_MAGITEK, ORIGINAL_CHECK_GAME_OVER, CHECK_GAME_OVER
+    # select party functions call delete all characters, its address is part of their key so they are recorded
+    # again if it moves
+    DELETE_ALL_CHARACTERS = patch_bundle.run("field function delete all characters", None, _delete_all_characters_mod)
+    REFRESH_CHARACTERS_AND_SELECT_PARTY = patch_bundle.run("field function refresh characters and select party", DELETE_ALL_CHARACTERS, _select_party_mod)
+    REFRESH_CHARACTERS_AND_SELECT_TWO_PARTIES = patch_bundle.run("field function refresh characters and select two parties", DELETE_ALL_CHARACTERS, _select_two_parties_mod)
+    REFRESH_CHARACTERS_AND_SELECT_THREE_PARTIES = patch_bundle.run("field function refresh characters and select three parties", DELETE_ALL_CHARACTERS, _select_three_parties_mod)
+    TOGGLE_PARTY_MAGITEK = patch_bundle.run("field function toggle party magitek", None, _toggle_party_magitek_mod)
+    ORIGINAL_CHECK_GAME_OVER = patch_bundle.run("field function original check game over", None, _original_check_game_over_mod)
+    CHECK_GAME_OVER = patch_bundle.run("field function check game over", None, _check_game_over_mod)
@@ -1,4 +1,4 @@
-from memory.space import Bank, Allocate, Reserve, Write, Read
+from memory.space import Bank, Allocate, Reserve, Plan, Read
 import args
 
 import instruction.field.instructions as field
@@ -156,7 +156,7 @@ def reflect():
         ),
         field.Return(),
     ]
-    space = Write(Bank.CC, src, "field y npc reflect")
+    space = Plan(Bank.CC, src, "field y npc reflect")
     return space.start_address
 
 def stone():
@@ -174,7 +174,7 @@ def stone():
         Read(0xc19fd, 0xc1a03), # set palette 7 to gray
         field.Return(),
     ]
-    space = Write(Bank.CC, src, "field y npc stone")
+    space = Plan(Bank.CC, src, "field y npc stone")
     return space.start_address
 
 def vanish_xzone():
@@ -227,7 +227,7 @@ def vanish_xzone():
         ),
         field.Return(),
     ]
-    space = Write(Bank.CC, src, "field y npc vanish xzone")
+    space = Plan(Bank.CC, src, "field y npc vanish xzone")
     return space.start_address
 
 def sketch():
@@ -239,7 +239,7 @@ def sketch():
         YNPCEffect(YEffect.ANY_RANDOM_GRAPHIC),
         field.Return(),
     ]
-    space = Write(Bank.CC, src, "field y npc sketch")
+    space = Plan(Bank.CC, src, "field y npc sketch")
     return space.start_address
 
 def remove():
@@ -250,7 +250,7 @@ def remove():
         YNPCEffect(YEffect.DELETE),
         field.Return(),
     ]
-    space = Write(Bank.CC, src, "field y npc remove")
+    space = Plan(Bank.CC, src, "field y npc remove")
     return space.start_address
 
 def random_graphics():
@@ -261,7 +261,7 @@ def random_graphics():
         YNPCEffect(YEffect.RANDOM_GRAPHIC),
         field.Return(),
     ]
-    space = Write(Bank.CC, src, "field y npc random graphics")
+    space = Plan(Bank.CC, src, "field y npc random graphics")
     return space.start_address
 
 def _y_npc():
@@ -289,5 +289,7 @@ def _y_npc():
         address = remove()
     return address
 
-# called when player interacts with npc using y button
-Y_NPC = _y_npc()
+def init():
+    global Y_NPC
+    # called when player interacts with npc using y button
+    Y_NPC = _y_npc()
@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right, insort
+
 class Block:
     def __init__(self, start, end):
         if start > end:
@@ -7,6 +9,7 @@ class Block:
             self._start = start
             self._end = end
         self._size = self._end - self._start + 1
+        self.order = 0
 
     @property
     def size(self):
@@ -31,91 +34,119 @@ class Block:
         self._size = self._end - self._start + 1
 
 class Heap:
+    # free blocks are indexed by address (to find blocks touching a freed/reserved range) and by size (for best fit)
+    # blocks also have an order matching the list order of the original linear heap: freed blocks are placed
+    # first and blocks split by reserve are placed last, best fit ties are broken by this order so the same
+    # sequence of calls always results in the same addresses
     def __init__(self):
-        self.blocks = []
+        self._starts = []       # sorted start addresses of free blocks
+        self._start_block = {}  # start address -> free block
+        self._sizes = []        # sorted (size, order, start) of free blocks
+        self._first_order = 0
+        self._last_order = 0
         self._available = 0
 
+    def _add(self, block, order):
+        block.order = order
+        insort(self._starts, block.start)
+        self._start_block[block.start] = block
+        insort(self._sizes, (block.size, order, block.start))
+
+    def _remove(self, block):
+        del self._starts[bisect_left(self._starts, block.start)]
+        del self._start_block[block.start]
+        del self._sizes[bisect_left(self._sizes, (block.size, block.order, block.start))]
+
+    def _touching(self, start, end):
+        # blocks which overlap or are within the given range, in descending address order
+        blocks = []
+        index = bisect_right(self._starts, end)
+        while index > 0:
+            block = self._start_block[self._starts[index - 1]]
+            if block.end < start:
+                break
+            blocks.append(block)
+            index -= 1
+        return blocks
+
     def allocate(self, size):
-        def find_best_fit(size):
-            best_block = None
-            if not self.blocks:
-                return None
-
-            best_diff = self._available
-            for block in self.blocks:
-                diff = block.size - size
-                if diff == 0:
-                    return block
-                elif diff > 0 and diff < best_diff:
-                    best_block = block
-                    best_diff = diff
-            return best_block
-
-        block = find_best_fit(size)
-        if block is None:
+        # smallest block which fits, first in order if multiple blocks are the same size
+        index = bisect_left(self._sizes, (size,))
+        if index == len(self._sizes) or (self._sizes[index][0] != size and self._sizes[index][0] - size >= self._available):
             raise MemoryError(f"Unable to allocate block of size {size}")
 
-        start = block.start
+        _, order, start = self._sizes[index]
+        block = self._start_block[start]
+        self._remove(block)
         block.start += size
-        if block.size == 0:
-            self.blocks.remove(block)
+        if block.size > 0:
+            self._add(block, order)
         self._available -= size
         return start
 
     def free(self, start, end):
         new_block = Block(start, end)
 
-        overlaps = set()
-        for block in self.blocks:
-            if block.start >= new_block.start and block.start <= new_block.end + 1:
-                if block.end > new_block.end:
-                    new_block.end = block.end
-                overlaps.add(block)
-            elif block.end <= new_block.end and block.end >= new_block.start - 1:
-                if block.start < new_block.start:
-                    new_block.start = block.start
-                overlaps.add(block)
-            elif block.start < new_block.start and block.end > new_block.end:
+        overlaps = self._touching(new_block.start - 1, new_block.end + 1)
+        for block in overlaps:
+            if block.start < new_block.start and block.end > new_block.end:
                 return # new block is already encompassed by a single existing free block
 
-        new_blocks = [new_block]
-        self._available = new_block.size
-        for block in self.blocks:
-            if block not in overlaps:
-                new_blocks.append(block)
-                self._available += block.size
-        self.blocks = new_blocks
+        for block in overlaps:
+            self._remove(block)
+            self._available -= block.size
+            if block.start < new_block.start:
+                new_block.start = block.start
+            if block.end > new_block.end:
+                new_block.end = block.end
+
+        self._first_order -= 1
+        self._add(new_block, self._first_order)
+        self._available += new_block.size
 
     def reserve(self, start, end):
         reserved = Block(start, end)
 
-        overlaps = set()
-        for block in self.blocks:
-            if block.start >= reserved.start and block.start <= reserved.end:
-                if block.end > reserved.end:
-                    block.start = reserved.end + 1
-                else:
-                    overlaps.add(block)
-            elif block.end <= reserved.end and block.end >= reserved.start:
-                if block.start < reserved.start:
-                    block.end = reserved.start - 1
-                else:
-                    overlaps.add(block)
-            elif block.start < reserved.start and block.end > reserved.end:
+        for block in self._touching(reserved.start, reserved.end):
+            self._remove(block)
+            self._available -= block.size
+
+            if block.start < reserved.start and block.end > reserved.end:
                 # reserved is encompassed by a single exsting free block
                 # split block into two blocks which don't overlap reserved
-                self.blocks.append(Block(reserved.end + 1, block.end))
+                self._last_order += 1
+                self._add(Block(reserved.end + 1, block.end), self._last_order)
                 block.end = reserved.start - 1
-                self._available -= (end - start) + 1
+                self._add(block, block.order)
+                self._available += block.size + self._start_block[reserved.end + 1].size
                 return
 
-        new_blocks = []
-        self._available = 0
-        for block in self.blocks:
-            if block not in overlaps:
-                new_blocks.append(block)
-                self._available += block.size
-        self.blocks = new_blocks
+            if block.start >= reserved.start and block.end > reserved.end:
+                block.start = reserved.end + 1
+            elif block.start < reserved.start:
+                block.end = reserved.start - 1
+            else:
+                continue # block is entirely within reserved
+
+            self._add(block, block.order)
+            self._available += block.size
+
+    def copy(self):
+        result = Heap()
+        for block in self._start_block.values():
+            copy = Block(block.start, block.end)
+            copy.order = block.order
+            result._start_block[copy.start] = copy
+        result._starts = list(self._starts)
+        result._sizes = list(self._sizes)
+        result._first_order = self._first_order
+        result._last_order = self._last_order
+        result._available = self._available
+        return result
+
+    @property
+    def blocks(self):
+        return sorted(self._start_block.values(), key = lambda block : block.order)
 
     @property
     def available(self):
@@ -60,3 +60,77 @@ class LabelPointer:
 
     def __repr__(self):
         return f"{hex(int(self))}, *{hex(self.address)} = {repr(self.label)} + {hex(self.offset)}"
+
+# address of a space planned with Plan, unknown until Place writes the space
+# arithmetic returns a new planned address computed from this one, e.g. address - EVENT_CODE_START or address & 0xffff
+# and to_bytes returns a planned address for each byte, the rom keeps them until it is written
+# using the value (int(), comparisons, hex(), str(), ...) before the space is placed raises TypeError
+class PlannedAddress:
+    def __init__(self, resolve, description):
+        self.resolve = resolve          # function which returns the address or None if not placed yet
+        self.description = description  # description of the planned space
+
+    def __int__(self):
+        value = self.resolve()
+        if value is None:
+            raise TypeError(f"Address of planned space \"{self.description}\" used before it was placed")
+        return value
+
+    def __index__(self):
+        return int(self)
+
+    def __bool__(self):
+        return bool(int(self))
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if not isinstance(other, (int, PlannedAddress)):
+            return NotImplemented
+        return int(self) == int(other)
+
+    __hash__ = None
+
+    def _operation(self, operation, other):
+        return PlannedAddress(lambda : operation(int(self), int(other)), self.description)
+
+    def __add__(self, other):
+        return self._operation(lambda value, other : value + other, other)
+
+    def __radd__(self, other):
+        return self._operation(lambda value, other : other + value, other)
+
+    def __sub__(self, other):
+        return self._operation(lambda value, other : value - other, other)
+
+    def __rsub__(self, other):
+        return self._operation(lambda value, other : other - value, other)
+
+    def __and__(self, other):
+        return self._operation(lambda value, other : value & other, other)
+
+    def __or__(self, other):
+        return self._operation(lambda value, other : value | other, other)
+
+    def __rshift__(self, other):
+        return self._operation(lambda value, other : value >> other, other)
+
+    def __floordiv__(self, other):
+        return self._operation(lambda value, other : value // other, other)
+
+    def __mod__(self, other):
+        return self._operation(lambda value, other : value % other, other)
+
+    def to_bytes(self, length, byteorder, *, signed = False):
+        return [PlannedAddress(lambda index = index : int(self).to_bytes(length, byteorder, signed = signed)[index], self.description)
+                for index in range(length)]
+
+    def __str__(self):
+        return hex(int(self))
+
+    def __format__(self, format_spec):
+        return format(int(self), format_spec)
+
+    def __repr__(self):
+        value = self.resolve()
+        return f"planned \"{self.description}\" ({'?' if value is None else hex(value)})"
@@ -1,14 +1,22 @@
 from memory.rom import ROM
 from memory.space import Space
 from memory.free import free
+import memory.patch_bundle as patch_bundle
 import args
 
 class Memory:
-    def __init__(self):
-        self.rom = ROM(args.input_file)
+    def __init__(self, rom = None):
+        if rom is None:
+            rom = ROM(args.input_file, args.rom_cache_directory)
+        self.rom = rom
         Space.rom = self.rom
+        Space.planned = [] if args.pack_allocations else None
         free()
 
     def write(self):
+        Space.check_labels()
+        patch_bundle.save()
         if not args.no_rom_output:
             self.rom.write(args.output_file)
+        if args.patch_file:
+            self.rom.write_patch(args.patch_file)
@@ -0,0 +1,240 @@
+# bundle of rom writes made by stages which do not depend on the seed (e.g. bug fixes, fixed field functions)
+# a stage is run once and its writes, the heap reservations/allocations/frees it made and the spaces it created
+# are recorded, later runs copy the recorded bytes into the rom and replay the heap calls instead of assembling it
+#   patch_bundle.run("bug fixes", [args.fix_evade, ...], BugFixes)
+# a recorded stage is only applied if every allocation it made returns the same address again, otherwise it is run
+# and recorded again, stages which write outside of the spaces they create are always run and never recorded
+# stages must only depend on key, not on rom contents written by other stages, a stage which calls code written by
+# another stage must include that code's address in its key
+# an entry also stores a hash of every generator source file loaded when it was recorded, it is recorded again
+# if any of them changed
+import hashlib, json, os, struct, sys
+
+BUNDLE_VERSION = 2
+MAGIC = b"WCPB"
+HEADER = struct.Struct("<4sHI") # magic, bundle version, index size
+
+_path = None        # bundle file loaded
+_entries = {}       # (name, key) -> entry
+_modified = False   # entries recorded since the bundle was loaded
+_source_hashes = {} # (path, size, modification time) -> sha256 of source file
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _bundle_path():
+    import args
+    return getattr(args, "patch_bundle", None)
+
+def _source_hash(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    cache_key = (path, stat.st_size, stat.st_mtime_ns)
+    if cache_key not in _source_hashes:
+        with open(path, "rb") as source_file:
+            _source_hashes[cache_key] = hashlib.sha256(source_file.read()).hexdigest()
+    return _source_hashes[cache_key]
+
+def _sources():
+    # relative path -> hash of the source of every generator module loaded, a stage can only run code from these
+    import inspect
+    result = {}
+    for module in list(sys.modules.values()):
+        try:
+            path = inspect.getsourcefile(module)
+        except TypeError:
+            continue # built in module or an object which replaced its module (e.g. objectives)
+        if path is None:
+            continue
+        path = os.path.abspath(path)
+        if path.startswith(ROOT_DIRECTORY + os.sep):
+            result[os.path.relpath(path, ROOT_DIRECTORY)] = _source_hash(path)
+    return result
+
+def _sources_changed(sources):
+    return any(_source_hash(os.path.join(ROOT_DIRECTORY, path)) != source_hash for path, source_hash in sources.items())
+
+def _entry_key(name, key):
+    return (name, json.dumps(key))
+
+def load(path):
+    # read entries from bundle file at path, a missing file or one from another version is an empty bundle
+    global _path, _entries, _modified
+    import version
+    _path = path
+    _entries = {}
+    _modified = False
+    try:
+        with open(path, "rb") as bundle_file:
+            data = bundle_file.read()
+    except OSError:
+        return
+
+    if len(data) < HEADER.size:
+        return
+    magic, bundle_version, index_size = HEADER.unpack_from(data)
+    if magic != MAGIC or bundle_version != BUNDLE_VERSION:
+        return
+    try:
+        index = json.loads(data[HEADER.size : HEADER.size + index_size])
+    except ValueError:
+        return
+    if index.get("version") != version.__version__:
+        return
+
+    blob = memoryview(data)[HEADER.size + index_size:]
+    for entry in index["entries"]:
+        entry["writes"] = [(address, blob[offset : offset + size]) for address, offset, size in entry["writes"]]
+        _entries[_entry_key(entry["name"], entry["key"])] = entry
+
+def save():
+    # write recorded entries to the bundle file, nothing is written if no new entries were recorded
+    global _modified
+    if _path is None or not _modified:
+        return
+    import version
+
+    blob = bytearray()
+    entries = []
+    for entry in _entries.values():
+        writes = []
+        for address, data in entry["writes"]:
+            writes.append([address, len(blob), len(data)])
+            blob += data
+        entries.append(dict(entry, writes = writes))
+    index = json.dumps({"version" : version.__version__, "entries" : entries}).encode()
+
+    # write to a temporary file first so concurrent runs never read a partially written bundle
+    temp_path = f"{_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as bundle_file:
+        bundle_file.write(HEADER.pack(MAGIC, BUNDLE_VERSION, len(index)))
+        bundle_file.write(index)
+        bundle_file.write(blob)
+    os.replace(temp_path, _path)
+    _modified = False
+
+def run(name, key, function):
+    # apply stage name from the bundle if it was recorded with the same key, otherwise call function and record it
+    # key is every value (e.g. flags) the stage depends on, function's result is stored if it can be stored as json
+    global _modified
+    path = _bundle_path()
+    if path is None:
+        return function()
+    if path != _path:
+        load(path)
+
+    entry = _entries.get(_entry_key(name, key))
+    if entry is not None and not _sources_changed(entry["sources"]) and _apply(entry):
+        return entry["result"]
+
+    result, entry = _record(function)
+    if entry is not None:
+        entry["name"] = name
+        entry["key"] = key
+        try:
+            entry["result"] = json.loads(json.dumps(result))
+        except (TypeError, ValueError):
+            entry["result"] = None
+        _entries[_entry_key(name, key)] = entry
+        _modified = True
+    return result
+
+def _heap(heaps, address):
+    from memory.space import Space, Bank, BANK_SIZE
+    bank = Bank((address // BANK_SIZE) * BANK_SIZE)
+    if bank not in heaps:
+        heaps[bank] = Space.heaps[bank].copy()
+    return heaps[bank]
+
+def _apply(entry):
+    from memory.space import Space
+
+    # replay heap calls on copies of the heaps used so nothing changes if an allocation moved
+    heaps = {}
+    for operation, start_address, end_address in entry["operations"]:
+        heap = _heap(heaps, start_address)
+        if operation == "reserve":
+            heap.reserve(start_address, end_address)
+        elif operation == "free":
+            heap.free(start_address, end_address)
+        else:
+            try:
+                if heap.allocate(end_address - start_address + 1) != start_address:
+                    return False
+            except MemoryError:
+                return False
+
+    for start_address, end_address, description in entry["spaces"]:
+        Space(start_address, end_address, description)
+    Space.heaps.update(heaps)
+    if Space.heap_operations is not None:
+        Space.heap_operations.extend(tuple(operation) for operation in entry["operations"])
+
+    for address, data in entry["writes"]:
+        Space.rom.set_bytes(address, data)
+    return True
+
+def _ranges(spaces):
+    # merged (start, end) address ranges covered by spaces
+    result = []
+    for space in sorted(spaces, key = lambda space : space.start_address):
+        if result and space.start_address <= result[-1][1] + 1:
+            result[-1][1] = max(result[-1][1], space.end_address)
+        else:
+            result.append([space.start_address, space.end_address])
+    return result
+
+def _record(function):
+    # call function and return its result and an entry with everything it changed
+    # the entry is None if function changed the rom outside of the spaces it created
+    from memory.space import Space
+    rom = Space.rom
+    data = bytes(rom.data)
+    deferred = dict(rom.deferred)
+    spaces = set(id(space) for space in Space.spaces)
+
+    outer_operations = Space.heap_operations # stage run by another stage being recorded
+    Space.heap_operations = []
+    planned = Space.planned # blocks planned by the stage are written while it is recorded
+    Space.planned = None
+    try:
+        result = function()
+    finally:
+        operations = Space.heap_operations
+        Space.heap_operations = outer_operations
+        Space.planned = planned
+        if outer_operations is not None:
+            outer_operations.extend(operations)
+
+    new_spaces = [space for space in Space.spaces if id(space) not in spaces]
+    ranges = _ranges(new_spaces)
+
+    # everything outside of the new spaces must be unchanged
+    previous_end = 0
+    for start_address, end_address in ranges + [[len(rom.data), len(rom.data)]]:
+        if rom.data[previous_end : start_address] != data[previous_end : start_address]:
+            return result, None
+        previous_end = end_address + 1
+    starts = [start_address for start_address, end_address in ranges]
+    from bisect import bisect_right
+    for address in set(deferred) | set(rom.deferred):
+        index = bisect_right(starts, address) - 1
+        if (index < 0 or address > ranges[index][1]) and deferred.get(address) is not rom.deferred.get(address):
+            return result, None
+
+    writes = []
+    for start_address, end_address in ranges:
+        try:
+            values = bytes([int(value) for value in rom.get_bytes(start_address, end_address - start_address + 1)])
+        except (TypeError, ValueError):
+            return result, None # label pointers which have not found their labels
+        writes.append((start_address, values))
+
+    entry = {
+        "operations" : [list(operation) for operation in operations],
+        "spaces" : [[space.start_address, space.end_address, space.description] for space in new_spaces],
+        "writes" : writes,
+        "sources" : _sources(),
+    }
+    return result, entry
@@ -1,51 +1,113 @@
+from bisect import bisect_left, insort
+from utils.interval_set import IntervalSet
+
 class ROM():
     SHORT_PTR_SIZE = 2  # short ptr (16-bit)
     LONG_PTR_SIZE = 3   # long ptr  (24-bit)
 
-    def __init__(self, file_name):
-        from valid_rom_file import valid_rom_file
-        if not valid_rom_file(file_name):
-            raise ValueError("Invalid ROM File")
+    EXPANDED_SIZE = 4 * 2 ** 20 # 4 mb
+
+    def __init__(self, file_name, cache_directory = None):
+        # values which cannot be stored as a byte yet (e.g. label pointers and placeholders for labels
+        # which have not been found) are kept separately and resolved when the rom is written
+        self.deferred = {}
+        self.deferred_addresses = []
+
+        self.data = None
+        if cache_directory is not None:
+            from memory.rom_cache import load
+            self.data = load(file_name, cache_directory, self.EXPANDED_SIZE)
+
+        if self.data is None:
+            from valid_rom_file import get_sha256_hex, EXPECTED_SHA256
+            sha256 = get_sha256_hex(file_name)
+            if sha256 != EXPECTED_SHA256:
+                raise ValueError("Invalid ROM File")
+
+            with open(file_name, "rb") as rom_file:
+                self.data = bytearray(rom_file.read())
+
+            self.expand()
 
-        with open(file_name, "rb") as rom_file:
-            self.data = list(rom_file.read())
+            if cache_directory is not None:
+                from memory.rom_cache import store
+                store(file_name, cache_directory, sha256, self.data)
 
-        self.expand()
+        # unmodified input rom and the address ranges written since, patches are created from the difference
+        import os
+        self.source = bytes(self.data[:os.path.getsize(file_name)])
+        self.dirty = IntervalSet()
+
+    def copy(self):
+        rom = ROM.__new__(ROM)
+        rom.data = bytearray(self.data)
+        rom.deferred = dict(self.deferred)
+        rom.deferred_addresses = list(self.deferred_addresses)
+        rom.source = self.source
+        rom.dirty = self.dirty.copy()
+        return rom
 
     def size(self):
         return len(self.data)
 
     def expand(self):
-        expanded_size = 4 * 2 ** 20 # 4 mb
-        self.data.extend([0xff] * (expanded_size - len(self.data)))
+        self.data.extend(b'\xff' * (self.EXPANDED_SIZE - len(self.data)))
 
     def write(self, file_name):
         with open(file_name, "wb") as out_file:
-            out_file.write(bytearray(self.data))
+            out_file.write(self.to_bytes())
+
+    def write_patch(self, file_name):
+        # ips patch if file_name ends with .ips, otherwise bps
+        from memory.rom_patch import create
+        with open(file_name, "wb") as out_file:
+            out_file.write(create(self.source, self.to_bytes(), self.dirty, file_name.lower().endswith(".ips")))
+
+    def to_bytes(self):
+        # resolve deferred values and return a copy of the final rom data
+        result = bytearray(self.data)
+        for address, value in self.deferred.items():
+            result[address] = value
+        return result
 
     def get_bits(self, address, mask):
         return self.data[address] & mask
 
     def get_byte(self, address):
+        if self.deferred:
+            return self.deferred.get(address, self.data[address])
         return self.data[address]
 
     def get_short(self, address):
-        return int.from_bytes(self.get_bytes(address, 2), byteorder='little')
+        return int.from_bytes(self.get_view(address, 2), byteorder='little')
+
+    def get_view(self, address, count):
+        # zero-copy read-only view of rom data, deferred values are not included
+        return memoryview(self.data).toreadonly()[address : address + count]
 
     def get_bytes(self, address, count):
-        return self.data[address : address + count]
+        # list copy for callers which modify or extend the result
+        result = list(self.data[address : address + count])
+        if self.deferred:
+            start = bisect_left(self.deferred_addresses, address)
+            end = bisect_left(self.deferred_addresses, address + count)
+            for deferred_address in self.deferred_addresses[start : end]:
+                result[deferred_address - address] = self.deferred[deferred_address]
+        return result
 
     def get_bytes_endian_swap(self, address, count):
         return self.get_bytes(address, count)[::-1]
 
     def set_bits(self, address, mask, value):
         not_mask = 0xff - mask # be careful of signed values
+        self.dirty.add(address, address + 1)
         self.data[address] = (value & mask) | (self.data[address] & not_mask)
 
     def set_bit_num(self, address, bit_num, value):
         # set bit_num starting at address, e.g. bit_num = 12 address = 0xa0000, sets bit 4 in byte 0xa0001
         byte = bit_num // 8
         bit = bit_num % 8
+        self.dirty.add(address + byte, address + byte + 1)
 
         if value:
             self.data[address + byte] = self.data[address + byte] | (1 << bit)
@@ -53,14 +115,39 @@ class ROM():
             self.data[address + byte] = self.data[address + byte] & ~(1 << bit)
 
     def set_byte(self, address, value):
+        if self.deferred:
+            self._clear_deferred(address, address + 1)
+        self.dirty.add(address, address + 1)
         self.data[address] = value
 
     def set_short(self, address, value):
         self.set_bytes(address, value.to_bytes(2, 'little'))
 
     def set_bytes(self, address, values):
-        self.data[address : address + len(values)] = values
-        return address + len(values)
+        end_address = address + len(values)
+        if self.deferred:
+            self._clear_deferred(address, end_address)
+        self.dirty.add(address, end_address)
+
+        try:
+            self.data[address : end_address] = values
+        except TypeError:
+            # values contains label pointers or placeholders, store them until the rom is written
+            values = list(values)
+            for index, value in enumerate(values):
+                if not isinstance(value, int):
+                    self.deferred[address + index] = value
+                    insort(self.deferred_addresses, address + index)
+                    values[index] = 0
+            self.data[address : end_address] = bytes(values)
+        return end_address
+
+    def _clear_deferred(self, start_address, end_address):
+        start = bisect_left(self.deferred_addresses, start_address)
+        end = bisect_left(self.deferred_addresses, end_address)
+        for address in self.deferred_addresses[start : end]:
+            del self.deferred[address]
+        del self.deferred_addresses[start : end]
 
     def set_bytes_endian_swap(self, address, values):
         return self.set_bytes(address, values[::-1])
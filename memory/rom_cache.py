@@ -0,0 +1,56 @@
+# cache of validated and expanded input roms
+# entries are keyed by the input file's path, size and modification time, if none of those changed the file
+# does not need to be hashed again and the expanded image can be read directly
+import hashlib, json, os
+
+CACHE_VERSION = 1
+
+def _entry_path(cache_directory, file_name):
+    stat = os.stat(file_name)
+    key = f"{os.path.abspath(file_name)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return os.path.join(cache_directory, hashlib.sha256(key.encode()).hexdigest()), stat
+
+def load(file_name, cache_directory, expanded_size):
+    # return expanded rom data for file_name if it has already been validated, otherwise None
+    entry_path, stat = _entry_path(cache_directory, file_name)
+    try:
+        with open(entry_path + ".json", "r") as metadata_file:
+            metadata = json.load(metadata_file)
+    except (OSError, ValueError):
+        return None
+
+    from valid_rom_file import EXPECTED_SHA256
+    if (metadata.get("version") != CACHE_VERSION or metadata.get("sha256") != EXPECTED_SHA256 or
+        metadata.get("size") != stat.st_size or metadata.get("mtime_ns") != stat.st_mtime_ns):
+        return None
+
+    data = bytearray(expanded_size)
+    try:
+        with open(entry_path + ".rom", "rb") as image_file:
+            if image_file.readinto(data) != expanded_size or image_file.read(1):
+                return None
+    except OSError:
+        return None
+    return data
+
+def store(file_name, cache_directory, sha256, data):
+    # save validated, expanded rom data for file_name, write to temporary files first so that
+    # concurrent runs never read a partially written entry
+    os.makedirs(cache_directory, exist_ok = True)
+    entry_path, stat = _entry_path(cache_directory, file_name)
+    metadata = {
+        "version" : CACHE_VERSION,
+        "input_file" : os.path.abspath(file_name),
+        "size" : stat.st_size,
+        "mtime_ns" : stat.st_mtime_ns,
+        "sha256" : sha256,
+    }
+
+    temp_suffix = f".{os.getpid()}.tmp"
+    with open(entry_path + ".rom" + temp_suffix, "wb") as image_file:
+        image_file.write(data)
+    os.replace(entry_path + ".rom" + temp_suffix, entry_path + ".rom")
+
+    with open(entry_path + ".json" + temp_suffix, "w") as metadata_file:
+        json.dump(metadata, metadata_file, indent = 4)
+    os.replace(entry_path + ".json" + temp_suffix, entry_path + ".json")
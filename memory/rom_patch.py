@@ -0,0 +1,111 @@
+# ips and bps patches which turn the input rom into the generated rom
+# only ranges written to the rom are compared, everything else is known to be unchanged (the expanded part
+# of the rom after the input is 0xff)
+import re, zlib
+
+COMPARE_BLOCK_SIZE = 64
+MERGE_GAP = 4 # unchanged bytes between two changes which are copied with them instead of starting a new change
+
+def _changes(source, target, ranges):
+    # sorted (start, end) ranges where target differs from source
+    baseline = source + b"\xff" * (len(target) - len(source))
+    result = []
+    for range_start, range_end in ranges:
+        for block_start in range(range_start, range_end, COMPARE_BLOCK_SIZE):
+            block_end = min(block_start + COMPARE_BLOCK_SIZE, range_end)
+            if target[block_start : block_end] == baseline[block_start : block_end]:
+                continue
+            for address in range(block_start, block_end):
+                if target[address] == baseline[address]:
+                    continue
+                if result and address <= result[-1][1] + MERGE_GAP:
+                    result[-1][1] = address + 1
+                else:
+                    result.append([address, address + 1])
+    return result
+
+def _bps_number(value):
+    result = bytearray()
+    while True:
+        low = value & 0x7f
+        value >>= 7
+        if value == 0:
+            result.append(0x80 | low)
+            return result
+        result.append(low)
+        value -= 1
+
+def bps(source, target, changes):
+    SOURCE_READ, TARGET_READ, TARGET_COPY = 0, 1, 3
+    patch = bytearray(b"BPS1")
+    patch += _bps_number(len(source)) + _bps_number(len(target)) + _bps_number(0) # no metadata
+    target_relative_offset = 0
+
+    def action(action_type, length):
+        patch.extend(_bps_number(((length - 1) << 2) | action_type))
+
+    def unchanged(start, end):
+        nonlocal target_relative_offset
+        source_end = min(end, len(source))
+        if start < source_end:
+            action(SOURCE_READ, source_end - start)
+            start = source_end
+        if start < end:
+            # expanded part of the rom, write one 0xff and repeat it by copying from the previous output byte
+            action(TARGET_READ, 1)
+            patch.append(0xff)
+            if end - start > 1:
+                offset = start - target_relative_offset
+                action(TARGET_COPY, end - start - 1)
+                patch.extend(_bps_number((abs(offset) << 1) | (offset < 0)))
+                target_relative_offset = end - 1
+
+    output_offset = 0
+    for start, end in changes:
+        unchanged(output_offset, start)
+        action(TARGET_READ, end - start)
+        patch += target[start : end]
+        output_offset = end
+    unchanged(output_offset, len(target))
+
+    patch += zlib.crc32(source).to_bytes(4, "little")
+    patch += zlib.crc32(target).to_bytes(4, "little")
+    patch += zlib.crc32(patch).to_bytes(4, "little")
+    return patch
+
+IPS_MAX_SIZE = 0xffff
+IPS_RLE_MIN_SIZE = 8 # runs of the same byte at least this long are written as rle records
+IPS_RUN = re.compile(rb"(.)\1{%d,}" % (IPS_RLE_MIN_SIZE - 1), re.DOTALL)
+
+def ips(source, target, changes):
+    # ips cannot extend the rom with a fill value, the whole expanded part is written
+    if len(target) > 0x454f46:
+        raise ValueError(f"rom too large for ips patch ({len(target)} bytes)")
+    ranges = [(start, min(end, len(source))) for start, end in changes if start < len(source)]
+    if len(target) > len(source):
+        ranges.append((len(source), len(target)))
+
+    patch = bytearray(b"PATCH")
+    def data_records(start, end):
+        for offset in range(start, end, IPS_MAX_SIZE):
+            size = min(IPS_MAX_SIZE, end - offset)
+            patch.extend(offset.to_bytes(3, "big") + size.to_bytes(2, "big"))
+            patch.extend(target[offset : offset + size])
+
+    for start, end in ranges:
+        for run in IPS_RUN.finditer(target, start, end):
+            data_records(start, run.start())
+            for offset in range(run.start(), run.end(), IPS_MAX_SIZE):
+                size = min(IPS_MAX_SIZE, run.end() - offset)
+                patch.extend(offset.to_bytes(3, "big") + bytes(2) + size.to_bytes(2, "big") + run.group(1))
+            start = run.end()
+        data_records(start, end)
+    patch += b"EOF"
+    return patch
+
+def create(source, target, ranges, use_ips = False):
+    # patch from source to target given the ranges of target which may have changed
+    changes = _changes(source, target, ranges)
+    if use_ips:
+        return ips(source, target, changes)
+    return bps(source, target, changes)
@@ -1,6 +1,6 @@
 from memory.rom import ROM
 from memory.heap import Heap
-from memory.label import Label, LabelPointer
+from memory.label import Label, LabelPointer, PlannedAddress
 
 from enum import IntEnum
 BANK_SIZE = 0x10000
@@ -12,6 +12,17 @@ class Space():
     rom = None
     heaps = { bank : Heap() for bank in Bank }
     spaces = []
+    heap_operations = None  # list of reserve/allocate/free calls while a patch bundle stage is recorded
+    planned = None          # blocks waiting for Place while planning, None places blocks when they are planned
+
+    @classmethod
+    def reset(cls):
+        # forget the rom and every allocation so another rom can be generated in the same process
+        cls.rom = None
+        cls.heaps = { bank : Heap() for bank in Bank }
+        cls.spaces = []
+        cls.heap_operations = None
+        cls.planned = None
 
     def __init__(self, start_address, end_address, description, clear_value = None):
         self._start_address = start_address
@@ -26,8 +37,8 @@ class Space():
         if clear_value is not None:
             self.clear(clear_value)
 
-        self.labels = {}
-        self.label_pointers = []
+        self.labels = {}            # label name -> label defined in this space
+        self.label_pointers = {}    # label name -> pointers to the label created in this space
 
         # check if space conflicts with any existing spaces
         from bisect import bisect
@@ -78,13 +89,20 @@ class Space():
         from utils.flatten import flatten
         values = flatten(values)
         values = self._invoke_callables(values)
-        values = self._parse_labels(values)
+        values, new_labels, label_pointers = self._parse_labels(values)
 
         self._next_address = Space.rom.set_bytes(self.next_address, values)
         if(self.next_address - 1 > self.end_address):
             raise MemoryError(f"Not enough room in space \"{self.description}\": Next (0x{self.next_address -1:x}) > End (0x{self.end_address:x}). Diff: {(self.next_address - 1) - (self.end_address)}")
 
-        self._update_label_pointers()
+        # pointers written before the labels they point to were found
+        for name in new_labels:
+            self._update_label_pointers(name)
+
+        # single byte pointers to labels found before this write, their values are resolved when the rom is written
+        for label_pointer in label_pointers:
+            if label_pointer.label.name in self.labels:
+                label_pointer.label.address = self.labels[label_pointer.label.name].address
 
     def clear(self, value):
         try:
@@ -102,6 +120,10 @@ class Space():
         self.write(Space.rom.get_bytes(start_address, end_address - start_address + 1))
 
     def add_label(self, name, address):
+        self._define_label(name, address)
+        self._update_label_pointers(name)
+
+    def _define_label(self, name, address):
         self.labels[name] = Label(name)
         self.labels[name].address = address
 
@@ -125,7 +147,7 @@ class Space():
 
     def _label_pointer(self, name, mode):
         label_pointer = LabelPointer(Label(name), None, mode)
-        self.label_pointers.append(label_pointer)
+        self.label_pointers.setdefault(name, []).append(label_pointer)
         return label_pointer # return a new pointer to a new label
 
     def _invoke_callables(self, values):
@@ -146,14 +168,18 @@ class Space():
 
     def _parse_labels(self, values):
         # find labels (strs) in given values list and update the addresses of the labels and the label pointers
+        # returns the values to write, the names of the labels found and the single byte pointers
         index = 0
         new_values = []
+        new_labels = []
+        label_pointers = []
         for value in values:
             if isinstance(value, str):
                 if value in self.labels:
                     raise ValueError(f"Label '{value}' already exists in space '{str(self)}'")
 
-                self.add_label(value, self.next_address + index)
+                self._define_label(value, self.next_address + index)
+                new_labels.append(value)
             elif isinstance(value, LabelPointer):
                 value.address = self.next_address + index
 
@@ -172,6 +198,7 @@ class Space():
                         new_values.extend([None] * size)  # temp values until label found
                 else:
                     new_values.append(value)
+                    label_pointers.append(value)
                 index += size
             else:
                 new_values.append(value)
@@ -179,19 +206,55 @@ class Space():
                     index += len(value)
                 except:
                     index += 1
-        return new_values
-
-    def _update_label_pointers(self):
-        # update allocated labels pointed to found so far
-        for label_pointer in self.label_pointers:
-            if label_pointer.label.name in self.labels:
-                label_pointer.label.address = self.labels[label_pointer.label.name].address
-
-                # overwrite temp values if 16/24 bit labels
-                if label_pointer.mode == LabelPointer.ABSOLUTE24:
-                    Space.rom.set_bytes(label_pointer.address, label_pointer.to_bytes(3, "little"))
-                elif label_pointer.mode == LabelPointer.ABSOLUTE16:
-                    Space.rom.set_bytes(label_pointer.address, label_pointer.to_bytes(2, "little"))
+        return new_values, new_labels, label_pointers
+
+    def _update_label_pointers(self, name):
+        # update pointers to label name, only the pointers to that label are visited
+        address = self.labels[name].address
+        for label_pointer in self.label_pointers.get(name, ()):
+            if label_pointer.address is None:
+                continue # not written yet, resolved when it is
+            label_pointer.label.address = address
+
+            # overwrite temp values if 16/24 bit labels
+            if label_pointer.mode == LabelPointer.ABSOLUTE24:
+                Space.rom.set_bytes(label_pointer.address, label_pointer.to_bytes(3, "little"))
+            elif label_pointer.mode == LabelPointer.ABSOLUTE16:
+                Space.rom.set_bytes(label_pointer.address, label_pointer.to_bytes(2, "little"))
+
+    def _unresolved_label_pointers(self):
+        # pointers written to the rom which still point to a label not found in this space
+        for name, label_pointers in self.label_pointers.items():
+            if name in self.labels:
+                continue
+            for label_pointer in label_pointers:
+                # skip pointers which were never written or have been overwritten since
+                if label_pointer.address is None or label_pointer.address not in Space.rom.deferred:
+                    continue
+                if Space.rom.deferred[label_pointer.address] in (None, label_pointer):
+                    yield label_pointer
+
+    @classmethod
+    def check_labels(cls):
+        # check every pointer written has found its label, report all missing labels at once
+        # nothing is resolved or relocated here, pointers resolve when the rom is written and planned spaces when placed
+        # labels belong to the space they are in, a pointer to a label in another space is also reported
+        label_spaces = {}
+        for space in cls.spaces:
+            for name in space.labels:
+                label_spaces.setdefault(name, []).append(space)
+
+        errors = []
+        for space in cls.spaces:
+            for label_pointer in space._unresolved_label_pointers():
+                error = f"  0x{label_pointer.address:06x} {space}: label '{label_pointer.label.name}' not found"
+                if label_pointer.label.name in label_spaces:
+                    other_spaces = ", ".join(str(other) for other in label_spaces[label_pointer.label.name])
+                    error += f" (defined in other space {other_spaces})"
+                errors.append(error)
+
+        if errors:
+            raise ValueError(f"{len(errors)} unresolved label pointers:\n" + "\n".join(errors))
 
     def __str__(self):
         return f"[0x{self.start_address:06x} - 0x{self.end_address:06x}] \"{self.description}\""
@@ -265,6 +328,8 @@ def Reserve(start_address, end_address, description, clear_value = None):
     bank_start = (start_address // BANK_SIZE) * BANK_SIZE
     heap = Space.heaps[Bank(bank_start)]
     heap.reserve(start_address, end_address)
+    if Space.heap_operations is not None:
+        Space.heap_operations.append(("reserve", start_address, end_address))
 
     return Space(start_address, end_address, description, clear_value)
 
@@ -272,6 +337,8 @@ def Allocate(bank, size, description, clear_value = None):
     heap = Space.heaps[bank]
     start_address = heap.allocate(size)
     end_address = start_address + size - 1
+    if Space.heap_operations is not None:
+        Space.heap_operations.append(("allocate", start_address, end_address))
 
     return Space(start_address, end_address, description, clear_value)
 
@@ -279,18 +346,25 @@ def Free(start_address, end_address):
     bank_start = (start_address // BANK_SIZE) * BANK_SIZE
     heap = Space.heaps[Bank(bank_start)]
     heap.free(start_address, end_address)
+    if Space.heap_operations is not None:
+        Space.heap_operations.append(("free", start_address, end_address))
 
-def Write(destination, data, description):
-    from utils.flatten import flatten
-
+def _size(data):
+    # number of bytes flattened data takes, labels (strs) take no space
     size = 0
-    data = flatten(data)
     for value in data:
         if not isinstance(value, str):
             try:
                 size += len(value)
             except TypeError:
                 size += 1
+    return size
+
+def Write(destination, data, description):
+    from utils.flatten import flatten
+
+    data = flatten(data)
+    size = _size(data)
 
     if isinstance(destination, Bank):
         space = Allocate(destination, size, description)
@@ -299,5 +373,62 @@ def Write(destination, data, description):
     space.write(data)
     return space
 
+class PlannedSpace:
+    # space returned by Plan while planning, its addresses are PlannedAddresses until Place writes it
+    def __init__(self, bank, size, data, description):
+        self.bank = bank
+        self.size = size
+        self.data = data
+        self.description = description
+        self.space = None # written space once placed
+
+        self.start_address = PlannedAddress(lambda : None if self.space is None else self.space.start_address, description)
+        self.start_address_snes = self.start_address + START_ADDRESS_SNES
+        self.end_address = self.start_address + (size - 1)
+        self.end_address_snes = self.end_address + START_ADDRESS_SNES
+
+    def __len__(self):
+        return self.size
+
+def Plan(bank, data, description):
+    # write relocatable data to bank, code which refers to it only needs its start/end addresses
+    # while planning the space is not allocated until Place is called and a PlannedSpace is returned, code and data
+    # using its addresses are resolved when the rom is written, otherwise it is written immediately like Write
+    from utils.flatten import flatten
+    data = flatten(data)
+    if Space.planned is None:
+        return Write(bank, data, description)
+    planned = PlannedSpace(bank, _size(data), data, description)
+    Space.planned.append(planned)
+    return planned
+
+def Place():
+    # allocate and write every planned block, the largest blocks in each bank are placed first (best fit decreasing)
+    # so small blocks fill the gaps left around them instead of splitting the free blocks large ones need
+    # blocks planned after this are written immediately
+    planned = Space.planned or []
+    Space.planned = None
+
+    failed = {}
+    order = sorted(range(len(planned)), key = lambda index : (planned[index].bank, -planned[index].size, index))
+    for index in order:
+        space = planned[index]
+        try:
+            space.space = Write(space.bank, space.data, space.description)
+        except MemoryError:
+            # keep placing the smaller blocks, they may still fit in the remaining gaps
+            failed.setdefault(space.bank, []).append((space.size, space.description))
+
+    if failed:
+        message = "Unable to place planned blocks:\n"
+        for bank, blocks in failed.items():
+            heap = Space.heaps[bank]
+            largest = max((block.size for block in heap.blocks), default = 0)
+            message += f"  {bank.name}: {sum(size for size, description in blocks)} bytes in {len(blocks)} blocks, "
+            message += f"{heap.available} bytes available, largest free block {largest}\n"
+            for size, description in blocks:
+                message += f"    {size} \"{description}\"\n"
+        raise MemoryError(message[:-1])
+
 def Read(start_address, end_address):
     return Space.rom.get_bytes(start_address, end_address - start_address + 1)
@@ -0,0 +1,169 @@
+# compare memory.heap.Heap against the original linear scan heap
+# replays the same random free/reserve/allocate calls on both, verifies every allocated address and the
+# resulting free blocks are identical and prints how long each heap took
+
+class LinearHeap:
+    # original implementation, every call scans/rebuilds the whole list of blocks
+    def __init__(self):
+        self.blocks = []
+        self._available = 0
+
+    def allocate(self, size):
+        def find_best_fit(size):
+            best_block = None
+            if not self.blocks:
+                return None
+
+            best_diff = self._available
+            for block in self.blocks:
+                diff = block.size - size
+                if diff == 0:
+                    return block
+                elif diff > 0 and diff < best_diff:
+                    best_block = block
+                    best_diff = diff
+            return best_block
+
+        block = find_best_fit(size)
+        if block is None:
+            raise MemoryError(f"Unable to allocate block of size {size}")
+
+        start = block.start
+        block.start += size
+        if block.size == 0:
+            self.blocks.remove(block)
+        self._available -= size
+        return start
+
+    def free(self, start, end):
+        from memory.heap import Block
+        new_block = Block(start, end)
+
+        overlaps = set()
+        for block in self.blocks:
+            if block.start >= new_block.start and block.start <= new_block.end + 1:
+                if block.end > new_block.end:
+                    new_block.end = block.end
+                overlaps.add(block)
+            elif block.end <= new_block.end and block.end >= new_block.start - 1:
+                if block.start < new_block.start:
+                    new_block.start = block.start
+                overlaps.add(block)
+            elif block.start < new_block.start and block.end > new_block.end:
+                return
+
+        new_blocks = [new_block]
+        self._available = new_block.size
+        for block in self.blocks:
+            if block not in overlaps:
+                new_blocks.append(block)
+                self._available += block.size
+        self.blocks = new_blocks
+
+    def reserve(self, start, end):
+        from memory.heap import Block
+        reserved = Block(start, end)
+
+        overlaps = set()
+        for block in self.blocks:
+            if block.start >= reserved.start and block.start <= reserved.end:
+                if block.end > reserved.end:
+                    block.start = reserved.end + 1
+                else:
+                    overlaps.add(block)
+            elif block.end <= reserved.end and block.end >= reserved.start:
+                if block.start < reserved.start:
+                    block.end = reserved.start - 1
+                else:
+                    overlaps.add(block)
+            elif block.start < reserved.start and block.end > reserved.end:
+                self.blocks.append(Block(reserved.end + 1, block.end))
+                block.end = reserved.start - 1
+                self._available -= (end - start) + 1
+                return
+
+        new_blocks = []
+        self._available = 0
+        for block in self.blocks:
+            if block not in overlaps:
+                new_blocks.append(block)
+                self._available += block.size
+        self.blocks = new_blocks
+
+    @property
+    def available(self):
+        return self._available
+
+def generate_calls(seed, bank_count, call_count):
+    # vanilla free ranges plus expanded banks, followed by a random mix of allocate/reserve/free calls
+    import random
+    from memory.free import spaces
+    from memory.space import BANK_SIZE
+
+    rng = random.Random(seed)
+    calls = [("free", start, end) for start, end in spaces]
+    for bank in range(0x30, 0x30 + bank_count):
+        calls.append(("free", bank * BANK_SIZE, bank * BANK_SIZE + BANK_SIZE - 1))
+
+    for _ in range(call_count):
+        value = rng.random()
+        if value < 0.6:
+            calls.append(("allocate", rng.choice([1, 2, 3, 4, 8, 16, 24, 32, 64, 100, 256, rng.randint(1, 2048)])))
+        else:
+            start = rng.choice([rng.randrange(0, 0x300000), rng.randrange(0x300000, 0x300000 + bank_count * BANK_SIZE)])
+            end = start + rng.randint(0, 512)
+            calls.append(("reserve" if value < 0.8 else "free", start, end))
+    return calls
+
+def replay(heap, calls):
+    addresses = []
+    for call in calls:
+        if call[0] == "allocate":
+            try:
+                addresses.append(heap.allocate(call[1]))
+            except MemoryError:
+                addresses.append(None)
+        else:
+            getattr(heap, call[0])(call[1], call[2])
+    return addresses
+
+def benchmark(seeds, bank_count, call_count):
+    import time
+    from memory.heap import Heap
+
+    times = {"linear" : 0.0, "indexed" : 0.0}
+    for seed in range(seeds):
+        calls = generate_calls(seed, bank_count, call_count)
+
+        linear_heap = LinearHeap()
+        start_time = time.perf_counter()
+        linear_addresses = replay(linear_heap, calls)
+        times["linear"] += time.perf_counter() - start_time
+
+        heap = Heap()
+        start_time = time.perf_counter()
+        addresses = replay(heap, calls)
+        times["indexed"] += time.perf_counter() - start_time
+
+        linear_blocks = [(block.start, block.end) for block in linear_heap.blocks]
+        blocks = [(block.start, block.end) for block in heap.blocks]
+        assert addresses == linear_addresses, f"seed {seed}: allocated addresses differ"
+        assert blocks == linear_blocks, f"seed {seed}: free blocks differ"
+        assert heap.available == linear_heap.available, f"seed {seed}: available bytes differ"
+
+    print(f"{seeds} seeds x {call_count} calls, identical results")
+    for name, total in times.items():
+        print(f"  {name:<8} {total:.3f}s")
+
+if __name__ == "__main__":
+    import os, sys
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-seeds", type = int, default = 20, help = "Number of random call sequences")
+    parser.add_argument("-banks", type = int, default = 16, help = "Number of expanded banks to free")
+    parser.add_argument("-calls", type = int, default = 2000, help = "Number of calls per sequence")
+
+    args = parser.parse_args()
+    benchmark(args.seeds, args.banks, args.calls)
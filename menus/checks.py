@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Write
+from memory.space import Bank, START_ADDRESS_SNES, Plan
 import instruction.asm as asm
 import instruction.f0 as f0
 import args
@@ -38,7 +38,7 @@ class Checks(scroll_area.ScrollArea):
             "FALSE",
             asm.JMP(f0.set_user_text_color, asm.ABS),
         ]
-        space = Write(Bank.F0, src, f"menu checks line color function {hex(address)} {hex(bit)}")
+        space = Plan(Bank.F0, src, f"menu checks line color function {hex(address)} {hex(bit)}")
         return space.start_address
 
     def open_world_init(self):
@@ -97,7 +97,7 @@ class Checks(scroll_area.ScrollArea):
                 address_bit[0].to_bytes(2, "little"),
                 2 ** address_bit[1],
             ]
-        space = Write(Bank.F0, src, "menu checks post invoke byte bit table")
+        space = Plan(Bank.F0, src, "menu checks post invoke byte bit table")
         byte_bit_table = space.start_address
 
         # write out which indices of self.lines to display
@@ -152,7 +152,7 @@ class Checks(scroll_area.ScrollArea):
             "RETURN",
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "menu checks initialize store line indices to draw")
+        space = Plan(Bank.F0, src, "menu checks initialize store line indices to draw")
         self.initialize = space.start_address
 
     def initialize_line_mod(self):
@@ -173,5 +173,5 @@ class Checks(scroll_area.ScrollArea):
             "AFTER_SET_COLOR",
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "menu checks initialize line set line color")
+        space = Plan(Bank.F0, src, "menu checks initialize line set line color")
         self.initialize_line = space.start_address
@@ -1,4 +1,4 @@
-from memory.space import Write, Bank, Reserve
+from memory.space import Plan, Bank, Reserve
 import instruction.asm as asm
 import args
 
@@ -18,7 +18,7 @@ class MagicMenu:
             asm.STA(STRING_DRAW_ADDR, asm.ABS), # Add to string
             asm.RTL()
         ]
-        space = Write(Bank.F0, src, "Create MP Cost string")
+        space = Plan(Bank.F0, src, "Create MP Cost string")
         create_string = space.start_address_snes
 
         space = Reserve(0x351e9, 0x351ed, "Call create_string", asm.NOP())
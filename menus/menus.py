@@ -27,7 +27,8 @@ class Menus:
         self.sell_menu = sell.SellMenu()
         self.magic_menu = magic.MagicMenu()
 
-        self.scrollbar_bugfix()
+        from memory import patch_bundle
+        patch_bundle.run("menus scrollbar bugfix", None, self.scrollbar_bugfix)
 
     def scrollbar_bugfix(self):
         from memory.space import Reserve
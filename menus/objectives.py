@@ -1,4 +1,4 @@
-from memory.space import Bank, Write
+from memory.space import Bank, Plan
 import instruction.asm as asm
 import instruction.f0 as f0
 import args
@@ -61,7 +61,7 @@ class Objectives(scroll_area.ScrollArea):
             src += [
                 (objective.conditions_complete.menu().space.start_address & 0xffff).to_bytes(2, "little"),
             ]
-        space = Write(Bank.F0, src, "objectives menu count conditions complete table")
+        space = Plan(Bank.F0, src, "objectives menu count conditions complete table")
         count_table = space.start_address
 
         src = []
@@ -69,7 +69,7 @@ class Objectives(scroll_area.ScrollArea):
             src += [
                 objective.conditions_required.to_bytes(1, "little"),
             ]
-        space = Write(Bank.F0, src, "objectives menu conditions required table")
+        space = Plan(Bank.F0, src, "objectives menu conditions required table")
         conditions_required_table = space.start_address_snes
 
         src = [
@@ -107,5 +107,5 @@ class Objectives(scroll_area.ScrollArea):
             asm.STA(0x2180, asm.ABS),                           # write character in a register
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "objectives menu draw character")
+        space = Plan(Bank.F0, src, "objectives menu draw character")
         self.draw_character = space.start_address
@@ -1,4 +1,4 @@
-from memory.space import START_ADDRESS_SNES, Bank, Write, Reserve, Allocate, Read
+from memory.space import START_ADDRESS_SNES, Bank, Plan, Reserve, Allocate, Read
 import instruction.asm as asm
 import instruction.c3 as c3
 
@@ -43,7 +43,7 @@ class PreGameMenu:
         src += [
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "pregame draw options")
+        space = Plan(Bank.C3, src, "pregame draw options")
         self.draw_options = space.start_address
 
     def initialize_mod(self):
@@ -63,7 +63,7 @@ class PreGameMenu:
             asm.JMP(0x3541, asm.ABS),       # set brightness and refresh screen
         ]
         # called by C3 JSR jump table
-        space = Write(Bank.C3, src, "pregame initialize")
+        space = Plan(Bank.C3, src, "pregame initialize")
         self.initialize = space.start_address
 
     def invoke_objectives_menu_mod(self):
@@ -71,7 +71,7 @@ class PreGameMenu:
             asm.JSR(0x6a3c, asm.ABS),   # clear BG3 a (workaround for bizhawk snes9x core bug)
             asm.JMP(self.common.invoke_objectives, asm.ABS),
         ]
-        space = Write(Bank.C3, src, "pregame invoke objectives")
+        space = Plan(Bank.C3, src, "pregame invoke objectives")
         self.invoke_objectives = space.start_address
 
     def invoke_flags_menu_mod(self):
@@ -79,7 +79,7 @@ class PreGameMenu:
             asm.JSR(0x6a3c, asm.ABS),   # clear BG3 a (workaround for bizhawk snes9x core bug)
             asm.JMP(self.common.invoke_flags, asm.ABS),
         ]
-        space = Write(Bank.C3, src, "pregame invoke flags")
+        space = Plan(Bank.C3, src, "pregame invoke flags")
         self.invoke_flags = space.start_address
 
     def invoke_flags_submenu_mod(self, submenu_idx):
@@ -87,7 +87,7 @@ class PreGameMenu:
             asm.JSR(0x6a3c, asm.ABS),   # clear BG3 a (workaround for bizhawk snes9x core bug)
             asm.JMP(self.common.invoke_flags_submenu[submenu_idx], asm.ABS),
         ]
-        space = Write(Bank.C3, src, "pregame invoke flag submenu")
+        space = Plan(Bank.C3, src, "pregame invoke flag submenu")
         self.invoke_flags_submenu[submenu_idx] = space.start_address
 
     def sustain_mod(self):
@@ -105,7 +105,7 @@ class PreGameMenu:
             asm.STA(0x26, asm.DIR),         # add fade out pregame menu to queue
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "pregame new game option clicked")
+        space = Plan(Bank.C3, src, "pregame new game option clicked")
         new_game = space.start_address
 
         src = [
@@ -116,7 +116,7 @@ class PreGameMenu:
             asm.STA(0x26, asm.DIR),         # add fade out pregame menu to queue
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "pregame config option clicked")
+        space = Plan(Bank.C3, src, "pregame config option clicked")
         config = space.start_address
 
         src = [
@@ -125,7 +125,7 @@ class PreGameMenu:
             (self.invoke_flags & 0xffff).to_bytes(2, "little"),
             (config & 0xffff).to_bytes(2, "little"),
         ]
-        space = Write(Bank.C3, src, "pregame option click table")
+        space = Plan(Bank.C3, src, "pregame option click table")
         options_table = space.start_address
 
         src = [
@@ -182,7 +182,7 @@ class PreGameMenu:
         src.extend(self.common.get_scroll_area_exit_src(self.MENU_NUMBER, self.invoke_flags))
         
         # Called by C3 JSR jump table
-        space = Write(Bank.C3, src, "pregame sustain")
+        space = Plan(Bank.C3, src, "pregame sustain")
         self.sustain = space.start_address
 
     def initialize_config_menu_mod(self):
@@ -193,7 +193,7 @@ class PreGameMenu:
             asm.TRB(0x43, asm.DIR),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame initialize config menu reset uncondense")
+        space = Plan(Bank.F0, src, "pregame initialize config menu reset uncondense")
         reset_uncondense = space.start_address
 
         space = Reserve(0x31c7d, 0x31c81, "pregame initialize config menu reset", asm.NOP())
@@ -217,7 +217,7 @@ class PreGameMenu:
             "MAIN_MENU_EXIT",
             Read(0x3230c, 0x32315)          # cursor sound, queue main menu, fade out
         ]
-        space = Write(Bank.C3, src, "pregame config menu exit check")
+        space = Plan(Bank.C3, src, "pregame config menu exit check")
         config_menu_exit_check = space.start_address
 
         space = Reserve(0x3230c, 0x32315, "config menu exit")
@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Reserve, Allocate, Write, Read
+from memory.space import Bank, START_ADDRESS_SNES, Reserve, Allocate, Plan, Read
 import instruction.asm as asm
 import instruction.c3 as c3
 import args
@@ -93,7 +93,7 @@ class PreGameTrack:
             0x1c, 0x07, # 28x7
         ]
         # Note: keep in C3 as this is then used by the C3/0341 subroutine called below
-        space = Write(Bank.C3, src, "pregame track top window layout")
+        space = Plan(Bank.C3, src, "pregame track top window layout")
         top_window_layout = space.start_address
 
         src = [
@@ -101,7 +101,7 @@ class PreGameTrack:
             0x1c, 0x0f, # width/height (excluding border)
         ]
         # Note: keep in C3 as this is then used by the C3/0341 subroutine called below
-        space = Write(Bank.C3, src, "pregame track bottom window layout")
+        space = Plan(Bank.C3, src, "pregame track bottom window layout")
         bottom_window_layout = space.start_address
 
         src = [
@@ -113,7 +113,7 @@ class PreGameTrack:
             c3.eggers_jump(0x0341), # draw bottom window
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, "pregame track draw layout")
+        space = Plan(Bank.F0, src, "pregame track draw layout")
         self.draw_layout = space.start_address
 
     def decrease_line_height_mod(self):
@@ -127,7 +127,7 @@ class PreGameTrack:
             0x00,             # end
         ]
         # Keep in C3 as it's used by C3 subroutine called below
-        space = Write(Bank.C3, src, "pregame track bg3 shift table")
+        space = Plan(Bank.C3, src, "pregame track bg3 shift table")
         bg3_shift_table = space.start_address
 
         src = [
@@ -135,7 +135,7 @@ class PreGameTrack:
             asm.LDY(bg3_shift_table, asm.IMM16),
             asm.JMP(0x7e38, asm.ABS), # same bg1 scrolling as item menus
         ]
-        space = Write(Bank.C3, src, "pregame track decrease line height")
+        space = Plan(Bank.C3, src, "pregame track decrease line height")
         self.decrease_line_height = space.start_address
 
     def draw_labels_mod(self):
@@ -169,7 +169,7 @@ class PreGameTrack:
         src += [
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, "pregame track draw labels")
+        space = Plan(Bank.F0, src, "pregame track draw labels")
         self.draw_labels = space.start_address
 
     def draw_entry_mod(self):
@@ -217,7 +217,7 @@ class PreGameTrack:
                 asm.JMP(self.flags.submenus[submenu_idx].draw_line, asm.ABS),
             ]
 
-        space = Write(Bank.C3, src, "pregame track draw entry")
+        space = Plan(Bank.C3, src, "pregame track draw entry")
         draw_entry = space.start_address
 
         space = Reserve(0x37fa1, 0x37fa3, "pregame track menu draw entry")
@@ -232,7 +232,7 @@ class PreGameTrack:
             c3.eggers_jump(0x0e6e), # upload bg3 a+b
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track upload bg123ab")
+        space = Plan(Bank.F0, src, "pregame track upload bg123ab")
         self.upload_bg123ab = space.start_address
 
     def initialize_cursor_mod(self):
@@ -243,7 +243,7 @@ class PreGameTrack:
             0x08, 0x41, # config     / flags
         ]
         # Keep in C3 -- used by subroutines
-        space = Write(Bank.C3, src, "pregame track cursor positions")
+        space = Plan(Bank.C3, src, "pregame track cursor positions")
         self.cursor_positions = space.start_address
 
         src = [
@@ -254,7 +254,7 @@ class PreGameTrack:
             0x04, # rows
         ]
         # Keep in C3 -- used by subroutines
-        space = Write(Bank.C3, src, "pregame track navigation data")
+        space = Plan(Bank.C3, src, "pregame track navigation data")
         navigation_data = space.start_address
 
         src = [
@@ -262,7 +262,7 @@ class PreGameTrack:
             c3.eggers_jump(0x05fe),   # load navigation data
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, "pregame track update navigation data")
+        space = Plan(Bank.F0, src, "pregame track update navigation data")
         self.update_navigation_data = space.start_address
 
         src = [
@@ -270,7 +270,7 @@ class PreGameTrack:
             asm.STA(0x4e, asm.DIR),     # cursor row = saved row
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, "pregame track remember cursor position")
+        space = Plan(Bank.F0, src, "pregame track remember cursor position")
         self.remember_cursor_position = space.start_address
 
         src = [
@@ -279,7 +279,7 @@ class PreGameTrack:
             c3.eggers_jump(0x07b0),   # add cursor to animation queue
             asm.RTS(),                
         ]
-        space = Write(Bank.F0, src, "pregame track update cursor position")
+        space = Plan(Bank.F0, src, "pregame track update cursor position")
         self.update_cursor_position = space.start_address
 
         src = [
@@ -293,7 +293,7 @@ class PreGameTrack:
             asm.JSR(self.update_cursor_position, asm.ABS),
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, "pregame track initialize cursor")
+        space = Plan(Bank.F0, src, "pregame track initialize cursor")
         self.initialize_cursor = space.start_address
 
     def initialize_scroll_area_mod(self):
@@ -393,7 +393,7 @@ class PreGameTrack:
                 asm.JMP(self.flags.submenus[submenu_idx].remember_draw, asm.ABS),
             ]
 
-        space = Write(Bank.F0, src, "pregame track initialize scroll area")
+        space = Plan(Bank.F0, src, "pregame track initialize scroll area")
         self.initialize_scroll_area = space.start_address
 
     def InvokeScrollArea(self, scroll_area_menu):
@@ -409,35 +409,35 @@ class PreGameTrack:
         src = [
             self.InvokeScrollArea(self.objectives),
         ]
-        space = Write(Bank.C3, src, "pregame track invoke objectives")
+        space = Plan(Bank.C3, src, "pregame track invoke objectives")
         self.invoke_objectives = space.start_address
 
     def invoke_checks_mod(self):
         src = [
             self.InvokeScrollArea(self.checks),
         ]
-        space = Write(Bank.C3, src, "pregame track invoke checks")
+        space = Plan(Bank.C3, src, "pregame track invoke checks")
         self.invoke_checks = space.start_address
 
     def invoke_progress_mod(self):
         src = [
             self.InvokeScrollArea(self.progress),
         ]
-        space = Write(Bank.C3, src, "pregame track invoke progress")
+        space = Plan(Bank.C3, src, "pregame track invoke progress")
         self.invoke_progress = space.start_address
 
     def invoke_flags_mod(self):
         src = [
             self.InvokeScrollArea(self.flags),
         ]
-        space = Write(Bank.C3, src, "pregame track invoke flags")
+        space = Plan(Bank.C3, src, "pregame track invoke flags")
         self.invoke_flags = space.start_address
 
     def invoke_flags_submenu_mod(self, submenu_idx):
         src = [
             self.InvokeScrollArea(self.flags.submenus[submenu_idx]),
         ]
-        space = Write(Bank.C3, src, "pregame track invoke flags submenu")
+        space = Plan(Bank.C3, src, "pregame track invoke flags submenu")
         self.invoke_flags_submenu[submenu_idx] = space.start_address
 
     def sustain_scroll_area_mod(self):
@@ -453,7 +453,7 @@ class PreGameTrack:
             "RETURN",
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "pregame track sustain scroll area")
+        space = Plan(Bank.C3, src, "pregame track sustain scroll area")
         self.sustain_scroll_area = space.start_address
 
     def exit_scroll_area_mod(self):
@@ -484,7 +484,7 @@ class PreGameTrack:
 
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track exit scroll area")
+        space = Plan(Bank.F0, src, "pregame track exit scroll area")
         self.exit_scroll_area = space.start_address
 
     def load_sprite_palettes_mod(self):
@@ -574,7 +574,7 @@ class PreGameTrack:
             c3.eggers_jump(0x6ce9),           # load single pose for characters terra, locke, ..., ghost, kefka
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, "pregame track load sprite palettes")
+        space = Plan(Bank.F0, src, "pregame track load sprite palettes")
         self.load_sprite_palettes = space.start_address
 
     def refresh_sprites_mod(self):
@@ -588,7 +588,7 @@ class PreGameTrack:
             src += [
                 x_start + x_spacing * index,
             ]
-        space = Write(Bank.F0, src, "pregame track refresh sprites x positions")
+        space = Plan(Bank.F0, src, "pregame track refresh sprites x positions")
         x_positions_address = space.start_address
 
         y_start = 0x32 # higher is lower on screen
@@ -598,20 +598,20 @@ class PreGameTrack:
             src += [
                 y_start + entry.y_offset * 8,
             ]
-        space = Write(Bank.F0, src, "pregame track refresh sprites y positions")
+        space = Plan(Bank.F0, src, "pregame track refresh sprites y positions")
         y_positions_address = space.start_address
 
         # if not zero, these palettes override sprite oam palettes (at 0xc31324)
         src = [
             0x00, 0x00, 0x00, 0x00,
         ]
-        space = Write(Bank.F0, src, "pregame track refresh sprites palettes address")
+        space = Plan(Bank.F0, src, "pregame track refresh sprites palettes address")
         palettes_address = space.start_address
 
         src = [
             HASH_CHARACTERS,
         ]
-        space = Write(Bank.F0, src, "pregame track refresh sprites characters address")
+        space = Plan(Bank.F0, src, "pregame track refresh sprites characters address")
         characters_address = space.start_address
 
         # modified version of c31903 used for save/load menus
@@ -655,7 +655,7 @@ class PreGameTrack:
             asm.RTS(),
         ]
         # Keep in C3 -- called by JMP methods that are called from C3 JSR jump table
-        space = Write(Bank.C3, src, "pregame track refresh sprites")
+        space = Plan(Bank.C3, src, "pregame track refresh sprites")
         self.refresh_sprites = space.start_address
 
     def hash_characters(self):
@@ -711,7 +711,7 @@ class PreGameTrack:
             asm.JSR(self.initialize_cursor, asm.ABS),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track initialize")
+        space = Plan(Bank.F0, src, "pregame track initialize")
         self.initialize = space.start_address
 
     def wait_for_fade_mod(self):
@@ -724,7 +724,7 @@ class PreGameTrack:
             asm.JMP(self.refresh_sprites, asm.ABS),
         ]
         # Keep in C3 -- called by C3 JSR jump table
-        space = Write(Bank.C3, src, "pregame track wait for fade")
+        space = Plan(Bank.C3, src, "pregame track wait for fade")
         self.wait_for_fade = space.start_address
 
     def fade_in_mod(self):
@@ -737,7 +737,7 @@ class PreGameTrack:
             asm.JMP(self.refresh_sprites, asm.ABS),
         ]
          # Keep in C3 -- called by C3 JSR jump table
-        space = Write(Bank.C3, src, "pregame track fade in")
+        space = Plan(Bank.C3, src, "pregame track fade in")
         self.fade_in = space.start_address
 
     def fade_out_mod(self):
@@ -750,7 +750,7 @@ class PreGameTrack:
             asm.JMP(self.refresh_sprites, asm.ABS),   # refresh sprites
         ]
          # Keep in C3 -- called by C3 JSR jump table
-        space = Write(Bank.C3, src, "pregame track fade out")
+        space = Plan(Bank.C3, src, "pregame track fade out")
         self.fade_out = space.start_address
 
     def menu_commands_jump_table(self):
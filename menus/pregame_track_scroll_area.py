@@ -1,4 +1,4 @@
-from memory.space import START_ADDRESS_SNES, Bank, Write
+from memory.space import START_ADDRESS_SNES, Bank, Plan
 import instruction.asm as asm
 import instruction.f0 as f0
 import instruction.c3 as c3
@@ -25,9 +25,8 @@ def _draw_mod():
         asm.JSR(0x7e01, asm.ABS),   # upload bg1 abc, bg3 abcd
         asm.RTS(),
     ]
-    space = Write(Bank.C3, src, "pregame track scroll area draw")
+    space = Plan(Bank.C3, src, "pregame track scroll area draw")
     return space.start_address
-draw = _draw_mod()
 
 def _set_line_x_pos_mod():
     src = [
@@ -44,9 +43,8 @@ def _set_line_x_pos_mod():
         asm.TAY(),
         asm.RTL(),
     ]
-    space = Write(Bank.C3, src, "pregame track scroll area set line x position")
+    space = Plan(Bank.C3, src, "pregame track scroll area set line x position")
     return space.start_address
-set_line_x_pos = _set_line_x_pos_mod()
 
 # 2 bytes to store cursor position + 1 byte to store page position
 # addresses >= 0x250 and < 0x300 in menu ram seem available
@@ -69,7 +67,7 @@ class ScrollArea:
             line_color_addresses.extend((self.lines[li].color_function & 0xffff).to_bytes(2, "little"))
             self.lines[li] = Line(self.lines[li].text.ljust(WIDTH), self.lines[li].color_function)
 
-        space = Write(Bank.F0, line_color_addresses, "pregame track scroll area line colors table")
+        space = Plan(Bank.F0, line_color_addresses, "pregame track scroll area line colors table")
         self.line_colors_table = space.start_address
 
         self.number_excess_lines = max(len(self.lines) - HEIGHT, 0)
@@ -145,7 +143,7 @@ class ScrollArea:
             asm.JSR(draw, asm.ABS),             # draw scroll area
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "pregame track scroll area invoke")
+        space = Plan(Bank.C3, src, "pregame track scroll area invoke")
         self.invoke = space.start_address
 
     def set_line_color_mod(self):
@@ -158,7 +156,7 @@ class ScrollArea:
             asm.JSR(self.line_colors_table, asm.ABS_X_16),  # set line color
             asm.RTS(),
         ]
-        space = Write(Bank.F0, src, "pregame track scroll area set line color")
+        space = Plan(Bank.F0, src, "pregame track scroll area set line color")
         self.set_line_color = space.start_address
 
     def initialize_line_mod(self):
@@ -169,7 +167,7 @@ class ScrollArea:
             asm.JSR(self.set_line_color, asm.ABS),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track scroll area set line color")
+        space = Plan(Bank.F0, src, "pregame track scroll area set line color")
         self.initialize_line = space.start_address
 
     def draw_character_mod(self):
@@ -177,7 +175,7 @@ class ScrollArea:
             asm.STA(0x2180, asm.ABS),   # write current character
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track scroll area draw character")
+        space = Plan(Bank.F0, src, "pregame track scroll area draw character")
         self.draw_character = space.start_address
 
     def draw_line_mod(self):
@@ -190,7 +188,7 @@ class ScrollArea:
                     src.append(ord(character)) # assume special character
                 else:
                     src.append(text_value[character])
-        space = Write(Bank.F0, src, "pregame track scroll area lines table")
+        space = Plan(Bank.F0, src, "pregame track scroll area lines table")
         lines_table = space.start_address + START_ADDRESS_SNES
 
         src = [
@@ -234,7 +232,7 @@ class ScrollArea:
             asm.STZ(0x2180, asm.ABS),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track scroll area write line")
+        space = Plan(Bank.F0, src, "pregame track scroll area write line")
         write_line = space.start_address
 
         src = [
@@ -243,7 +241,7 @@ class ScrollArea:
             asm.JSR(0x37fd9, asm.ABS),  # draw line
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "pregame track scroll area draw line")
+        space = Plan(Bank.C3, src, "pregame track scroll area draw line")
         self.draw_line = space.start_address
 
     def remember_cursor_mod(self):
@@ -256,7 +254,7 @@ class ScrollArea:
             c3.eggers_jump(0x0e1e),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track scroll area remember cursor")
+        space = Plan(Bank.F0, src, "pregame track scroll area remember cursor")
         self.remember_cursor = space.start_address
 
     def remember_scrollbar_mod(self):
@@ -271,7 +269,7 @@ class ScrollArea:
 
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "pregame track scroll area remember scrollbar")
+        space = Plan(Bank.F0, src, "pregame track scroll area remember scrollbar")
         self.remember_scrollbar = space.start_address
 
     def remember_draw_mod(self):
@@ -285,7 +283,7 @@ class ScrollArea:
             c3.eggers_jump(draw),
             asm.RTS(), 
         ]
-        space = Write(Bank.F0, src, "pregame track scroll area remember draw")
+        space = Plan(Bank.F0, src, "pregame track scroll area remember draw")
         self.remember_draw = space.start_address
 
     def mod(self):
@@ -299,3 +297,8 @@ class ScrollArea:
         self.initialize_line_mod()
         self.draw_character_mod()
         self.draw_line_mod()
+
+def init():
+    global draw, set_line_x_pos
+    draw = _draw_mod()
+    set_line_x_pos = _set_line_x_pos_mod()
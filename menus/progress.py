@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Write
+from memory.space import Bank, START_ADDRESS_SNES, Plan
 import instruction.asm as asm
 import instruction.f0 as f0
 import args
@@ -59,7 +59,7 @@ class Progress(scroll_area.ScrollArea):
                 asm.LDA(address, asm.ABS),
                 asm.RTS(),
             ]
-            space = Write(Bank.F0, src, "progress menu load value at {hex(address)}")
+            space = Plan(Bank.F0, src, "progress menu load value at {hex(address)}")
             value_functions.append(space.start_address)
 
         src = []
@@ -67,7 +67,7 @@ class Progress(scroll_area.ScrollArea):
             src += [
                 (function & 0xffff).to_bytes(2, "little"),
             ]
-        space = Write(Bank.F0, src, "progress menu value functions table")
+        space = Plan(Bank.F0, src, "progress menu value functions table")
         value_functions_table = space.start_address
 
         src = [
@@ -79,7 +79,7 @@ class Progress(scroll_area.ScrollArea):
             asm.JSR(0x04b6, asm.ABS),   # draw 2 digit number
             asm.RTL(),
         ]
-        space = Write(Bank.C3, src, "draw 2 digit number long function")
+        space = Plan(Bank.C3, src, "draw 2 digit number long function")
         draw_2_digit_number = space.start_address
 
         src = [
@@ -99,5 +99,5 @@ class Progress(scroll_area.ScrollArea):
             "RETURN",
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "progress menu initialize line")
+        space = Plan(Bank.F0, src, "progress menu initialize line")
         self.initialize_line = space.start_address
@@ -1,4 +1,4 @@
-from memory.space import Bank, Reserve, Allocate, Write
+from memory.space import Bank, Reserve, Allocate, Plan
 import instruction.asm as asm
 from data.spell_names import name_id, id_name
 
@@ -76,14 +76,14 @@ class RageMenu:
             running_offset += len(bytes)
             line_offsets.append(running_offset)
             src.append(bytes)
-        space = Write(Bank.F0, src, "rage description lines table")
+        space = Plan(Bank.F0, src, "rage description lines table")
         lines_table = space.start_address_snes
 
         # write the 2-byte line offsets to F0
         src = []
         for offset in line_offsets:
             src.append(offset.to_bytes(2, 'little'))
-        space = Write(Bank.F0, src, "rage description lines table offsets")
+        space = Plan(Bank.F0, src, "rage description lines table offsets")
         lines_table_offsets = space.start_address_snes
 
         src = [
@@ -114,7 +114,7 @@ class RageMenu:
             "RETURN",
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "draw ability names")
+        space = Plan(Bank.C3, src, "draw ability names")
         draw_ability_names = space.start_address
 
         sustain_replace = 0x328c6   # handle L and R
@@ -126,7 +126,7 @@ class RageMenu:
             asm.JSR(0x4c52, asm.ABS),  # displaced code: handle D-Pad
             asm.JMP(draw_ability_names, asm.ABS),
         ]
-        space = Write(Bank.C3, src, "sustain rage list")
+        space = Plan(Bank.C3, src, "sustain rage list")
         sustain_rage_list = space.start_address
 
         space = Reserve(sustain_replace, sustain_replace + replace_size - 1, "rage menu sustain handle D-Pad")
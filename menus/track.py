@@ -1,4 +1,4 @@
-from memory.space import START_ADDRESS_SNES, Bank, Write, Reserve, Allocate, Read
+from memory.space import START_ADDRESS_SNES, Bank, Plan, Reserve, Allocate, Read
 import instruction.asm as asm
 import instruction.c3 as c3
 
@@ -101,7 +101,7 @@ class TrackMenu:
             src += [
                 (option & 0xffff).to_bytes(2, "little"),
             ]
-        space = Write(Bank.C3, src, "track main menu option table")
+        space = Plan(Bank.C3, src, "track main menu option table")
         option_table = space.start_address
 
         space = Reserve(0x33204, 0x33209, "draw equip, track, config menu options", asm.NOP())
@@ -118,7 +118,7 @@ class TrackMenu:
             0xaf, 0x6c,                 # config
             0xaf, 0x7b,                 # save
         ]
-        space = Write(Bank.C3, src, "track main menu cursor positions")
+        space = Plan(Bank.C3, src, "track main menu cursor positions")
         cursor_positions = space.start_address
 
         space = Reserve(0x32f66, 0x32f67, "main menu initialize cursor position")
@@ -164,7 +164,7 @@ class TrackMenu:
         src += [
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "track draw options")
+        space = Plan(Bank.C3, src, "track draw options")
         self.draw_options = space.start_address
 
     def invoke_mod(self):
@@ -175,7 +175,7 @@ class TrackMenu:
             asm.STA(0x27, asm.DIR),     # add initialize track menu to queue
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "track invoke")
+        space = Plan(Bank.C3, src, "track invoke")
         invoke = space.start_address
 
         src = [
@@ -183,7 +183,7 @@ class TrackMenu:
             (invoke & 0xffff).to_bytes(2, "little"),
             Read(0x32e76, 0x32e79),     # config/save
         ]
-        space = Write(Bank.C3, src, "track invoke option table")
+        space = Plan(Bank.C3, src, "track invoke option table")
         option_table = space.start_address
 
         space = Reserve(0x32e6a, 0x32e6b, "track main menu options jump table address")
@@ -208,7 +208,7 @@ class TrackMenu:
             asm.JMP(0x3541, asm.ABS),   # set brightness and refresh screen
         ]
         # called by C3 JSR jump table
-        space = Write(Bank.C3, src, "track initialize")
+        space = Plan(Bank.C3, src, "track initialize")
         self.initialize = space.start_address
 
     def sustain_mod(self):
@@ -218,7 +218,7 @@ class TrackMenu:
             (self.common.invoke_progress & 0xffff).to_bytes(2, "little"),
             (self.common.invoke_flags & 0xffff).to_bytes(2, "little"),
         ]
-        space = Write(Bank.C3, src, "track option click table")
+        space = Plan(Bank.C3, src, "track option click table")
         options_table = space.start_address
 
         src = [
@@ -290,7 +290,7 @@ class TrackMenu:
         src.extend(self.common.get_scroll_area_exit_src(self.MENU_NUMBER, self.common.invoke_flags))
 
         # Called by C3 JSR jump table
-        space = Write(Bank.C3, src, "track sustain")
+        space = Plan(Bank.C3, src, "track sustain")
         self.sustain = space.start_address
 
     def menu_commands_jump_table(self):
@@ -9,7 +9,13 @@ blacklisted_args = [
     'seed_id',
     'debug',
     'no_rom_output',
-    'stdout_log'
+    'stdout_log',
+    'rom_cache_directory',
+    'profile',
+    'stage_cache_directory',
+    'patch_bundle',
+    'patch_file',
+    'pack_allocations'
 ]
 
 class Object:
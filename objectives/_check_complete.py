@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Write
+from memory.space import Bank, START_ADDRESS_SNES, Plan
 import instruction.asm as asm
 import instruction.field as field
 
@@ -26,7 +26,7 @@ class Field(_CachedFunction, field.Call):
             field.Dialog(dialogs.OBJECTIVES[objective.id]),
             field.Return(),
         ]
-        return Write(Bank.CA, src, f"field check complete objective {objective.id}")
+        return Plan(Bank.CA, src, f"field check complete objective {objective.id}")
 
 class Battle(_CachedFunction, asm.JSL):
     def __init__(self, *args, **kwargs):
@@ -60,7 +60,7 @@ class Battle(_CachedFunction, asm.JSL):
             asm.LDA(0x00, asm.IMM8),    # return false
             asm.RTL(),
         ]
-        return Write(Bank.F0, src, "battle check objective" + str(objective.id))
+        return Plan(Bank.F0, src, "battle check objective" + str(objective.id))
 
 class CheckComplete:
     def __init__(self, objective):
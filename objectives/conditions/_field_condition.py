@@ -1,4 +1,4 @@
-from memory.space import Bank, Write
+from memory.space import Bank, Plan
 import instruction.field as field
 from objectives._cached_function import _CachedFunction
 
@@ -28,7 +28,7 @@ class _BitCondition(_Condition):
             false,
             field.Return(),
         ]
-        return Write(Bank.CA, src, description)
+        return Plan(Bank.CA, src, description)
 
 class EventBitCondition(_BitCondition):
     def write(self, bit, true = None, false = None):
@@ -78,4 +78,4 @@ class EventWordCondition(_Condition):
             lt,
             field.Return(),
         ]
-        return Write(Bank.CA, src, f"field count condition {hex(word)} {count}")
+        return Plan(Bank.CA, src, f"field count condition {hex(word)} {count}")
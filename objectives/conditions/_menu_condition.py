@@ -1,4 +1,4 @@
-from memory.space import Bank, Write
+from memory.space import Bank, Plan
 import instruction.asm as asm
 from objectives._cached_function import _CachedFunction
 
@@ -30,7 +30,7 @@ class _BitCondition(_Condition):
             false,
             asm.RTS(),
         ]
-        return Write(Bank.F0, src, f"menu bit condition {hex(address)} {hex(bit)}")
+        return Plan(Bank.F0, src, f"menu bit condition {hex(address)} {hex(bit)}")
 
 class EventBitCondition(_BitCondition):
     def write(self, bit, true = None, false = None):
@@ -67,4 +67,4 @@ class EventWordCondition(_Condition):
             lt,
             asm.RTS(),
         ]
-        return Write(Bank.F0, src, f"menu word condition {hex(word)} {count}")
+        return Plan(Bank.F0, src, f"menu word condition {hex(word)} {count}")
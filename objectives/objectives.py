@@ -12,6 +12,9 @@ class Objectives:
     def __init__(self):
         self.objectives = []
         self.suplex_train_condition_exists = False
+
+    def init(self):
+        # create the objectives given by args, called by init_hooks once args are parsed
         for index in range(len(args.objectives)):
             objective = Objective(index)
             self.objectives.append(objective)
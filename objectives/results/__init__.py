@@ -1,4 +1,5 @@
 results = {}
+_modules = [] # result modules in import order
 def __init__():
     import os, importlib
     for module_file in os.listdir(os.path.dirname(__file__)):
@@ -7,6 +8,13 @@ def __init__():
 
         module_name = module_file[:-3]
         module = importlib.import_module("objectives.results." + module_name)
+        _modules.append(module)
 
         results[module.Result.NAME] = module.Result
 __init__()
+
+def init():
+    # write the functions and tables shared by every result of a type (e.g. add stat all)
+    for module in _modules:
+        if hasattr(module, "init"):
+            module.init()
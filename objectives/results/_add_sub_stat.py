@@ -1,4 +1,4 @@
-from memory.space import Bank, Write
+from memory.space import Bank, Plan
 import instruction.asm as asm
 import instruction.field as field
 
@@ -38,7 +38,7 @@ def add_stat_all(stat_address, stat_string):
         asm.RTL(),
     ]
 
-    space = Write(Bank.F0, src, f"add {stat_string} all")
+    space = Plan(Bank.F0, src, f"add {stat_string} all")
     return space.start_address
 
 def sub_stat_all(stat_address, stat_string):
@@ -47,7 +47,7 @@ def sub_stat_all(stat_address, stat_string):
         asm.RTL(),
     ]
 
-    space = Write(Bank.F0, src, f"sub {stat_string} all")
+    space = Plan(Bank.F0, src, f"sub {stat_string} all")
     return space.start_address
 
 def add_stat_character(character, stat_address, stat_string):
@@ -56,7 +56,7 @@ def add_stat_character(character, stat_address, stat_string):
         asm.RTL(),
     ]
 
-    space = Write(Bank.F0, src, f"add {stat_string} {character}")
+    space = Plan(Bank.F0, src, f"add {stat_string} {character}")
     return space.start_address
 
 def sub_stat_character(character, stat_address, stat_string):
@@ -65,5 +65,5 @@ def sub_stat_character(character, stat_address, stat_string):
         asm.RTL(),
     ]
 
-    space = Write(Bank.F0, src, f"sub {stat_string} {character}")
+    space = Plan(Bank.F0, src, f"sub {stat_string} {character}")
     return space.start_address
@@ -1,4 +1,4 @@
-from memory.space import Bank, START_ADDRESS_SNES, Write
+from memory.space import Bank, START_ADDRESS_SNES, Plan
 import instruction.asm as asm
 from objectives._cached_function import _CachedFunction
 
@@ -12,7 +12,7 @@ class Result(_CachedFunction, asm.JSR):
             self.src(*args, **kwargs),
             asm.RTS(),
         ]
-        return Write(Bank.F0, src, f"battle result {type(self).__name__} {self.arg_string}")
+        return Plan(Bank.F0, src, f"battle result {type(self).__name__} {self.arg_string}")
 
 def SetBit(address, bit):
     bitmask = 2 ** (bit % 8)
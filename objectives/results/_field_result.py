@@ -1,4 +1,4 @@
-from memory.space import Bank, Write
+from memory.space import Bank, Plan
 from objectives._cached_function import _CachedFunction
 import instruction.field as field
 
@@ -12,4 +12,4 @@ class Result(_CachedFunction, field.Call):
             self.src(*args, **kwargs),
             field.Return(),
         ]
-        return Write(Bank.CA, src, f"field result {type(self).__name__} {self.arg_string}")
+        return Plan(Bank.CA, src, f"field result {type(self).__name__} {self.arg_string}")
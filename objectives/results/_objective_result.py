@@ -3,10 +3,11 @@ import objectives.results._battle_result as battle_result
 
 from constants.objectives.results import name_type
 
-from memory.space import Bank, START_ADDRESS_SNES, Write
+from memory.space import Bank, START_ADDRESS_SNES, Write, Plan
 import instruction.field as field
 import instruction.asm as asm
-import random
+from seed import random_stream
+rng = random_stream("objectives")
 
 class ObjectiveResult:
     def __init__(self, field_class, battle_class, *args):
@@ -11,5 +11,5 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Add Dragon Levels"
     def __init__(self, min_levels, max_levels):
-        self.levels = random.randint(min_levels, max_levels)
+        self.levels = rng.randint(min_levels, max_levels)
         super().__init__(Field, Battle, self.levels)
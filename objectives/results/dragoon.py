@@ -20,8 +20,7 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Dragoon"
     def __init__(self):
-        import random
         lances = ["Partisan", "Pearl Lance", "Aura Lance"]
-        lance = random.choice(lances)
+        lance = rng.choice(lances)
 
         super().__init__(Field, Battle, lance)
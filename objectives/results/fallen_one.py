@@ -14,9 +14,8 @@ def _set_hp_one():
         asm.RTL(),
     ]
 
-    space = Write(Bank.F0, src, "fallen one set hp one")
+    space = Plan(Bank.F0, src, "fallen one set hp one")
     return space.start_address
-set_hp_one = _set_hp_one()
 
 class Field(field_result.Result):
     def src(self):
@@ -34,3 +33,7 @@ class Result(ObjectiveResult):
     NAME = "Fallen One"
     def __init__(self):
         super().__init__(Field, Battle)
+
+def init():
+    global set_hp_one
+    set_hp_one = _set_hp_one()
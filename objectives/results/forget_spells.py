@@ -9,14 +9,13 @@ def _random_spell_table():
     for a_spell_id in args.remove_learnable_spell_ids:
         spell_table.remove(a_spell_id)
 
-    random.shuffle(spell_table)
+    rng.shuffle(spell_table)
 
     if len(spell_table) > 0:
-        space = Write(Bank.F0, spell_table, "forget spells random spell table")
+        space = Plan(Bank.F0, spell_table, "forget spells random spell table")
         return space.start_address, len(spell_table)
     else:
         return None, 0
-random_forget_spell_table, random_forget_spell_table_size = _random_spell_table()
 
 def _forget_random_spells():
     # input: 8 bit number of random spells to forget with each character
@@ -92,9 +91,8 @@ def _forget_random_spells():
         src = [
             asm.RTL()
         ]
-    space = Write(Bank.F0, src, "forget spells forget random spells")
+    space = Plan(Bank.F0, src, "forget spells forget random spells")
     return space.start_address
-forget_random_spells = _forget_random_spells()
 
 class Field(field_result.Result):
     def src(self, count):
@@ -113,5 +111,10 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Forget Spells"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global random_forget_spell_table, random_forget_spell_table_size, forget_random_spells
+    random_forget_spell_table, random_forget_spell_table_size = _random_spell_table()
+    forget_random_spells = _forget_random_spells()
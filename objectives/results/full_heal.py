@@ -32,9 +32,8 @@ def _full_heal():
         asm.RTL(),
     ]
 
-    space = Write(Bank.F0, src, "full heal")
+    space = Plan(Bank.F0, src, "full heal")
     return space.start_address
-full_heal = _full_heal()
 
 class Field(field_result.Result):
     def src(self):
@@ -52,3 +51,7 @@ class Result(ObjectiveResult):
     NAME = "Full Heal"
     def __init__(self):
         super().__init__(Field, Battle)
+
+def init():
+    global full_heal
+    full_heal = _full_heal()
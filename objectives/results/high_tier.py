@@ -15,8 +15,7 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "High Tier Item"
     def __init__(self):
-        import random
         from data.items import Items
 
-        random_item = random.choice(Items.GOOD)
+        random_item = rng.choice(Items.GOOD)
         super().__init__(Field, Battle, random_item)
@@ -17,13 +17,12 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "High Tier Armor"
     def __init__(self):
-        import random
         from data.items import Items
 
         # filter down to just armors (or empty)
         good_armors = intersection(Items.GOOD, ARMORS)
         if len(good_armors) > 0:
-            random_item = random.choice(good_armors)
+            random_item = rng.choice(good_armors)
         else:
             random_item = EMPTY
         super().__init__(Field, Battle, random_item)
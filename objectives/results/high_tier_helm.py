@@ -17,12 +17,11 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "High Tier Helm"
     def __init__(self):
-        import random
         from data.items import Items
 
         good_helms = intersection(Items.GOOD, HELMETS)
         if len(good_helms) > 0:
-            random_item = random.choice(good_helms)
+            random_item = rng.choice(good_helms)
         else:
             random_item = EMPTY
         super().__init__(Field, Battle, random_item)
@@ -17,12 +17,11 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "High Tier Relic"
     def __init__(self):
-        import random
         from data.items import Items
 
         good_relics = intersection(Items.GOOD, RELICS)
         if len(good_relics) > 0:
-            random_item = random.choice(good_relics)
+            random_item = rng.choice(good_relics)
         else:
             random_item = EMPTY
         super().__init__(Field, Battle, random_item)
@@ -17,12 +17,11 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "High Tier Shield"
     def __init__(self):
-        import random
         from data.items import Items
 
         good_shields = intersection(Items.GOOD, SHIELDS)
         if len(good_shields) > 0:
-            random_item = random.choice(good_shields)
+            random_item = rng.choice(good_shields)
         else:
             random_item = EMPTY
         super().__init__(Field, Battle, random_item)
@@ -17,12 +17,11 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "High Tier Weapon"
     def __init__(self):
-        import random
         from data.items import Items
 
         good_weapons = intersection(Items.GOOD, WEAPONS)
         if len(good_weapons) > 0:
-            random_item = random.choice(good_weapons)
+            random_item = rng.choice(good_weapons)
         else:
             random_item = EMPTY
         super().__init__(Field, Battle, random_item)
@@ -4,11 +4,10 @@ def _random_blitz_table():
     from constants.blitzes import id_blitz
 
     blitz_table = [2 ** index for index in range(len(id_blitz))]
-    random.shuffle(blitz_table)
+    rng.shuffle(blitz_table)
 
-    space = Write(Bank.F0, blitz_table, "learn blitzes random blitz table")
+    space = Plan(Bank.F0, blitz_table, "learn blitzes random blitz table")
     return space.start_address, len(blitz_table)
-random_blitz_table, random_blitz_table_size = _random_blitz_table()
 
 def _set_bum_rush_learned():
     import data.event_bit as event_bit
@@ -36,9 +35,8 @@ def _set_bum_rush_learned():
 
         asm.RTS(),
     ]
-    space = Write(Bank.F0, src, "learn blitzes set bum rush learned")
+    space = Plan(Bank.F0, src, "learn blitzes set bum rush learned")
     return space.start_address
-set_bum_rush_learned = _set_bum_rush_learned()
 
 def _learn_random_blitzes():
     # input: 8 bit number of random blitzes to learn
@@ -71,9 +69,8 @@ def _learn_random_blitzes():
         asm.PLP(),
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "learn blitzes learn random blitzes")
+    space = Plan(Bank.F0, src, "learn blitzes learn random blitzes")
     return space.start_address
-learn_random_blitzes = _learn_random_blitzes()
 
 class Field(field_result.Result):
     def src(self, count):
@@ -92,5 +89,11 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Learn Blitzes"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global random_blitz_table, random_blitz_table_size, set_bum_rush_learned, learn_random_blitzes
+    random_blitz_table, random_blitz_table_size = _random_blitz_table()
+    set_bum_rush_learned = _set_bum_rush_learned()
+    learn_random_blitzes = _learn_random_blitzes()
@@ -4,11 +4,10 @@ def _random_dance_table():
     from constants.dances import id_dance
 
     dance_table = [2 ** index for index in range(len(id_dance))]
-    random.shuffle(dance_table)
+    rng.shuffle(dance_table)
 
-    space = Write(Bank.F0, dance_table, "learn dances random dance table")
+    space = Plan(Bank.F0, dance_table, "learn dances random dance table")
     return space.start_address, len(dance_table)
-random_dance_table, random_dance_table_size = _random_dance_table()
 
 def _learn_random_dances():
     # input: 8 bit number of random dances to learn
@@ -36,9 +35,8 @@ def _learn_random_dances():
         asm.PLP(),
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "learn dances learn random dances")
+    space = Plan(Bank.F0, src, "learn dances learn random dances")
     return space.start_address
-learn_random_dances = _learn_random_dances()
 
 class Field(field_result.Result):
     def src(self, count):
@@ -57,5 +55,10 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Learn Dances"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global random_dance_table, random_dance_table_size, learn_random_dances
+    random_dance_table, random_dance_table_size = _random_dance_table()
+    learn_random_dances = _learn_random_dances()
@@ -5,11 +5,10 @@ def _random_lore_table():
     from constants.lores import id_lore
 
     lore_table = list(range(len(id_lore)))
-    random.shuffle(lore_table)
+    rng.shuffle(lore_table)
 
-    space = Write(Bank.F0, lore_table, "learn lores random lore table")
+    space = Plan(Bank.F0, lore_table, "learn lores random lore table")
     return space.start_address, len(lore_table)
-random_lore_table, random_lore_table_size = _random_lore_table()
 
 def _learn_random_lores():
     # input: 8 bit number of random lores to learn
@@ -57,9 +56,8 @@ def _learn_random_lores():
         asm.PLP(),
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "learn lores learn random lores")
+    space = Plan(Bank.F0, src, "learn lores learn random lores")
     return space.start_address
-learn_random_lores = _learn_random_lores()
 
 class Field(field_result.Result):
     def src(self, count):
@@ -78,5 +76,10 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Learn Lores"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global random_lore_table, random_lore_table_size, learn_random_lores
+    random_lore_table, random_lore_table_size = _random_lore_table()
+    learn_random_lores = _learn_random_lores()
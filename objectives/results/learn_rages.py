@@ -5,11 +5,10 @@ def _random_rage_table():
     from constants.rages import id_rage
 
     rage_table = list(range(len(id_rage)))
-    random.shuffle(rage_table)
+    rng.shuffle(rage_table)
 
-    space = Write(Bank.F0, rage_table, "learn rages random rage table")
+    space = Plan(Bank.F0, rage_table, "learn rages random rage table")
     return space.start_address, len(rage_table)
-random_rage_table, random_rage_table_size = _random_rage_table()
 
 def _learn_random_rages():
     # input: 8 bit number of random rages to learn
@@ -57,9 +56,8 @@ def _learn_random_rages():
         asm.PLP(),
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "learn rages learn random rages")
+    space = Plan(Bank.F0, src, "learn rages learn random rages")
     return space.start_address
-learn_random_rages = _learn_random_rages()
 
 class Field(field_result.Result):
     def src(self, count):
@@ -78,5 +76,10 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Learn Rages"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global random_rage_table, random_rage_table_size, learn_random_rages
+    random_rage_table, random_rage_table_size = _random_rage_table()
+    learn_random_rages = _learn_random_rages()
@@ -9,14 +9,13 @@ def _random_spell_table():
     for a_spell_id in args.remove_learnable_spell_ids:
         spell_table.remove(a_spell_id)
 
-    random.shuffle(spell_table)
+    rng.shuffle(spell_table)
 
     if len(spell_table) > 0:
-        space = Write(Bank.F0, spell_table, "learn spells random spell table")
+        space = Plan(Bank.F0, spell_table, "learn spells random spell table")
         return space.start_address, len(spell_table)
     else:
         return None, 0
-random_learn_spell_table, random_learn_spell_table_size = _random_spell_table()
 
 def _learn_random_spells():
     # input: 8 bit number of random spells to learn with each character
@@ -91,9 +90,8 @@ def _learn_random_spells():
         src = [
             asm.RTL()
         ]
-    space = Write(Bank.F0, src, "learn spells learn random spells")
+    space = Plan(Bank.F0, src, "learn spells learn random spells")
     return space.start_address
-learn_random_spells = _learn_random_spells()
 
 class Field(field_result.Result):
     def src(self, count):
@@ -112,5 +110,10 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Learn Spells"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global random_learn_spell_table, random_learn_spell_table_size, learn_random_spells
+    random_learn_spell_table, random_learn_spell_table_size = _random_spell_table()
+    learn_random_spells = _learn_random_spells()
@@ -25,9 +25,8 @@ def _learn_swdtechs():
         asm.PLP(),
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "learn swdtechs learn swdtechs")
+    space = Plan(Bank.F0, src, "learn swdtechs learn swdtechs")
     return space.start_address
-learn_swdtechs = _learn_swdtechs()
 
 class Field(field_result.Result):
     def src(self, count):
@@ -46,5 +45,9 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Learn SwdTechs"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global learn_swdtechs
+    learn_swdtechs = _learn_swdtechs()
@@ -8,9 +8,8 @@ def _max_morph_duration():
         asm.STA(morph_duration_address, asm.ABS),
         asm.RTL(),
     ]
-    space = Write(Bank.F0, src, "max morph duration")
+    space = Plan(Bank.F0, src, "max morph duration")
     return space.start_address
-max_morph_duration = _max_morph_duration()
 
 class Field(field_result.Result):
     def src(self):
@@ -28,3 +27,7 @@ class Result(ObjectiveResult):
     NAME = "Max Morph Duration"
     def __init__(self):
         super().__init__(Field, Battle)
+
+def init():
+    global max_morph_duration
+    max_morph_duration = _max_morph_duration()
@@ -2,8 +2,6 @@ from objectives.results._objective_result import *
 from objectives.results._add_sub_stat import add_stat_all, sub_stat_all
 
 STAMINA_ADDRESS = 0x161c
-add_stamina = add_stat_all(STAMINA_ADDRESS, "stamina")
-sub_stamina = sub_stat_all(STAMINA_ADDRESS, "stamina")
 
 class Field(field_result.Result):
     def src(self, count):
@@ -36,5 +34,10 @@ class Battle(battle_result.Result):
 class Result(ObjectiveResult):
     NAME = "Stamina All"
     def __init__(self, min_count, max_count):
-        self.count = random.randint(min_count, max_count)
+        self.count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, self.count)
+
+def init():
+    global add_stamina, sub_stamina
+    add_stamina = add_stat_all(STAMINA_ADDRESS, "stamina")
+    sub_stamina = sub_stat_all(STAMINA_ADDRESS, "stamina")
@@ -48,8 +48,8 @@ class Result(ObjectiveResult):
     NAME = "Stamina Random"
     def __init__(self, min_count, max_count):
         from constants.entities import id_character, CHARACTER_COUNT
-        character = random.randint(0, CHARACTER_COUNT - 1)
+        character = rng.randint(0, CHARACTER_COUNT - 1)
         character_name = id_character[character]
 
-        count = random.randint(min_count, max_count)
+        count = rng.randint(min_count, max_count)
         super().__init__(Field, Battle, count, character_name, character)
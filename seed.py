@@ -5,10 +5,27 @@ def generate_seed():
     alpha_digits = string.ascii_lowercase + string.digits
     return ''.join(secrets.choice(alpha_digits) for i in range(SEED_LENGTH))
 
+# independent random number generators for each subsystem
+# each stream is seeded by the seed, flags and subsystem name, so the results of one subsystem do not depend
+# on how many random numbers other subsystems used before it
+_stream_seed = ""
+_streams = {}
+
+def random_stream(name):
+    import random
+    if name not in _streams:
+        _streams[name] = random.Random(_stream_seed + "/" + name)
+    return _streams[name]
+
 def seed_rng(seed = None, flags = ""):
     if seed is None:
         seed = generate_seed()
 
     import random
     random.seed(seed + flags)
+
+    global _stream_seed
+    _stream_seed = seed + flags
+    for name, stream in _streams.items():
+        stream.seed(_stream_seed + "/" + name)
     return seed
@@ -0,0 +1,465 @@
+# long-lived generator which loads and validates the vanilla rom and imports the generator once and then generates
+# seeds for requests read from stdin, one json object per line, e.g.
+#   {"id": 1, "args": "-o out.smc -s myseed -cg -oa 2.3.3.1.r.1.r.1.r"}
+# each request gets one json line response on stdout, everything else is printed to stderr
+# with -workers N, requests are generated in parallel by processes forked from the warm server process
+# each seed starts from a copy of the vanilla rom, Data tables are still read from it for each seed because Data reads
+# and randomizes every table in the same constructor
+#
+# batch mode generates many seeds for the same flags in a single invocation, e.g.
+#   wc.py --count 100 -i ffiii.smc -cg -oa 2.3.3.1.r.1.r.1.r
+#   wc.py --batch seeds.txt -i ffiii.smc -cg -oa 2.3.3.1.r.1.r.1.r
+
+import os, sys
+
+ROOT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# modules which are kept between seeds and reset explicitly, args are parsed again and Space.reset clears memory
+KEEP_MODULE_PACKAGES = ["args", "memory"]
+KEEP_MODULES = ["__main__", "__mp_main__", "server", "wc", "seed", "version", "valid_rom_file", "sprite_hash", "init_hooks"]
+
+def _keep_module(name):
+    return name in KEEP_MODULES or name.split('.')[0] in KEEP_MODULE_PACKAGES
+
+def _module_path(module):
+    # namespace packages (directories without __init__.py) have no __file__, use their directory instead
+    module_file = getattr(module, "__file__", None)
+    if module_file is None:
+        module_file = next(iter(getattr(module, "__path__", [])), None)
+    return module_file
+
+def _root_packages():
+    # top level packages of the generator, every module in them belongs to the generator even if it replaced itself
+    # in sys.modules with an object which has no file (e.g. objectives is an Objectives instance)
+    return set(name for name in os.listdir(ROOT_DIRECTORY) if os.path.isdir(os.path.join(ROOT_DIRECTORY, name)))
+
+def _generator_modules():
+    # loaded generator modules which are not kept, name -> module (or the object which replaced it)
+    root_packages = _root_packages()
+    result = {}
+    for name, module in list(sys.modules.items()):
+        if _keep_module(name):
+            continue
+        module_path = _module_path(module)
+        if name.split('.')[0] in root_packages or \
+           (module_path is not None and os.path.abspath(module_path).startswith(ROOT_DIRECTORY + os.sep)):
+            result[name] = module
+    return result
+
+def _import_exception(name):
+    import init_hooks
+    return any(name == module or name.startswith(module + ".") for module in init_hooks.IMPORT_EXCEPTIONS)
+
+def import_generator():
+    # import every module of the generator except init_hooks.IMPORT_EXCEPTIONS
+    # importing them does not read args or the rom, so they are imported once and kept between seeds
+    import importlib
+    for directory, directories, files in os.walk(ROOT_DIRECTORY):
+        directories[:] = sorted(name for name in directories if name[0] not in "._" and name not in ("tests", "tools"))
+        for file_name in sorted(files):
+            if not file_name.endswith(".py") or "-" in file_name:
+                continue
+            name = os.path.relpath(os.path.join(directory, file_name[:-3]), ROOT_DIRECTORY).replace(os.sep, ".")
+            if name == "__init__":
+                continue
+            if name.endswith(".__init__"):
+                name = name[:-len(".__init__")]
+            if not _import_exception(name):
+                importlib.import_module(name)
+
+def _copy_contents(value):
+    # copy of a list, dict or set and the lists, dicts and sets it contains, other values are shared
+    if isinstance(value, list):
+        return [_copy_contents(element) for element in value]
+    if isinstance(value, dict):
+        return {key : _copy_contents(element) for key, element in value.items()}
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+class _ModuleSnapshot:
+    # globals and class attributes of the generator modules right after they were imported
+    # restore undoes what a seed assigned, added or patched (e.g. init hook globals, classes which replace their
+    # __init__ once their code is written, cached function addresses) before the next seed
+    # lists, dicts and sets are restored in place because other modules may hold them (e.g. from x import tiers)
+    def __init__(self, modules):
+        self.names = set(modules)
+        self.namespaces = []
+        added = set()
+        for name, module in modules.items():
+            namespaces = [module] + [value for value in vars(module).values()
+                                     if isinstance(value, type) and value.__module__ == name]
+            for namespace in namespaces:
+                if id(namespace) not in added:
+                    added.add(id(namespace))
+                    self._add(namespace)
+
+    def _add(self, namespace):
+        attributes = dict(vars(namespace))
+        # dunder values are not generator state (e.g. __builtins__ is the builtins module dict)
+        contents = {name : _copy_contents(value) for name, value in attributes.items()
+                    if isinstance(value, (list, dict, set)) and not name.startswith("__")}
+        self.namespaces.append((namespace, attributes, contents))
+
+    def restore(self):
+        for namespace, attributes, contents in self.namespaces:
+            current = vars(namespace)
+            for name in [name for name in current if name not in attributes]:
+                delattr(namespace, name)
+            for name, value in attributes.items():
+                if current.get(name) is not value:
+                    setattr(namespace, name, value)
+
+            for name, value in contents.items():
+                container = attributes[name]
+                if isinstance(container, list):
+                    container[:] = _copy_contents(value)
+                else:
+                    container.clear()
+                    container.update(_copy_contents(value))
+
+_snapshot = None
+
+def warm():
+    # import the generator and remember the state of its modules, reset restores it before each seed
+    global _snapshot
+    if _snapshot is None:
+        import_generator()
+        _snapshot = _ModuleSnapshot(_generator_modules())
+
+def _unload_modules():
+    # remove generator modules which were not imported by warm (init_hooks.IMPORT_EXCEPTIONS), they read args or
+    # the rom when imported so they are imported again by the next seed
+    for name in _generator_modules():
+        if name not in _snapshot.names:
+            del sys.modules[name]
+
+def _reset_logging():
+    # log configures the root logger on import, remove the previous seed's log file handler
+    import logging
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+def _parse_args(argv):
+    sys.argv = [sys.argv[0]] + argv
+    import args
+    args.parse()
+
+def reset():
+    _reset_logging()
+    warm()
+    _unload_modules()
+    _snapshot.restore()
+
+    from memory.space import Space
+    Space.reset()
+
+def generate(vanilla_rom, argv):
+    # generate a single seed from a copy of the already loaded vanilla rom, returns the args used
+    reset()
+    _parse_args(argv)
+
+    from wc import main
+    main(vanilla_rom.copy())
+
+    _reset_logging() # close log file
+    return sys.modules["args"]
+
+class InvalidArguments(Exception):
+    pass
+
+# vanilla rom loaded by the pool process, inherited (copy-on-write) by every forked worker
+_pool_rom = None
+
+def _generate_worker(argv):
+    # runs in a freshly forked worker (one seed per worker), modules imported by the pool process have not been used
+    # for a seed yet so they are used as they are, generate with the output redirected to a temporary directory
+    import contextlib, tempfile, time
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr), tempfile.TemporaryDirectory() as temp_directory:
+        try:
+            _parse_args(argv)
+        except SystemExit as e:
+            # do not let argparse exit the worker process, report the error back to the pool
+            raise InvalidArguments(f"invalid arguments (exit code {e.code})")
+        args = sys.modules["args"]
+
+        output_file = args.output_file
+        manifest_file = args.manifest_file
+        args.output_file = os.path.join(temp_directory, os.path.basename(output_file))
+        if manifest_file:
+            args.manifest_file = os.path.join(temp_directory, "manifest.json")
+        patch_file = args.patch_file
+        if patch_file:
+            args.patch_file = os.path.join(temp_directory, "patch")
+        args.stdout_log = False
+        no_rom_output = args.no_rom_output
+        args.no_rom_output = True
+
+        from wc import main
+        main(_pool_rom.copy())
+        _reset_logging() # close log file
+
+        from memory.space import Space
+        from utils import profile
+        result = {
+            "seed" : args.seed,
+            "flags" : args.flags,
+            "output_file" : output_file,
+            "rom" : None if no_rom_output else bytes(Space.rom.to_bytes()),
+            "log" : None,
+            "manifest_file" : manifest_file,
+            "manifest" : None,
+            "patch_file" : patch_file,
+            "patch" : None,
+            "profile_file" : profile.output_path(output_file, manifest_file) if args.profile else None,
+            "profile" : None,
+            "time" : None,
+        }
+        with open(os.path.splitext(args.output_file)[0] + ".txt", "r") as log_file:
+            result["log"] = log_file.read()
+        if manifest_file:
+            with open(args.manifest_file, "r") as manifest:
+                result["manifest"] = manifest.read()
+        if patch_file:
+            with open(args.patch_file, "rb") as patch:
+                result["patch"] = patch.read()
+        if args.profile:
+            with open(profile.output_path(args.output_file, args.manifest_file), "r") as profile_file:
+                result["profile"] = profile_file.read()
+        result["time"] = round(time.perf_counter() - start_time, 3)
+        return result
+
+class GeneratorPool:
+    # forks one worker process per seed from a process which already imported the generator and loaded the rom
+    def __init__(self, input_file, workers = None, rom_cache_directory = None):
+        global _pool_rom
+        from memory.rom import ROM
+        _pool_rom = ROM(input_file, rom_cache_directory)
+        self.input_file = input_file
+
+        # import the generator before forking so workers share the imported modules instead of importing them again
+        import_generator()
+
+        import multiprocessing
+        context = multiprocessing.get_context("fork")
+        self.pool = context.Pool(workers, maxtasksperchild = 1)
+
+    def submit(self, argv, callback = None, error_callback = None):
+        return self.pool.apply_async(_generate_worker, (argv,), callback = callback, error_callback = error_callback)
+
+    def generate(self, argv):
+        # returns dict with seed, flags, output rom bytes, log and manifest contents
+        return self.submit(argv).get()
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+def write_result(result):
+    # write the rom, log, manifest and patch returned by a pool worker to the locations requested
+    if result["rom"] is not None:
+        with open(result["output_file"], "wb") as output:
+            output.write(result["rom"])
+
+    log_file = os.path.splitext(result["output_file"])[0] + ".txt"
+    with open(log_file, "w") as output:
+        output.write(result["log"])
+
+    if result["manifest_file"]:
+        with open(result["manifest_file"], "w") as output:
+            output.write(result["manifest"])
+
+    if result["patch_file"]:
+        with open(result["patch_file"], "wb") as output:
+            output.write(result["patch"])
+
+    if result["profile_file"]:
+        with open(result["profile_file"], "w") as output:
+            output.write(result["profile"])
+    return log_file
+
+def _request_argv(request, input_file):
+    import shlex
+    argv = request.get("args", [])
+    if isinstance(argv, str):
+        argv = shlex.split(argv)
+    if "-i" not in argv:
+        argv = ["-i", input_file] + argv
+    return argv
+
+def _handle_request(vanilla_rom, input_file, request):
+    import contextlib, time, traceback
+    response = {"id" : request.get("id")}
+    start_time = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            args = generate(vanilla_rom, _request_argv(request, input_file))
+
+        log_file = os.path.splitext(args.output_file)[0] + ".txt"
+        response["seed"] = args.seed
+        response["flags"] = args.flags
+        response["output_file"] = None if args.no_rom_output else args.output_file
+        response["log_file"] = None if args.stdout_log else log_file
+        response["manifest_file"] = args.manifest_file
+        response["patch_file"] = args.patch_file
+        if args.profile:
+            from utils import profile
+            response["profile_file"] = profile.output_path(args.output_file, args.manifest_file)
+    except SystemExit as e:
+        response["error"] = f"invalid arguments (exit code {e.code})"
+    except Exception:
+        response["error"] = traceback.format_exc()
+    response["time"] = round(time.perf_counter() - start_time, 3)
+    return response
+
+def _serve_pool(input_file, rom_cache_directory, workers, requests, respond):
+    import threading, time, traceback
+    pool = GeneratorPool(input_file, workers, rom_cache_directory)
+    lock = threading.Lock()
+
+    for request in requests:
+        if "error" in request:
+            respond(request)
+            continue
+
+        def on_result(result, request_id = request.get("id"), start_time = time.perf_counter()):
+            response = {"id" : request_id}
+            try:
+                response["seed"] = result["seed"]
+                response["flags"] = result["flags"]
+                response["output_file"] = result["output_file"] if result["rom"] is not None else None
+                response["log_file"] = write_result(result)
+                response["manifest_file"] = result["manifest_file"]
+                response["patch_file"] = result["patch_file"]
+                if result["profile_file"]:
+                    response["profile_file"] = result["profile_file"]
+            except Exception:
+                response["error"] = traceback.format_exc()
+            response["time"] = round(time.perf_counter() - start_time, 3)
+            with lock:
+                respond(response)
+
+        def on_error(error, request_id = request.get("id"), start_time = time.perf_counter()):
+            if isinstance(error, InvalidArguments):
+                message = str(error)
+            else:
+                message = "".join(traceback.format_exception(error))
+            with lock:
+                respond({"id" : request_id, "error" : message, "time" : round(time.perf_counter() - start_time, 3)})
+
+        pool.submit(_request_argv(request, input_file), on_result, on_error)
+    pool.close()
+
+def serve(argv = None):
+    import json
+    from argparse import ArgumentParser
+    parser = ArgumentParser(allow_abbrev = False)
+    parser.add_argument("--serve", action = "store_true", required = True, help = "Generate seeds for json requests read from stdin")
+    parser.add_argument("-i", dest = "input_file", required = True, help = "FFIII US v1.0 rom file")
+    parser.add_argument("-cache", dest = "rom_cache_directory", required = False, help = "Directory to cache the validated input rom in")
+    parser.add_argument("-workers", dest = "workers", type = int, default = 0,
+                        help = "Generate seeds in parallel in N forked worker processes (0 = sequentially in the server process)")
+    server_args, _ = parser.parse_known_args(argv)
+
+    stdout = sys.stdout
+    def respond(response):
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+    def requests():
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield {"id" : None, "error" : f"invalid request: {e}"}
+
+    if server_args.workers > 0:
+        _serve_pool(server_args.input_file, server_args.rom_cache_directory, server_args.workers, requests(), respond)
+        return
+
+    from memory.rom import ROM
+    vanilla_rom = ROM(server_args.input_file, server_args.rom_cache_directory)
+    warm()
+
+    for request in requests():
+        if "error" in request:
+            respond(request)
+        else:
+            respond(_handle_request(vanilla_rom, server_args.input_file, request))
+
+def batch(argv = None):
+    import time
+    from argparse import ArgumentParser
+    parser = ArgumentParser(allow_abbrev = False, usage = "wc.py (--batch SEEDS_FILE | --count N) -i INPUT_FILE [-workers N] [flags]")
+    group = parser.add_mutually_exclusive_group(required = True)
+    group.add_argument("--batch", dest = "seeds_file", help = "Generate a seed for each line in SEEDS_FILE")
+    group.add_argument("--count", dest = "count", type = int, help = "Generate N random seeds")
+    parser.add_argument("-i", dest = "input_file", required = True, help = "FFIII US v1.0 rom file")
+    parser.add_argument("-cache", dest = "rom_cache_directory", required = False, help = "Directory to cache the validated input rom in")
+    parser.add_argument("-workers", dest = "workers", type = int, default = 0,
+                        help = "Generate seeds in parallel in N forked worker processes (0 = sequentially)")
+    batch_args, flags = parser.parse_known_args(argv)
+
+    for option in ("-s", "-o"):
+        if option in flags:
+            parser.error(f"{option} cannot be used in batch mode, each seed is written to <input>_wc_<seed>")
+
+    if batch_args.seeds_file:
+        with open(batch_args.seeds_file, "r") as seeds_file:
+            seeds = [line.strip() for line in seeds_file if line.strip()]
+    else:
+        from seed import generate_seed
+        seeds = [generate_seed() for _ in range(batch_args.count)]
+
+    def seed_argv(seed):
+        return ["-i", batch_args.input_file, "-s", seed] + flags
+
+    def print_header(setup_time):
+        # the rom and the imported generator are shared, Data tables are still read from the rom for each seed
+        print(f"Loaded rom and imported generator in {setup_time:.3f}s, seed times include reading Data from the rom")
+        print(f"{'Seed':<24} {'Time':>8}")
+
+    def report(seed, seconds, error = None):
+        print(f"{seed:<24} {seconds:>7.3f}s" + (" FAILED" if error else ""), flush = True)
+        if error:
+            print(f"{seed}: {error}", file = sys.stderr)
+
+    errors = 0
+    times = []
+    start_time = time.perf_counter()
+    if batch_args.workers > 0:
+        pool = GeneratorPool(batch_args.input_file, batch_args.workers, batch_args.rom_cache_directory)
+        print_header(time.perf_counter() - start_time)
+        pending = [(seed, pool.submit(seed_argv(seed))) for seed in seeds]
+        for seed, pending_result in pending:
+            try:
+                result = pending_result.get()
+                write_result(result)
+                times.append(result["time"])
+                report(seed, result["time"])
+            except Exception as e:
+                errors += 1
+                report(seed, 0.0, str(e))
+        pool.close()
+    else:
+        from memory.rom import ROM
+        vanilla_rom = ROM(batch_args.input_file, batch_args.rom_cache_directory)
+        warm()
+        print_header(time.perf_counter() - start_time)
+        for seed in seeds:
+            response = _handle_request(vanilla_rom, batch_args.input_file, {"args" : seed_argv(seed)})
+            if "error" in response:
+                errors += 1
+            else:
+                times.append(response["time"])
+            report(seed, response["time"], response.get("error"))
+
+    total_time = time.perf_counter() - start_time
+    mean_time = sum(times) / len(times) if times else 0.0
+    print(f"{len(seeds) - errors}/{len(seeds)} seeds generated in {total_time:.3f}s (mean {mean_time:.3f}s per seed)")
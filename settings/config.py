@@ -1,4 +1,4 @@
-from memory.space import Reserve, Bank, Write
+from memory.space import Reserve, Bank, Plan
 import instruction.asm as asm
 import args
 
@@ -25,7 +25,7 @@ class Config:
             asm.STA(0x1D54, asm.ABS),                   # STA $1D54;  # Config #2
             asm.RTS(),
             ]
-        space = Write(Bank.C3, src, "Config #2 default value")
+        space = Plan(Bank.C3, src, "Config #2 default value")
 
         # Update the JSR for Config default #2
         config2_loc = space.start_address
@@ -41,7 +41,7 @@ class Config:
             asm.STA(0x1D4E, asm.ABS),  
             asm.RTS(),
         ]
-        space = Write(Bank.C3, src, "Config_3_default")
+        space = Plan(Bank.C3, src, "Config_3_default")
 
         # Update the JSR for Config default #3
         config3_loc = space.start_address
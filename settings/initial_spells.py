@@ -1,4 +1,4 @@
-from memory.space import START_ADDRESS_SNES, Bank, Reserve, Write, Read
+from memory.space import START_ADDRESS_SNES, Bank, Reserve, Plan, Read
 import instruction.asm as asm
 import args
 
@@ -59,7 +59,7 @@ class InitialSpells:
             asm.TDC(),
             asm.RTL(),
         ]
-        space = Write(Bank.F0, src, "scan all learn_scan")
+        space = Plan(Bank.F0, src, "scan all learn_scan")
         learn_spells_snes = space.start_address_snes
 
         space = Reserve(0x0bdcc, 0x0bdd6, "initialize spells and learn initial", asm.NOP())
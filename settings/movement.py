@@ -1,4 +1,4 @@
-from memory.space import Allocate, Bank, Reserve, Write
+from memory.space import Allocate, Bank, Reserve, Plan
 import instruction.asm as asm
 from data.movement import AUTO_SPRINT, B_DASH, ORIGINAL, SPRINT_SHOES_B_DASH, MovementSpeed
 
@@ -16,7 +16,7 @@ class Movement:
 
         src = self.get_auto_sprint_src()
 
-        space = Write(Bank.F0, src, "Sprint subroutine")
+        space = Plan(Bank.F0, src, "Sprint subroutine")
 
         src = [
             asm.JSL(space.start_address_snes),
@@ -32,8 +32,8 @@ class YNPC:
 
     def interact(self):
         from memory.space import START_ADDRESS_SNES
-        from instruction.field import Y_NPC
-        y_npc_event_bytes = (Y_NPC + START_ADDRESS_SNES).to_bytes(3, "little")
+        import instruction.field.y_npc.functions as y_npc_functions
+        y_npc_event_bytes = (y_npc_functions.Y_NPC + START_ADDRESS_SNES).to_bytes(3, "little")
 
         from data.characters import Characters
         src = [
@@ -0,0 +1,161 @@
+# cache of generated roms keyed by the seed and every flag except the ones only read by patch stages
+# patch stages (character sprites, portraits and palettes) only write tables at fixed addresses, a re-roll which
+# only changes their flags starts from the cached rom and generation log and re-applies just those stages
+# e.g. changing -cspr/-cpal/-cpor of an already generated seed does not run any other stage
+import hashlib, json, logging, os
+
+CACHE_VERSION = 2
+
+# flags read only by patch stages, each one takes a single value, mapped to their argument names
+PATCH_FLAGS = {
+    "-cpal" : "character_palettes",
+    "-cpor" : "character_portraits",
+    "-cspr" : "character_sprites",
+}
+
+def _character_graphics(rom, args):
+    # write character sprite, portrait and palette tables modified by args to rom
+    # returns the (start, end) address ranges written
+    from data.menu_character_sprites import MenuCharacterSprites
+    from data.character_sprites import CharacterSprites
+    from data.character_palettes import CharacterPalettes
+
+    character_sprites = CharacterSprites(rom, args)
+    character_palettes = CharacterPalettes(rom, args, MenuCharacterSprites(rom, args))
+    character_sprites.mod()
+    character_palettes.mod()
+    character_sprites.write()
+    character_palettes.write()
+
+    return [
+        (CharacterSprites.DATA_START, CharacterSprites.DATA_END),
+        (CharacterSprites.OTHER_DATA_START, CharacterSprites.OTHER_DATA_END),
+        (CharacterSprites.PORTRAIT_DATA_START, CharacterSprites.PORTRAIT_DATA_END),
+        (CharacterPalettes.FIELD_DATA_START, CharacterPalettes.FIELD_DATA_END),
+        (CharacterPalettes.BATTLE_DATA_START, CharacterPalettes.BATTLE_DATA_END),
+        (CharacterPalettes.PORTRAIT_DATA_START, CharacterPalettes.PORTRAIT_DATA_END),
+    ]
+
+PATCH_STAGES = [_character_graphics]
+
+def _key_flags(flags):
+    # flags without the patch flags and their values
+    result = []
+    flags = iter(flags.split())
+    for flag in flags:
+        if flag in PATCH_FLAGS:
+            next(flags, None)
+        else:
+            result.append(flag)
+    return ' '.join(result)
+
+def _entry_path(cache_directory, args):
+    import version
+    key = f"{CACHE_VERSION}:{version.__version__}:{args.seed}:{_key_flags(args.flags)}:{args.debug}:{args.hide_flags}:{args.pack_allocations}"
+    return os.path.join(cache_directory, hashlib.sha256(key.encode()).hexdigest())
+
+def _patch_args(args, patch_values):
+    # copy of args with the given patch flag values processed the same way the command line values were
+    import types
+    result = types.SimpleNamespace(**{name : value for name, value in vars(args).items() if not name.startswith("__")})
+    for name, value in patch_values.items():
+        setattr(result, name, value)
+    args.group_modules["graphics"].process(result)
+    return result
+
+class _LogCapture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(record.getMessage())
+
+_log_capture = None
+
+def capture_log():
+    # record everything logged from now on so it can be stored with the generated rom
+    global _log_capture
+    _log_capture = _LogCapture()
+    logging.getLogger().addHandler(_log_capture)
+
+def load(cache_directory, rom):
+    # replace the vanilla rom data with a cached generation for the current args, returns False if there is none
+    import args
+    entry_path = _entry_path(cache_directory, args)
+    try:
+        with open(entry_path + ".json", "r") as metadata_file:
+            metadata = json.load(metadata_file)
+    except (OSError, ValueError):
+        return False
+    if metadata.get("version") != CACHE_VERSION:
+        return False
+
+    data = bytearray(rom.size())
+    try:
+        with open(entry_path + ".rom", "rb") as image_file:
+            if image_file.readinto(data) != len(data) or image_file.read(1):
+                return False
+    except OSError:
+        return False
+    if hashlib.sha256(data).hexdigest() != metadata.get("sha256"):
+        return False # rom was replaced by a concurrent store with different patch values
+
+    # run each patch stage on the vanilla rom with the cached and the current flags, copy the bytes which
+    # differ into the cached rom, bytes of the tables which other stages changed are kept unless they differ
+    cached_args = _patch_args(args, metadata["patch_values"])
+    for patch_stage in PATCH_STAGES:
+        cached_rom = rom.copy()
+        current_rom = rom.copy()
+        ranges = patch_stage(cached_rom, cached_args)
+        patch_stage(current_rom, args)
+
+        for start, end in ranges:
+            cached_data = cached_rom.data[start : end + 1]
+            current_data = current_rom.data[start : end + 1]
+            if cached_data == current_data:
+                continue
+            for offset, (cached_byte, current_byte) in enumerate(zip(cached_data, current_data)):
+                if cached_byte != current_byte:
+                    data[start + offset] = current_byte
+
+    rom.data = data
+    rom.dirty.add(0, len(data))
+    rom.deferred = {}
+    rom.deferred_addresses = []
+
+    for line in metadata["log"]:
+        logging.info(line)
+    return True
+
+def store(cache_directory, rom):
+    # save generated rom and everything logged since capture_log was called
+    global _log_capture
+    import args
+    os.makedirs(cache_directory, exist_ok = True)
+    entry_path = _entry_path(cache_directory, args)
+
+    log_lines = []
+    if _log_capture is not None:
+        logging.getLogger().removeHandler(_log_capture)
+        log_lines = _log_capture.lines
+        _log_capture = None
+
+    data = rom.to_bytes()
+    metadata = {
+        "version" : CACHE_VERSION,
+        "sha256" : hashlib.sha256(data).hexdigest(),
+        "seed" : args.seed,
+        "flags" : args.flags,
+        "patch_values" : {name : getattr(args, name) for name in PATCH_FLAGS.values()},
+        "log" : log_lines,
+    }
+
+    temp_suffix = f".{os.getpid()}.tmp"
+    with open(entry_path + ".rom" + temp_suffix, "wb") as image_file:
+        image_file.write(data)
+    os.replace(entry_path + ".rom" + temp_suffix, entry_path + ".rom")
+
+    with open(entry_path + ".json" + temp_suffix, "w") as metadata_file:
+        json.dump(metadata, metadata_file, indent = 4)
+    os.replace(entry_path + ".json" + temp_suffix, entry_path + ".json")
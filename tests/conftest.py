@@ -0,0 +1,4 @@
+# tests import the generator's top level packages (data, memory, ...) the same way wc.py does
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,38 @@
+import os, subprocess, sys
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# imports every generator module in a new interpreter without parsing args or loading a rom
+# modules listed in init_hooks.IMPORT_EXCEPTIONS (and their packages) are skipped
+IMPORT_ALL = """
+import importlib, os, sys
+import init_hooks
+
+def exception(name):
+    return any(name == module or name.startswith(module + ".") for module in init_hooks.IMPORT_EXCEPTIONS)
+
+failed = []
+for directory, directories, files in os.walk("."):
+    directories[:] = sorted(name for name in directories if name[0] not in "._" and name not in ("tests", "tools"))
+    for file_name in sorted(files):
+        if not file_name.endswith(".py") or "-" in file_name:
+            continue
+        name = os.path.relpath(os.path.join(directory, file_name[:-3])).replace(os.sep, ".")
+        if name in ("__init__", "wc"):
+            continue
+        if name.endswith(".__init__"):
+            name = name[:-len(".__init__")]
+        if exception(name):
+            continue
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            failed.append(f"{name}: {e!r}")
+print("\\n".join(failed))
+"""
+
+def test_import_without_args_or_rom():
+    result = subprocess.run([sys.executable, "-c", IMPORT_ALL], cwd = ROOT_DIRECTORY,
+                            capture_output = True, text = True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
@@ -0,0 +1,46 @@
+# -pack generation tests need the vanilla rom, set WC_TEST_ROM to its path to run them
+import os, subprocess, sys
+import pytest
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROM_FILE = os.environ.get("WC_TEST_ROM")
+requires_rom = pytest.mark.skipif(ROM_FILE is None, reason = "WC_TEST_ROM not set")
+
+FLAGS = ["-cg", "-oa", "2.3.3.1.r.1.r.1.r", "-ob", "3.2.2.1.r.1.r"]
+
+def test_planned_address_before_and_after_place():
+    from memory.label import PlannedAddress
+    placed = [None]
+    address = PlannedAddress(lambda : placed[0], "test block")
+    low_byte, high_byte = (address + 0xc00000 & 0xffff).to_bytes(2, "little")
+
+    for use in (int, str, hex, bool, lambda value : f"{value}", lambda value : value < 0x10000):
+        with pytest.raises(TypeError):
+            use(address)
+    with pytest.raises(TypeError):
+        hash(address)
+
+    placed[0] = 0x301234
+    assert int(address) == 0x301234
+    assert str(address) == "0x301234"
+    assert (int(low_byte), int(high_byte)) == (0x34, 0x12)
+
+def _generate(output_directory, extra_args):
+    # same output file name in both runs so only the generated time differs in the log header
+    output_directory.mkdir()
+    output_file = output_directory / "pack.smc"
+    result = subprocess.run([sys.executable, "wc.py", "-i", ROM_FILE, "-o", str(output_file), "-s", "pack"]
+                            + FLAGS + extra_args, cwd = ROOT_DIRECTORY, capture_output = True, text = True)
+    assert result.returncode == 0, result.stderr
+    log = (output_directory / "pack.txt").read_text().splitlines()
+    return output_file.read_bytes(), [line for line in log if not line.startswith("Generated")]
+
+@requires_rom
+def test_pack_generates_same_seed(tmp_path):
+    # -pack only changes where relocatable blocks are placed, the randomization and log must not change
+    default_rom, default_log = _generate(tmp_path / "default", [])
+    packed_rom, packed_log = _generate(tmp_path / "packed", ["-pack"])
+
+    assert packed_log == default_log
+    assert len(packed_rom) == len(default_rom)
+    assert packed_rom != default_rom
@@ -0,0 +1,90 @@
+# generation tests need the vanilla rom, set WC_TEST_ROM to its path to run them
+import os, subprocess, sys, types
+import pytest
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROM_FILE = os.environ.get("WC_TEST_ROM")
+requires_rom = pytest.mark.skipif(ROM_FILE is None, reason = "WC_TEST_ROM not set")
+
+OBJECTIVE = "2.3.3.1.r.1.r.1.r"
+
+def test_snapshot_restores_module_state():
+    from server import _ModuleSnapshot
+
+    class Patched:
+        addresses = None
+        def __init__(self):
+            pass
+
+    module = types.ModuleType("snapshot_test_module")
+    module.Patched = Patched
+    Patched.__module__ = module.__name__
+    module.count = 0
+    module.tiers = [[1, 2], [3]]
+    module.names = {"a" : [1]}
+    module.seen = set()
+    module.__builtins__ = {"len" : len}
+    tiers, names, seen, first_tier = module.tiers, module.names, module.seen, module.tiers[0]
+
+    snapshot = _ModuleSnapshot({module.__name__ : module})
+
+    module.count = 5
+    module.added = True
+    module.tiers[0].append(9)
+    module.tiers.append([4])
+    module.names["a"].append(2)
+    module.names["b"] = []
+    module.seen.add(1)
+    module.__builtins__["print"] = print
+    Patched.__init__ = lambda self : None
+    Patched.addresses = [0x1234]
+    snapshot.restore()
+
+    assert module.count == 0
+    assert not hasattr(module, "added")
+    assert module.tiers == [[1, 2], [3]] and module.tiers is tiers
+    assert module.names == {"a" : [1]} and module.names is names
+    assert module.seen == set() and module.seen is seen
+    assert module.__builtins__ == {"len" : len, "print" : print} # not generator state, left alone
+    assert "__init__" in vars(Patched) and Patched.__init__ is not None
+    assert Patched.addresses is None
+
+    # restoring again must not share containers with the previous seed
+    first_tier.append(7)
+    module.tiers[0].append(8)
+    snapshot.restore()
+    assert module.tiers == [[1, 2], [3]]
+
+@requires_rom
+def test_objectives_reset_between_seeds(tmp_path):
+    import server
+    from memory.rom import ROM
+    vanilla_rom = ROM(ROM_FILE)
+
+    def generate(seed, objective_args):
+        argv = ["-i", ROM_FILE, "-o", str(tmp_path / f"{seed}.smc"), "-s", seed, "-nro"] + objective_args
+        server.generate(vanilla_rom, argv)
+        return sys.modules["objectives"]
+
+    first = generate("first", ["-oa", OBJECTIVE])
+    assert len(first) == 1
+
+    # objectives is kept loaded, the objectives and results of the first seed must not be carried over
+    second = generate("second", ["-oa", OBJECTIVE, "-ob", OBJECTIVE])
+    assert len(second) == 2
+    assert sum(len(objectives) for objectives in type(second).results.values()) == 2
+
+@requires_rom
+def test_server_seed_matches_new_process(tmp_path):
+    import server
+    from memory.rom import ROM
+    vanilla_rom = ROM(ROM_FILE)
+
+    flags = ["-cg", "-oa", OBJECTIVE]
+    server.generate(vanilla_rom, ["-i", ROM_FILE, "-o", str(tmp_path / "first.smc"), "-s", "first"] + flags)
+    server.generate(vanilla_rom, ["-i", ROM_FILE, "-o", str(tmp_path / "server.smc"), "-s", "second"] + flags)
+
+    result = subprocess.run([sys.executable, "wc.py", "-i", ROM_FILE, "-o", str(tmp_path / "process.smc"),
+                             "-s", "second"] + flags, cwd = ROOT_DIRECTORY, capture_output = True, text = True)
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "server.smc").read_bytes() == (tmp_path / "process.smc").read_bytes()
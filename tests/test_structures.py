@@ -0,0 +1,118 @@
+import pytest
+
+class _ROM:
+    def __init__(self, data):
+        self.data = bytearray(data)
+
+    def get_view(self, address, count):
+        return memoryview(self.data)[address : address + count]
+
+    def set_bytes(self, address, values):
+        self.data[address : address + len(values)] = values
+
+class _Record:
+    pass
+
+def test_record_array_single_field():
+    from data.structures import RecordArray, RecordField, RecordLayout
+    layout = RecordLayout(2, [RecordField("value", 0, width = 2)])
+    rom = _ROM(bytes([0x34, 0x12, 0x78, 0x56, 0xff]))
+
+    records = RecordArray(rom, 0, layout, 2)
+    assert list(records["value"]) == [0x1234, 0x5678]
+
+    values = records.records(_Record)
+    values[0].value = 0xabcd
+    records.set_records(values)
+    records.write()
+    assert rom.data == bytearray([0xcd, 0xab, 0x78, 0x56, 0xff])
+
+    records.set_records([])
+    assert len(records) == 0 and len(records["value"]) == 0
+
+def _bit_field_layout():
+    from data.structures import RecordField, RecordLayout
+    return RecordLayout(3, [
+        RecordField("low",      0, 0x0f),
+        RecordField("high",     0, 0xf0),
+        RecordField("address",  1, 0x03ff, width = 2),
+        RecordField("flag",     2, 0x80, shift = 0),
+    ])
+
+def test_record_layout_bit_fields():
+    layout = _bit_field_layout()
+    record = layout.decode(_Record(), [0xa5, 0x34, 0xfe])
+    assert (record.low, record.high, record.address, record.flag) == (0x5, 0xa, 0x234, 0x80)
+
+    # bits 2-6 of the last byte are not part of a field and are kept
+    record.low = 0xc
+    record.address = 0x1ff
+    record.flag = 0
+    assert layout.encode(record, [0xa5, 0x34, 0xfe]) == [0xac, 0xff, 0x7d]
+    assert layout.encode(record) == [0xac, 0xff, 0x01]
+
+def test_record_array_bit_fields():
+    from data.structures import RecordArray
+    rom = _ROM(bytes([0xa5, 0x34, 0x82, 0x00, 0x00, 0x00]))
+
+    records = RecordArray(rom, 0, _bit_field_layout(), 2)
+    assert list(records["low"]) == [0x5, 0x0] and list(records["high"]) == [0xa, 0x0]
+    assert list(records["address"]) == [0x234, 0x0] and list(records["flag"]) == [0x80, 0x0]
+
+    values = records.records(_Record)
+    values[1].high = 0xf
+    values[1].address = 0x3ff
+    values[1].flag = 0x80
+    records.set_records(values)
+    records.write()
+    assert rom.data == bytearray([0xa5, 0x34, 0x82, 0xf0, 0xff, 0x83])
+
+@pytest.mark.parametrize("name, value", [
+    ("low", 0x10),
+    ("high", -1),
+    ("address", 0x400),
+    ("flag", 0x40),
+])
+def test_record_layout_overflow(name, value):
+    from data.structures import RecordArray
+    layout = _bit_field_layout()
+    rom = _ROM(bytes(3))
+    records = RecordArray(rom, 0, layout, 1)
+
+    values = records.records(_Record)
+    setattr(values[0], name, value)
+    with pytest.raises(OverflowError):
+        layout.encode(values[0])
+    with pytest.raises(OverflowError):
+        records.set_records(values)
+        records.write()
+    assert rom.data == bytearray(3)
+
+def test_record_layout_full_width_overflow():
+    from data.structures import RecordField, RecordLayout
+    layout = RecordLayout(2, [RecordField("hp", 0, width = 2)])
+    record = _Record()
+    record.hp = 70000
+    with pytest.raises(OverflowError):
+        layout.encode(record)
+
+def test_record_layout_truncate():
+    from data.structures import RecordArray, RecordField, RecordLayout
+    layout = RecordLayout(3, [
+        RecordField("address",  0, 0x03ffff, 3, truncate = True),
+        RecordField("bit",      2, 0x1c, truncate = True),
+        RecordField("flag",     2, 0x20),
+    ])
+    record = _Record()
+    record.address, record.bit, record.flag = 0xca5eb3, 0xb, 1
+    assert layout.encode(record) == [0xb3, 0x5e, 0x2e]
+
+    rom = _ROM(bytes(3))
+    records = RecordArray(rom, 0, layout, 1)
+    records.set_records([record])
+    records.write()
+    assert rom.data == bytearray([0xb3, 0x5e, 0x2e])
+
+    record.flag = 2
+    with pytest.raises(OverflowError):
+        layout.encode(record)
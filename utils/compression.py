@@ -1,3 +1,5 @@
+from bisect import bisect_left
+
 WINDOW_SIZE = 0x800
 WINDOW_START = 0x7de # why start here?
 
@@ -5,85 +7,115 @@ MIN_MULTI_LENGTH = 3
 MAX_MULTI_LENGTH = 34
 MAX_COMPRESS_SIZE = 2 ** 16 - 1
 
-def compress(data):
-    result = []
-    data_index = 0
-
-    group = []
-    control_byte = 0
-    control_bit = 1
-
-    byte_positions = {} # lists of sorted positions each byte occurs at
-    window_indices = {} # start indices of byte_positions within current window
-    for index, byte in enumerate(data):
-        if byte in byte_positions:
-            byte_positions[byte].append(index)
+def _match_finder(data):
+    # returns function which finds the longest match for data[index:] within the window before index
+    # the earliest position is used if multiple matches have the same length, None if there is no match
+    sequence_positions = {} # sorted positions each MIN_MULTI_LENGTH byte sequence occurs at
+    for index in range(len(data) - MIN_MULTI_LENGTH + 1):
+        sequence = data[index : index + MIN_MULTI_LENGTH]
+        if sequence in sequence_positions:
+            sequence_positions[sequence].append(index)
         else:
-            byte_positions[byte] = [index]
-            window_indices[byte] = 0
+            sequence_positions[sequence] = [index]
+
+    matches = [False] * (len(data) + 1) # found matches by index, False if not searched yet
+    def longest_match(index):
+        match = matches[index]
+        if match is not False:
+            return match
+
+        match = None
+        positions = sequence_positions.get(data[index : index + MIN_MULTI_LENGTH])
+        if positions is not None:
+            max_length = min(MAX_MULTI_LENGTH, len(data) - index)
+            longest_length = MIN_MULTI_LENGTH - 1
+            window_start = bisect_left(positions, index - WINDOW_SIZE)
+            window_end = bisect_left(positions, index, window_start)
+            for position_index in range(window_start, window_end):
+                position = positions[position_index]
+                if data[position + longest_length] != data[index + longest_length]:
+                    continue # cannot be longer than the current longest match
+
+                if data[position : position + max_length] == data[index : index + max_length]:
+                    match = (max_length, position)
+                    break
 
-    while data_index < len(data):
-        longest_length = 0
-        longest_start = 0
-
-        start_byte = data[data_index]
-        for x in range(window_indices[start_byte], len(byte_positions[start_byte])):
-            position = byte_positions[start_byte][x]
-
-            if position >= data_index:
-                # window has not reached position yet, skip the rest of the positions
-                break
-            if position < data_index - WINDOW_SIZE:
-                # position is no longer within the window, increment window index for this byte and go to next position
-                window_indices[start_byte] += 1
-                continue
-
-            try:
-                length = 1
-                while length < MAX_MULTI_LENGTH and data[data_index + length] == data[position + length]:
+                length = longest_length + 1
+                if data[position : position + length] != data[index : index + length]:
+                    continue
+                while data[position + length] == data[index + length]:
                     length += 1
-            except IndexError:
-                pass
-
-            if length > longest_length:
                 longest_length = length
-                longest_start = position
-                if length == MAX_MULTI_LENGTH:
-                    break
+                match = (length, position)
 
-        if longest_length >= MIN_MULTI_LENGTH:
-            length_start = ((longest_start + WINDOW_START) % WINDOW_SIZE) | ((longest_length - MIN_MULTI_LENGTH) << 11)
-            group.extend(list(length_start.to_bytes(2, "little")))
-            data_index += longest_length
-        else:
-            control_byte = control_byte | control_bit
-            group.append(data[data_index])
+        matches[index] = match
+        return match
+    return longest_match
+
+def _parse(data, longest_match, lazy):
+    # list of matches and literal bytes (None) to encode data as
+    # with lazy matching, a literal is used instead of a match if the next byte starts a longer match
+    result = []
+    data_index = 0
+    while data_index < len(data):
+        match = longest_match(data_index)
+        if match is not None and lazy and match[0] < MAX_MULTI_LENGTH:
+            next_match = longest_match(data_index + 1)
+            if next_match is not None and next_match[0] > match[0]:
+                match = None
+
+        result.append(match)
+        if match is None:
             data_index += 1
+        else:
+            data_index += match[0]
+    return result
 
-        control_bit <<= 1
-        if control_bit > 0xff:
-            result.append(control_byte)
-            result.extend(group)
-            control_byte = 0
-            control_bit = 1
-            group = []
+def _encoded_size(parse):
+    literal_count = parse.count(None)
+    match_count = len(parse) - literal_count
+    return len(parse) // 8 + 1 + literal_count + match_count * 2
 
-    result.append(control_byte)
-    result.extend(group)
+def compress(data):
+    data = bytes(data)
+    longest_match = _match_finder(data)
+
+    # use lazy matching only if it is smaller, otherwise the result matches the original greedy compressor
+    parse = _parse(data, longest_match, lazy = False)
+    lazy_parse = _parse(data, longest_match, lazy = True)
+    if _encoded_size(lazy_parse) < _encoded_size(parse):
+        parse = lazy_parse
+
+    result = bytearray()
+    data_index = 0
+    for group_start in range(0, len(parse) + 1, 8):
+        control_byte = 0
+        group = bytearray()
+        for control_index, match in enumerate(parse[group_start : group_start + 8]):
+            if match is None:
+                control_byte |= 1 << control_index
+                group.append(data[data_index])
+                data_index += 1
+            else:
+                length, start = match
+                length_start = ((start + WINDOW_START) % WINDOW_SIZE) | ((length - MIN_MULTI_LENGTH) << 11)
+                group += length_start.to_bytes(2, "little")
+                data_index += length
+        result.append(control_byte)
+        result += group
 
     size = len(result) + 2
     if size > MAX_COMPRESS_SIZE:
         print(f"Error: compress: data too large (compressed size {size} > 65535)")
         size = MAX_COMPRESS_SIZE
-    return list(size.to_bytes(2, "little")) + result
+    return bytearray(size.to_bytes(2, "little")) + result
 
 def decompress(data):
-    window = [0] * WINDOW_SIZE
-    window_index = WINDOW_START
-
-    result = []
     data_index = 2 # first two bytes should be len(data)
     assert int.from_bytes(data[ : data_index], byteorder = "little") == len(data)
+
+    # result starts with the initial window values so window copies can be made directly from result
+    result = bytearray(WINDOW_SIZE)
     while data_index < len(data):
         control_byte = data[data_index]
         data_index += 1
@@ -92,22 +124,21 @@ def decompress(data):
         while control_bit <= 0xff and data_index < len(data):
             if control_bit & control_byte:
                 # copy single value from data
-                value = data[data_index]
+                result.append(data[data_index])
                 data_index += 1
-                result.append(value)
-                window[window_index] = value
-                window_index = (window_index + 1) % WINDOW_SIZE
             else:
                 # copy multiple values from window
-                length_start = int.from_bytes(data[data_index : data_index + 2], byteorder = "little")
+                length_start = data[data_index] | (data[data_index + 1] << 8)
                 data_index += 2
 
                 length = (length_start >> 11) + MIN_MULTI_LENGTH
-                start = length_start % WINDOW_SIZE
-                for position in range(start, start + length):
-                    value = window[position % WINDOW_SIZE]
-                    result.append(value)
-                    window[window_index] = value
-                    window_index = (window_index + 1) % WINDOW_SIZE
+                window_index = len(result) - WINDOW_SIZE + WINDOW_START
+                distance = (window_index - length_start) % WINDOW_SIZE or WINDOW_SIZE
+                start = len(result) - distance
+                if distance >= length:
+                    result += result[start : start + length]
+                else:
+                    # copy overlaps the values being written, repeat the values from start
+                    result += (result[start : ] * (length // distance + 1))[ : length]
             control_bit <<= 1
-    return result
+    return result[WINDOW_SIZE : ]
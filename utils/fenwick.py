@@ -0,0 +1,38 @@
+# binary indexed tree of integer values supporting logarithmic point updates and prefix sums
+#   sizes = FenwickTree([3, 1, 4])
+#   sizes.add(0, 2)         # values [5, 1, 4]
+#   sizes.prefix_sum(2)     # 5 + 1 = 6
+class FenwickTree():
+    def __init__(self, values):
+        self.values = list(values)
+        self.tree = [0] + self.values
+        for index in range(1, len(self.tree)):
+            parent = index + (index & -index)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, index):
+        return self.values[index]
+
+    def add(self, index, delta):
+        self.values[index] += delta
+        index += 1
+        while index < len(self.tree):
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index):
+        # sum of the first index values
+        result = 0
+        while index > 0:
+            result += self.tree[index]
+            index -= index & -index
+        return result
+
+    def prefix_sums(self):
+        # sum of the values before each index, all at once
+        from itertools import accumulate
+        return list(accumulate(self.values, initial = 0))[:-1]
@@ -0,0 +1,8 @@
+def get_ids(name_id, names, table_name):
+    # ids of the given names from a name to id dictionary, unknown names are an error instead of None
+    names = list(names)
+    try:
+        return [name_id[name] for name in names]
+    except KeyError:
+        unknown = ", ".join(repr(name) for name in names if name not in name_id)
+        raise ValueError(f"Unknown {table_name} name: {unknown}") from None
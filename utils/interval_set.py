@@ -0,0 +1,41 @@
+from bisect import bisect_left, bisect_right
+
+# sorted set of disjoint half-open [start, end) integer intervals, overlapping and adjacent intervals are merged
+#   ranges = IntervalSet()
+#   ranges.add(0, 4)
+#   ranges.add(4, 8)    # [(0, 8)]
+#   ranges.add(10, 12)  # [(0, 8), (10, 12)]
+class IntervalSet():
+    def __init__(self, intervals = ()):
+        self.starts = []
+        self.ends = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def copy(self):
+        result = IntervalSet()
+        result.starts = list(self.starts)
+        result.ends = list(self.ends)
+        return result
+
+    def add(self, start, end):
+        if start >= end:
+            return
+        # intervals first to last - 1 overlap or touch [start, end)
+        first = bisect_left(self.ends, start)
+        last = bisect_right(self.starts, end)
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+        self.starts[first : last] = [start]
+        self.ends[first : last] = [end]
+
+    def clear(self):
+        self.starts = []
+        self.ends = []
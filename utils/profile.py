@@ -0,0 +1,97 @@
+# optional stage profiler, records wall time, cpu time and peak traced memory of nested stages
+#   with profile.stage("Data"):
+#       with profile.stage("spells"):
+#           ...
+# stages do nothing unless profiling was started
+import time, tracemalloc
+from contextlib import contextmanager
+
+class _Stage:
+    def __init__(self, name):
+        self.name = name
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.start_memory = 0
+        self.end_memory = 0
+        self.peak_memory = 0
+        self.stages = []
+
+    def to_dict(self):
+        return {
+            "name" : self.name,
+            "wall_time" : round(self.wall_time, 6),
+            "cpu_time" : round(self.cpu_time, 6),
+            "peak_memory" : self.peak_memory,
+            "memory_delta" : self.end_memory - self.start_memory,
+            "stages" : [stage.to_dict() for stage in self.stages],
+        }
+
+_stack = []
+
+def enabled():
+    return bool(_stack)
+
+def start(name = "main"):
+    stop()
+    tracemalloc.start()
+    root = _Stage(name)
+    root.start_memory = tracemalloc.get_traced_memory()[0]
+    root.wall_time = time.perf_counter()
+    root.cpu_time = time.process_time()
+    _stack.append(root)
+
+def stop():
+    # returns dictionary of every recorded stage
+    if not _stack:
+        return None
+
+    root = _stack[0]
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    root.wall_time = time.perf_counter() - root.wall_time
+    root.cpu_time = time.process_time() - root.cpu_time
+    root.end_memory = current_memory
+    root.peak_memory = max(root.peak_memory, peak_memory, *(stage.peak_memory for stage in root.stages))
+    tracemalloc.stop()
+
+    _stack.clear()
+    return root.to_dict()
+
+@contextmanager
+def stage(name):
+    if not _stack:
+        yield
+        return
+
+    # peak memory is reset for each stage, keep the parent's peak so far before resetting it
+    parent = _stack[-1]
+    parent.peak_memory = max(parent.peak_memory, tracemalloc.get_traced_memory()[1])
+    tracemalloc.reset_peak()
+
+    current = _Stage(name)
+    parent.stages.append(current)
+    _stack.append(current)
+
+    current.start_memory = tracemalloc.get_traced_memory()[0]
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        current.wall_time = time.perf_counter() - wall_start
+        current.cpu_time = time.process_time() - cpu_start
+        current.end_memory, peak_memory = tracemalloc.get_traced_memory()
+        current.peak_memory = max(current.peak_memory, peak_memory)
+        parent.peak_memory = max(parent.peak_memory, current.peak_memory)
+        _stack.pop()
+
+def output_path(output_file, manifest_file = None):
+    # profile is written next to the manifest if there is one, otherwise next to the output rom
+    import os
+    return os.path.splitext(manifest_file or output_file)[0] + ".profile.json"
+
+def write(file_name):
+    import json
+    result = stop()
+    if result is not None:
+        with open(file_name, "w") as output:
+            output.write(json.dumps(result, indent = 4))
@@ -1,11 +1,12 @@
 #https://stackoverflow.com/a/12238093
 # shuffle elements of given list that meet given condition
-def shuffle_if(lst, condition):
+def shuffle_if(lst, condition, rng = None):
     indices, elements = zip(*[(i, e) for i, e in enumerate(lst) if condition(e)])
     indices = list(indices)
 
-    import random
-    random.shuffle(indices)
+    if rng is None:
+        import random as rng
+    rng.shuffle(indices)
 
     for i, e in zip(indices, elements):
         lst[i] = e
@@ -0,0 +1,144 @@
+# round trip and throughput benchmark of utils.compression on every vanilla map tilemap
+# compared with the vanilla compressed tilemaps and with baseline_compress, the compress it replaced
+#   python utils/tools/benchmark_compression.py -i ff3.smc
+import os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+TILEMAP_PTRS_START = 0x19cd90
+TILEMAPS_START = 0x19d1b0
+
+def baseline_compress(data):
+    # utils.compression.compress before it matched 3-byte sequences (greedy longest match, byte by byte compare)
+    from utils.compression import WINDOW_SIZE, WINDOW_START, MIN_MULTI_LENGTH, MAX_MULTI_LENGTH, MAX_COMPRESS_SIZE
+    result = []
+    data_index = 0
+
+    group = []
+    control_byte = 0
+    control_bit = 1
+
+    byte_positions = {} # lists of sorted positions each byte occurs at
+    window_indices = {} # start indices of byte_positions within current window
+    for index, byte in enumerate(data):
+        if byte in byte_positions:
+            byte_positions[byte].append(index)
+        else:
+            byte_positions[byte] = [index]
+            window_indices[byte] = 0
+
+    while data_index < len(data):
+        longest_length = 0
+        longest_start = 0
+
+        start_byte = data[data_index]
+        for x in range(window_indices[start_byte], len(byte_positions[start_byte])):
+            position = byte_positions[start_byte][x]
+
+            if position >= data_index:
+                break
+            if position < data_index - WINDOW_SIZE:
+                window_indices[start_byte] += 1
+                continue
+
+            try:
+                length = 1
+                while length < MAX_MULTI_LENGTH and data[data_index + length] == data[position + length]:
+                    length += 1
+            except IndexError:
+                pass
+
+            if length > longest_length:
+                longest_length = length
+                longest_start = position
+                if length == MAX_MULTI_LENGTH:
+                    break
+
+        if longest_length >= MIN_MULTI_LENGTH:
+            length_start = ((longest_start + WINDOW_START) % WINDOW_SIZE) | ((longest_length - MIN_MULTI_LENGTH) << 11)
+            group.extend(list(length_start.to_bytes(2, "little")))
+            data_index += longest_length
+        else:
+            control_byte = control_byte | control_bit
+            group.append(data[data_index])
+            data_index += 1
+
+        control_bit <<= 1
+        if control_bit > 0xff:
+            result.append(control_byte)
+            result.extend(group)
+            control_byte = 0
+            control_bit = 1
+            group = []
+
+    result.append(control_byte)
+    result.extend(group)
+
+    size = min(len(result) + 2, MAX_COMPRESS_SIZE)
+    return list(size.to_bytes(2, "little")) + result
+
+def read_tilemaps(rom):
+    # compressed tilemaps in address order, tilemaps which share an address are only included once
+    addresses = set()
+    for ptr_address in range(TILEMAP_PTRS_START, TILEMAPS_START, rom.LONG_PTR_SIZE):
+        addresses.add(TILEMAPS_START + int.from_bytes(rom.get_bytes(ptr_address, rom.LONG_PTR_SIZE), "little"))
+
+    tilemaps = []
+    for address in sorted(addresses):
+        if address + 2 > rom.size():
+            continue
+        size = rom.get_short(address)
+        if size > 2 and address + size <= rom.size():
+            tilemaps.append(rom.get_bytes(address, size))
+    return tilemaps
+
+def benchmark(input_file, repeat):
+    from memory.rom import ROM
+    from utils.compression import compress, decompress
+
+    tilemaps = read_tilemaps(ROM(input_file))
+    decompressed = [decompress(tilemap) for tilemap in tilemaps]
+
+    compressed = []
+    baseline = []
+    for tilemap, data in zip(tilemaps, decompressed):
+        for compress_function, results in ((compress, compressed), (baseline_compress, baseline)):
+            result = compress_function(data)
+            if decompress(result) != data:
+                raise SystemExit(f"{compress_function.__name__} round trip failed for tilemap of size {len(tilemap)}")
+            results.append(result)
+
+    compress_time = min(_time(lambda: [compress(data) for data in decompressed]) for _ in range(repeat))
+    baseline_time = min(_time(lambda: [baseline_compress(data) for data in decompressed]) for _ in range(repeat))
+    decompress_time = min(_time(lambda: [decompress(tilemap) for tilemap in tilemaps]) for _ in range(repeat))
+
+    data_size = sum(len(data) for data in decompressed)
+    vanilla_size = sum(len(tilemap) for tilemap in tilemaps)
+    baseline_size = sum(len(result) for result in baseline)
+    compressed_size = sum(len(result) for result in compressed)
+    sizes = list(zip(tilemaps, baseline, compressed))
+    larger = sum(len(result) > len(baseline_result) for _, baseline_result, result in sizes)
+    smaller = sum(len(result) < len(baseline_result) for _, baseline_result, result in sizes)
+    larger_than_vanilla = sum(len(result) > len(tilemap) for tilemap, _, result in sizes)
+
+    print(f"tilemaps:   {len(tilemaps)} ({data_size} bytes decompressed, {vanilla_size} bytes compressed in vanilla)")
+    print(f"{'':<12}{'size':>10} {'vs vanilla':>11} {'ratio':>7} {'time':>8} {'MiB/s':>7}")
+    for name, size, seconds in (("baseline", baseline_size, baseline_time), ("compress", compressed_size, compress_time)):
+        print(f"{name:<12}{size:>10} {size - vanilla_size:>+11} {size / data_size:>7.3f} "
+              f"{seconds:>7.3f}s {data_size / seconds / 2 ** 20:>7.2f}")
+    print(f"compress vs baseline: {smaller} smaller, {len(sizes) - smaller - larger} equal, {larger} larger, "
+          f"{compress_time / baseline_time:.2f}x time ({larger_than_vanilla} larger than vanilla)")
+    print(f"decompress: {decompress_time:.3f}s ({data_size / decompress_time / 2 ** 20:.2f} MiB/s)")
+
+def _time(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", dest = "input_file", required = True, help = "FF3/FF6 rom file")
+    parser.add_argument("-repeat", type = int, default = 3, help = "Number of timed runs, the fastest is reported")
+
+    args = parser.parse_args()
+    benchmark(args.input_file, args.repeat)
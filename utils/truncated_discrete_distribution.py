@@ -1,9 +1,10 @@
 # not a "real" distribution, the discretization and clamping skew it
-def truncated_discrete_distribution(mean, stddev, minimum = None, maximum = None):
-    import random
-    result = round(random.gauss(mean, stddev))
+def truncated_discrete_distribution(mean, stddev, minimum = None, maximum = None, rng = None):
+    if rng is None:
+        import random as rng
+    result = round(rng.gauss(mean, stddev))
     if minimum and result < minimum:
-        return truncated_discrete_distribution(mean, stddev, minimum, maximum)
+        return truncated_discrete_distribution(mean, stddev, minimum, maximum, rng)
     if maximum and result > maximum:
-        return truncated_discrete_distribution(mean, stddev, minimum, maximum)
+        return truncated_discrete_distribution(mean, stddev, minimum, maximum, rng)
     return result
@@ -1,7 +1,8 @@
 # https://eli.thegreenplace.net/2010/01/22/weighted-random-generation-in-python/
-def weighted_random(weights):
-    import random
-    rnd = random.random() * sum(weights)
+def weighted_random(weights, rng = None):
+    if rng is None:
+        import random as rng
+    rnd = rng.random() * sum(weights)
     for i, w in enumerate(weights):
         rnd -= w
         if rnd < 0:
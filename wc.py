@@ -1,30 +1,84 @@
-def main():
+def main(rom = None):
     import args
-    import log
+    from utils import profile
+    if args.profile:
+        profile.start()
 
-    from memory.memory import Memory
-    memory = Memory()
+    try:
+        with profile.stage("Log"):
+            import log
 
-    from data.data import Data
-    data = Data(memory.rom, args)
+        with profile.stage("Memory"):
+            from memory.memory import Memory
+            memory = Memory(rom)
 
-    from event.events import Events
-    events = Events(memory.rom, args, data)
+        cached = False
+        if args.stage_cache_directory:
+            import stage_cache
+            with profile.stage("stage_cache.load"):
+                cached = stage_cache.load(args.stage_cache_directory, memory.rom)
+            if not cached:
+                stage_cache.capture_log()
 
-    from menus.menus import Menus
-    menus = Menus(data.characters, data.dances, data.rages, data.enemies)
+        if not cached:
+            with profile.stage("init_hooks"):
+                import init_hooks
+                init_hooks.run()
 
-    from battle import Battle
-    battle = Battle()
+            with profile.stage("Data"):
+                with profile.stage("import"):
+                    from data.data import Data
+                data = Data(memory.rom, args)
 
-    from settings import Settings
-    settings = Settings()
+            with profile.stage("Events"):
+                from event.events import Events
+                events = Events(memory.rom, args, data)
 
-    from bug_fixes import BugFixes
-    bug_fixes = BugFixes()
+            with profile.stage("Menus"):
+                from menus.menus import Menus
+                menus = Menus(data.characters, data.dances, data.rages, data.enemies)
 
-    data.write()
-    memory.write()
+            with profile.stage("Battle"):
+                from battle import Battle
+                battle = Battle()
+
+            with profile.stage("Settings"):
+                from settings import Settings
+                settings = Settings()
+
+            with profile.stage("BugFixes"):
+                from bug_fixes import BugFixes, bundle_key
+                from memory import patch_bundle
+                patch_bundle.run("bug fixes", bundle_key(), BugFixes)
+
+            with profile.stage("Place"):
+                from memory.space import Place
+                Place()
+
+            with profile.stage("data.write"):
+                data.write()
+
+            if args.stage_cache_directory:
+                with profile.stage("stage_cache.store"):
+                    stage_cache.store(args.stage_cache_directory, memory.rom)
+
+        with profile.stage("memory.write"):
+            memory.write()
+
+        if profile.enabled():
+            profile.write(profile.output_path(args.output_file, args.manifest_file))
+    finally:
+        profile.stop() # stop tracing memory if generation failed before the profile was written
 
 if __name__ == '__main__':
-    main()
+    import sys
+    if "--serve" in sys.argv:
+        from server import serve
+        serve()
+    elif "--batch" in sys.argv or "--count" in sys.argv:
+        from server import batch
+        batch()
+    else:
+        import args
+        args.parse()
+        main()